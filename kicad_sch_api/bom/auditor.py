@@ -215,16 +215,15 @@ class BOMPropertyAuditor:
                 sch = Schematic.load(str(sch_path))
                 sch_modified = False
 
-                for component in sch.components.all():
+                for component in PropertyMatcher.filter(sch.components, match_criteria):
                     if exclude_dnp and not component.in_bom:
                         continue
 
-                    if PropertyMatcher.matches(component, match_criteria):
-                        for prop_name, prop_value in property_updates.items():
-                            if not dry_run:
-                                component.set_property(prop_name, prop_value)
-                            sch_modified = True
-                            updated_count += 1
+                    for prop_name, prop_value in property_updates.items():
+                        if not dry_run:
+                            component.set_property(prop_name, prop_value)
+                        sch_modified = True
+                        updated_count += 1
 
                 if sch_modified and not dry_run:
                     sch.save(str(sch_path))
@@ -2,12 +2,14 @@
 
 import re
 import fnmatch
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class PropertyMatcher:
     """Match components based on criteria with regex/wildcard support."""
 
+    FIELDS = ["reference", "value", "footprint", "lib_id"]
+
     @staticmethod
     def parse_criteria(criteria_str: str) -> Dict[str, str]:
         """Parse criteria string into dict.
@@ -53,7 +55,7 @@ class PropertyMatcher:
         """
         for field, pattern in criteria.items():
             # Get field value from component
-            if field in ["reference", "value", "footprint", "lib_id"]:
+            if field in PropertyMatcher.FIELDS:
                 component_value = getattr(component, field, "")
             else:
                 # Assume it's a property
@@ -83,3 +85,61 @@ class PropertyMatcher:
                     return False
 
         return True
+
+    @staticmethod
+    def filter(components: Iterable[Any], criteria: Dict[str, str]) -> List[Any]:
+        """Get all components matching criteria.
+
+        When components is a ComponentCollection with an index on one of the
+        criteria fields, exact patterns (empty check or "^literal$") are
+        answered from the most selective index before applying matches().
+
+        Args:
+            components: ComponentCollection or iterable of components
+            criteria: Dictionary of field->pattern mappings
+
+        Returns:
+            List of matching components in collection order
+        """
+        candidates = PropertyMatcher._indexed_candidates(components, criteria)
+        if candidates is None:
+            candidates = list(components)
+        return [c for c in candidates if PropertyMatcher.matches(c, criteria)]
+
+    @staticmethod
+    def _indexed_candidates(components: Any, criteria: Dict[str, str]) -> Optional[List[Any]]:
+        """Narrow components through the most selective usable index."""
+        if not hasattr(components, "index_lookup"):
+            return None
+
+        best = None
+        for field, pattern in criteria.items():
+            keys = PropertyMatcher._exact_keys(field, pattern)
+            if keys is None:
+                continue
+            if field in PropertyMatcher.FIELDS:
+                index_name = field
+            else:
+                index_name = components.property_index_name(field)
+            found = components.index_lookup(index_name, *keys)
+            if found is not None and (best is None or len(found) < len(best)):
+                best = found
+        return best
+
+    @staticmethod
+    def _exact_keys(field: str, pattern: str) -> Optional[Tuple[Any, ...]]:
+        """Get the index keys an exact pattern can match, or None."""
+        if pattern == "":
+            if field in PropertyMatcher.FIELDS:
+                return ("",)
+            # Missing properties are indexed under None
+            return (None, "")
+
+        if len(pattern) > 2 and pattern.startswith("^") and pattern.endswith("$"):
+            literal = pattern[1:-1]
+            if "*" in literal or "?" in literal or re.escape(literal) != literal:
+                return None
+            # "$" also matches before a trailing newline
+            return (literal, literal + "\n")
+
+        return None
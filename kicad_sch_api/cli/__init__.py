@@ -12,6 +12,9 @@ Supported operations:
 - SVG export
 - DXF export
 
+The ``kicad-sch-api`` command runs batch ERC over many schematic files
+(``kicad-sch-api erc``, see erc_batch).
+
 Example:
     >>> import kicad_sch_api as ksa
     >>> sch = ksa.Schematic('circuit.kicad_sch')
@@ -20,6 +23,10 @@ Example:
     >>> sch.export_bom(exclude_dnp=True)
 """
 
+import argparse
+from typing import List, Optional
+
+from kicad_sch_api.cli import erc_batch
 from kicad_sch_api.cli.base import (
     ExecutionMode,
     KiCadExecutor,
@@ -42,4 +49,17 @@ __all__ = [
     "ErcFormat",
     "ErcSeverity",
     "Units",
+    "main",
 ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``kicad-sch-api`` command."""
+    parser = argparse.ArgumentParser(
+        prog="kicad-sch-api", description="KiCAD Schematic API command line tools"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    erc_batch.add_parser(subparsers)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
@@ -233,3 +233,39 @@ def _parse_text_report(content: str, schematic_path: Path) -> ErcReport:
         schematic_path=schematic_path,
         raw_output=content,
     )
+
+
+def report_from_result(result, schematic_path: Optional[Path] = None) -> ErcReport:
+    """
+    Convert an in-process ERCResult into an ErcReport.
+
+    Args:
+        result: ERCResult from validation.ElectricalRulesChecker
+        schematic_path: Schematic file the result belongs to, if saved
+
+    Returns:
+        ErcReport with one violation per error and warning
+    """
+    violations = [
+        ErcViolation(
+            severity=violation.severity,
+            type=violation.violation_type,
+            description=violation.message,
+            sheet="/",
+            position=(
+                {"x": violation.location.x, "y": violation.location.y}
+                if violation.location
+                else None
+            ),
+        )
+        for violation in result.errors + result.warnings
+    ]
+
+    return ErcReport(
+        violations=violations,
+        error_count=len(result.errors),
+        warning_count=len(result.warnings),
+        exclusion_count=0,
+        schematic_path=Path(schematic_path) if schematic_path else None,
+        raw_output=result.to_json(),
+    )
@@ -0,0 +1,468 @@
+"""
+Batch Electrical Rule Check over many schematic files.
+
+Runs the native checker (validation.ElectricalRulesChecker) on every
+schematic found in the given directories, files or glob patterns, across a
+process pool. Results are cached by file content hash, so unchanged files are
+skipped on the next run, and reported as combined JSON and/or JUnit XML.
+
+Example:
+    $ kicad-sch-api erc hardware/ --jobs 8 --junit erc.xml
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".ksa-erc-cache"
+
+_SHEETFILE_PATTERN = re.compile(r'\(property\s+"Sheetfile"\s+"((?:[^"\\]|\\.)*)"')
+
+
+@dataclass
+class FileErcResult:
+    """ERC outcome of one schematic file."""
+
+    path: Path
+    status: str  # "passed", "failed" (ERC errors) or "error" (could not be checked)
+    elapsed: float  # Seconds spent checking (0.0 for cached results)
+    cached: bool = False
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    warnings: List[Dict[str, Any]] = field(default_factory=list)
+    message: str = ""  # Reason a file could not be checked
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary for serialization."""
+        return {
+            "path": str(self.path),
+            "status": self.status,
+            "elapsed": round(self.elapsed, 4),
+            "cached": self.cached,
+            "error_count": len(self.errors),
+            "warning_count": len(self.warnings),
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "message": self.message,
+        }
+
+
+@dataclass
+class BatchErcReport:
+    """Combined ERC report over many schematic files."""
+
+    files: List[FileErcResult]
+    wall_time: float
+
+    @property
+    def error_count(self) -> int:
+        return sum(len(result.errors) for result in self.files)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(len(result.warnings) for result in self.files)
+
+    @property
+    def cached_count(self) -> int:
+        return sum(result.cached for result in self.files)
+
+    def has_failures(self) -> bool:
+        """Check if any file has ERC errors or could not be checked."""
+        return any(result.status != "passed" for result in self.files)
+
+    def summary(self) -> str:
+        """One-line summary with the total wall-clock time."""
+        failed = sum(result.status == "failed" for result in self.files)
+        broken = sum(result.status == "error" for result in self.files)
+        return (
+            f"Checked {len(self.files)} files ({self.cached_count} cached) in "
+            f"{self.wall_time:.2f}s: {failed} failed, {broken} not checked, "
+            f"{self.error_count} errors, {self.warning_count} warnings"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to dictionary for serialization."""
+        return {
+            "files": [result.to_dict() for result in self.files],
+            "summary": {
+                "files": len(self.files),
+                "cached": self.cached_count,
+                "failed": sum(result.status == "failed" for result in self.files),
+                "not_checked": sum(result.status == "error" for result in self.files),
+                "errors": self.error_count,
+                "warnings": self.warning_count,
+                "check_time": round(sum(result.elapsed for result in self.files), 4),
+                "wall_time": round(self.wall_time, 4),
+            },
+        }
+
+    def to_json(self) -> str:
+        """Convert report to JSON string."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_junit(self) -> str:
+        """
+        Convert report to JUnit XML, one test case per schematic file.
+
+        ERC errors become failures, files that could not be checked become
+        errors, and warnings are listed in the test case output.
+        """
+        failures = sum(result.status == "failed" for result in self.files)
+        errors = sum(result.status == "error" for result in self.files)
+        counts = {
+            "tests": str(len(self.files)),
+            "failures": str(failures),
+            "errors": str(errors),
+            "time": f"{self.wall_time:.3f}",
+        }
+        suites = ET.Element("testsuites", name="kicad-sch-api erc", **counts)
+        suite = ET.SubElement(suites, "testsuite", name="erc", skipped="0", **counts)
+
+        for result in self.files:
+            case = ET.SubElement(
+                suite,
+                "testcase",
+                classname="erc",
+                name=str(result.path),
+                time=f"{result.elapsed:.3f}",
+            )
+            if result.status == "failed":
+                failure = ET.SubElement(
+                    case, "failure", type="erc", message=f"{len(result.errors)} ERC errors"
+                )
+                failure.text = "\n".join(_format_violation(v) for v in result.errors)
+            elif result.status == "error":
+                error = ET.SubElement(case, "error", type="load", message=result.message)
+                error.text = result.message
+            if result.warnings:
+                output = ET.SubElement(case, "system-out")
+                output.text = "\n".join(_format_violation(v) for v in result.warnings)
+
+        ET.indent(suites)
+        return ET.tostring(suites, encoding="unicode", xml_declaration=True) + "\n"
+
+
+class ErcResultCache:
+    """
+    ERC results stored per schematic content hash.
+
+    An entry is only reused when it was written by the same library version
+    and every child sheet file it depended on, found relative to the file
+    being checked, still has the same content.
+    Symbol library changes are not tracked; clear the directory (or run with
+    --no-cache) after updating libraries.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+
+    def get(self, path: Path, digest: str) -> Optional[FileErcResult]:
+        """
+        Get the cached result of a file, if still valid.
+
+        Args:
+            path: Schematic file
+            digest: SHA-256 of its content
+
+        Returns:
+            Cached FileErcResult for this path, or None
+        """
+        try:
+            entry = json.loads((self.cache_dir / f"{digest}.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != _library_version():
+            return None
+        base = path.resolve().parent
+        for dependency, dependency_digest in entry.get("dependencies", {}).items():
+            if _file_digest(base / dependency) != dependency_digest:
+                return None
+
+        return FileErcResult(
+            path=path,
+            status="failed" if entry["errors"] else "passed",
+            elapsed=0.0,
+            cached=True,
+            errors=entry["errors"],
+            warnings=entry["warnings"],
+        )
+
+    def put(self, digest: str, outcome: Dict[str, Any]) -> None:
+        """
+        Store a checked file's result.
+
+        Args:
+            digest: SHA-256 of the file content
+            outcome: Worker outcome with errors, warnings and dependencies
+        """
+        entry = {
+            "version": _library_version(),
+            "dependencies": outcome["dependencies"],
+            "errors": outcome["errors"],
+            "warnings": outcome["warnings"],
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            target = self.cache_dir / f"{digest}.json"
+            temporary = target.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(entry))
+            temporary.replace(target)
+        except OSError as e:
+            logger.warning(f"Could not write ERC cache entry: {e}")
+
+
+def collect_schematics(patterns: Iterable[str]) -> List[Path]:
+    """
+    Expand directories, files and glob patterns into schematic files.
+
+    Directories are searched recursively; KiCad autosave files are skipped.
+    Each file is listed once, in the order first found.
+
+    Args:
+        patterns: Directories, .kicad_sch files or glob patterns
+
+    Returns:
+        List of schematic file paths
+    """
+    found: Dict[Path, Path] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = sorted(path.rglob("*.kicad_sch"))
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = sorted(Path(p) for p in glob.glob(pattern, recursive=True))
+            candidates = [p for p in candidates if p.suffix == ".kicad_sch" and p.is_file()]
+
+        for candidate in candidates:
+            if candidate.name.startswith("_autosave-"):
+                continue
+            found.setdefault(candidate.resolve(), candidate)
+    return list(found.values())
+
+
+def check_schematics(
+    paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[Path] = Path(DEFAULT_CACHE_DIR),
+) -> BatchErcReport:
+    """
+    Run ERC on many schematic files.
+
+    Files whose content hash has a still-valid cache entry are not checked
+    again; the rest are checked across a process pool (in-process for a
+    single worker or a single file). Results keep the input order.
+
+    Args:
+        paths: Schematic files
+        max_workers: Worker processes (None: one per CPU)
+        cache_dir: Result cache directory (None disables caching)
+
+    Returns:
+        BatchErcReport with per-file results and total wall-clock time
+    """
+    start = time.perf_counter()
+    paths = [Path(p) for p in paths]
+    cache = ErcResultCache(cache_dir) if cache_dir is not None else None
+
+    results: Dict[int, FileErcResult] = {}
+    pending: Dict[int, str] = {}
+    for index, path in enumerate(paths):
+        digest = _file_digest(path)
+        if digest is None:
+            results[index] = FileErcResult(
+                path, "error", 0.0, message=f"Cannot read schematic: {path}"
+            )
+            continue
+        cached = cache.get(path, digest) if cache else None
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending[index] = digest
+
+    for index, outcome in _run_checks({i: paths[i] for i in pending}, max_workers).items():
+        path = paths[index]
+        if "message" in outcome:
+            results[index] = FileErcResult(
+                path, "error", outcome["elapsed"], message=outcome["message"]
+            )
+            continue
+        if cache:
+            cache.put(pending[index], outcome)
+        results[index] = FileErcResult(
+            path=path,
+            status="failed" if outcome["errors"] else "passed",
+            elapsed=outcome["elapsed"],
+            errors=outcome["errors"],
+            warnings=outcome["warnings"],
+        )
+
+    return BatchErcReport(
+        files=[results[index] for index in range(len(paths))],
+        wall_time=time.perf_counter() - start,
+    )
+
+
+def _run_checks(paths: Dict[int, Path], max_workers: Optional[int]) -> Dict[int, Dict[str, Any]]:
+    """Check files across a process pool, falling back to in-process."""
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    outcomes: Dict[int, Dict[str, Any]] = {}
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    index: pool.submit(_check_file, str(path)) for index, path in paths.items()
+                }
+                for index, future in futures.items():
+                    outcomes[index] = future.result()
+        except Exception as e:
+            # Pool start-up or a broken pool: check the remaining files serially
+            logger.warning(f"Parallel ERC failed, continuing serially: {e}")
+
+    for index, path in paths.items():
+        if index not in outcomes:
+            outcomes[index] = _check_file(str(path))
+    return outcomes
+
+
+def _check_file(path: str) -> Dict[str, Any]:
+    """
+    Run ERC on one file (worker entry point).
+
+    Returns:
+        Dict with errors, warnings, dependencies (child sheet file digests)
+        and elapsed seconds, or with message if the file cannot be checked
+    """
+    from kicad_sch_api.core.schematic import Schematic
+    from kicad_sch_api.validation.erc import ElectricalRulesChecker
+
+    start = time.perf_counter()
+    try:
+        schematic = Schematic.load(path)
+        result = ElectricalRulesChecker(schematic).run_all_checks()
+        dependencies = _sheet_dependencies(Path(path))
+    except Exception as e:
+        return {"message": f"{type(e).__name__}: {e}", "elapsed": time.perf_counter() - start}
+
+    return {
+        "errors": [violation.to_dict() for violation in result.errors],
+        "warnings": [violation.to_dict() for violation in result.warnings],
+        "dependencies": dependencies,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def _sheet_dependencies(path: Path) -> Dict[str, Optional[str]]:
+    """
+    Digests of the child sheet files below a schematic, recursively.
+
+    Keys are paths relative to the schematic's directory, so an identical
+    schematic elsewhere is checked against its own child sheets.
+    """
+    root = path.resolve()
+    dependencies: Dict[str, Optional[str]] = {}
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            text = current.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for filename in _SHEETFILE_PATTERN.findall(text):
+            child = (current.parent / filename).resolve()
+            relative = Path(os.path.relpath(child, root.parent)).as_posix()
+            if child != root and relative not in dependencies:
+                dependencies[relative] = _file_digest(child)
+                stack.append(child)
+    return dependencies
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    """SHA-256 of a file's content, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _library_version() -> str:
+    from kicad_sch_api import __version__
+
+    return __version__
+
+
+def _format_violation(violation: Dict[str, Any]) -> str:
+    refs = ", ".join(violation.get("component_refs") or [])
+    suffix = f" [{refs}]" if refs else ""
+    return f"{violation['error_code']} {violation['message']}{suffix}"
+
+
+def add_parser(subparsers) -> argparse.ArgumentParser:
+    """Register the ``erc`` command on a subparsers action."""
+    parser = subparsers.add_parser(
+        "erc",
+        help="Run ERC on many schematics",
+        description="Run the native Electrical Rule Check on schematic files.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Schematic files, directories or glob patterns to check"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Result cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Check every file again")
+    parser.add_argument("--json", metavar="PATH", help="Write a combined JSON report")
+    parser.add_argument("--junit", metavar="PATH", help="Write a JUnit XML report")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only print the summary")
+    parser.set_defaults(func=run)
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the ``erc`` command; returns 1 if any file failed."""
+    paths = collect_schematics(args.paths)
+    if not paths:
+        print("No schematic files found")
+        return 1
+
+    report = check_schematics(
+        paths,
+        max_workers=args.jobs,
+        cache_dir=None if args.no_cache else Path(args.cache_dir),
+    )
+
+    if not args.quiet:
+        for result in report.files:
+            status = result.status.upper()
+            if result.status == "error":
+                detail = result.message
+            else:
+                detail = f"{len(result.errors)} errors, {len(result.warnings)} warnings"
+            timing = "cached" if result.cached else f"{result.elapsed * 1000:.1f} ms"
+            print(f"{status:6} {result.path}: {detail} ({timing})")
+    print(report.summary())
+
+    if args.json:
+        Path(args.json).write_text(report.to_json())
+    if args.junit:
+        Path(args.junit).write_text(report.to_junit())
+
+    return 1 if report.has_failures() else 0
@@ -17,6 +17,7 @@ from .base import (
     ValidationLevel,
 )
 from .bus_entries import BusEntryCollection
+from .columnar import ComponentColumns, ComponentView, PinTable, StringTable
 from .components import Component, ComponentCollection
 from .junctions import JunctionCollection
 from .labels import LabelCollection, LabelElement
@@ -29,6 +30,10 @@ __all__ = [
     "PropertyDict",
     "ValidationLevel",
     "BusEntryCollection",
+    "ComponentColumns",
+    "ComponentView",
+    "PinTable",
+    "StringTable",
     "Component",
     "ComponentCollection",
     "JunctionCollection",
@@ -5,17 +5,31 @@ Provides:
 - IndexSpec: Index specification and declaration
 - IndexRegistry: Centralized index management with lazy rebuilding
 - PropertyDict: Auto-tracking dictionary for modification detection
+- ChangeEvent/ChangeJournal: Structured change log with subscriber notification
 - ValidationLevel: Configurable validation levels
 - BaseCollection: Abstract base class for all collections
 """
 
 import logging
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import MutableMapping
 from dataclasses import dataclass
 from enum import Enum
 from functools import total_ordering
-from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Set, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -190,6 +204,39 @@ class IndexRegistry:
 
         return key in self.indexes[index_name]
 
+    def has_index(self, index_name: str) -> bool:
+        """
+        Check if an index is registered.
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            True if the index exists, False otherwise
+        """
+        return index_name in self.specs
+
+    def lookup(self, index_name: str, key: Any) -> List[int]:
+        """
+        Get item positions stored under a key.
+
+        Normalizes unique (single position) and non-unique (position list)
+        indexes to a list of positions in collection order.
+
+        Args:
+            index_name: Name of the index
+            key: Key to look up
+
+        Returns:
+            List of item positions (empty if key not found)
+        """
+        value = self.get(index_name, key)
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return value
+        return [value]
+
     def add_spec(self, spec: IndexSpec) -> None:
         """
         Add a new index specification.
@@ -206,6 +253,21 @@ class IndexRegistry:
 
         logger.debug(f"Added index spec: {spec.name}")
 
+    def remove_spec(self, index_name: str) -> None:
+        """
+        Remove an index specification and its data.
+
+        Args:
+            index_name: Name of the index to remove
+        """
+        if index_name not in self.specs:
+            raise KeyError(f"Unknown index: {index_name}")
+
+        del self.specs[index_name]
+        del self.indexes[index_name]
+
+        logger.debug(f"Removed index spec: {index_name}")
+
 
 class PropertyDict(MutableMapping):
     """
@@ -225,7 +287,7 @@ class PropertyDict(MutableMapping):
             data: Initial dictionary data
             on_modify: Callback to invoke when dict is modified
         """
-        self._data = data or {}
+        self._data = data if data is not None else {}
         self._on_modify = on_modify
 
     def __getitem__(self, key: str) -> Any:
@@ -256,11 +318,161 @@ class PropertyDict(MutableMapping):
         """String representation."""
         return f"PropertyDict({self._data!r})"
 
+    def copy(self) -> Dict[str, Any]:
+        """Plain dictionary copy of the current items."""
+        return dict(self._data)
+
     def set_callback(self, on_modify: Callable[[], None]) -> None:
         """Set or update the modification callback."""
         self._on_modify = on_modify
 
 
+class ChangeKind(Enum):
+    """Kind of change recorded in a collection's change journal."""
+
+    ADD = "add"
+    REMOVE = "remove"
+    MODIFY = "modify"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    A single structured change to a collection item.
+
+    Attributes:
+        kind: What happened to the item
+        uuid: UUID of the affected item
+        field: Name of the changed field (MODIFY events only, None if unknown)
+        version: Journal version assigned to this event
+    """
+
+    kind: ChangeKind
+    uuid: str
+    field: Optional[str] = None
+    version: int = 0
+
+
+ChangeListener = Callable[[List[ChangeEvent]], None]
+
+
+class ChangeJournal:
+    """
+    Bounded log of collection changes with subscriber notification.
+
+    Every recorded event gets a monotonically increasing version number.
+    Listeners receive a list of events: one event per call normally, or all
+    events of a batch in a single call when the batch ends. Consumers that
+    poll instead of subscribing can use changes_since() with the last
+    version they processed.
+    """
+
+    def __init__(self, max_events: int = 10000):
+        """
+        Initialize change journal.
+
+        Args:
+            max_events: Maximum number of events retained for changes_since()
+        """
+        self._events: Deque[ChangeEvent] = deque(maxlen=max_events)
+        self._version = 0
+        self._listeners: List[ChangeListener] = []
+        self._pending: List[ChangeEvent] = []
+        self._batch_depth = 0
+
+    @property
+    def version(self) -> int:
+        """Version of the most recently recorded event (0 if none)."""
+        return self._version
+
+    def record(self, kind: ChangeKind, uuid: str, field: Optional[str] = None) -> ChangeEvent:
+        """
+        Record a change and notify listeners (or defer inside a batch).
+
+        Args:
+            kind: Kind of change
+            uuid: UUID of the affected item
+            field: Changed field name for MODIFY events
+
+        Returns:
+            The recorded event
+        """
+        self._version += 1
+        event = ChangeEvent(kind, uuid, field, self._version)
+        self._events.append(event)
+
+        if self._batch_depth:
+            self._pending.append(event)
+        elif self._listeners:
+            self._notify([event])
+        return event
+
+    def changes_since(self, version: int) -> Optional[List[ChangeEvent]]:
+        """
+        Get all events recorded after a given version.
+
+        Args:
+            version: Last version the caller has seen
+
+        Returns:
+            Events newer than version in order, or None if some of them have
+            already been dropped from the bounded log (caller must resync)
+        """
+        if version >= self._version:
+            return []
+        if not self._events or self._events[0].version > version + 1:
+            return None
+        start = len(self._events) - (self._version - version)
+        return [self._events[i] for i in range(start, len(self._events))]
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """
+        Register a listener called with lists of ChangeEvent.
+
+        Args:
+            listener: Callable taking a list of events
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        """
+        Remove a previously registered listener.
+
+        Args:
+            listener: Listener to remove (ignored if not registered)
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def begin_batch(self) -> None:
+        """Start deferring notifications until the matching end_batch()."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """End a batch and deliver deferred events in a single notification."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._pending:
+            events, self._pending = self._pending, []
+            self._notify(events)
+
+    def reset(self) -> None:
+        """Drop all recorded events and restart versioning at 0."""
+        self._events.clear()
+        self._pending.clear()
+        self._version = 0
+
+    def _notify(self, events: List[ChangeEvent]) -> None:
+        """Deliver events to all listeners."""
+        for listener in list(self._listeners):
+            try:
+                listener(events)
+            except Exception as e:
+                logger.warning(f"Change listener {listener!r} failed: {e}")
+
+
 class BaseCollection(Generic[T], ABC):
     """
     Abstract base class for all schematic element collections.
@@ -270,6 +482,7 @@ class BaseCollection(Generic[T], ABC):
     - Automatic modification tracking
     - Configurable validation levels
     - Batch mode for performance
+    - Change journal with add/remove/modify events for incremental consumers
     - Consistent collection operations (add, remove, get, filter)
 
     Subclasses must implement:
@@ -298,11 +511,15 @@ class BaseCollection(Generic[T], ABC):
         # Set up index registry with subclass-specific indexes
         index_specs = self._get_index_specs()
         self._index_registry = IndexRegistry(index_specs)
+        self._builtin_indexes = {spec.name for spec in index_specs}
+        self._journal = ChangeJournal()
 
         # Add initial items
         if items:
             for item in items:
                 self._add_item_to_collection(item)
+            # Initial contents are the baseline, not changes
+            self._journal.reset()
 
         logger.debug(f"{self.__class__.__name__} initialized with {len(self._items)} items")
 
@@ -401,6 +618,7 @@ class BaseCollection(Generic[T], ABC):
         self._items.pop(index)
         self._mark_modified()
         self._index_registry.mark_dirty()
+        self._journal.record(ChangeKind.REMOVE, self._get_item_uuid(item))
 
         logger.debug(f"Removed item with UUID {self._get_item_uuid(item)}")
         return True
@@ -439,6 +657,9 @@ class BaseCollection(Generic[T], ABC):
         """
         Filter items by attribute criteria.
 
+        If an index is registered under the same name as a criterion, the
+        most selective such index narrows the candidates before scanning.
+
         Args:
             **criteria: Attribute name/value pairs to match
 
@@ -452,7 +673,165 @@ class BaseCollection(Generic[T], ABC):
                     return False
             return True
 
-        return self.find(matches_criteria)
+        return [item for item in self._candidates(criteria) if matches_criteria(item)]
+
+    def explain(self, **criteria) -> Dict[str, Any]:
+        """
+        Describe how filter() would evaluate the given criteria.
+
+        Args:
+            **criteria: Same criteria accepted by filter()
+
+        Returns:
+            Dictionary with keys:
+            - strategy: "index" or "scan"
+            - index: Name of the index used (None for scan)
+            - key: Index key looked up (None for scan)
+            - candidates: Number of items scanned after index narrowing
+            - total: Number of items in the collection
+        """
+        plan = self._select_index(self._index_lookups(criteria))
+        total = len(self._items)
+        if plan is None:
+            return {
+                "strategy": "scan",
+                "index": None,
+                "key": None,
+                "candidates": total,
+                "total": total,
+            }
+
+        name, key, positions = plan
+        return {
+            "strategy": "index",
+            "index": name,
+            "key": key,
+            "candidates": len(positions),
+            "total": total,
+        }
+
+    # Secondary index management
+    def add_index(self, spec: IndexSpec) -> None:
+        """
+        Register an additional index on this collection.
+
+        Indexes whose name matches a filter criterion are used by filter()
+        to narrow candidates. The index is built lazily on next use.
+
+        Args:
+            spec: Index specification
+
+        Raises:
+            ValueError: If an index with the same name already exists
+
+        Example:
+            collection.add_index(
+                IndexSpec(name="text", key_func=lambda l: l.text, unique=False)
+            )
+        """
+        self._index_registry.add_spec(spec)
+
+    def remove_index(self, name: str) -> None:
+        """
+        Remove a previously registered index.
+
+        Args:
+            name: Index name
+
+        Raises:
+            ValueError: If the index is one of the collection's built-in indexes
+            KeyError: If no index with this name exists
+        """
+        if name in self._builtin_indexes:
+            raise ValueError(f"Cannot remove built-in index '{name}'")
+        self._index_registry.remove_spec(name)
+
+    def index_lookup(self, index_name: str, *keys: Any) -> Optional[List[T]]:
+        """
+        Get items stored under one or more keys of an index.
+
+        Args:
+            index_name: Name of the index
+            *keys: Keys to look up
+
+        Returns:
+            Matching items in collection order, or None if the index does not
+            exist or is stale inside batch mode
+        """
+        if not self._index_registry.has_index(index_name):
+            return None
+        if self._batch_mode and self._index_registry.is_dirty():
+            return None
+        self._ensure_indexes_current()
+
+        positions: Set[int] = set()
+        for key in keys:
+            positions.update(self._index_registry.lookup(index_name, key))
+        return [self._items[i] for i in sorted(positions)]
+
+    @property
+    def index_names(self) -> List[str]:
+        """Names of all registered indexes."""
+        return list(self._index_registry.specs.keys())
+
+    def _index_lookups(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map filter criteria to equality lookups on registered indexes.
+
+        Args:
+            criteria: Filter criteria
+
+        Returns:
+            Dictionary of index name to key
+        """
+        return {
+            name: value for name, value in criteria.items() if self._index_registry.has_index(name)
+        }
+
+    def _select_index(self, lookups: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Pick the most selective index for a set of equality lookups.
+
+        Args:
+            lookups: Dictionary of index name to key
+
+        Returns:
+            (index_name, key, positions) or None if no index applies
+        """
+        if not lookups:
+            return None
+        # Stale indexes can't be trusted while a batch defers rebuilding
+        if self._batch_mode and self._index_registry.is_dirty():
+            return None
+        self._ensure_indexes_current()
+
+        best = None
+        for name, key in lookups.items():
+            try:
+                positions = self._index_registry.lookup(name, key)
+            except TypeError:
+                # Unhashable key - index can't answer this lookup
+                continue
+            if best is None or len(positions) < len(best[2]):
+                best = (name, key, positions)
+            if not positions:
+                break
+        return best
+
+    def _candidates(self, criteria: Dict[str, Any]) -> List[T]:
+        """
+        Get the items a filter needs to scan.
+
+        Args:
+            criteria: Filter criteria
+
+        Returns:
+            Items narrowed by the most selective index, or all items
+        """
+        plan = self._select_index(self._index_lookups(criteria))
+        if plan is None:
+            return list(self._items)
+        return [self._items[i] for i in plan[2]]
 
     def all(self) -> Iterator[T]:
         """
@@ -473,6 +852,13 @@ class BaseCollection(Generic[T], ABC):
 
     def clear(self) -> None:
         """Clear all items from the collection."""
+        removed = [self._get_item_uuid(item) for item in self._items]
+        self._journal.begin_batch()
+        try:
+            for uuid_str in removed:
+                self._journal.record(ChangeKind.REMOVE, uuid_str)
+        finally:
+            self._journal.end_batch()
         self._items.clear()
         self._index_registry.mark_dirty()
         self._mark_modified()
@@ -483,7 +869,9 @@ class BaseCollection(Generic[T], ABC):
         """
         Context manager for batch operations.
 
-        Defers index rebuilding until the batch is complete.
+        Defers index rebuilding until the batch is complete. Change events
+        recorded inside the batch are delivered to subscribers in a single
+        notification when the batch exits.
 
         Example:
             with collection.batch_mode():
@@ -493,6 +881,54 @@ class BaseCollection(Generic[T], ABC):
         """
         return BatchContext(self)
 
+    # Change journal
+    def subscribe(self, listener: ChangeListener) -> None:
+        """
+        Subscribe to structured change events.
+
+        The listener is called with a list of ChangeEvent after each add,
+        remove or field change, or once with all events when a batch_mode()
+        block exits.
+
+        Args:
+            listener: Callable taking a list of ChangeEvent
+
+        Example:
+            def on_change(events):
+                for event in events:
+                    print(event.kind.value, event.uuid, event.field)
+
+            sch.components.subscribe(on_change)
+        """
+        self._journal.subscribe(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        """
+        Stop delivering change events to a listener.
+
+        Args:
+            listener: Listener previously passed to subscribe()
+        """
+        self._journal.unsubscribe(listener)
+
+    @property
+    def change_version(self) -> int:
+        """Version of the latest change event (0 if unchanged since load)."""
+        return self._journal.version
+
+    def changes_since(self, version: int) -> Optional[List[ChangeEvent]]:
+        """
+        Get change events recorded after a version.
+
+        Args:
+            version: Last change_version the caller processed
+
+        Returns:
+            List of events, or None if the journal no longer holds all of
+            them and the caller must recompute from scratch
+        """
+        return self._journal.changes_since(version)
+
     # Collection interface methods
     def __len__(self) -> int:
         """Number of items in collection."""
@@ -535,13 +971,22 @@ class BaseCollection(Generic[T], ABC):
         # Always mark indexes as dirty when items change
         # Batch mode just defers the rebuild, not the dirty flag
         self._index_registry.mark_dirty()
+        self._journal.record(ChangeKind.ADD, self._get_item_uuid(item))
 
         logger.debug(f"Added item with UUID {self._get_item_uuid(item)}")
         return item
 
-    def _mark_modified(self) -> None:
-        """Mark collection as modified."""
+    def _mark_modified(self, item: Optional[T] = None, field: Optional[str] = None) -> None:
+        """
+        Mark collection as modified.
+
+        Args:
+            item: Item whose field changed; records a MODIFY change event
+            field: Name of the changed field
+        """
         self._modified = True
+        if item is not None:
+            self._journal.record(ChangeKind.MODIFY, self._get_item_uuid(item), field)
 
     def _ensure_indexes_current(self) -> None:
         """Ensure all indexes are current (unless in batch mode)."""
@@ -613,6 +1058,7 @@ class BatchContext:
     def __enter__(self):
         """Enter batch mode - defers index rebuilds."""
         self.collection._batch_mode = True
+        self.collection._journal.begin_batch()
         logger.debug(f"Entered batch mode for {self.collection.__class__.__name__}")
         return self.collection
 
@@ -622,5 +1068,6 @@ class BatchContext:
         # Indexes are already marked dirty by add operations
         # Just ensure they're rebuilt now
         self.collection._ensure_indexes_current()
+        self.collection._journal.end_batch()
         logger.debug(f"Exited batch mode for {self.collection.__class__.__name__}")
         return False
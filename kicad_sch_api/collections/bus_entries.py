@@ -48,6 +48,8 @@ class BusEntryCollection(BaseCollection[BusEntry]):
             with self.batch_mode():
                 for entry in bus_entries:
                     super().add(entry)
+            # Initial contents are the baseline, not changes
+            self._journal.reset()
 
         logger.debug(f"BusEntryCollection initialized with {len(self)} bus entries")
 
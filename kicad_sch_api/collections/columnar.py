@@ -0,0 +1,651 @@
+"""
+Columnar component store for analytics over very large designs.
+
+Provides:
+- StringTable: Interned string table (string <-> integer id)
+- ComponentColumns: Column arrays for x/y/rotation/unit plus interned
+  lib_id/value/footprint/reference ids and a sparse property map
+- ComponentView: Lightweight read-only view of one row
+- PinTable: Absolute pin positions of all components (reference, pin, x, y)
+
+The store is an opt-in, read-optimized snapshot built from a
+ComponentCollection (``components.to_columns()``) or from several schematics
+at once. Filters and BOM grouping operate on integer id columns and run
+vectorized when NumPy is installed.
+"""
+
+import logging
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.types import Point, SchematicSymbol
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Interned id used for missing (None) strings
+MISSING = -1
+
+# Columns holding interned string ids
+STRING_COLUMNS = ("reference", "lib_id", "value", "footprint")
+
+
+class StringTable:
+    """
+    Interned string table.
+
+    Each distinct string is stored once and referred to by an integer id.
+    None maps to MISSING.
+    """
+
+    __slots__ = ("_strings", "_ids")
+
+    def __init__(self):
+        """Initialize empty string table."""
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        """
+        Get the id for a string, adding it if needed.
+
+        Args:
+            value: String to intern (None maps to MISSING)
+
+        Returns:
+            Integer id
+        """
+        if value is None:
+            return MISSING
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._ids[value] = string_id
+        return string_id
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        """
+        Get the id for a string without adding it.
+
+        Args:
+            value: String to look up
+
+        Returns:
+            Integer id, MISSING for None, or None if the string is unknown
+        """
+        if value is None:
+            return MISSING
+        return self._ids.get(value)
+
+    def resolve(self, string_id: int) -> Optional[str]:
+        """
+        Get the string for an id.
+
+        Args:
+            string_id: Integer id
+
+        Returns:
+            The interned string, or None for MISSING
+        """
+        if string_id == MISSING:
+            return None
+        return self._strings[string_id]
+
+    def __len__(self) -> int:
+        """Number of distinct strings."""
+        return len(self._strings)
+
+
+class ComponentView:
+    """
+    Lightweight read-only view of one component row.
+
+    Exposes the same read attributes as Component (reference, lib_id, value,
+    footprint, position, rotation, unit, in_bom, on_board, properties).
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ComponentColumns", row: int):
+        """
+        Initialize component view.
+
+        Args:
+            store: Columnar store holding the data
+            row: Row number in the store
+        """
+        self._store = store
+        self._row = row
+
+    @property
+    def row(self) -> int:
+        """Row number in the store."""
+        return self._row
+
+    @property
+    def uuid(self) -> str:
+        """Component UUID."""
+        return self._store._uuids[self._row]
+
+    @property
+    def reference(self) -> str:
+        """Component reference designator."""
+        return self._store._resolve("reference", self._row)
+
+    @property
+    def lib_id(self) -> str:
+        """Library identifier."""
+        return self._store._resolve("lib_id", self._row)
+
+    @property
+    def value(self) -> str:
+        """Component value."""
+        return self._store._resolve("value", self._row)
+
+    @property
+    def footprint(self) -> Optional[str]:
+        """Component footprint."""
+        return self._store._resolve("footprint", self._row)
+
+    @property
+    def position(self) -> Point:
+        """Component position (mm)."""
+        return Point(self._store._x[self._row], self._store._y[self._row])
+
+    @property
+    def rotation(self) -> float:
+        """Component rotation in degrees."""
+        return self._store._rotation[self._row]
+
+    @property
+    def unit(self) -> int:
+        """Unit number."""
+        return self._store._unit[self._row]
+
+    @property
+    def in_bom(self) -> bool:
+        """Whether component appears in bill of materials."""
+        return bool(self._store._in_bom[self._row])
+
+    @property
+    def on_board(self) -> bool:
+        """Whether component appears on PCB."""
+        return bool(self._store._on_board[self._row])
+
+    @property
+    def properties(self) -> Dict[str, str]:
+        """Custom properties of this row (built on access)."""
+        return self._store._row_properties(self._row)
+
+    def get_property(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get property value by name.
+
+        Args:
+            name: Property name
+            default: Default value if property doesn't exist
+
+        Returns:
+            Property value or default
+        """
+        column = self._store._properties.get(name)
+        if column is None or self._row not in column:
+            return default
+        return self._store._strings.resolve(column[self._row])
+
+    def __repr__(self) -> str:
+        """Detailed representation for debugging."""
+        return (
+            f"ComponentView(ref='{self.reference}', lib_id='{self.lib_id}', "
+            f"value='{self.value}', pos={self.position})"
+        )
+
+
+class ComponentColumns:
+    """
+    Columnar component store.
+
+    Keeps one array per scalar field (x, y, rotation, unit, in_bom, on_board),
+    interned ids for reference/lib_id/value/footprint sharing a single
+    StringTable, and a sparse property map (property name -> {row: id}).
+
+    Example:
+        columns = sch.components.to_columns()
+        resistors = columns.filter(lib_id="Device:R", value="10k")
+        groups = columns.group_by("lib_id", "value", "footprint")
+    """
+
+    def __init__(self):
+        """Initialize empty columnar store."""
+        self._strings = StringTable()
+        self._uuids: List[str] = []
+        self._ids: Dict[str, array] = {name: array("i") for name in STRING_COLUMNS}
+        self._x = array("d")
+        self._y = array("d")
+        self._rotation = array("d")
+        self._unit = array("i")
+        self._in_bom = array("b")
+        self._on_board = array("b")
+        self._properties: Dict[str, Dict[int, int]] = {}
+        # NumPy copies of columns, invalidated whenever rows are appended
+        self._numpy_cache: Dict[str, Any] = {}
+
+    @classmethod
+    def from_components(cls, components: Iterable[Any]) -> "ComponentColumns":
+        """
+        Build a store from components.
+
+        Args:
+            components: Component wrappers or SchematicSymbol objects
+
+        Returns:
+            New ComponentColumns
+        """
+        store = cls()
+        store.extend(components)
+        return store
+
+    @classmethod
+    def from_schematics(cls, schematics: Iterable[Any]) -> "ComponentColumns":
+        """
+        Build one store over the components of several schematics.
+
+        Args:
+            schematics: Schematic objects (e.g., all sheets of a project)
+
+        Returns:
+            New ComponentColumns
+        """
+        store = cls()
+        for schematic in schematics:
+            store.extend(schematic.components)
+        return store
+
+    def extend(self, components: Iterable[Any]) -> None:
+        """
+        Append components to the store.
+
+        Args:
+            components: Component wrappers or SchematicSymbol objects
+        """
+        self._numpy_cache.clear()
+        intern = self._strings.intern
+        for component in components:
+            symbol: SchematicSymbol = getattr(component, "_data", component)
+            row = len(self._uuids)
+
+            self._uuids.append(symbol.uuid)
+            self._ids["reference"].append(intern(symbol.reference))
+            self._ids["lib_id"].append(intern(symbol.lib_id))
+            self._ids["value"].append(intern(symbol.value))
+            self._ids["footprint"].append(intern(symbol.footprint))
+            self._x.append(symbol.position.x)
+            self._y.append(symbol.position.y)
+            self._rotation.append(symbol.rotation)
+            self._unit.append(symbol.unit)
+            self._in_bom.append(1 if symbol.in_bom else 0)
+            self._on_board.append(1 if symbol.on_board else 0)
+
+            for name, value in symbol.properties.items():
+                # Skip preserved S-expression data and non-string metadata
+                if name.startswith("__") or not isinstance(value, str):
+                    continue
+                self._properties.setdefault(name, {})[row] = intern(value)
+
+        logger.debug(f"ComponentColumns holds {len(self)} rows, {len(self._strings)} strings")
+
+    # Row access
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self._uuids)
+
+    def __iter__(self) -> Iterator[ComponentView]:
+        """Iterate over row views."""
+        return (ComponentView(self, row) for row in range(len(self._uuids)))
+
+    def __getitem__(self, row: int) -> ComponentView:
+        """Get row view by row number."""
+        if row < 0:
+            row += len(self._uuids)
+        if not 0 <= row < len(self._uuids):
+            raise IndexError(f"Row {row} out of range")
+        return ComponentView(self, row)
+
+    def column(self, name: str) -> Any:
+        """
+        Get a raw column.
+
+        Args:
+            name: One of x, y, rotation, unit, in_bom, on_board (numeric) or
+                  reference, lib_id, value, footprint (interned ids)
+
+        Returns:
+            NumPy array if NumPy is available, otherwise array.array
+        """
+        numeric = {
+            "x": self._x,
+            "y": self._y,
+            "rotation": self._rotation,
+            "unit": self._unit,
+            "in_bom": self._in_bom,
+            "on_board": self._on_board,
+        }
+        if name in numeric:
+            data = numeric[name]
+        elif name in self._ids:
+            data = self._ids[name]
+        else:
+            raise KeyError(f"Unknown column: {name}")
+
+        if NUMPY_AVAILABLE:
+            return self._to_numpy(name, data)
+        return data
+
+    # Queries
+    def select(self, **criteria) -> List[int]:
+        """
+        Get row numbers matching all criteria.
+
+        Supported criteria:
+            reference, lib_id, value, footprint: Exact match
+            in_area: Tuple of (x1, y1, x2, y2)
+            has_property: Property name that must be present
+            properties: Dict of property name -> exact value
+            in_bom, on_board: Boolean flags
+
+        Args:
+            **criteria: Filter criteria
+
+        Returns:
+            Matching row numbers in ascending order
+        """
+        if NUMPY_AVAILABLE:
+            return self._select_numpy(criteria)
+        return self._select_python(criteria)
+
+    def filter(self, **criteria) -> List[ComponentView]:
+        """
+        Get row views matching all criteria (see select()).
+
+        Args:
+            **criteria: Filter criteria
+
+        Returns:
+            List of matching ComponentView objects
+        """
+        return [ComponentView(self, row) for row in self.select(**criteria)]
+
+    def group_by(self, *fields: str, rows: Optional[List[int]] = None) -> Dict[Tuple, List[int]]:
+        """
+        Group rows by interned string columns or property names.
+
+        Groups are keyed by resolved string tuples, which is what BOM
+        generation needs (e.g., group_by("lib_id", "value", "footprint")).
+
+        Args:
+            *fields: Column names (reference, lib_id, value, footprint) or
+                     property names
+            rows: Restrict grouping to these rows (defaults to all rows)
+
+        Returns:
+            Dictionary mapping field value tuples to row numbers
+        """
+        if not fields:
+            raise ValueError("group_by() requires at least one field")
+        if rows is None:
+            rows = range(len(self._uuids))
+
+        code_columns = [self._code_column(field) for field in fields]
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        # Pack the per-field codes into one int64 key (codes shifted past MISSING)
+        radix = len(self._strings) + 1
+        if NUMPY_AVAILABLE and len(rows) and radix ** len(fields) < 2**63:
+            row_array = np.asarray(rows, dtype=np.intp)
+            packed = np.zeros(len(row_array), dtype=np.int64)
+            for column in code_columns:
+                packed = packed * radix + (column[row_array].astype(np.int64) + 1)
+            keys, inverse = np.unique(packed, return_inverse=True)
+            order = np.argsort(inverse, kind="stable")
+            boundaries = np.cumsum(np.bincount(inverse, minlength=len(keys)))
+            sorted_rows = row_array[order].tolist()
+            start = 0
+            for key, end in zip(keys.tolist(), boundaries.tolist()):
+                codes = []
+                for _ in fields:
+                    key, code = divmod(key, radix)
+                    codes.append(code - 1)
+                groups[tuple(reversed(codes))] = sorted_rows[start:end]
+                start = end
+        else:
+            for row in rows:
+                key = tuple(column[row] for column in code_columns)
+                groups.setdefault(key, []).append(row)
+
+        resolve = self._strings.resolve
+        return {
+            tuple(resolve(code) for code in key): members
+            for key, members in sorted(groups.items(), key=lambda item: item[1][0])
+        }
+
+    # Internal helpers
+    def _resolve(self, column: str, row: int) -> Optional[str]:
+        """Resolve an interned column value for a row."""
+        return self._strings.resolve(self._ids[column][row])
+
+    def _row_properties(self, row: int) -> Dict[str, str]:
+        """Build the property dict for a row from the sparse map."""
+        resolve = self._strings.resolve
+        return {
+            name: resolve(column[row]) for name, column in self._properties.items() if row in column
+        }
+
+    def _code_column(self, field: str) -> Any:
+        """Get an integer code column for a string column or property."""
+        if field in self._ids:
+            column = self._ids[field]
+            return self._to_numpy(field, column) if NUMPY_AVAILABLE else column
+
+        # Dense code column for a sparse property (MISSING where absent)
+        key = f"property:{field}"
+        if key in self._numpy_cache:
+            return self._numpy_cache[key]
+        sparse = self._properties.get(field, {})
+        dense = array("i", [MISSING]) * len(self._uuids)
+        for row, code in sparse.items():
+            dense[row] = code
+        return self._to_numpy(key, dense) if NUMPY_AVAILABLE else dense
+
+    def _to_numpy(self, key: str, data: array) -> Any:
+        """Get a cached NumPy copy of an array column."""
+        cached = self._numpy_cache.get(key)
+        if cached is None:
+            # Copy so the source array stays resizable for extend()
+            cached = np.array(data, dtype=data.typecode)
+            self._numpy_cache[key] = cached
+        return cached
+
+    def _string_criteria(self, criteria: Dict[str, Any]) -> Optional[List[Tuple[Any, int]]]:
+        """
+        Translate string criteria to (code column, id) pairs.
+
+        Returns None when a criterion value was never interned, meaning
+        nothing can match.
+        """
+        pairs = []
+        for field in STRING_COLUMNS:
+            if field in criteria:
+                code = self._strings.lookup(criteria[field])
+                if code is None:
+                    return None
+                pairs.append((field, code))
+        for name, value in criteria.get("properties", {}).items():
+            code = self._strings.lookup(value)
+            if code is None or name not in self._properties:
+                return None
+            pairs.append((name, code))
+        return pairs
+
+    def _select_numpy(self, criteria: Dict[str, Any]) -> List[int]:
+        """Vectorized row selection."""
+        count = len(self._uuids)
+        pairs = self._string_criteria(criteria)
+        if pairs is None or count == 0:
+            return []
+
+        mask = np.ones(count, dtype=bool)
+        for field, code in pairs:
+            mask &= self._code_column(field) == code
+
+        if "in_area" in criteria:
+            x1, y1, x2, y2 = criteria["in_area"]
+            x = self.column("x")
+            y = self.column("y")
+            mask &= (x >= x1) & (x <= x2) & (y >= y1) & (y <= y2)
+
+        if "has_property" in criteria:
+            rows = self._properties.get(criteria["has_property"], {})
+            present = np.zeros(count, dtype=bool)
+            if rows:
+                present[np.fromiter(rows.keys(), dtype=np.intp, count=len(rows))] = True
+            mask &= present
+
+        for flag in ("in_bom", "on_board"):
+            if flag in criteria:
+                mask &= self.column(flag).astype(bool) == bool(criteria[flag])
+
+        return np.flatnonzero(mask).tolist()
+
+    def _select_python(self, criteria: Dict[str, Any]) -> List[int]:
+        """Pure-Python row selection over integer columns."""
+        pairs = self._string_criteria(criteria)
+        if pairs is None:
+            return []
+
+        rows = range(len(self._uuids))
+        for field, code in pairs:
+            column = self._code_column(field)
+            rows = [row for row in rows if column[row] == code]
+
+        if "in_area" in criteria:
+            x1, y1, x2, y2 = criteria["in_area"]
+            xs, ys = self._x, self._y
+            rows = [row for row in rows if x1 <= xs[row] <= x2 and y1 <= ys[row] <= y2]
+
+        if "has_property" in criteria:
+            present = self._properties.get(criteria["has_property"], {})
+            rows = [row for row in rows if row in present]
+
+        for flag, column in (("in_bom", self._in_bom), ("on_board", self._on_board)):
+            if flag in criteria:
+                wanted = 1 if criteria[flag] else 0
+                rows = [row for row in rows if column[row] == wanted]
+
+        return list(rows)
+
+
+class PinTable:
+    """
+    Schematic-wide table of absolute pin positions.
+
+    Parallel columns hold the component reference, pin number and x/y
+    coordinates of every pin. Rows are taken from the per-component pin
+    tables cached by pin_utils, so rebuilding the table after a few edits only
+    transforms the pins of the edited components.
+
+    Example:
+        table = sch.components.pin_table()
+        for reference, pin, position in table:
+            print(reference, pin, position)
+    """
+
+    __slots__ = ("references", "pins", "x", "y", "_rows")
+
+    def __init__(self):
+        """Initialize empty pin table."""
+        self.references: List[str] = []
+        self.pins: List[str] = []
+        self.x = array("d")
+        self.y = array("d")
+        self._rows: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def from_components(cls, components: Iterable[Any]) -> "PinTable":
+        """
+        Build a pin table from components.
+
+        Args:
+            components: Component wrappers (cached) or SchematicSymbol objects
+
+        Returns:
+            New PinTable
+        """
+        table = cls()
+        table.extend(components)
+        return table
+
+    def extend(self, components: Iterable[Any]) -> None:
+        """
+        Append the pins of components to the table.
+
+        Args:
+            components: Component wrappers or SchematicSymbol objects
+        """
+        from ..core.pin_utils import list_component_pins
+
+        for component in components:
+            reference = component.reference
+            for pin_number, position in list_component_pins(component):
+                self._rows.setdefault((reference, pin_number), len(self.pins))
+                self.references.append(reference)
+                self.pins.append(pin_number)
+                self.x.append(position.x)
+                self.y.append(position.y)
+
+    def __len__(self) -> int:
+        """Number of pins."""
+        return len(self.pins)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, Point]]:
+        """Iterate over (reference, pin number, position) rows."""
+        for row in range(len(self.pins)):
+            yield self.references[row], self.pins[row], Point(self.x[row], self.y[row])
+
+    def position(self, reference: str, pin_number: str) -> Optional[Point]:
+        """
+        Get the absolute position of a pin.
+
+        Args:
+            reference: Component reference
+            pin_number: Pin number
+
+        Returns:
+            Pin position, or None if the pin is not in the table
+        """
+        row = self._rows.get((reference, pin_number))
+        if row is None:
+            return None
+        return Point(self.x[row], self.y[row])
+
+    def column(self, name: str) -> Any:
+        """
+        Get the x or y coordinate column.
+
+        Args:
+            name: "x" or "y"
+
+        Returns:
+            NumPy array if NumPy is available, otherwise array.array
+        """
+        if name not in ("x", "y"):
+            raise KeyError(f"Unknown column: {name}")
+        data = self.x if name == "x" else self.y
+        if NUMPY_AVAILABLE:
+            return np.array(data, dtype=data.typecode)
+        return data
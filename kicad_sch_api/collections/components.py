@@ -8,13 +8,16 @@ and batch mode support.
 
 import logging
 import uuid
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from ..core.ic_manager import ICManager
 from ..core.types import PinInfo, Point, SchematicPin, SchematicSymbol
 from ..library.cache import SymbolDefinition, get_symbol_cache
 from ..utils.validation import SchematicValidator, ValidationError, ValidationIssue
-from .base import BaseCollection, IndexSpec, ValidationLevel
+from .base import BaseCollection, IndexSpec, PropertyDict, ValidationLevel
+
+if TYPE_CHECKING:
+    from .columnar import ComponentColumns, PinTable
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,8 @@ class Component:
     automatically notify the parent collection for tracking.
     """
 
+    __slots__ = ("_data", "_collection", "_validator", "_pin_table")
+
     def __init__(self, symbol_data: SchematicSymbol, parent_collection: "ComponentCollection"):
         """
         Initialize component wrapper.
@@ -38,7 +43,14 @@ class Component:
         """
         self._data = symbol_data
         self._collection = parent_collection
-        self._validator = SchematicValidator()
+        self._validator: Optional[SchematicValidator] = None
+        self._pin_table = None  # Absolute pin table cached by pin_utils
+
+    def _get_validator(self) -> SchematicValidator:
+        """Get the validator, creating it on first use."""
+        if self._validator is None:
+            self._validator = SchematicValidator()
+        return self._validator
 
     # Core properties with validation
     @property
@@ -62,7 +74,7 @@ class Component:
         Raises:
             ValidationError: If reference format is invalid or already exists
         """
-        if not self._validator.validate_reference(value):
+        if not self._get_validator().validate_reference(value):
             raise ValidationError(f"Invalid reference format: {value}")
 
         # Check for duplicates in parent collection
@@ -72,7 +84,7 @@ class Component:
         old_ref = self._data.reference
         self._data.reference = value
         self._collection._update_reference_index(old_ref, value)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "reference")
         logger.debug(f"Updated reference: {old_ref} -> {value}")
 
     @property
@@ -86,7 +98,8 @@ class Component:
         old_value = self._data.value
         self._data.value = value
         self._collection._update_value_index(self, old_value, value)
-        self._collection._mark_modified()
+        self._collection._invalidate_field_indexes()
+        self._collection._mark_modified(self, "value")
 
     @property
     def footprint(self) -> Optional[str]:
@@ -97,7 +110,8 @@ class Component:
     def footprint(self, value: Optional[str]):
         """Set component footprint."""
         self._data.footprint = value
-        self._collection._mark_modified()
+        self._collection._invalidate_field_indexes()
+        self._collection._mark_modified(self, "footprint")
 
     @property
     def position(self) -> Point:
@@ -115,7 +129,8 @@ class Component:
         if isinstance(value, tuple):
             value = Point(value[0], value[1])
         self._data.position = value
-        self._collection._mark_modified()
+        self._pin_table = None
+        self._collection._mark_modified(self, "position")
 
     @property
     def rotation(self) -> float:
@@ -148,7 +163,8 @@ class Component:
             )
 
         self._data.rotation = normalized
-        self._collection._mark_modified()
+        self._pin_table = None
+        self._collection._mark_modified(self, "rotation")
 
     @property
     def lib_id(self) -> str:
@@ -167,9 +183,14 @@ class Component:
 
     # Properties dictionary
     @property
-    def properties(self) -> Dict[str, str]:
-        """Dictionary of all component properties."""
-        return self._data.properties
+    def properties(self) -> PropertyDict:
+        """Dictionary of all component properties; writes are tracked like set_property()."""
+        return PropertyDict(self._data.properties, self._properties_changed)
+
+    def _properties_changed(self) -> None:
+        """Record a write made through the properties dictionary."""
+        self._collection._invalidate_field_indexes()
+        self._collection._mark_modified(self, "properties")
 
     @property
     def hidden_properties(self) -> "set[str]":
@@ -204,7 +225,8 @@ class Component:
             raise ValidationError("Property name and value must be strings")
 
         self._data.properties[name] = value
-        self._collection._mark_modified()
+        self._collection._invalidate_field_indexes()
+        self._collection._mark_modified(self, "properties")
         logger.debug(f"Set property {self.reference}.{name} = {value}")
 
     def remove_property(self, name: str) -> bool:
@@ -221,7 +243,8 @@ class Component:
             del self._data.properties[name]
             # Also remove from hidden_properties if present
             self._data.hidden_properties.discard(name)
-            self._collection._mark_modified()
+            self._collection._invalidate_field_indexes()
+            self._collection._mark_modified(self, "properties")
             return True
         return False
 
@@ -255,7 +278,8 @@ class Component:
             >>> component.add_property("Tolerance", "1%", hidden=False)
         """
         self._data.add_property(name, value, hidden)
-        self._collection._mark_modified()
+        self._collection._invalidate_field_indexes()
+        self._collection._mark_modified(self, "properties")
         logger.debug(f"Added property {self.reference}.{name} = {value} (hidden={hidden})")
 
     def add_properties(self, props: Dict[str, str], hidden: bool = False) -> None:
@@ -278,7 +302,8 @@ class Component:
             ... }, hidden=True)
         """
         self._data.add_properties(props, hidden)
-        self._collection._mark_modified()
+        self._collection._invalidate_field_indexes()
+        self._collection._mark_modified(self, "properties")
         logger.debug(f"Added {len(props)} properties to {self.reference} (hidden={hidden})")
 
     # Text effects (position, font, color, etc.)
@@ -346,7 +371,7 @@ class Component:
             >>> r1.set_property_effects("Footprint", {"visible": False})
         """
         self._data.set_property_effects(property_name, effects)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "property_effects")
         logger.debug(f"Updated effects for {self.reference}.{property_name}")
 
     # Pin access
@@ -462,7 +487,7 @@ class Component:
     def in_bom(self, value: bool):
         """Set BOM inclusion flag."""
         self._data.in_bom = bool(value)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "in_bom")
 
     @property
     def on_board(self) -> bool:
@@ -473,7 +498,7 @@ class Component:
     def on_board(self, value: bool):
         """Set board inclusion flag."""
         self._data.on_board = bool(value)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "on_board")
 
     @property
     def fields_autoplaced(self) -> bool:
@@ -484,7 +509,7 @@ class Component:
     def fields_autoplaced(self, value: bool):
         """Set fields autoplaced flag."""
         self._data.fields_autoplaced = bool(value)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "fields_autoplaced")
 
     # Utility methods
     def move(self, x: float, y: float):
@@ -619,6 +644,7 @@ class Component:
 
         # Update pins
         self._data.pins = symbol_def.pins.copy()
+        self._pin_table = None
 
         # Warn if reference prefix doesn't match
         if not self.reference.startswith(symbol_def.reference_prefix):
@@ -626,7 +652,7 @@ class Component:
                 f"Reference {self.reference} doesn't match expected prefix {symbol_def.reference_prefix}"
             )
 
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "pins")
         return True
 
     def validate(self) -> List[ValidationIssue]:
@@ -636,7 +662,7 @@ class Component:
         Returns:
             List of validation issues (empty if valid)
         """
-        return self._validator.validate_component(self._data.__dict__)
+        return self._get_validator().validate_component(self._data.__dict__)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -677,6 +703,11 @@ class ComponentCollection(BaseCollection[Component]):
     Provides fast lookup, filtering, and bulk operations with lazy index rebuilding
     and batch mode support. Uses centralized IndexRegistry for managing all indexes
     (UUID, reference, lib_id, value).
+
+    Secondary indexes on component fields or custom properties can be registered
+    with add_field_index() / add_property_index(). filter() and bulk_update()
+    then narrow candidates through the most selective matching index; explain()
+    reports which index was chosen.
     """
 
     def __init__(
@@ -711,6 +742,8 @@ class ComponentCollection(BaseCollection[Component]):
                     component = Component(comp_data, self)
                     super().add(component)
                     self._add_to_manual_indexes(component)
+            # Initial contents are the baseline, not changes
+            self._journal.reset()
 
         logger.debug(f"ComponentCollection initialized with {len(self)} components")
 
@@ -930,6 +963,191 @@ class ComponentCollection(BaseCollection[Component]):
         logger.info(f"Added component: {reference} ({lib_id})")
         return component
 
+    def add_many(self, specs: Iterable[Dict[str, Any]]) -> List[Component]:
+        """
+        Add many components in one operation.
+
+        Each spec is a dictionary of add() keyword arguments (lib_id, reference,
+        value, position, footprint, unit, rotation, component_uuid, grid_units,
+        grid_size, plus custom properties). Unlike repeated add() calls, the
+        whole batch is validated up front, each distinct lib_id is resolved
+        once, references and UUIDs are pre-allocated, and indexes are rebuilt
+        once at the end. Nothing is added if any spec is invalid.
+
+        Args:
+            specs: Iterable of component specifications
+
+        Returns:
+            List of added components, in spec order
+
+        Raises:
+            ValidationError: If any spec is invalid
+            LibraryError: If a symbol library is not found
+
+        Example:
+            sch.components.add_many(
+                {"lib_id": "Device:R", "value": "10k", "position": (x * 5.08, 0)}
+                for x in range(1000)
+            )
+        """
+        from ..core.config import config
+        from ..core.exceptions import LibraryError
+        from ..core.geometry import snap_to_grid
+
+        specs = [dict(spec) for spec in specs]
+        if not specs:
+            return []
+
+        validator = SchematicValidator()
+        symbol_cache = get_symbol_cache()
+
+        # Resolve each distinct lib_id once
+        symbol_defs: Dict[str, SymbolDefinition] = {}
+        for spec in specs:
+            if spec.get("add_all_units"):
+                raise ValidationError("add_many() does not support add_all_units")
+            lib_id = spec.get("lib_id")
+            if lib_id in symbol_defs:
+                continue
+            if not validator.validate_lib_id(lib_id):
+                raise ValidationError(f"Invalid lib_id format: {lib_id}")
+            symbol_def = symbol_cache.get_symbol(lib_id)
+            if not symbol_def:
+                library_name = lib_id.split(":")[0] if ":" in lib_id else "unknown"
+                raise LibraryError(
+                    f"Symbol '{lib_id}' not found in KiCAD libraries. "
+                    f"Please verify the library name '{library_name}' and symbol name are "
+                    "correct. Common libraries include: Device, Connector_Generic, "
+                    "Regulator_Linear, RF_Module",
+                    field="lib_id",
+                    value=lib_id,
+                )
+            symbol_defs[lib_id] = symbol_def
+
+        # Snapshot existing references (lib_id + units) and UUIDs in one pass
+        units_by_reference: Dict[str, Tuple[str, Set[int]]] = {}
+        used_uuids: Set[str] = set()
+        for existing in self._items:
+            entry = units_by_reference.setdefault(existing.reference, (existing.lib_id, set()))
+            entry[1].add(existing._data.unit)
+            used_uuids.add(existing.uuid)
+
+        # Pre-allocate references, skipping existing and explicitly requested ones
+        taken_references = set(units_by_reference)
+        taken_references.update(spec["reference"] for spec in specs if spec.get("reference"))
+        next_number: Dict[str, int] = {}
+        for spec in specs:
+            if spec.get("reference"):
+                continue
+            prefix = symbol_defs[spec["lib_id"]].reference_prefix
+            counter = next_number.get(prefix, 1)
+            while f"{prefix}{counter}" in taken_references:
+                counter += 1
+            spec["reference"] = f"{prefix}{counter}"
+            taken_references.add(spec["reference"])
+            next_number[prefix] = counter + 1
+
+        hierarchy_path = None
+        if self._parent_schematic and hasattr(self._parent_schematic, "_hierarchy_path"):
+            hierarchy_path = self._parent_schematic._hierarchy_path
+
+        # Validate and build every component before touching the collection
+        components = []
+        for slot, spec in enumerate(specs, start=len(self._items)):
+            lib_id = spec.pop("lib_id")
+            reference = spec.pop("reference")
+            value = spec.pop("value", "")
+            position = spec.pop("position", None)
+            footprint = spec.pop("footprint", None)
+            unit = spec.pop("unit", 1)
+            rotation = spec.pop("rotation", 0.0)
+            component_uuid = spec.pop("component_uuid", None)
+            grid_units = spec.pop("grid_units", None)
+            grid_size = spec.pop("grid_size", None)
+            spec.pop("add_all_units", None)
+            spec.pop("unit_spacing", None)
+            properties = spec
+
+            if not validator.validate_reference(reference):
+                raise ValidationError(f"Invalid reference format: {reference}")
+
+            if unit < 1:
+                raise ValidationError(f"Unit number must be >= 1, got {unit}")
+            symbol_def = symbol_defs[lib_id]
+            if symbol_def.units > 1 and unit > symbol_def.units:
+                raise ValidationError(
+                    f"Unit {unit} invalid for symbol '{lib_id}' "
+                    f"(valid units: 1-{symbol_def.units})"
+                )
+
+            existing_lib_id, existing_units = units_by_reference.setdefault(
+                reference, (lib_id, set())
+            )
+            if existing_lib_id != lib_id:
+                raise ValidationError(
+                    f"Reference '{reference}' already exists with different lib_id "
+                    f"'{existing_lib_id}' (attempting to add '{lib_id}')"
+                )
+            if unit in existing_units:
+                raise ValidationError(
+                    f"Unit {unit} of reference '{reference}' already exists in schematic"
+                )
+            existing_units.add(unit)
+
+            rotation = rotation % 360
+            if rotation not in (0, 90, 180, 270):
+                raise ValidationError(
+                    f"Component rotation must be 0, 90, 180, or 270 degrees. "
+                    f"Got {rotation}°. KiCad does not support arbitrary rotation angles."
+                )
+
+            if grid_units is None:
+                grid_units = config.positioning.use_grid_units
+            if grid_size is None:
+                grid_size = config.positioning.grid_size
+            if position is None:
+                position = self._find_available_position(slot)
+            elif isinstance(position, Point):
+                if grid_units:
+                    position = Point(position.x * grid_size, position.y * grid_size)
+            elif grid_units:
+                position = Point(position[0] * grid_size, position[1] * grid_size)
+            else:
+                position = Point(position[0], position[1])
+            snapped_x, snapped_y = snap_to_grid((position.x, position.y), grid_size=1.27)
+
+            if component_uuid is None:
+                component_uuid = str(uuid.uuid4())
+            elif component_uuid in used_uuids:
+                raise ValidationError(f"Item with UUID {component_uuid} already exists")
+            used_uuids.add(component_uuid)
+
+            if hierarchy_path:
+                properties["hierarchy_path"] = hierarchy_path
+
+            component_data = SchematicSymbol(
+                uuid=component_uuid,
+                lib_id=lib_id,
+                position=Point(snapped_x, snapped_y),
+                reference=reference,
+                value=value,
+                footprint=footprint,
+                unit=unit,
+                rotation=rotation,
+                properties=properties,
+            )
+            component_data.pins = symbol_def.pins.copy()
+            components.append(Component(component_data, self))
+
+        # Insert everything; indexes are rebuilt once when the batch exits
+        with self.batch_mode():
+            for component in components:
+                self._add_item_to_collection(component)
+                self._add_to_manual_indexes(component)
+
+        logger.info(f"Added {len(components)} components in bulk")
+        return components
+
     def add_with_pin_at(
         self,
         lib_id: str,
@@ -1249,6 +1467,27 @@ class ComponentCollection(BaseCollection[Component]):
         """
         return super().get(component_uuid)
 
+    def get_units(self, reference: str) -> List[Component]:
+        """
+        Get every component sharing a reference designator.
+
+        Multi-unit symbols (e.g., op-amps) place one component per unit
+        under the same reference; the lookup uses the reference index.
+
+        Args:
+            reference: Component reference (e.g., "U1")
+
+        Returns:
+            Components with this reference, in collection order
+        """
+        self._ensure_indexes_current()
+        ref_idx = self._index_registry.get("reference", reference)
+        if ref_idx is None:
+            return []
+        if isinstance(ref_idx, list):
+            return [self._items[i] for i in ref_idx]
+        return [self._items[ref_idx]]
+
     # Filter and search methods
     def filter(self, **criteria) -> List[Component]:
         """
@@ -1262,6 +1501,10 @@ class ComponentCollection(BaseCollection[Component]):
             footprint: Filter by footprint (exact match)
             in_area: Filter by area (tuple of (x1, y1, x2, y2))
             has_property: Filter components that have a specific property
+            properties: Filter by property values (dict of name -> exact value)
+
+        Exact-match criteria (lib_id, value, footprint, properties) use a
+        registered secondary index when one exists; see explain().
 
         Args:
             **criteria: Filter criteria
@@ -1269,7 +1512,7 @@ class ComponentCollection(BaseCollection[Component]):
         Returns:
             List of matching components
         """
-        results = list(self._items)
+        results = self._candidates(criteria)
 
         # Apply filters
         if "lib_id" in criteria:
@@ -1302,8 +1545,91 @@ class ComponentCollection(BaseCollection[Component]):
             prop_name = criteria["has_property"]
             results = [c for c in results if prop_name in c.properties]
 
+        if "properties" in criteria:
+            for prop_name, prop_value in criteria["properties"].items():
+                results = [c for c in results if c.properties.get(prop_name) == prop_value]
+
         return results
 
+    # Secondary indexes
+    @staticmethod
+    def property_index_name(property_name: str) -> str:
+        """
+        Get the index name used for a custom property index.
+
+        Args:
+            property_name: Property name (e.g., "MPN")
+
+        Returns:
+            Index name (e.g., "property:MPN")
+        """
+        return f"property:{property_name}"
+
+    def add_field_index(self, field: str) -> None:
+        """
+        Register a secondary index on a component attribute.
+
+        Args:
+            field: Component attribute name (e.g., "value", "footprint", "lib_id")
+
+        Raises:
+            ValueError: If the index already exists
+
+        Example:
+            sch.components.add_field_index("value")
+            sch.components.filter(value="10k")  # Uses the "value" index
+        """
+        self.add_index(
+            IndexSpec(
+                name=field,
+                key_func=lambda c: getattr(c, field),
+                unique=False,
+                description=f"Secondary index on component {field}",
+            )
+        )
+
+    def add_property_index(self, property_name: str) -> None:
+        """
+        Register a secondary index on a custom component property.
+
+        Components without the property are indexed under None.
+
+        Args:
+            property_name: Property name (e.g., "MPN")
+
+        Raises:
+            ValueError: If the index already exists
+
+        Example:
+            sch.components.add_property_index("MPN")
+            sch.components.filter(properties={"MPN": "RC0603FR-0710KL"})
+        """
+        self.add_index(
+            IndexSpec(
+                name=self.property_index_name(property_name),
+                key_func=lambda c: c.properties.get(property_name),
+                unique=False,
+                description=f"Secondary index on property {property_name}",
+            )
+        )
+
+    def _index_lookups(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """Map exact-match filter criteria to registered secondary indexes."""
+        lookups = {}
+        for field in ("lib_id", "value", "footprint"):
+            if field in criteria and self._index_registry.has_index(field):
+                lookups[field] = criteria[field]
+        for prop_name, prop_value in criteria.get("properties", {}).items():
+            index_name = self.property_index_name(prop_name)
+            if self._index_registry.has_index(index_name):
+                lookups[index_name] = prop_value
+        return lookups
+
+    def _invalidate_field_indexes(self) -> None:
+        """Mark indexes dirty after a field change if secondary indexes exist."""
+        if len(self._index_registry.specs) > len(self._builtin_indexes):
+            self._index_registry.mark_dirty()
+
     def filter_by_type(self, component_type: str) -> List[Component]:
         """
         Filter components by type prefix.
@@ -1619,6 +1945,9 @@ class ComponentCollection(BaseCollection[Component]):
         Returns:
             Number of components updated
 
+        Matching uses filter(), so registered secondary indexes narrow the
+        candidates before any component is inspected.
+
         Example:
             # Update all 10k resistors to 1% tolerance
             count = sch.components.bulk_update(
@@ -1646,6 +1975,45 @@ class ComponentCollection(BaseCollection[Component]):
         logger.info(f"Bulk updated {len(matching)} components")
         return len(matching)
 
+    # Analytics
+    def pin_table(self) -> "PinTable":
+        """
+        Build a schematic-wide table of absolute pin positions.
+
+        Rows come from each component's cached pin table, so only components
+        moved, rotated or changed since the last call are transformed again.
+
+        Returns:
+            PinTable with parallel reference, pin, x and y columns
+
+        Example:
+            table = sch.components.pin_table()
+            position = table.position("R1", "2")
+        """
+        from .columnar import PinTable
+
+        return PinTable.from_components(self._items)
+
+    def to_columns(self) -> "ComponentColumns":
+        """
+        Build a columnar snapshot of the collection for analytics.
+
+        The snapshot interns lib_id/value/footprint/reference strings, stores
+        positions, rotations and units in flat arrays, and supports vectorized
+        filter() and group_by() (BOM grouping). It does not track later edits.
+
+        Returns:
+            ComponentColumns snapshot
+
+        Example:
+            columns = sch.components.to_columns()
+            for (lib_id, value), rows in columns.group_by("lib_id", "value").items():
+                print(lib_id, value, len(rows))
+        """
+        from .columnar import ComponentColumns
+
+        return ComponentColumns.from_components(self._items)
+
     # Sorting
     def sort_by_reference(self):
         """Sort components by reference designator (in-place)."""
@@ -2006,12 +2374,15 @@ class ComponentCollection(BaseCollection[Component]):
 
         return f"{prefix}{counter}"
 
-    def _find_available_position(self) -> Point:
+    def _find_available_position(self, slot: Optional[int] = None) -> Point:
         """
         Find an available position for automatic placement.
 
         Uses simple grid layout algorithm.
 
+        Args:
+            slot: Grid slot to use (defaults to the current component count)
+
         Returns:
             Point for component placement
         """
@@ -2019,8 +2390,10 @@ class ComponentCollection(BaseCollection[Component]):
         grid_size = 10.0  # 10mm grid
         max_per_row = 10
 
-        row = len(self._items) // max_per_row
-        col = len(self._items) % max_per_row
+        if slot is None:
+            slot = len(self._items)
+        row = slot // max_per_row
+        col = slot % max_per_row
 
         return Point(col * grid_size, row * grid_size)
 
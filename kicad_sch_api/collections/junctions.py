@@ -48,6 +48,8 @@ class JunctionCollection(BaseCollection[Junction]):
             with self.batch_mode():
                 for junction in junctions:
                     super().add(junction)
+            # Initial contents are the baseline, not changes
+            self._journal.reset()
 
         logger.debug(f"JunctionCollection initialized with {len(self)} junctions")
 
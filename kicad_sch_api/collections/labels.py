@@ -25,6 +25,8 @@ class LabelElement:
     modifications automatically notify the parent collection.
     """
 
+    __slots__ = ("_data", "_collection", "_validator")
+
     def __init__(self, label_data: Label, parent_collection: "LabelCollection"):
         """
         Initialize label element wrapper.
@@ -65,7 +67,7 @@ class LabelElement:
         old_text = self._data.text
         self._data.text = value.strip()
         self._collection._update_text_index(old_text, self)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "text")
         logger.debug(f"Updated label text: '{old_text}' -> '{value}'")
 
     @property
@@ -82,7 +84,7 @@ class LabelElement:
             raise ValidationError(f"Position must be Point or tuple, got {type(value)}")
 
         self._data.position = value
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "position")
 
     @property
     def rotation(self) -> float:
@@ -93,7 +95,7 @@ class LabelElement:
     def rotation(self, value: float):
         """Set label rotation."""
         self._data.rotation = float(value)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "rotation")
 
     @property
     def size(self) -> float:
@@ -115,7 +117,7 @@ class LabelElement:
             raise ValidationError(f"Label size must be positive, got {value}")
 
         self._data.size = float(value)
-        self._collection._mark_modified()
+        self._collection._mark_modified(self, "size")
 
     # Utility methods
     def move(self, x: float, y: float):
@@ -220,6 +222,8 @@ class LabelCollection(BaseCollection[LabelElement]):
                     label_element = LabelElement(label_data, self)
                     super().add(label_element)
                     self._add_to_text_index(label_element)
+            # Initial contents are the baseline, not changes
+            self._journal.reset()
 
         logger.debug(f"LabelCollection initialized with {len(self)} labels")
 
@@ -50,6 +50,8 @@ class WireCollection(BaseCollection[Wire]):
             with self.batch_mode():
                 for wire in wires:
                     super().add(wire)
+            # Initial contents are the baseline, not changes
+            self._journal.reset()
 
         logger.debug(f"WireCollection initialized with {len(self)} wires")
 
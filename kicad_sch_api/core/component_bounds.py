@@ -8,7 +8,7 @@ KiCAD component bounds calculation and collision detection.
 import logging
 import math
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..library.cache import get_symbol_cache
 from .types import Point, SchematicSymbol
@@ -370,6 +370,27 @@ def get_component_bounding_box(
 
     if not symbol:
         logger.warning(f"Symbol not found for {component.lib_id}")
+        return _world_bounding_box(component, None)
+
+    # Calculate symbol bounding box
+    symbol_bbox = SymbolBoundingBoxCalculator.calculate_bounding_box(symbol, include_properties)
+    return _world_bounding_box(component, symbol_bbox)
+
+
+def _world_bounding_box(
+    component: SchematicSymbol, symbol_bbox: Optional[BoundingBox]
+) -> BoundingBox:
+    """
+    Place a symbol-space bounding box at a component's position and rotation.
+
+    Args:
+        component: The schematic component
+        symbol_bbox: Bounding box of the symbol, or None if the symbol is unknown
+
+    Returns:
+        BoundingBox in world coordinates
+    """
+    if symbol_bbox is None:
         # Return default size centered at component position
         default_size = 5.08  # 4 grid units
         return BoundingBox(
@@ -379,13 +400,8 @@ def get_component_bounding_box(
             component.position.y + default_size / 2,
         )
 
-    # Calculate symbol bounding box
-    symbol_bbox = SymbolBoundingBoxCalculator.calculate_bounding_box(symbol, include_properties)
-
     # Transform to world coordinates with rotation
     # Apply rotation matrix to bounding box corners, then find new min/max
-    import math
-
     angle_rad = math.radians(component.rotation)
     cos_a = math.cos(angle_rad)
     sin_a = math.sin(angle_rad)
@@ -422,9 +438,38 @@ def get_component_bounding_box(
     return world_bbox
 
 
-def get_schematic_component_bboxes(components: List[SchematicSymbol]) -> List[BoundingBox]:
-    """Get bounding boxes for all components in a schematic."""
-    return [get_component_bounding_box(comp) for comp in components]
+def get_schematic_component_bboxes(
+    components: List[SchematicSymbol], include_properties: bool = True
+) -> List[BoundingBox]:
+    """
+    Get bounding boxes for all components in a schematic.
+
+    The symbol-space box is calculated once per lib_id and placed for every
+    component using it.
+
+    Args:
+        components: Components to measure
+        include_properties: Whether to include space for Reference/Value labels
+
+    Returns:
+        BoundingBox in world coordinates per component, in order
+    """
+    cache = get_symbol_cache()
+    symbol_bboxes: Dict[str, Optional[BoundingBox]] = {}
+    bboxes = []
+    for component in components:
+        lib_id = component.lib_id
+        if lib_id not in symbol_bboxes:
+            symbol = cache.get_symbol(lib_id)
+            if symbol:
+                symbol_bboxes[lib_id] = SymbolBoundingBoxCalculator.calculate_bounding_box(
+                    symbol, include_properties
+                )
+            else:
+                logger.warning(f"Symbol not found for {lib_id}")
+                symbol_bboxes[lib_id] = None
+        bboxes.append(_world_bounding_box(component, symbol_bboxes[lib_id]))
+    return bboxes
 
 
 def check_path_collision(
@@ -51,6 +51,13 @@ class ToleranceSettings:
     coordinate_precision: float = 0.01  # Coordinate comparison precision
 
 
+@dataclass
+class ValidationSettings:
+    """Thresholds used by schematic validation (Schematic.validate())."""
+
+    component_clearance: float = 0.0  # Minimum gap between symbol bodies in mm
+
+
 @dataclass
 class PositioningSettings:
     """Global positioning behavior settings."""
@@ -158,6 +165,7 @@ class KiCADConfig:
         self.sheet = SheetSettings()
         self.tolerance = ToleranceSettings()
         self.positioning = PositioningSettings()
+        self.validation = ValidationSettings()
         self.defaults = DefaultValues()
         self.file_format = FileFormatConstants()
         self.paper = PaperSizeConstants()
@@ -2,21 +2,30 @@
 Network connectivity analysis for KiCAD schematics.
 
 Implements comprehensive net tracing through wires, junctions, labels,
-hierarchical connections, and power symbols.
+hierarchical connections, and power symbols on top of a union-find over
+snapped grid coordinates.
 """
 
+import hashlib
 import logging
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
-
-from .geometry import points_equal
-from .types import Junction, Label, LabelType, Point, SchematicSymbol, Wire
+import math
+import os
+import re
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .types import LabelType, PinType, Point, Wire
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PinConnection:
     """Represents a component pin in the connectivity graph."""
 
@@ -44,6 +53,7 @@ class Net:
     junctions: Set[str] = field(default_factory=set)  # Junction UUIDs
     labels: Set[str] = field(default_factory=set)  # Label UUIDs
     points: Set[Tuple[float, float]] = field(default_factory=set)  # All connection points
+    code: Optional[int] = None  # Analyzer-assigned id, unique within one analyzer
 
     def add_pin(self, pin: PinConnection):
         """Add a pin to this net."""
@@ -67,6 +77,909 @@ class Net:
         return f"Net({name_str}, {len(self.pins)} pins, {len(self.wires)} wires)"
 
 
+class DisjointSet:
+    """
+    Union-find over dense integer node ids.
+
+    Uses union by size with path halving, so any sequence of n operations
+    runs in near-linear time.
+    """
+
+    __slots__ = ("_parent", "_size", "_on_merge")
+
+    def __init__(self, on_merge: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize an empty disjoint set.
+
+        Args:
+            on_merge: Optional callback(root, absorbed_root) run after each
+                union that merges two distinct sets
+        """
+        self._parent: List[int] = []
+        self._size: List[int] = []
+        self._on_merge = on_merge
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return len(self._parent)
+
+    def make(self) -> int:
+        """
+        Create a new singleton node.
+
+        Returns:
+            Id of the new node
+        """
+        node = len(self._parent)
+        self._parent.append(node)
+        self._size.append(1)
+        return node
+
+    def find(self, node: int) -> int:
+        """
+        Find the representative of a node's set.
+
+        Args:
+            node: Node id
+
+        Returns:
+            Root node id
+        """
+        parent = self._parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: int, b: int) -> int:
+        """
+        Merge the sets containing two nodes.
+
+        Args:
+            a: First node id
+            b: Second node id
+
+        Returns:
+            Root of the merged set
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        if self._on_merge is not None:
+            self._on_merge(root_a, root_b)
+        return root_a
+
+    def reset(self, nodes: Iterable[int]) -> None:
+        """
+        Turn nodes back into singletons.
+
+        The caller must pass every node of each affected set, otherwise
+        nodes outside the list keep pointing into the reset ones.
+
+        Args:
+            nodes: Node ids to split off
+        """
+        for node in nodes:
+            self._parent[node] = node
+            self._size[node] = 1
+
+
+class PointGrid:
+    """
+    Hashed grid mapping schematic coordinates to DisjointSet nodes.
+
+    Coordinates snap to integer cells of size ``tolerance``. Two points that
+    match under points_equal() always fall in the same or adjacent cells, so
+    a lookup probes at most nine buckets regardless of sheet size.
+    """
+
+    __slots__ = ("_uf", "_tolerance", "_cells")
+
+    def __init__(self, uf: DisjointSet, tolerance: float):
+        """
+        Initialize point grid.
+
+        Args:
+            uf: Disjoint set that owns the nodes
+            tolerance: Position matching tolerance in mm (must be positive)
+        """
+        if tolerance <= 0:
+            raise ValueError(f"Tolerance must be positive, got {tolerance}")
+        self._uf = uf
+        self._tolerance = tolerance
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, int]]] = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Snap a coordinate to its grid cell."""
+        return (math.floor(x / self._tolerance), math.floor(y / self._tolerance))
+
+    def _matches(self, x: float, y: float) -> List[Tuple[float, float, int]]:
+        """Get registered points within tolerance of (x, y)."""
+        tolerance = self._tolerance
+        cx, cy = self._cell(x, y)
+        matches = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                bucket = self._cells.get((cx + dx, cy + dy))
+                if bucket:
+                    for entry in bucket:
+                        if abs(entry[0] - x) < tolerance and abs(entry[1] - y) < tolerance:
+                            matches.append(entry)
+        return matches
+
+    def find(self, point: Point) -> Optional[int]:
+        """
+        Get the node at a position without creating one.
+
+        Args:
+            point: Position to look up
+
+        Returns:
+            Node id, or None if nothing was registered near the position
+        """
+        matches = self._matches(point.x, point.y)
+        return matches[0][2] if matches else None
+
+    def node(self, point: Point) -> int:
+        """
+        Get or create the node at a position.
+
+        Every registered point within tolerance is unioned with the result.
+
+        Args:
+            point: Position to register
+
+        Returns:
+            Node id for the position
+        """
+        x, y = point.x, point.y
+        matches = self._matches(x, y)
+        if not matches:
+            node = self._uf.make()
+            self._cells.setdefault(self._cell(x, y), []).append((x, y, node))
+            return node
+
+        node = matches[0][2]
+        exact = False
+        for mx, my, other in matches:
+            self._uf.union(node, other)
+            exact = exact or (mx == x and my == y)
+        if not exact:
+            # Register inexact matches too so tolerance chains stay connected
+            self._cells.setdefault(self._cell(x, y), []).append((x, y, node))
+        return node
+
+
+class SegmentIndex:
+    """
+    Bucketed index of orthogonal wire segments and points.
+
+    Horizontal segments are bucketed by row (y snapped to tolerance-sized
+    cells) and sorted by x; vertical segments by column and sorted by y.
+    Points are kept in both layouts. A point-on-segment query probes three
+    buckets per axis and bisects, so all incidences between n segments and
+    m points cost O((n + m) log n) plus the hits instead of n * m segment
+    tests. Diagonal segments are not indexed.
+    """
+
+    __slots__ = ("_tolerance", "_tables", "_spans", "_unsorted", "_entries")
+
+    _SEGMENTS = 0
+    _POINTS = 1
+
+    def __init__(self, tolerance: float):
+        """
+        Initialize segment index.
+
+        Args:
+            tolerance: Position matching tolerance in mm (must be positive)
+        """
+        if tolerance <= 0:
+            raise ValueError(f"Tolerance must be positive, got {tolerance}")
+        self._tolerance = tolerance
+        # _tables[kind][axis]: cell -> entries; axis 0 is horizontal (rows)
+        self._tables: Tuple[Tuple[Dict[int, list], ...], ...] = (({}, {}), ({}, {}))
+        self._spans: Tuple[Dict[int, float], ...] = ({}, {})
+        self._unsorted: Set[Tuple[int, int, int]] = set()
+        self._entries: Dict[Any, List[Tuple[int, int, int, tuple]]] = {}
+
+    def _cell(self, value: float) -> int:
+        """Snap a coordinate to its bucket."""
+        return math.floor(value / self._tolerance)
+
+    def _axis(self, start: Point, end: Point) -> Optional[Tuple[int, float, float, float]]:
+        """
+        Classify a segment.
+
+        Returns:
+            (axis, fixed coordinate, low end, high end), or None if the
+            segment is diagonal or too short to have an interior
+        """
+        tolerance = self._tolerance
+        if abs(start.y - end.y) < tolerance:
+            axis, fixed, a, b = 0, start.y, start.x, end.x
+        elif abs(start.x - end.x) < tolerance:
+            axis, fixed, a, b = 1, start.x, start.y, end.y
+        else:
+            return None
+        low, high = min(a, b), max(a, b)
+        if high - low <= 2 * tolerance:
+            return None
+        return axis, fixed, low, high
+
+    def _insert(self, kind: int, axis: int, cell: int, entry: tuple) -> None:
+        """Append an entry to a bucket; buckets are sorted on first query."""
+        self._tables[kind][axis].setdefault(cell, []).append(entry)
+        self._unsorted.add((kind, axis, cell))
+        self._entries.setdefault(entry[-1], []).append((kind, axis, cell, entry))
+
+    def _bucket(self, kind: int, axis: int, cell: int) -> list:
+        """Get a bucket sorted by its first (along-axis) coordinate."""
+        bucket = self._tables[kind][axis].get(cell)
+        if bucket and (kind, axis, cell) in self._unsorted:
+            bucket.sort(key=itemgetter(0))
+            self._unsorted.discard((kind, axis, cell))
+        return bucket or []
+
+    def add_segment(self, key: Any, start: Point, end: Point) -> bool:
+        """
+        Index a wire segment.
+
+        Args:
+            key: Hashable owner of the segment (several segments may share it)
+            start: Segment start
+            end: Segment end
+
+        Returns:
+            True if the segment was indexed (orthogonal with an interior)
+        """
+        classified = self._axis(start, end)
+        if classified is None:
+            return False
+        axis, fixed, low, high = classified
+        cell = self._cell(fixed)
+        self._insert(self._SEGMENTS, axis, cell, (low, high, fixed, key))
+        spans = self._spans[axis]
+        spans[cell] = max(spans.get(cell, 0.0), high - low)
+        return True
+
+    def add_point(self, key: Any, point: Point) -> None:
+        """
+        Index a point (junction, pin or wire end).
+
+        Args:
+            key: Hashable owner of the point
+            point: Position
+        """
+        self._insert(self._POINTS, 0, self._cell(point.y), (point.x, point.y, key))
+        self._insert(self._POINTS, 1, self._cell(point.x), (point.y, point.x, key))
+
+    def remove(self, key: Any) -> None:
+        """
+        Remove every segment and point indexed under a key.
+
+        Args:
+            key: Owner passed to add_segment()/add_point()
+        """
+        for kind, axis, cell, entry in self._entries.pop(key, ()):
+            bucket = self._tables[kind][axis][cell]
+            bucket.remove(entry)
+            if not bucket:
+                del self._tables[kind][axis][cell]
+                self._unsorted.discard((kind, axis, cell))
+
+    def segments_at(self, point: Point) -> List[Any]:
+        """
+        Find segments whose interior contains a point.
+
+        Points within tolerance of a segment end are not interior; those
+        contacts are plain endpoint matches.
+
+        Args:
+            point: Position to test
+
+        Returns:
+            Keys of the matching segments (a key repeats if several of its
+            segments match)
+        """
+        tolerance = self._tolerance
+        hits = []
+        for axis, along, fixed in ((0, point.x, point.y), (1, point.y, point.x)):
+            center = self._cell(fixed)
+            for cell in (center - 1, center, center + 1):
+                bucket = self._bucket(self._SEGMENTS, axis, cell)
+                if not bucket:
+                    continue
+                # Candidates start before the point; stop once even the
+                # longest segment in the bucket could not reach it
+                reach = along - self._spans[axis][cell]
+                index = bisect_left(bucket, along - tolerance, key=itemgetter(0))
+                for position in range(index - 1, -1, -1):
+                    low, high, seg_fixed, key = bucket[position]
+                    if low < reach:
+                        break
+                    if high - tolerance > along and abs(seg_fixed - fixed) < tolerance:
+                        hits.append(key)
+        return hits
+
+    def points_on(self, start: Point, end: Point) -> List[Any]:
+        """
+        Find indexed points on the interior of a segment.
+
+        Args:
+            start: Segment start
+            end: Segment end
+
+        Returns:
+            Keys of the matching points (empty for diagonal segments)
+        """
+        classified = self._axis(start, end)
+        if classified is None:
+            return []
+        axis, fixed, low, high = classified
+        tolerance = self._tolerance
+
+        hits = []
+        center = self._cell(fixed)
+        for cell in (center - 1, center, center + 1):
+            bucket = self._bucket(self._POINTS, axis, cell)
+            if not bucket:
+                continue
+            first = bisect_right(bucket, low + tolerance, key=itemgetter(0))
+            last = bisect_left(bucket, high - tolerance, key=itemgetter(0))
+            for _, point_fixed, key in bucket[first:last]:
+                if abs(point_fixed - fixed) < tolerance:
+                    hits.append(key)
+        return hits
+
+
+class EndpointIndex:
+    """
+    Grid hash from connection points to the items that end there.
+
+    Pins, wire points, junctions, no-connect flags, labels and sheet pins
+    of one sheet are bucketed by position on a 1 mm grid. Building the index
+    and each point lookup cost O(1) per item, so checks such as unconnected
+    pins or dangling wires run in linear time instead of scanning every wire
+    for every pin. for_schematic() keeps one index per schematic, patching
+    it from the component and wire change journals, so all validators of an
+    ERC run, and Schematic.validate(), share it.
+
+    Only coincident points are matched; a pin or wire end on the interior
+    of another wire is not a contact (KiCad needs a junction there).
+    """
+
+    PIN = "pin"
+    WIRE = "wire"
+    JUNCTION = "junction"
+    NO_CONNECT = "no_connect"
+    LABEL = "label"
+    SHEET_PIN = "sheet_pin"
+
+    # Cells are much larger than the tolerance, so a lookup nearly always
+    # probes a single cell
+    CELL_SIZE = 1.0
+
+    __slots__ = (
+        "_tolerance",
+        "_cells",
+        "_pins",
+        "_wires",
+        "_unconnected",
+        "_wire_states",
+        "_dirty",
+        "_stale_components",
+        "_stale_wires",
+    )
+
+    def __init__(self, tolerance: float = 0.01):
+        """
+        Initialize endpoint index.
+
+        Args:
+            tolerance: Position matching tolerance in mm (must be positive)
+        """
+        if tolerance <= 0:
+            raise ValueError(f"Tolerance must be positive, got {tolerance}")
+        self._tolerance = tolerance
+        # Cell -> [(x, y, kind, key, owner UUID of pins and wires)]
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, str, Any, Any]]] = {}
+        # Component UUID -> [(component, reference, pin number, position)]
+        self._pins: Dict[str, List[Tuple[Any, str, str, Point]]] = {}
+        self._wires: Dict[str, List[Point]] = {}
+        # Check results per owner, kept up to date after edits: unconnected
+        # pins per component, (floating, dangling end) per wire
+        self._unconnected: Optional[Dict[str, List[Tuple[str, str, Point]]]] = None
+        self._wire_states: Optional[Dict[str, Tuple[bool, Optional[Point]]]] = None
+        self._dirty: List[Tuple[float, float]] = []
+        self._stale_components: Set[str] = set()
+        self._stale_wires: Set[str] = set()
+
+    @classmethod
+    def build(cls, schematic, tolerance: float = 0.01) -> "EndpointIndex":
+        """
+        Index the connection points of a schematic's root sheet.
+
+        Args:
+            schematic: Schematic to index
+            tolerance: Position matching tolerance in mm
+
+        Returns:
+            New EndpointIndex
+        """
+        from .pin_utils import list_pins_batch
+
+        index = cls(tolerance)
+        components = list(schematic.components)
+        for component, pins in zip(components, list_pins_batch(components)):
+            index.set_component(component.uuid, component, pins)
+
+        for wire in schematic.wires:
+            index.set_wire(wire.uuid, wire.points)
+        for junction in schematic.junctions:
+            index.add(cls.JUNCTION, junction.uuid, junction.position)
+        for no_connect in getattr(schematic, "no_connects", []):
+            index.add(cls.NO_CONNECT, no_connect.uuid, no_connect.position)
+        for collection in ("labels", "hierarchical_labels"):
+            for label in getattr(schematic, collection, []):
+                index.add(cls.LABEL, label.uuid, label.position)
+
+        data = getattr(schematic, "_data", None)
+        if isinstance(data, dict):
+            for label in data.get("global_label", []):
+                index.add(cls.LABEL, label.get("uuid"), Point(label["at"][0], label["at"][1]))
+            for sheet in data.get("sheets", []):
+                for pin in sheet.get("pins", []):
+                    if pin.get("position"):
+                        position = Point(pin["position"]["x"], pin["position"]["y"])
+                        index.add(cls.SHEET_PIN, (sheet.get("uuid"), pin.get("name")), position)
+        return index
+
+    @classmethod
+    def for_schematic(cls, schematic) -> "EndpointIndex":
+        """
+        Get the endpoint index of a schematic, updating it only after changes.
+
+        Component and wire edits are replayed from the collections' change
+        journals; any other change, or a truncated journal, rebuilds the index.
+
+        Args:
+            schematic: Schematic to index
+
+        Returns:
+            EndpointIndex describing the schematic's current contents
+        """
+        stamp = _endpoint_stamp(schematic)
+        cached = _endpoint_indexes.get(schematic)
+        if cached is not None:
+            old_stamp, index = cached
+            if old_stamp == stamp:
+                return index
+            if old_stamp[2:] == stamp[2:] and index._replay(schematic, *old_stamp[:2]):
+                _endpoint_indexes[schematic] = (stamp, index)
+                return index
+        index = cls.build(schematic)
+        _endpoint_indexes[schematic] = (stamp, index)
+        return index
+
+    def _replay(self, schematic, components_version: int, wires_version: int) -> bool:
+        """Apply component and wire changes since the given versions; False if unavailable."""
+        from .pin_utils import list_pins_batch
+
+        components = schematic.components
+        wires = schematic.wires
+        component_changes = components.changes_since(components_version)
+        wire_changes = wires.changes_since(wires_version)
+        if component_changes is None or wire_changes is None:
+            return False
+
+        changed = list(dict.fromkeys(change.uuid for change in component_changes))
+        present = [components.get_by_uuid(uuid) for uuid in changed]
+        pins = iter(list_pins_batch([c for c in present if c is not None]))
+        for uuid, component in zip(changed, present):
+            self.set_component(uuid, component, next(pins) if component is not None else ())
+        for uuid in dict.fromkeys(change.uuid for change in wire_changes):
+            wire = wires.get(uuid)
+            self.set_wire(uuid, wire.points if wire is not None else None)
+        return True
+
+    def _cells_near(self, x: float, y: float) -> List[Tuple[int, int]]:
+        """Cells overlapping the tolerance box around a coordinate."""
+        size = self.CELL_SIZE
+        tolerance = self._tolerance
+        x_low = math.floor((x - tolerance) / size)
+        x_high = math.floor((x + tolerance) / size)
+        y_low = math.floor((y - tolerance) / size)
+        y_high = math.floor((y + tolerance) / size)
+        if x_low == x_high and y_low == y_high:
+            return [(x_low, y_low)]
+        return [(cx, cy) for cx in range(x_low, x_high + 1) for cy in range(y_low, y_high + 1)]
+
+    def add(self, kind: str, key: Any, point: Point, owner: Any = None) -> None:
+        """
+        Index one connection point.
+
+        Args:
+            kind: Item kind (PIN, WIRE, JUNCTION, NO_CONNECT, LABEL or SHEET_PIN)
+            key: Hashable owner of the point
+            point: Position
+            owner: UUID of the component or wire the point belongs to
+        """
+        size = self.CELL_SIZE
+        cell = (math.floor(point.x / size), math.floor(point.y / size))
+        self._cells.setdefault(cell, []).append((point.x, point.y, kind, key, owner))
+        self._touch(point)
+
+    def _discard(self, kind: str, key: Any, point: Point, owner: Any) -> None:
+        """Remove one connection point added with add()."""
+        size = self.CELL_SIZE
+        cell = (math.floor(point.x / size), math.floor(point.y / size))
+        bucket = self._cells[cell]
+        bucket.remove((point.x, point.y, kind, key, owner))
+        if not bucket:
+            del self._cells[cell]
+        self._touch(point)
+
+    def _tracking(self) -> bool:
+        """Whether check results are cached and edits must be recorded."""
+        return self._unconnected is not None or self._wire_states is not None
+
+    def _touch(self, point: Point) -> None:
+        """Remember a changed position while check results are cached."""
+        if self._tracking():
+            self._dirty.append((point.x, point.y))
+
+    def set_component(
+        self,
+        component_uuid: str,
+        component=None,
+        pins: Iterable[Tuple[str, Optional[Point]]] = (),
+    ) -> None:
+        """
+        Replace the pins indexed for a component.
+
+        Pins are keyed by (reference, pin number). Without a component, its
+        pins are removed from the index.
+
+        Args:
+            component_uuid: Component UUID
+            component: Component owning the pins
+            pins: (pin number, absolute position) pairs; pins without a
+                position are skipped
+        """
+        for _, reference, pin_number, position in self._pins.get(component_uuid, ()):
+            self._discard(self.PIN, (reference, pin_number), position, component_uuid)
+        if self._tracking():
+            self._stale_components.add(component_uuid)
+        if component is None:
+            self._pins.pop(component_uuid, None)
+            return
+        reference = component.reference
+        entries = [
+            (component, reference, pin_number, position)
+            for pin_number, position in pins
+            if position is not None
+        ]
+        self._pins[component_uuid] = entries
+        for _, _, pin_number, position in entries:
+            self.add(self.PIN, (reference, pin_number), position, component_uuid)
+
+    def set_wire(self, wire_uuid: str, points: Optional[List[Point]] = None) -> None:
+        """
+        Replace the points indexed for a wire.
+
+        Args:
+            wire_uuid: Wire UUID
+            points: Wire points, or None to remove the wire from the index
+        """
+        for point in self._wires.get(wire_uuid, ()):
+            self._discard(self.WIRE, wire_uuid, point, wire_uuid)
+        if self._tracking():
+            self._stale_wires.add(wire_uuid)
+        if points is None:
+            self._wires.pop(wire_uuid, None)
+            return
+        points = list(points)
+        self._wires[wire_uuid] = points
+        for point in points:
+            self.add(self.WIRE, wire_uuid, point, wire_uuid)
+
+    def _entries_at(self, x: float, y: float) -> Iterable[Tuple[float, float, str, Any, Any]]:
+        """Yield the indexed entries within tolerance of a coordinate."""
+        tolerance = self._tolerance
+        for cell in self._cells_near(x, y):
+            for entry in self._cells.get(cell, ()):
+                if abs(entry[0] - x) < tolerance and abs(entry[1] - y) < tolerance:
+                    yield entry
+
+    def at(self, point: Point) -> List[Tuple[str, Any]]:
+        """
+        Get the items at a position.
+
+        Args:
+            point: Position to look up
+
+        Returns:
+            (kind, key) of every item within tolerance of the position
+        """
+        return [(kind, key) for _, _, kind, key, _ in self._entries_at(point.x, point.y)]
+
+    def count(self, point: Point) -> int:
+        """Number of items at a position."""
+        return len(self.at(point))
+
+    def _refresh(self) -> None:
+        """Re-evaluate cached check results of owners near changed positions."""
+        stale_components = self._stale_components
+        stale_wires = self._stale_wires
+        for x, y in self._dirty:
+            for _, _, kind, _, owner in self._entries_at(x, y):
+                if kind == self.PIN:
+                    stale_components.add(owner)
+                elif kind == self.WIRE:
+                    stale_wires.add(owner)
+        self._dirty = []
+
+        if self._unconnected is not None:
+            for component_uuid in stale_components:
+                self._unconnected.pop(component_uuid, None)
+                pins = self._component_unconnected(component_uuid)
+                if pins:
+                    self._unconnected[component_uuid] = pins
+        if self._wire_states is not None:
+            for wire_uuid in stale_wires:
+                self._wire_states.pop(wire_uuid, None)
+                state = self._wire_state(wire_uuid)
+                if state != (False, None):
+                    self._wire_states[wire_uuid] = state
+        stale_components.clear()
+        stale_wires.clear()
+
+    def _component_unconnected(self, component_uuid: str) -> List[Tuple[str, str, Point]]:
+        """Unconnected pins of one component."""
+        from .pin_utils import _symbol_local_pins
+
+        unconnected = []
+        nc_pins = None
+        for component, reference, pin_number, position in self._pins.get(component_uuid, ()):
+            if reference.startswith("#"):
+                break
+            if any(
+                entry[2] != self.PIN or entry[4] != component_uuid
+                for entry in self._entries_at(position.x, position.y)
+            ):
+                continue
+            if nc_pins is None:
+                nc_pins = {
+                    pin.number
+                    for pin in _symbol_local_pins(component)
+                    if pin.pin_type is PinType.NO_CONNECT
+                }
+            if pin_number not in nc_pins:
+                unconnected.append((reference, pin_number, position))
+        return unconnected
+
+    def _wire_state(self, wire_uuid: str) -> Tuple[bool, Optional[Point]]:
+        """Whether a wire is floating, and its first end that meets nothing else."""
+        points = self._wires.get(wire_uuid)
+        if not points:
+            return (False, None)
+        floating = all(
+            entry[4] == wire_uuid
+            for point in points
+            for entry in self._entries_at(point.x, point.y)
+        )
+        for end in (points[0], points[-1]):
+            if sum(1 for _ in self._entries_at(end.x, end.y)) < 2:
+                return (floating, end)
+        return (floating, None)
+
+    def unconnected_pins(self) -> List[Tuple[str, str, Point]]:
+        """
+        Find component pins that touch nothing.
+
+        A pin is unconnected when no wire, other pin, label, junction, sheet
+        pin or no-connect flag shares its position. Pins of power symbols
+        (references starting with "#") and pins of the no_connect electrical
+        type are not reported. After the first call, edits only re-check the
+        pins near the changed positions.
+
+        Returns:
+            (reference, pin number, position) per unconnected pin
+        """
+        if self._unconnected is None:
+            self._unconnected = {}
+            for component_uuid in self._pins:
+                pins = self._component_unconnected(component_uuid)
+                if pins:
+                    self._unconnected[component_uuid] = pins
+        else:
+            self._refresh()
+        unconnected = self._unconnected
+        return [pin for uuid in self._pins if uuid in unconnected for pin in unconnected[uuid]]
+
+    def _wire_results(self) -> Dict[str, Tuple[bool, Optional[Point]]]:
+        """Floating and dangling state of every wire that has either."""
+        if self._wire_states is None:
+            self._wire_states = {}
+            for wire_uuid in self._wires:
+                state = self._wire_state(wire_uuid)
+                if state != (False, None):
+                    self._wire_states[wire_uuid] = state
+        else:
+            self._refresh()
+        return self._wire_states
+
+    def floating_wires(self) -> List[str]:
+        """
+        Find wires that touch nothing at any of their points.
+
+        Returns:
+            UUIDs of wires whose points meet no pin, label, junction, sheet
+            pin, no-connect flag or other wire
+        """
+        states = self._wire_results()
+        return [uuid for uuid in self._wires if uuid in states and states[uuid][0]]
+
+    def dangling_wire_ends(self) -> List[Tuple[str, Point]]:
+        """
+        Find wires with an end that meets nothing else.
+
+        Returns:
+            (wire UUID, first dangling end) per dangling wire
+        """
+        states = self._wire_results()
+        return [
+            (uuid, states[uuid][1])
+            for uuid in self._wires
+            if uuid in states and states[uuid][1] is not None
+        ]
+
+
+# Endpoint index per schematic, with the content stamp it was built from
+_endpoint_indexes: "weakref.WeakKeyDictionary[Any, Tuple[tuple, EndpointIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _endpoint_stamp(schematic) -> tuple:
+    """
+    Describe the contents an endpoint index depends on.
+
+    Starts with the component and wire change versions, which
+    EndpointIndex.for_schematic() replays edits from. Other journaled
+    collections contribute their change version; no-connect flags, global
+    labels and sheet pins, which have no change journal, contribute their
+    positions.
+    """
+    versions = tuple(
+        getattr(getattr(schematic, name, None), "change_version", None)
+        for name in ("junctions", "labels", "hierarchical_labels")
+    )
+    no_connects = tuple(
+        (no_connect.position.x, no_connect.position.y)
+        for no_connect in getattr(schematic, "no_connects", [])
+    )
+    data = getattr(schematic, "_data", None)
+    if isinstance(data, dict):
+        global_labels = tuple(tuple(label["at"][:2]) for label in data.get("global_label", []))
+        sheet_pins = tuple(
+            (pin["position"]["x"], pin["position"]["y"])
+            for sheet in data.get("sheets", [])
+            for pin in sheet.get("pins", [])
+            if pin.get("position")
+        )
+    else:
+        global_labels = sheet_pins = ()
+    return (
+        schematic.components.change_version,
+        schematic.wires.change_version,
+        versions,
+        no_connects,
+        global_labels,
+        sheet_pins,
+    )
+
+
+_PIN = "pin"
+_WIRE = "wire"
+_JUNCTION = "junction"
+_LABEL = "label"
+_HIER_LABEL = "hierarchical_label"
+_GLOBAL_LABEL = "global_label"
+_SHEET_NET = "sheet_net"
+
+
+@dataclass(slots=True, eq=False)
+class _GraphItem:
+    """A pin, wire, junction, label or child sheet net on the connectivity graph."""
+
+    kind: str
+    sheet: int
+    key: Any  # PinConnection for pins, UUID for everything else
+    points: List[Point]
+    seq: int  # Insertion order, used for deterministic net naming
+    name: Optional[str] = None  # Label text or power symbol value
+    nodes: List[int] = field(default_factory=list)
+    data: Any = None  # (SheetNet, instance pins) for child sheet nets
+
+
+@dataclass
+class SheetNet:
+    """A net local to one sheet file, before hierarchical composition."""
+
+    pins: List[PinConnection] = field(default_factory=list)  # References as stored in the file
+    wires: List[str] = field(default_factory=list)
+    junctions: List[str] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    points: List[Tuple[float, float]] = field(default_factory=list)
+    powers: List[str] = field(default_factory=list)  # Power symbol values on the net
+    label_names: List[str] = field(default_factory=list)  # Local label texts
+    global_names: List[str] = field(default_factory=list)  # Global label texts
+
+
+@dataclass
+class SheetComponent:
+    """A symbol placed on one sheet instance, as listed in a netlist."""
+
+    reference: str
+    value: str
+    lib_id: str
+    uuid: str
+    footprint: Optional[str] = None
+    on_board: bool = True
+    sheet_path: str = "/"  # Instance path, e.g. "/<root uuid>/<sheet uuid>"
+    sheet_names: str = "/"  # Sheet name path, e.g. "/Child Circuit/"
+    pin_types: Dict[str, str] = field(default_factory=dict)  # Pin number -> electrical type
+
+
+@dataclass
+class SheetSummary:
+    """
+    Local connectivity of one sheet file, shared by all of its instances.
+
+    Hierarchical nets are composed per instance path by stitching the
+    summary's ports (hierarchical labels) to the sheet pins of the parent.
+    """
+
+    nets: List[SheetNet] = field(default_factory=list)
+    ports: Dict[str, int] = field(default_factory=dict)  # Hierarchical label -> net index
+    # Child sheets placed on this sheet: (sheet UUID, sheet name, filename,
+    # [(pin name, net index)])
+    sheets: List[Tuple[str, str, str, List[Tuple[str, Optional[int]]]]] = field(
+        default_factory=list
+    )
+    # Reference in the file -> {instance path: reference of that instance}
+    references: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    components: List[SheetComponent] = field(default_factory=list)  # References as in the file
+
+
+# Sheet summaries by (analyzer class, tolerance, SHA-256 of the file content,
+# modification times of the symbol libraries the file uses): pin positions and
+# types come from the libraries, so editing one invalidates its sheets
+_SHEET_SUMMARY_CACHE_SIZE = 256
+_SummaryKey = Tuple[type, float, str, Tuple[Tuple[str, Optional[float]], ...]]
+_sheet_summaries: "OrderedDict[_SummaryKey, SheetSummary]" = OrderedDict()
+_LIB_ID_LIBRARY = re.compile(rb'\(lib_id "([^":]*):')
+
+
+def clear_sheet_summary_cache() -> None:
+    """Forget the cached local connectivity of all sheet files."""
+    _sheet_summaries.clear()
+
+
+def _summarize_sheet_file(analyzer_class: type, tolerance: float, path: str) -> SheetSummary:
+    """Process pool worker: load one sheet file and summarize its connectivity."""
+    import kicad_sch_api as ksa
+
+    return analyzer_class(tolerance=tolerance)._summarize_sheet(ksa.Schematic.load(path))
+
+
 class ConnectivityAnalyzer:
     """
     Analyzes schematic connectivity and builds electrical nets.
@@ -78,6 +991,19 @@ class ConnectivityAnalyzer:
     - Global labels (cross-schematic connections)
     - Hierarchical labels (parent-child sheet connections)
     - Power symbols (implicit global connections)
+
+    Every pin, wire point, junction and label of the root sheet is snapped
+    onto a PointGrid, and a SegmentIndex joins junctions placed on the
+    interior of a wire (T-connections and junction-dotted crossings). A
+    physical DisjointSet joins items that touch; a logical one additionally
+    joins groups linked by labels, sheet pins and power symbols.
+    Each logical set keeps its member items, so after analyze() wires and
+    components can be added or removed incrementally: additions are unions,
+    and a removal re-traverses only the net that contained the item.
+
+    Child sheets are analyzed once per unique file content into a
+    SheetSummary (cached across analyzers) and every instance contributes one
+    graph node per local net, stitched to its parent through sheet pins.
     """
 
     def __init__(self, tolerance: float = 0.01):
@@ -90,325 +1016,566 @@ class ConnectivityAnalyzer:
         self.tolerance = tolerance
         self.nets: List[Net] = []
         self._point_to_net: Dict[Tuple[float, float], Net] = {}
-        self._pin_to_net: Dict[PinConnection, Net] = {}
         self._label_name_to_nets: Dict[str, List[Net]] = defaultdict(list)
+        self._reset_graph()
 
         logger.info(f"Initialized ConnectivityAnalyzer (tolerance={tolerance}mm)")
 
-    def analyze(self, schematic, hierarchical=True) -> List[Net]:
+    def _reset_graph(self) -> None:
+        """Clear the union-find graph and per-sheet item tables."""
+        self._phys = DisjointSet(on_merge=self._merge_groups)
+        self._logic = DisjointSet(on_merge=self._merge_nets)
+        self._grids: List[PointGrid] = []
+        self._segment_indexes: List[SegmentIndex] = []
+        self._sheet_paths: List[str] = []  # Instance path per sheet index
+        self._sheet_names: List[str] = []  # Sheet name path per sheet index
+        self._schematic = None  # Root schematic of the last analysis
+        self._instance_components: List[SheetComponent] = []  # Child sheet symbols
+        self._instance_pin_types: Optional[Dict[str, Dict[str, str]]] = None  # By reference
+        self._seq = 0
+        self._unnamed_counter = 1
+
+        # Items by (kind, sheet, key), and members per physical/logical root
+        self._items: Dict[Tuple[str, int, Any], _GraphItem] = {}
+        self._pins_by_reference: Dict[Tuple[int, str], List[_GraphItem]] = defaultdict(list)
+        self._group_items: Dict[int, List[_GraphItem]] = {}
+        self._net_items: Dict[int, List[_GraphItem]] = {}
+        self._net_nodes: Dict[int, List[int]] = {}
+
+        # First attached node per local label name / global label name / power value
+        self._label_anchors: Dict[Tuple[int, str], int] = {}
+        self._global_anchors: Dict[str, int] = {}
+        self._power_anchors: Dict[str, int] = {}
+
+        # Sheet pins: (root sheet position or parent instance node, child port
+        # node, pin name)
+        self._hier_labels: List[_GraphItem] = []
+        self._sheet_links: List[Tuple[Any, int, str]] = []
+
+        # Materialized nets: logical root -> net code, (reference, pin) -> net
+        # code, and per-net pin arrays sorted by (reference, pin number)
+        self._next_code = 1
+        self._root_codes: Dict[int, int] = {}
+        self._root_label_names: Dict[int, Set[str]] = {}
+        self._nets_by_code: Dict[int, Net] = {}
+        self._net_pins: Dict[int, List[PinConnection]] = {}
+        self._pin_net_codes: Dict[Tuple[str, str], int] = {}
+        self._dirty_roots: Set[int] = set()
+        self._dropped_codes: Set[int] = set()
+
+    def analyze(self, schematic, hierarchical=True, max_workers: Optional[int] = 1) -> List[Net]:
         """
         Analyze schematic connectivity and return all nets.
 
         Args:
             schematic: Schematic object to analyze (root schematic)
             hierarchical: If True, also analyze child sheets (default: True)
+            max_workers: Processes used to analyze child sheet files that are
+                not cached yet (default: 1, in-process; None: one per CPU).
+                The resulting nets and their order do not depend on it.
 
         Returns:
             List of Net objects representing all electrical connections
         """
         logger.info("Starting connectivity analysis...")
-
-        # Collect all schematics (parent + children if hierarchical)
+        self.nets = []
+        self._point_to_net = {}
+        self._label_name_to_nets = defaultdict(list)
+        self._reset_graph()
+
+        # Step 1: Snap pins, wires, junctions and labels of the root onto its grid
+        root_uuid = getattr(schematic, "uuid", None)
+        self._schematic = schematic
+        self._sheet_paths.append(f"/{root_uuid}" if root_uuid else "/")
+        self._sheet_names.append("/")
+        items = self._add_sheet(schematic)
+
+        # Step 2: Compose child sheet instances from cached per-file summaries
         if hierarchical:
-            schematics = self._load_hierarchical_schematics(schematic)
-            logger.info(f"Analyzing {len(schematics)} schematics (hierarchical)")
-        else:
-            schematics = [schematic]
-
-        # Step 1: Build component pin positions from all schematics
-        all_pin_positions = {}
-        for sch in schematics:
-            pin_positions = self._build_pin_positions(sch)
-            all_pin_positions.update(pin_positions)
-        logger.info(f"Found {len(all_pin_positions)} component pins across all sheets")
-
-        # Step 2: Create initial nets from wire-to-pin connections
-        for sch in schematics:
-            sch_pins = {
-                pc: pos
-                for pc, pos in all_pin_positions.items()
-                if any(c.reference == pc.reference for c in sch.components)
-            }
-            self._trace_wire_connections(sch, sch_pins)
-        logger.info(f"Created {len(self.nets)} nets from wire connections")
-
-        # Step 3: Merge nets connected by junctions
-        for sch in schematics:
-            self._merge_junction_nets(sch)
-        logger.info(f"After junction merging: {len(self.nets)} nets")
-
-        # Step 4: Merge nets connected by local labels
-        for sch in schematics:
-            self._merge_label_nets(sch)
-        logger.info(f"After label merging: {len(self.nets)} nets")
-
-        # Step 5: Process hierarchical connections (sheet pins ↔ hierarchical labels)
-        if hierarchical and len(schematics) > 1:
-            self._process_hierarchical_connections(schematic, schematics)
-            logger.info(f"After hierarchical connections: {len(self.nets)} nets")
-
-        # Step 6: Process power symbols (implicit global connections across ALL sheets)
-        for sch in schematics:
-            self._process_power_symbols(sch)
-        logger.info(f"After power symbols: {len(self.nets)} nets")
-
-        # Step 7: Handle global labels
-        for sch in schematics:
-            self._process_global_labels(sch)
-        logger.info(f"After global labels: {len(self.nets)} nets")
-
-        # Step 8: Auto-generate net names for unnamed nets
-        self._generate_net_names()
+            file_path = getattr(schematic, "file_path", None)
+            base_dir = Path(file_path).parent if file_path else None
+            entries = self._root_sheet_entries(schematic)
+            workers = max_workers or os.cpu_count() or 1
+            if workers > 1:
+                self._prefetch_summaries(entries, base_dir, workers)
+            items.extend(
+                self._add_sheet_instances(
+                    entries,
+                    base_dir,
+                    0,
+                    frozenset([Path(file_path).resolve()] if file_path else []),
+                )
+            )
+            logger.info(f"Analyzing {len(self._sheet_paths)} sheet instances (hierarchical)")
+        logger.info(f"Snapped {len(items)} connectable items across all sheets")
+
+        # Step 3: Merge labels, sheet pins and power symbols, then build nets
+        self._connect(items)
 
         logger.info(f"Connectivity analysis complete: {len(self.nets)} nets")
         return self.nets
 
-    def _build_pin_positions(self, schematic) -> Dict[PinConnection, Point]:
+    def add_wire(self, wire: Wire, sheet_index: int = 0) -> None:
         """
-        Build mapping of all component pins to their absolute positions.
+        Add a wire to an analyzed schematic without re-analysis.
 
         Args:
-            schematic: Schematic to analyze
+            wire: Wire to add (replaces a wire with the same UUID)
+            sheet_index: Sheet in analysis order (0 is the root schematic; child
+                sheet instances are composed from summaries and read-only)
 
-        Returns:
-            Dict mapping PinConnection to absolute Point
+        Raises:
+            ValueError: If analyze() has not covered the sheet
         """
-        from .pin_utils import list_component_pins
+        self._check_sheet(sheet_index)
+        self.remove_wire(wire.uuid, sheet_index)
+        if len(wire.points) < 2:
+            logger.warning(f"Wire {wire.uuid} has < 2 points, skipping")
+            return
 
-        pin_positions = {}
+        self._update([self._new_item(_WIRE, sheet_index, wire.uuid, wire.points)])
 
-        for component in schematic.components:
-            # Get all pins for this component
-            pins = list_component_pins(component)
+    def remove_wire(self, wire_uuid: str, sheet_index: int = 0) -> bool:
+        """
+        Remove a wire from an analyzed schematic without re-analysis.
 
-            for pin_number, pin_position in pins:
-                if pin_position is not None:
-                    pin_conn = PinConnection(
-                        reference=component.reference, pin_number=pin_number, position=pin_position
-                    )
-                    pin_positions[pin_conn] = pin_position
-                    logger.debug(f"  {pin_conn}")
+        Args:
+            wire_uuid: UUID of the wire
+            sheet_index: Sheet in analysis order (0 is the root schematic)
 
-        return pin_positions
+        Returns:
+            True if the wire was part of the graph
+        """
+        item = self._items.get((_WIRE, sheet_index, wire_uuid))
+        if item is None:
+            return False
+        self._remove_items([item])
+        return True
 
-    def _trace_wire_connections(self, schematic, pin_positions: Dict[PinConnection, Point]):
+    def add_component(self, component, sheet_index: int = 0) -> None:
         """
-        Create initial nets by tracing wire-to-pin connections.
+        Add a component's pins to an analyzed schematic without re-analysis.
 
         Args:
-            schematic: Schematic to analyze
-            pin_positions: Mapping of pins to positions
+            component: Component to add
+            sheet_index: Sheet in analysis order (0 is the root schematic; child
+                sheet instances are composed from summaries and read-only)
+
+        Raises:
+            ValueError: If analyze() has not covered the sheet
         """
-        for wire in schematic.wires:
-            # Get wire endpoints
-            wire_points = wire.points
-            if len(wire_points) < 2:
-                logger.warning(f"Wire {wire.uuid} has < 2 points, skipping")
-                continue
+        self._check_sheet(sheet_index)
+        pin_positions = self._component_pin_positions(component)
+        replaced = [
+            self._items[key]
+            for key in ((_PIN, sheet_index, pin_conn) for pin_conn in pin_positions)
+            if key in self._items
+        ]
+        if replaced:
+            self._remove_items(replaced)
+
+        power_value = component.value if component.lib_id.startswith("power:") else None
+        self._update(
+            [
+                self._new_pin(sheet_index, pin_conn, position, power_value)
+                for pin_conn, position in pin_positions.items()
+            ]
+        )
+
+    def remove_component(self, reference: str, sheet_index: int = 0) -> bool:
+        """
+        Remove all pins of a reference without re-analysis.
 
-            # Find which pins connect to this wire
-            connected_pins = set()
+        Args:
+            reference: Component reference (all units are removed)
+            sheet_index: Sheet in analysis order (0 is the root schematic)
 
-            for pin_conn, pin_pos in pin_positions.items():
-                # Check if pin connects to any point on the wire
-                for wire_point in wire_points:
-                    if points_equal(wire_point, pin_pos, self.tolerance):
-                        connected_pins.add(pin_conn)
-                        logger.debug(f"  Wire {wire.uuid} connects to {pin_conn}")
-                        break
+        Returns:
+            True if any pin was part of the graph
+        """
+        items = self._pins_by_reference.get((sheet_index, reference))
+        if not items:
+            return False
+        self._remove_items(list(items))
+        return True
 
-            # Create or update net for this wire
-            # Always create a net for the wire, even if no pins connect yet
-            # (labels, junctions, or hierarchical connections may merge it later)
-            if connected_pins:
-                self._add_wire_to_net(wire, connected_pins, wire_points)
-            else:
-                # Create net for wire without pins (will be merged via labels/junctions)
-                net = Net()
-                net.wires.add(wire.uuid)
-                for point in wire_points:
-                    net.points.add((point.x, point.y))
-                    self._point_to_net[(point.x, point.y)] = net
-                self.nets.append(net)
-                logger.debug(f"  Created net for wire {wire.uuid} without pins")
-
-    def _add_wire_to_net(self, wire: Wire, pins: Set[PinConnection], wire_points: List[Point]):
-        """
-        Add wire and its connected pins to a net (create new or merge existing).
-
-        Args:
-            wire: Wire object
-            pins: Set of pins connected to this wire
-            wire_points: Points along the wire
-        """
-        # Check if any of these pins are already in a net
-        # Use list instead of set since Net objects are mutable (not hashable)
-        existing_nets = []
-        for pin in pins:
-            if pin in self._pin_to_net:
-                net = self._pin_to_net[pin]
-                if net not in existing_nets:
-                    existing_nets.append(net)
-
-        if existing_nets:
-            # Merge all existing nets into the first one
-            primary_net = existing_nets.pop()
-            for other_net in existing_nets:
-                primary_net.merge(other_net)
-                self.nets.remove(other_net)
-
-            # Add new pins and wire to primary net
-            for pin in pins:
-                primary_net.add_pin(pin)
-                self._pin_to_net[pin] = primary_net
-
-            primary_net.wires.add(wire.uuid)
-            for point in wire_points:
-                primary_net.points.add((point.x, point.y))
-                self._point_to_net[(point.x, point.y)] = primary_net
-        else:
-            # Create new net
-            net = Net()
-            for pin in pins:
-                net.add_pin(pin)
-                self._pin_to_net[pin] = net
+    def _check_sheet(self, sheet_index: int) -> None:
+        """Reject incremental updates on sheets that were never analyzed."""
+        if not 0 <= sheet_index < len(self._grids):
+            raise ValueError(
+                f"Sheet {sheet_index} has not been analyzed; call analyze() before "
+                f"incremental updates"
+            )
 
-            net.wires.add(wire.uuid)
-            for point in wire_points:
-                net.points.add((point.x, point.y))
-                self._point_to_net[(point.x, point.y)] = net
+    def _build_pin_positions(self, schematic) -> Dict[PinConnection, Point]:
+        """
+        Build mapping of all component pins to their absolute positions.
 
-            self.nets.append(net)
-            logger.debug(f"  Created new {net}")
+        Args:
+            schematic: Schematic to analyze
 
-    def _merge_junction_nets(self, schematic):
+        Returns:
+            Dict mapping PinConnection to absolute Point
         """
-        Merge nets that are connected by junction points.
+        from .pin_utils import list_pins_batch
 
-        Also includes wires at the junction that don't connect to pins
-        (e.g., test point taps, voltage monitoring points).
+        # Transformed per lib_id in bulk when NumPy is available
+        components = list(schematic.components)
+        pin_positions = {}
+        for component, pins in zip(components, list_pins_batch(components)):
+            for pin_number, pin_position in pins:
+                if pin_position is not None:
+                    pin_conn = PinConnection(component.reference, pin_number, pin_position)
+                    pin_positions[pin_conn] = pin_position
+        return pin_positions
+
+    def _component_pin_positions(self, component) -> Dict[PinConnection, Point]:
+        """
+        Build mapping of one component's pins to their absolute positions.
 
         Args:
-            schematic: Schematic to analyze
+            component: Component to inspect
+
+        Returns:
+            Dict mapping PinConnection to absolute Point
         """
-        for junction in schematic.junctions:
-            junc_pos = junction.position
+        from .pin_utils import list_component_pins
 
-            # Find all nets that have points at this junction position
-            nets_at_junction = []
+        pin_positions = {}
+        for pin_number, pin_position in list_component_pins(component):
+            if pin_position is not None:
+                pin_conn = PinConnection(
+                    reference=component.reference, pin_number=pin_number, position=pin_position
+                )
+                pin_positions[pin_conn] = pin_position
+                logger.debug(f"  {pin_conn}")
 
-            for net in self.nets:
-                for point in net.points:
-                    if points_equal(Point(point[0], point[1]), junc_pos, self.tolerance):
-                        if net not in nets_at_junction:  # Avoid duplicates
-                            nets_at_junction.append(net)
-                        break
+        return pin_positions
 
-            # Also find wires at this junction that aren't in any net yet
-            # (e.g., tap wires that don't connect to component pins)
-            unconnected_wires = []
-            for wire in schematic.wires:
-                # Check if wire has a point at junction
-                wire_at_junction = False
-                for wire_point in wire.points:
-                    if points_equal(wire_point, junc_pos, self.tolerance):
-                        wire_at_junction = True
-                        break
+    def _add_sheet(self, schematic) -> List[_GraphItem]:
+        """
+        Snap one sheet's connectable items onto a new point grid.
 
-                if wire_at_junction:
-                    # Check if this wire is already in a net
-                    wire_in_net = False
-                    for net in nets_at_junction:
-                        if wire.uuid in net.wires:
-                            wire_in_net = True
-                            break
+        Items at the same position share a node and all points of a wire are
+        unioned together.
 
-                    if not wire_in_net:
-                        unconnected_wires.append(wire)
+        Args:
+            schematic: Schematic to add
 
-            # If we have nets at junction, merge them and add unconnected wires
-            if len(nets_at_junction) >= 1:
-                primary_net = nets_at_junction[0]
+        Returns:
+            Items created for the sheet, in insertion order
+        """
+        sheet = len(self._grids)
+        self._grids.append(PointGrid(self._phys, self.tolerance))
+        self._segment_indexes.append(SegmentIndex(self.tolerance))
+
+        power_values = {
+            component.reference: component.value
+            for component in schematic.components
+            if component.lib_id.startswith("power:")
+        }
+
+        items = [
+            self._new_pin(sheet, pin_conn, position, power_values.get(pin_conn.reference))
+            for pin_conn, position in self._build_pin_positions(schematic).items()
+        ]
 
-                # Merge other nets
-                for other_net in nets_at_junction[1:]:
-                    primary_net.merge(other_net)
+        for wire in schematic.wires:
+            if len(wire.points) < 2:
+                logger.warning(f"Wire {wire.uuid} has < 2 points, skipping")
+                continue
+            items.append(self._new_item(_WIRE, sheet, wire.uuid, wire.points))
 
-                    # Update all pin mappings
-                    for pin in other_net.pins:
-                        self._pin_to_net[pin] = primary_net
+        for junction in schematic.junctions:
+            items.append(self._new_item(_JUNCTION, sheet, junction.uuid, [junction.position]))
+
+        for label in schematic.labels:
+            label_type = getattr(getattr(label, "_data", None), "label_type", None)
+            if label_type == LabelType.LOCAL:
+                items.append(
+                    self._new_item(_LABEL, sheet, label.uuid, [label.position], label.text)
+                )
+            elif label_type == LabelType.GLOBAL:
+                items.append(
+                    self._new_item(_GLOBAL_LABEL, sheet, label.uuid, [label.position], label.text)
+                )
+
+        # Global labels added with Schematic.add_global_label() or parsed from file
+        data = getattr(schematic, "_data", None)
+        for label in data.get("global_label", []) if isinstance(data, dict) else []:
+            position = Point(label["at"][0], label["at"][1])
+            items.append(
+                self._new_item(_GLOBAL_LABEL, sheet, label.get("uuid"), [position], label["text"])
+            )
+
+        for label in getattr(schematic, "hierarchical_labels", []):
+            item = self._new_item(_HIER_LABEL, sheet, label.uuid, [label.position], label.text)
+            self._hier_labels.append(item)
+            items.append(item)
+
+        return items
+
+    def _new_pin(
+        self, sheet: int, pin_conn: PinConnection, position: Point, power_value: Optional[str]
+    ) -> _GraphItem:
+        """Create and snap a pin item, indexed by reference for removal."""
+        item = self._new_item(_PIN, sheet, pin_conn, [position], power_value)
+        self._pins_by_reference[(sheet, pin_conn.reference)].append(item)
+        return item
+
+    def _new_item(
+        self, kind: str, sheet: int, key: Any, points: List[Point], name: Optional[str] = None
+    ) -> _GraphItem:
+        """Create an item, register it and snap it onto its sheet's grid."""
+        self._seq += 1
+        item = _GraphItem(kind, sheet, key, list(points), self._seq, name)
+        self._items[(kind, sheet, key)] = item
+
+        index = self._segment_indexes[sheet]
+        if kind == _WIRE:
+            for start, end in zip(item.points, item.points[1:]):
+                index.add_segment(item, start, end)
+        elif kind == _JUNCTION:
+            index.add_point(item, item.points[0])
+
+        self._place(item)
+        return item
+
+    def _new_sheet_net(
+        self, sheet: int, index: int, local: SheetNet, references: Dict[str, Dict[str, str]]
+    ) -> _GraphItem:
+        """Create the graph node standing for one local net of a sheet instance."""
+        path = self._sheet_paths[sheet]
+        pins = [
+            PinConnection(
+                references.get(pin.reference, {}).get(path, pin.reference),
+                pin.pin_number,
+                pin.position,
+            )
+            for pin in local.pins
+        ]
+        self._seq += 1
+        item = _GraphItem(
+            _SHEET_NET,
+            sheet,
+            (path, index),
+            [],
+            self._seq,
+            local.powers[0] if local.powers else None,
+            data=(local, pins),
+        )
+        self._place(item)
+        return item
+
+    def _sync_logic(self) -> None:
+        """Keep the logical set in step with nodes created in the physical one."""
+        while len(self._logic) < len(self._phys):
+            node = self._logic.make()
+            self._net_nodes[node] = [node]
+
+    def _place(self, item: _GraphItem) -> None:
+        """Snap an item's points onto the grid and join them."""
+        if item.kind == _SHEET_NET:
+            # Off-grid node, kept across re-placement so sheet links stay valid
+            if not item.nodes:
+                item.nodes = [self._phys.make()]
+                self._sync_logic()
+            node = item.nodes[0]
+            self._group_items.setdefault(self._phys.find(node), []).append(item)
+            self._net_items.setdefault(self._logic.find(node), []).append(item)
+            return
 
-                    # Update all point mappings
-                    for point in other_net.points:
-                        self._point_to_net[point] = primary_net
+        grid = self._grids[item.sheet]
+        nodes = []
+        for point in item.points:
+            nodes.append(grid.node(point))
+            self._sync_logic()
+
+        first = nodes[0]
+        for node in nodes[1:]:
+            self._phys.union(first, node)
+        item.nodes = nodes
+        self._group_items.setdefault(self._phys.find(first), []).append(item)
+        self._net_items.setdefault(self._logic.find(first), []).append(item)
+
+        # T-connections: a junction on the interior of a wire joins it
+        index = self._segment_indexes[item.sheet]
+        if item.kind == _WIRE:
+            for start, end in zip(item.points, item.points[1:]):
+                for junction in index.points_on(start, end):
+                    if junction.nodes:
+                        self._phys.union(first, junction.nodes[0])
+        elif item.kind == _JUNCTION:
+            for wire in index.segments_at(item.points[0]):
+                if wire.nodes:
+                    self._phys.union(first, wire.nodes[0])
+
+    def _merge_groups(self, root: int, absorbed: int) -> None:
+        """Physical union callback: move members and join the logical sets."""
+        items = self._group_items.pop(absorbed, None)
+        if items:
+            self._group_items.setdefault(root, []).extend(items)
+        self._logic.union(root, absorbed)
+
+    def _merge_nets(self, root: int, absorbed: int) -> None:
+        """Logical union callback: move members and flag stale nets."""
+        items = self._net_items.pop(absorbed, None)
+        if items:
+            self._net_items.setdefault(root, []).extend(items)
+        self._net_nodes[root].extend(self._net_nodes.pop(absorbed))
+        if root in self._root_codes or absorbed in self._root_codes:
+            self._dirty_roots.update((root, absorbed))
+
+    def _group_attached(self, node: int) -> bool:
+        """
+        Check whether a node's physical group forms a net.
 
-                    self.nets.remove(other_net)
+        A group forms a net when it contains a wire, a child sheet net, at
+        least two pins, or a pin with a label on it. Lone pins and labels
+        floating in free space stay unconnected.
 
-                # Add unconnected wires to the primary net
-                for wire in unconnected_wires:
-                    primary_net.wires.add(wire.uuid)
-                    for point in wire.points:
-                        primary_net.points.add((point.x, point.y))
-                        self._point_to_net[(point.x, point.y)] = primary_net
-                    logger.debug(f"Added unconnected wire {wire.uuid[:8]} to net at junction")
+        Args:
+            node: Any node of the group
 
-                primary_net.junctions.add(junction.uuid)
+        Returns:
+            True if the group is attached
+        """
+        pins = 0
+        labelled = False
+        for item in self._group_items.get(self._phys.find(node), ()):
+            if item.kind in (_WIRE, _SHEET_NET):
+                return True
+            if item.kind == _PIN:
+                pins += 1
+                if pins > 1:
+                    return True
+            elif item.kind in (_LABEL, _GLOBAL_LABEL, _HIER_LABEL):
+                labelled = True
+        return pins > 0 and labelled
+
+    def _update(self, items: List[_GraphItem]) -> None:
+        """Connect freshly placed items and publish the changed nets."""
+        self._connect(items)
+        if self._dropped_codes:
+            self.nets[:] = [net for net in self.nets if net.code not in self._dropped_codes]
+            self._dropped_codes.clear()
+
+    def _remove_items(self, removed: List[_GraphItem]) -> None:
+        """
+        Remove items and re-split the nets that contained them.
+
+        Each affected logical set is reset to singletons and its surviving
+        members are placed and connected again; other nets are untouched.
 
-    def _merge_label_nets(self, schematic):
+        Args:
+            removed: Items to remove
+        """
+        removed_ids = {id(item) for item in removed}
+        for item in removed:
+            key = (item.kind, item.sheet, item.key)
+            if self._items.get(key) is item:
+                del self._items[key]
+            self._segment_indexes[item.sheet].remove(item)
+            if item.kind == _PIN:
+                pins = self._pins_by_reference.get((item.sheet, item.key.reference))
+                if pins is not None:
+                    pins[:] = [pin for pin in pins if pin is not item]
+                    if not pins:
+                        del self._pins_by_reference[(item.sheet, item.key.reference)]
+
+        survivors: List[_GraphItem] = []
+        for root in {self._logic.find(item.nodes[0]) for item in removed}:
+            self._drop_net(root)
+            nodes = self._net_nodes.pop(root)
+            survivors.extend(
+                item for item in self._net_items.pop(root, ()) if id(item) not in removed_ids
+            )
+
+            self._phys.reset(nodes)
+            self._logic.reset(nodes)
+            for node in nodes:
+                self._group_items.pop(node, None)
+                self._net_items.pop(node, None)
+                self._net_nodes[node] = [node]
+
+            region = set(nodes)
+            for anchors in (self._label_anchors, self._global_anchors, self._power_anchors):
+                for anchor_key in [k for k, node in anchors.items() if node in region]:
+                    del anchors[anchor_key]
+
+        survivors.sort(key=lambda item: item.seq)
+        for item in survivors:
+            self._place(item)
+        self._update(survivors)
+
+    def _connect(self, items: List[_GraphItem]) -> None:
         """
-        Merge nets that are connected by labels with the same name.
+        Apply label, sheet pin and power unions for items and build their nets.
 
         Args:
-            schematic: Schematic to analyze
+            items: Placed items whose nets need (re)building
         """
-        # Process local labels only (global labels handled separately)
-        local_labels = [
-            label
-            for label in schematic.labels
-            if hasattr(label, "_data") and label._data.label_type == LabelType.LOCAL
+        attached_cache: Dict[int, bool] = {}
+
+        def attached(node: int) -> bool:
+            root = self._phys.find(node)
+            if root not in attached_cache:
+                attached_cache[root] = self._group_attached(root)
+            return attached_cache[root]
+
+        # Whole groups: a new wire can attach pins and labels placed earlier
+        groups = {self._phys.find(item.nodes[0]) for item in items}
+        linked = [
+            member
+            for group in groups
+            if attached(group)
+            for member in self._group_items.get(group, ())
         ]
 
-        for label in local_labels:
-            label_pos = label.position
+        # Merge nets connected by local labels, then by global labels
+        self._merge_label_nets(linked)
+        self._process_global_labels(linked)
 
-            # Find which net this label is on
-            net_for_label = None
-            for net in self.nets:
-                for point in net.points:
-                    if points_equal(Point(point[0], point[1]), label_pos, self.tolerance):
-                        net_for_label = net
-                        break
-                if net_for_label:
-                    break
+        # Process hierarchical connections (sheet pins ↔ hierarchical labels)
+        self._process_hierarchical_connections(attached)
 
-            if net_for_label:
-                # Set or merge net name
-                if not net_for_label.name:
-                    net_for_label.name = label.text
-                    logger.debug(f"Named {net_for_label} from label")
+        # Process power symbols (implicit global connections across ALL sheets)
+        self._process_power_symbols(linked)
 
-                net_for_label.labels.add(label.uuid)
-                self._label_name_to_nets[label.text].append(net_for_label)
+        # Materialize one Net per touched connected set
+        roots: Dict[int, None] = {}
+        for item in items:
+            roots.setdefault(self._logic.find(item.nodes[0]))
+        for root in self._dirty_roots:
+            self._drop_net(root)
+            roots.setdefault(self._logic.find(root))
+        self._dirty_roots.clear()
 
-        # Merge nets with the same label name
-        for label_name, nets_with_label in self._label_name_to_nets.items():
-            if len(nets_with_label) > 1:
-                logger.debug(f"Label '{label_name}' connects {len(nets_with_label)} nets")
+        built = []
+        for root in roots:
+            self._drop_net(root)
+            if attached(root):
+                built.append(self._build_net(root))
 
-                primary_net = nets_with_label[0]
-                for other_net in nets_with_label[1:]:
-                    if other_net in self.nets:  # Check if not already merged
-                        primary_net.merge(other_net)
+        # Auto-generate net names for unnamed nets
+        self._generate_net_names(built)
 
-                        # Update mappings
-                        for pin in other_net.pins:
-                            self._pin_to_net[pin] = primary_net
-                        for point in other_net.points:
-                            self._point_to_net[point] = primary_net
+    def _merge_label_nets(self, items: List[_GraphItem]) -> None:
+        """
+        Merge nets on one sheet that carry local labels with the same name.
 
-                        self.nets.remove(other_net)
+        Args:
+            items: Attached items to link
+        """
+        for item in items:
+            if item.kind != _LABEL:
+                continue
+            node = item.nodes[0]
+            anchor = self._label_anchors.setdefault((item.sheet, item.name), node)
+            if anchor != node:
+                self._logic.union(anchor, node)
 
-    def _process_power_symbols(self, schematic):
+    def _process_power_symbols(self, items: List[_GraphItem]) -> None:
         """
         Process power symbols and create implicit global connections.
 
@@ -417,81 +1584,157 @@ class ConnectivityAnalyzer:
         even if they're not physically wired together.
 
         Args:
-            schematic: Schematic to analyze
+            items: Attached items to link
         """
-        # Group power symbols by their value property
-        power_symbol_nets_by_value = defaultdict(list)
-
-        for component in schematic.components:
-            # Identify power symbols by lib_id pattern
-            if component.lib_id.startswith("power:"):
-                power_value = component.value
-
-                logger.debug(f"Found power symbol: {component.reference} (value={power_value})")
-
-                # Find the net this power symbol is connected to
-                # Power symbols have a single pin (usually pin "1")
-                power_pin_conn = None
-                for pin_conn in self._pin_to_net.keys():
-                    if pin_conn.reference == component.reference:
-                        power_pin_conn = pin_conn
-                        break
-
-                if power_pin_conn:
-                    net = self._pin_to_net[power_pin_conn]
-                    power_symbol_nets_by_value[power_value].append(net)
-                    logger.debug(f"  Power symbol {component.reference} on net '{net.name}'")
+        for item in items:
+            if item.kind == _PIN and item.name is not None:
+                values: Iterable[str] = (item.name,)
+            elif item.kind == _SHEET_NET:
+                values = item.data[0].powers
+            else:
+                continue
+            node = item.nodes[0]
+            for value in values:
+                anchor = self._power_anchors.setdefault(value, node)
+                if anchor != node and self._logic.find(anchor) != self._logic.find(node):
+                    logger.debug(f"Merging nets for power symbol '{value}'")
+                    self._logic.union(anchor, node)
+
+    def _drop_net(self, root: int) -> None:
+        """Forget the materialized net of a logical root, if any."""
+        code = self._root_codes.pop(root, None)
+        if code is None:
+            return
 
-        # Merge all nets with the same power symbol value
-        for power_value, nets_to_merge in power_symbol_nets_by_value.items():
-            if len(nets_to_merge) > 1:
-                logger.debug(f"Merging {len(nets_to_merge)} nets for power symbol '{power_value}'")
+        net = self._nets_by_code.pop(code)
+        for pin in self._net_pins.pop(code):
+            key = (pin.reference, pin.pin_number)
+            if self._pin_net_codes.get(key) == code:
+                del self._pin_net_codes[key]
+        for point in net.points:
+            if self._point_to_net.get(point) is net:
+                del self._point_to_net[point]
+        for label_name in self._root_label_names.pop(root, ()):
+            nets = [other for other in self._label_name_to_nets[label_name] if other is not net]
+            if nets:
+                self._label_name_to_nets[label_name] = nets
+            else:
+                del self._label_name_to_nets[label_name]
+        self._dropped_codes.add(code)
 
-                # Merge all nets into the first one
-                primary_net = nets_to_merge[0]
+    def _build_net(self, root: int) -> Net:
+        """
+        Create the Net for one logical root from its member items.
 
-                # Set the net name from power symbol value
-                primary_net.name = power_value
+        Power symbol values take precedence over global label names, and
+        those over local label names; the earliest inserted item of each kind
+        wins.
 
-                for other_net in nets_to_merge[1:]:
-                    if other_net in self.nets:  # Check if not already merged
-                        primary_net.merge(other_net)
+        Args:
+            root: Logical root node
 
-                        # Update mappings
-                        for pin in other_net.pins:
-                            self._pin_to_net[pin] = primary_net
-                        for point in other_net.points:
-                            self._point_to_net[point] = primary_net
+        Returns:
+            The new Net
+        """
+        net = Net(code=self._next_code)
+        self._next_code += 1
+        power_name = None
+        global_names: Dict[str, None] = {}
+        label_names: Dict[str, None] = {}
+
+        for item in sorted(self._net_items.get(root, ()), key=lambda item: item.seq):
+            kind = item.kind
+            if kind == _WIRE:
+                net.wires.add(item.key)
+                for point in item.points:
+                    net.points.add((point.x, point.y))
+                    self._point_to_net[(point.x, point.y)] = net
+            elif kind == _PIN:
+                net.add_pin(item.key)
+                self._pin_net_codes[(item.key.reference, item.key.pin_number)] = net.code
+                self._point_to_net[(item.key.position.x, item.key.position.y)] = net
+                if power_name is None:
+                    power_name = item.name
+            elif kind == _JUNCTION:
+                net.junctions.add(item.key)
+            elif kind == _LABEL:
+                net.labels.add(item.key)
+                label_names.setdefault(item.name)
+            elif kind == _GLOBAL_LABEL:
+                net.labels.add(item.key)
+                global_names.setdefault(item.name)
+            elif kind == _SHEET_NET:
+                local, pins = item.data
+                for pin in pins:
+                    net.add_pin(pin)
+                    self._pin_net_codes[(pin.reference, pin.pin_number)] = net.code
+                    self._point_to_net[(pin.position.x, pin.position.y)] = net
+                for point in local.points:
+                    net.points.add(point)
+                    self._point_to_net[point] = net
+                net.wires.update(local.wires)
+                net.junctions.update(local.junctions)
+                net.labels.update(local.labels)
+                if power_name is None:
+                    power_name = item.name
+                for label_name in local.global_names:
+                    global_names.setdefault(label_name)
+                for label_name in local.label_names:
+                    label_names.setdefault(label_name)
+
+        label_names = {**global_names, **label_names}
+        net.name = power_name or next(iter(label_names), None)
+        for label_name in label_names:
+            self._label_name_to_nets[label_name].append(net)
+
+        self._root_codes[root] = net.code
+        self._root_label_names[root] = set(label_names)
+        self._nets_by_code[net.code] = net
+        self._net_pins[net.code] = sorted(net.pins, key=lambda p: (p.reference, p.pin_number))
+        self.nets.append(net)
+        return net
+
+    def _process_global_labels(self, items: List[_GraphItem]) -> None:
+        """
+        Merge nets that carry global labels with the same name, on any sheet.
 
-                        self.nets.remove(other_net)
-            elif len(nets_to_merge) == 1:
-                # Single power symbol - just name the net
-                nets_to_merge[0].name = power_value
+        Each name keeps the node of its first attached label as an anchor, so
+        every label is merged with a single union instead of being compared
+        with every other net.
 
-    def _process_global_labels(self, schematic):
+        Args:
+            items: Attached items to link
+        """
+        for item in items:
+            if item.kind == _GLOBAL_LABEL:
+                names: Iterable[str] = (item.name,)
+            elif item.kind == _SHEET_NET:
+                names = item.data[0].global_names
+            else:
+                continue
+            node = item.nodes[0]
+            for name in names:
+                anchor = self._global_anchors.setdefault(name, node)
+                if anchor != node and self._logic.find(anchor) != self._logic.find(node):
+                    logger.debug(f"Merging nets for global label '{name}'")
+                    self._logic.union(anchor, node)
+
+    def _generate_net_names(self, nets: Optional[List[Net]] = None):
         """
-        Process global labels (cross-schematic connections).
+        Generate names for nets that don't have explicit names.
 
         Args:
-            schematic: Schematic to analyze
+            nets: Nets to name (default: all nets)
         """
-        # TODO: Implement global label handling
-        # Global labels with same name should connect across schematics
-        pass
-
-    def _generate_net_names(self):
-        """Generate names for nets that don't have explicit names."""
-        unnamed_counter = 1
-
-        for net in self.nets:
+        for net in self.nets if nets is None else nets:
             if not net.name:
                 # Try to name from connected component pins
                 if net.pins:
-                    first_pin = next(iter(net.pins))
+                    first_pin = min(net.pins, key=lambda p: (p.reference, p.pin_number))
                     net.name = f"Net-({first_pin.reference}-Pad{first_pin.pin_number})"
                 else:
-                    net.name = f"Net-(unnamed-{unnamed_counter})"
-                    unnamed_counter += 1
+                    net.name = f"Net-(unnamed-{self._unnamed_counter})"
+                    self._unnamed_counter += 1
 
     def are_connected(self, ref1: str, pin1: str, ref2: str, pin2: str) -> bool:
         """
@@ -506,164 +1749,481 @@ class ConnectivityAnalyzer:
         Returns:
             True if pins are on the same net, False otherwise
         """
-        # Find pins in the connectivity graph
-        pin_conn1 = None
-        pin_conn2 = None
+        code = self._pin_net_codes.get((ref1, pin1))
+        return code is not None and code == self._pin_net_codes.get((ref2, pin2))
 
-        for pin in self._pin_to_net.keys():
-            if pin.reference == ref1 and pin.pin_number == pin1:
-                pin_conn1 = pin
-            if pin.reference == ref2 and pin.pin_number == pin2:
-                pin_conn2 = pin
-
-        if not pin_conn1 or not pin_conn2:
-            return False
+    def get_net_code(self, reference: str, pin_number: str) -> Optional[int]:
+        """
+        Get the code of the net connected to a specific pin.
 
-        # Check if both pins are in the same net
-        net1 = self._pin_to_net.get(pin_conn1)
-        net2 = self._pin_to_net.get(pin_conn2)
+        Args:
+            reference: Component reference
+            pin_number: Pin number
 
-        return net1 is not None and net1 is net2
+        Returns:
+            Net code if pin is connected, None otherwise
+        """
+        return self._pin_net_codes.get((reference, pin_number))
 
-    def _load_hierarchical_schematics(self, root_schematic):
+    def get_net_by_code(self, code: int) -> Optional[Net]:
         """
-        Load root schematic and all child schematics.
+        Get a net by its code.
 
         Args:
-            root_schematic: Root schematic object
+            code: Net code from Net.code or get_net_code()
 
         Returns:
-            List of all schematics (root + children)
+            Net object, or None if no current net has that code
         """
-        from pathlib import Path
+        return self._nets_by_code.get(code)
 
-        schematics = [root_schematic]
+    def get_net_pins(self, code: int) -> List[PinConnection]:
+        """
+        Get the pins of a net sorted by (reference, pin number).
 
-        # Check if root schematic has hierarchical sheets
-        if not hasattr(root_schematic, "_data") or "sheets" not in root_schematic._data:
-            return schematics
+        Args:
+            code: Net code
 
-        sheets = root_schematic._data.get("sheets", [])
+        Returns:
+            List of PinConnection (empty for unknown codes)
+        """
+        return list(self._net_pins.get(code, ()))
 
-        # Load each child schematic
-        root_path = Path(root_schematic.file_path) if root_schematic.file_path else None
+    def get_sheet_instances(self) -> List[Tuple[str, str]]:
+        """
+        Get the analyzed sheet instances, root sheet first.
 
-        for sheet in sheets:
-            sheet_filename = sheet.get("filename")
-            if not sheet_filename:
-                continue
+        Returns:
+            (instance path, sheet name path) per instance, e.g.
+            ("/<root uuid>/<sheet uuid>", "/Child Circuit/")
+        """
+        return list(zip(self._sheet_paths, self._sheet_names))
 
-            # Build path to child schematic
-            if root_path:
-                child_path = root_path.parent / sheet_filename
-            else:
-                child_path = Path(sheet_filename)
-
-            if child_path.exists():
-                try:
-                    # Import Schematic class - use absolute import to avoid circular dependency
-                    import kicad_sch_api as ksa
-
-                    child_sch = ksa.Schematic.load(str(child_path))
-                    schematics.append(child_sch)
-                    logger.info(f"Loaded child schematic: {sheet_filename}")
-                except Exception as e:
-                    logger.warning(f"Could not load child schematic {sheet_filename}: {e}")
-            else:
-                logger.warning(f"Child schematic not found: {child_path}")
+    def get_components(self) -> List[SheetComponent]:
+        """
+        Get the symbols of every analyzed sheet instance.
 
-        return schematics
+        Root sheet symbols are read from the schematic as it is now, so
+        incremental edits are included; child sheet symbols carry the
+        reference of their instance.
 
-    def _process_hierarchical_connections(self, root_schematic, all_schematics):
+        Returns:
+            List of SheetComponent, root sheet first
         """
-        Process hierarchical connections between parent and child sheets.
+        if self._schematic is None:
+            return []
+        root = [
+            replace(component, sheet_path=self._sheet_paths[0])
+            for component in self._sheet_components(self._schematic)
+        ]
+        return root + self._instance_components
 
-        Connects sheet pins in parent to hierarchical labels in child sheets.
+    def get_pin_types(self, references: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get the library pin types of a few components by reference.
+
+        Cheaper than get_components() when only the components on some nets
+        are needed: root sheet symbols are looked up by reference and child
+        sheet symbols come from a table built once per analysis.
+
+        Args:
+            references: Component references
+
+        Returns:
+            Map of reference to {pin number: pin type} for the references found
+        """
+        if self._schematic is None:
+            return {}
+        if self._instance_pin_types is None:
+            self._instance_pin_types = {}
+            for component in self._instance_components:
+                pins = self._instance_pin_types.setdefault(component.reference, {})
+                pins.update(component.pin_types)
+
+        from .pin_utils import _symbol_local_pins
+
+        pin_types: Dict[str, Dict[str, str]] = {}
+        for reference in references:
+            component = self._schematic.components.get(reference)
+            if component is not None:
+                pin_types[reference] = {
+                    pin.number: pin.pin_type.value for pin in _symbol_local_pins(component)
+                }
+            elif reference in self._instance_pin_types:
+                pin_types[reference] = self._instance_pin_types[reference]
+        return pin_types
+
+    def _sheet_components(self, schematic) -> List[SheetComponent]:
+        """
+        Describe the symbols placed on one sheet.
 
         Args:
-            root_schematic: Root schematic with hierarchical sheets
-            all_schematics: List of all schematics (root + children)
+            schematic: Sheet to describe
+
+        Returns:
+            SheetComponent per symbol, with references as stored in the file
         """
-        from pathlib import Path
+        from .pin_utils import _symbol_local_pins
 
-        if not hasattr(root_schematic, "_data") or "sheets" not in root_schematic._data:
-            return
+        pin_types: Dict[str, Dict[str, str]] = {}  # Per lib_id
+        components = []
+        for component in schematic.components:
+            lib_id = component.lib_id
+            if lib_id not in pin_types:
+                pin_types[lib_id] = {
+                    pin.number: pin.pin_type.value for pin in _symbol_local_pins(component)
+                }
+            components.append(
+                SheetComponent(
+                    reference=component.reference,
+                    value=component.value,
+                    lib_id=lib_id,
+                    uuid=getattr(component, "uuid", ""),
+                    footprint=getattr(component, "footprint", None) or None,
+                    on_board=getattr(component, "on_board", True),
+                    pin_types=pin_types[lib_id],
+                )
+            )
+        return components
+
+    def _root_sheet_entries(self, schematic) -> List[Tuple[str, str, str, List[Tuple[str, Any]]]]:
+        """
+        List the sheets placed on the root schematic.
 
-        sheets = root_schematic._data.get("sheets", [])
+        Args:
+            schematic: Root schematic
 
-        for sheet_data in sheets:
-            sheet_filename = sheet_data.get("filename")
-            sheet_pins = sheet_data.get("pins", [])
+        Returns:
+            (sheet UUID, sheet name, filename, [(pin name, pin position)]) per sheet
+        """
+        data = getattr(schematic, "_data", None)
+        if not isinstance(data, dict):
+            return []
 
-            if not sheet_filename or not sheet_pins:
+        entries = []
+        for index, sheet in enumerate(data.get("sheets", [])):
+            filename = sheet.get("filename")
+            if not filename:
                 continue
+            pins = [
+                (pin["name"], Point(pin["position"]["x"], pin["position"]["y"]))
+                for pin in sheet.get("pins", [])
+                if pin.get("name") and pin.get("position")
+            ]
+            sheet_uuid = sheet.get("uuid") or f"sheet{index}"
+            entries.append((sheet_uuid, sheet.get("name") or sheet_uuid, filename, pins))
+        return entries
+
+    def _add_sheet_instances(
+        self,
+        sheets: List[Tuple[str, str, str, List[Tuple[str, Any]]]],
+        base_dir: Optional[Path],
+        parent: int,
+        chain: frozenset,
+    ) -> List[_GraphItem]:
+        """
+        Add child sheet instances, recursively, from their file summaries.
+
+        Each instance adds one node per local net of its sheet file and links
+        the parent's sheet pins to the matching hierarchical label ports.
 
-            # Find the child schematic
-            child_sch = None
-            for sch in all_schematics:
-                if sch.file_path and Path(sch.file_path).name == sheet_filename:
-                    child_sch = sch
-                    break
+        Args:
+            sheets: (sheet UUID, sheet name, filename, [(pin name, anchor)])
+                entries, where an anchor is a root sheet position or a parent
+                instance node
+            base_dir: Directory of the parent sheet file
+            parent: Sheet index of the parent instance
+            chain: Resolved files on the current branch, to stop recursion
 
-            if not child_sch:
-                logger.warning(f"Child schematic not found for sheet: {sheet_filename}")
+        Returns:
+            Items created for the instances
+        """
+        items: List[_GraphItem] = []
+        for sheet_uuid, sheet_name, filename, pins in sheets:
+            child_path = base_dir / filename if base_dir else Path(filename)
+            resolved = child_path.resolve()
+            if resolved in chain:
+                logger.warning(f"Recursive sheet reference to {filename}, skipping")
                 continue
 
-            # For each sheet pin, find matching hierarchical label in child
-            for pin_data in sheet_pins:
-                pin_name = pin_data.get("name")
-                pin_position = pin_data.get("position")
+            summary = self._sheet_summary(child_path)
+            if summary is None:
+                continue
 
-                if not pin_name or not pin_position:
+            sheet = len(self._sheet_paths)
+            path = f"{self._sheet_paths[parent].rstrip('/')}/{sheet_uuid}"
+            self._sheet_paths.append(path)
+            self._sheet_names.append(f"{self._sheet_names[parent]}{sheet_name}/")
+            self._instance_components.extend(
+                replace(
+                    component,
+                    reference=summary.references.get(component.reference, {}).get(
+                        path, component.reference
+                    ),
+                    sheet_path=path,
+                    sheet_names=self._sheet_names[sheet],
+                )
+                for component in summary.components
+            )
+            nets = [
+                self._new_sheet_net(sheet, index, local, summary.references)
+                for index, local in enumerate(summary.nets)
+            ]
+            items.extend(nets)
+
+            for pin_name, anchor in pins:
+                port = summary.ports.get(pin_name)
+                if anchor is None or port is None:
+                    logger.debug(f"No net found at sheet pin '{pin_name}'")
                     continue
+                self._sheet_links.append((anchor, nets[port].nodes[0], pin_name))
+
+            nested = [
+                (
+                    nested_uuid,
+                    nested_name,
+                    nested_filename,
+                    [
+                        (name, None if index is None else nets[index].nodes[0])
+                        for name, index in nested_pins
+                    ],
+                )
+                for nested_uuid, nested_name, nested_filename, nested_pins in summary.sheets
+            ]
+            items.extend(
+                self._add_sheet_instances(nested, child_path.parent, sheet, chain | {resolved})
+            )
+        return items
+
+    def _sheet_summary(self, path: Path) -> Optional[SheetSummary]:
+        """
+        Get the local connectivity of a sheet file, analyzing it on a cache miss.
 
-                pin_pos = Point(pin_position["x"], pin_position["y"])
+        Summaries are keyed by file content and the modification times of the
+        symbol libraries it uses, so a sheet reused by many instances, or
+        unchanged between analyses, is parsed and analyzed once.
 
-                # Find net at sheet pin position in parent
-                parent_net = None
-                for net in self.nets:
-                    for point in net.points:
-                        if points_equal(Point(point[0], point[1]), pin_pos, self.tolerance):
-                            parent_net = net
-                            break
-                    if parent_net:
-                        break
+        Args:
+            path: Sheet file
 
-                if not parent_net:
-                    logger.debug(f"No net found at sheet pin '{pin_name}' position")
-                    continue
+        Returns:
+            SheetSummary, or None if the file cannot be loaded
+        """
+        key = self._summary_key(path)
+        if key is None:
+            logger.warning(f"Child schematic not found: {path}")
+            return None
+
+        summary = _sheet_summaries.get(key)
+        if summary is not None:
+            _sheet_summaries.move_to_end(key)
+            return summary
+
+        try:
+            summary = _summarize_sheet_file(type(self), self.tolerance, str(path))
+        except Exception as e:
+            logger.warning(f"Could not load child schematic {path.name}: {e}")
+            return None
+
+        logger.info(f"Analyzed child schematic: {path.name}")
+        self._store_summary(key, summary)
+        return summary
+
+    def _summary_key(self, path: Path) -> Optional[_SummaryKey]:
+        """Cache key of a sheet file's summary, or None if it cannot be read."""
+        from ..library.cache import get_symbol_cache
+
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+
+        cache = get_symbol_cache()
+        libraries = tuple(
+            (name, cache.get_library_mtime(name))
+            for name in sorted(
+                {m.decode("utf-8", "replace") for m in _LIB_ID_LIBRARY.findall(content)}
+            )
+        )
+        return (type(self), self.tolerance, hashlib.sha256(content).hexdigest(), libraries)
+
+    @staticmethod
+    def _store_summary(key: _SummaryKey, summary: SheetSummary) -> None:
+        """Cache a summary, evicting the least recently used ones."""
+        _sheet_summaries[key] = summary
+        _sheet_summaries.move_to_end(key)
+        while len(_sheet_summaries) > _SHEET_SUMMARY_CACHE_SIZE:
+            _sheet_summaries.popitem(last=False)
+
+    def _prefetch_summaries(
+        self,
+        sheets: List[Tuple[str, str, List[Tuple[str, Any]]]],
+        base_dir: Optional[Path],
+        max_workers: int,
+    ) -> None:
+        """
+        Summarize uncached child sheet files across a process pool.
 
-                # Find matching hierarchical label in child schematic
-                for hier_label in child_sch.hierarchical_labels:
-                    if hier_label.text == pin_name:
-                        label_pos = hier_label.position
-
-                        # Find net at hierarchical label position in child
-                        child_net = None
-                        for net in self.nets:
-                            for point in net.points:
-                                if points_equal(
-                                    Point(point[0], point[1]), label_pos, self.tolerance
-                                ):
-                                    child_net = net
-                                    break
-                            if child_net:
-                                break
-
-                        if child_net and child_net is not parent_net:
-                            # Merge child net into parent net
-                            logger.debug(f"Merging nets via hierarchical connection '{pin_name}'")
-                            parent_net.merge(child_net)
-
-                            # Update mappings
-                            for pin in child_net.pins:
-                                self._pin_to_net[pin] = parent_net
-                            for point in child_net.points:
-                                self._point_to_net[point] = parent_net
-
-                            self.nets.remove(child_net)
+        The hierarchy is walked level by level; the files of a level that miss
+        the cache are parsed and analyzed by worker processes, which return
+        compact SheetSummary objects. Composition afterwards runs in the parent
+        in sheet order, so results are deterministic. Files a worker fails on
+        are left to the in-process path, which reports the error.
 
-                        break
+        Args:
+            sheets: Sheet entries placed on the root
+            base_dir: Directory of the root file
+            max_workers: Maximum worker processes
+        """
+        level = [
+            base_dir / filename if base_dir else Path(filename) for _, _, filename, _ in sheets
+        ]
+        seen: Set[Path] = set()
+        pool: Optional[ProcessPoolExecutor] = None
+        try:
+            while level:
+                summaries: List[Tuple[Path, SheetSummary]] = []
+                missing: Dict[_SummaryKey, Path] = {}
+                for path in level:
+                    resolved = path.resolve()
+                    if resolved in seen:
+                        continue
+                    seen.add(resolved)
+                    key = self._summary_key(path)
+                    if key is None:
+                        continue
+                    if key in _sheet_summaries:
+                        summaries.append((path, _sheet_summaries[key]))
+                    else:
+                        missing.setdefault(key, path)
+
+                if len(missing) > 1:
+                    if pool is None:
+                        pool = ProcessPoolExecutor(max_workers=min(max_workers, len(missing)))
+                    futures = {
+                        key: pool.submit(
+                            _summarize_sheet_file, type(self), self.tolerance, str(path)
+                        )
+                        for key, path in missing.items()
+                    }
+                    for key, future in futures.items():
+                        try:
+                            summary = future.result()
+                        except Exception as e:
+                            logger.debug(f"Worker could not summarize {missing[key].name}: {e}")
+                            continue
+                        self._store_summary(key, summary)
+                        summaries.append((missing[key], summary))
+                else:
+                    for path in missing.values():
+                        summary = self._sheet_summary(path)
+                        if summary is not None:
+                            summaries.append((path, summary))
+
+                level = [
+                    path.parent / filename
+                    for path, summary in summaries
+                    for _, _, filename, _ in summary.sheets
+                ]
+        except Exception as e:
+            # Pool start-up or a broken pool: composition falls back to in-process
+            logger.warning(f"Parallel sheet analysis failed, continuing serially: {e}")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def _summarize_sheet(self, schematic) -> SheetSummary:
+        """
+        Analyze one sheet on its own and summarize its nets and ports.
+
+        Args:
+            schematic: Sheet to summarize
+
+        Returns:
+            SheetSummary of the sheet
+        """
+        local = type(self)(tolerance=self.tolerance)
+        local.analyze(schematic, hierarchical=False)
+
+        summary = SheetSummary()
+        net_index: Dict[int, int] = {}
+        for root in local._root_codes:
+            net_index[root] = len(summary.nets)
+            summary.nets.append(local._sheet_net(root))
+
+        def index_at(node: Optional[int]) -> Optional[int]:
+            return None if node is None else net_index.get(local._logic.find(node))
+
+        for label in local._hier_labels:
+            index = index_at(label.nodes[0])
+            if index is not None:
+                summary.ports.setdefault(label.name, index)
+
+        grid = local._grids[0]
+        for sheet_uuid, sheet_name, filename, pins in local._root_sheet_entries(schematic):
+            summary.sheets.append(
+                (
+                    sheet_uuid,
+                    sheet_name,
+                    filename,
+                    [(name, index_at(grid.find(pos))) for name, pos in pins],
+                )
+            )
+        summary.components = self._sheet_components(schematic)
+
+        for component in schematic.components:
+            instances = getattr(getattr(component, "_data", None), "instances", None) or []
+            paths = {inst.path: inst.reference for inst in instances if inst.reference}
+            if paths:
+                summary.references.setdefault(component.reference, {}).update(paths)
+
+        return summary
+
+    def _sheet_net(self, root: int) -> SheetNet:
+        """Collect the members of one logical root as a SheetNet."""
+        local = SheetNet()
+        for item in sorted(self._net_items.get(root, ()), key=lambda item: item.seq):
+            if item.kind == _WIRE:
+                local.wires.append(item.key)
+                local.points.extend((point.x, point.y) for point in item.points)
+            elif item.kind == _PIN:
+                local.pins.append(item.key)
+                if item.name is not None and item.name not in local.powers:
+                    local.powers.append(item.name)
+            elif item.kind == _JUNCTION:
+                local.junctions.append(item.key)
+            elif item.kind == _LABEL:
+                local.labels.append(item.key)
+                if item.name not in local.label_names:
+                    local.label_names.append(item.name)
+            elif item.kind == _GLOBAL_LABEL:
+                local.labels.append(item.key)
+                if item.name not in local.global_names:
+                    local.global_names.append(item.name)
+        return local
+
+    def _process_hierarchical_connections(self, attached: Callable[[int], bool]) -> None:
+        """
+        Process hierarchical connections between parent and child sheets.
+
+        Connects sheet pins in parent to hierarchical labels in child sheets.
+
+        Args:
+            attached: Predicate telling whether a node's group forms a net
+        """
+        for anchor, port_node, pin_name in self._sheet_links:
+            # Sheet pins on the root are looked up on its grid, which can change
+            if isinstance(anchor, Point):
+                parent_node = self._grids[0].find(anchor)
+            else:
+                parent_node = anchor
+            if parent_node is None or not attached(parent_node):
+                logger.debug(f"No net found at sheet pin '{pin_name}' position")
+                continue
+
+            if self._logic.find(parent_node) != self._logic.find(port_node):
+                logger.debug(f"Merging nets via hierarchical connection '{pin_name}'")
+                self._logic.union(parent_node, port_node)
 
     def get_net_for_pin(self, reference: str, pin_number: str) -> Optional[Net]:
         """
@@ -676,11 +2236,8 @@ class ConnectivityAnalyzer:
         Returns:
             Net object if pin is connected, None otherwise
         """
-        for pin in self._pin_to_net.keys():
-            if pin.reference == reference and pin.pin_number == pin_number:
-                return self._pin_to_net[pin]
-
-        return None
+        code = self._pin_net_codes.get((reference, pin_number))
+        return None if code is None else self._nets_by_code[code]
 
     def get_connected_pins(self, reference: str, pin_number: str) -> List[Tuple[str, str]]:
         """
@@ -693,12 +2250,12 @@ class ConnectivityAnalyzer:
         Returns:
             List of (reference, pin_number) tuples for connected pins
         """
-        net = self.get_net_for_pin(reference, pin_number)
-        if not net:
+        code = self._pin_net_codes.get((reference, pin_number))
+        if code is None:
             return []
 
         return [
             (pin.reference, pin.pin_number)
-            for pin in net.pins
+            for pin in self._net_pins[code]
             if not (pin.reference == reference and pin.pin_number == pin_number)
         ]
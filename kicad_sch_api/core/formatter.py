@@ -8,7 +8,7 @@ ensuring round-trip compatibility and professional output quality.
 import logging
 import re
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import sexpdata
 
@@ -30,6 +30,19 @@ class FormatRule:
             self.quote_indices = set()
 
 
+class FormattedElement(str):
+    """
+    Already formatted text of a top-level schematic element.
+
+    Written verbatim by ExactFormatter in place of the element's S-expression.
+    """
+
+    def __new__(cls, text: str, tag: str):
+        element = super().__new__(cls, text)
+        element.tag = tag
+        return element
+
+
 class ExactFormatter:
     """
     S-expression formatter that produces output identical to KiCAD's native formatting.
@@ -193,6 +206,8 @@ class ExactFormatter:
         """Format a single S-expression element."""
         if isinstance(element, list):
             return self._format_list(element, indent_level)
+        elif isinstance(element, FormattedElement):
+            return element
         elif isinstance(element, sexpdata.Symbol):
             return str(element)
         elif isinstance(element, str):
@@ -404,20 +419,20 @@ class ExactFormatter:
         next_indent = "\t" * (indent_level + 1)
 
         tag = str(lst[0])
-        result = f"({tag}"
+        parts = [f"({tag}"]
 
         for i, element in enumerate(lst[1:], 1):
-            if isinstance(element, list):
-                result += f"\n{next_indent}{self._format_element(element, indent_level + 1)}"
+            if isinstance(element, (list, FormattedElement)):
+                parts.append(f"\n{next_indent}{self._format_element(element, indent_level + 1)}")
             else:
                 if i in rule.quote_indices and isinstance(element, str):
                     escaped_element = self._escape_string(element)
-                    result += f' "{escaped_element}"'
+                    parts.append(f' "{escaped_element}"')
                 else:
-                    result += f" {self._format_element(element, 0)}"
+                    parts.append(f" {self._format_element(element, 0)}")
 
-        result += f"\n{indent})"
-        return result
+        parts.append(f"\n{indent})")
+        return "".join(parts)
 
     def _should_format_inline(self, lst: List[Any], rule: FormatRule) -> bool:
         """Determine if list should be formatted inline."""
@@ -464,7 +479,8 @@ class ExactFormatter:
         """
         # Check if this is a blank schematic (no components, no UUID, minimal elements)
         has_components = any(
-            isinstance(item, list)
+            isinstance(item, FormattedElement)
+            or isinstance(item, list)
             and len(item) > 0
             and str(item[0])
             in ["symbol", "wire", "junction", "text", "sheet", "polyline", "rectangle", "graphics"]
@@ -581,3 +597,92 @@ class DebugFormatter(ExactFormatter):
         """Format with debug information."""
         result = super().format(data)
         return f"; Generated by kicad-sch-api ExactFormatter\n{result}"
+
+
+class ElementTextCache:
+    """
+    Formatted text of top-level schematic elements, by section and UUID.
+
+    Saving formats an element only when its cached text was invalidated
+    (or never built); unchanged elements are written from the cache, so a
+    save costs O(changed elements) formatting plus concatenation. The text
+    depends on the element alone plus the save context (schematic UUID and
+    project name), so changing the context drops every entry.
+    """
+
+    def __init__(self, formatter: Optional[ExactFormatter] = None):
+        """
+        Initialize element text cache.
+
+        Args:
+            formatter: Formatter producing the cached text
+        """
+        self._formatter = formatter or ExactFormatter()
+        # Section -> UUID -> (text, element data it was built from)
+        self._texts: Dict[str, Dict[str, Tuple[FormattedElement, Any]]] = {}
+        self._context: Any = None
+        self.hits = 0
+        self.misses = 0
+
+    def set_context(self, context: Any) -> None:
+        """
+        Declare the save context, dropping all entries if it changed.
+
+        Args:
+            context: Hashable description of everything outside an element
+                that its text depends on
+        """
+        if context != self._context:
+            self._texts.clear()
+            self._context = context
+
+    def get(
+        self,
+        section: str,
+        uuid: str,
+        to_sexp: Callable[[], List[Any]],
+        data: Optional[Dict[str, Any]] = None,
+    ) -> FormattedElement:
+        """
+        Get the formatted text of an element, building it if not cached.
+
+        Args:
+            section: Element section (e.g., 'symbol', 'wire')
+            uuid: Element UUID
+            to_sexp: Builds the element's S-expression on a miss
+            data: Freshly built element data; when given, cached text is only
+                reused if it was built from equal data, which also catches
+                edits that were never reported
+
+        Returns:
+            Text of the element as a direct child of kicad_sch
+        """
+        texts = self._texts.setdefault(section, {})
+        entry = texts.get(uuid)
+        if entry is not None and entry[1] == data:
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        text = FormattedElement(self._formatter._format_element(to_sexp(), 1), section)
+        texts[uuid] = (text, data)
+        return text
+
+    def invalidate(self, section: str, uuid: Optional[str] = None) -> None:
+        """
+        Drop cached text.
+
+        Args:
+            section: Element section
+            uuid: Element UUID, or None for the whole section
+        """
+        if uuid is None:
+            self._texts.pop(section, None)
+        elif section in self._texts:
+            self._texts[section].pop(uuid, None)
+
+    def clear(self) -> None:
+        """Drop all cached text."""
+        self._texts.clear()
+
+    def __len__(self) -> int:
+        return sum(len(texts) for texts in self._texts.values())
@@ -7,10 +7,17 @@ migrated from circuit-synth for improved maintainability.
 
 import logging
 import math
-from typing import Optional, Tuple, Union
+from typing import Any, Optional, Sequence, Tuple, Union
 
 from .types import Point
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,6 +127,68 @@ def apply_transformation(
     return (final_x, final_y)
 
 
+# Linear part of apply_transformation() per (mirror, rotation): Y inversion,
+# then mirroring, then rotation. Unsupported rotations leave points unrotated.
+_MIRROR_MATRICES = {None: ((1, 0), (0, -1)), "x": ((-1, 0), (0, -1)), "y": ((1, 0), (0, 1))}
+_ROTATION_MATRICES = {
+    0: ((1, 0), (0, 1)),
+    90: ((0, -1), (1, 0)),
+    180: ((-1, 0), (0, -1)),
+    270: ((0, 1), (-1, 0)),
+}
+
+
+def apply_transformation_batch(
+    points: Any,
+    origins: Any,
+    rotations: Sequence[float],
+    mirrors: Optional[Sequence[Optional[str]]] = None,
+) -> Any:
+    """
+    Apply apply_transformation() to a set of points for many instances at once.
+
+    Typically the points are the symbol-local pin coordinates of one lib_id
+    and each instance is a component using it. Results match the scalar
+    function exactly.
+
+    Args:
+        points: (N, 2) points in SYMBOL space, shared by all instances
+        origins: (M, 2) instance origins in SCHEMATIC space
+        rotations: M rotations in degrees (0, 90, 180, 270)
+        mirrors: M mirror axes ("x", "y" or None); default no mirroring
+
+    Returns:
+        (M, N, 2) NumPy array of absolute positions in SCHEMATIC space
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("apply_transformation_batch requires NumPy")
+
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    origins = np.asarray(origins, dtype=float).reshape(-1, 2)
+    if mirrors is None:
+        mirrors = [None] * len(origins)
+
+    # One 2x2 matrix per distinct (mirror, rotation), gathered per instance
+    codes: dict = {}
+    instance_codes = [
+        codes.setdefault((mirror if mirror in ("x", "y") else None, rotation), len(codes))
+        for mirror, rotation in zip(mirrors, rotations)
+    ]
+    matrices = np.array(
+        [
+            np.array(_ROTATION_MATRICES.get(rotation, _ROTATION_MATRICES[0]), dtype=float)
+            @ np.array(_MIRROR_MATRICES[mirror], dtype=float)
+            for mirror, rotation in codes
+        ]
+    ).reshape(-1, 2, 2)
+
+    transformed = np.einsum("mij,nj->mni", matrices[instance_codes], points)
+    return transformed + origins[:, None, :]
+
+
 def calculate_position_for_pin(
     pin_local_position: Union[Point, Tuple[float, float]],
     desired_pin_position: Union[Point, Tuple[float, float]],
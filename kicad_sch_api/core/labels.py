@@ -7,6 +7,7 @@ featuring fast lookup, bulk operations, and validation.
 
 import logging
 import uuid
+from dataclasses import fields
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..utils.validation import SchematicValidator, ValidationError, ValidationIssue
@@ -98,7 +99,9 @@ class LabelElement:
 
     def validate(self) -> List[ValidationIssue]:
         """Validate this label element."""
-        return self._validator.validate_label(self._data.__dict__)
+        return self._validator.validate_label(
+            {f.name: getattr(self._data, f.name) for f in fields(self._data)}
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert label element to dictionary representation."""
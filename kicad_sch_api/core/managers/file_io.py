@@ -12,7 +12,7 @@ from typing import Any, Dict, Optional, Union
 
 from ...utils.validation import ValidationError
 from ..config import config
-from ..formatter import ExactFormatter
+from ..formatter import ElementTextCache, ExactFormatter
 from ..parser import SExpressionParser
 from .base import BaseManager
 
@@ -77,6 +77,7 @@ class FileIOManager(BaseManager):
         schematic_data: Dict[str, Any],
         file_path: Union[str, Path],
         preserve_format: bool = True,
+        element_cache: Optional[ElementTextCache] = None,
     ) -> None:
         """
         Save schematic data to file.
@@ -85,6 +86,8 @@ class FileIOManager(BaseManager):
             schematic_data: Schematic data to save
             file_path: Target file path
             preserve_format: Whether to preserve exact formatting
+            element_cache: Formatted text of elements unchanged since the
+                previous save, reused instead of formatting them again
 
         Raises:
             PermissionError: If file cannot be written
@@ -100,7 +103,15 @@ class FileIOManager(BaseManager):
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Convert to S-expression format and save
-            sexp_data = self._parser._schematic_data_to_sexp(schematic_data)
+            if element_cache is not None:
+                element_cache.set_context(
+                    (
+                        schematic_data.get("uuid"),
+                        self._parser.project_name,
+                        config.defaults.project_name,
+                    )
+                )
+            sexp_data = self._parser._schematic_data_to_sexp(schematic_data, element_cache)
             formatted_content = self._formatter.format(sexp_data)
 
             with open(file_path, "w", encoding="utf-8") as f:
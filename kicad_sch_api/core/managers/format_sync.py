@@ -7,9 +7,11 @@ and tracking changes for efficient updates.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Union
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Union
 
 from ..components import Component
+from ..formatter import ElementTextCache
 from ..types import Point, Wire
 from .base import BaseManager
 
@@ -28,17 +30,22 @@ class FormatSyncManager(BaseManager):
     - Data consistency validation
     """
 
-    def __init__(self, schematic_data: Dict[str, Any]):
+    def __init__(self, schematic_data: Dict[str, Any], max_log_entries: int = 10000):
         """
         Initialize FormatSyncManager.
 
         Args:
             schematic_data: Reference to schematic data
+            max_log_entries: Maximum number of change log entries retained
         """
         super().__init__(schematic_data)
         self._dirty_flags: Set[str] = set()
-        self._change_log: List[Dict[str, Any]] = []
+        self._change_log: Deque[Dict[str, Any]] = deque(maxlen=max_log_entries)
         self._sync_lock = False
+        # Saved text of tracked elements, and the change version it reflects
+        self._element_cache = ElementTextCache()
+        self._tracked: Dict[str, Any] = {}
+        self._cached_versions: Dict[str, int] = {}
 
     def mark_dirty(
         self, section: str, operation: str = "update", context: Optional[Dict] = None
@@ -51,6 +58,9 @@ class FormatSyncManager(BaseManager):
             operation: Type of operation (update, add, remove)
             context: Additional context about the change
         """
+        # Saved text goes stale even while syncing is locked
+        self._element_cache.invalidate(section, (context or {}).get("uuid"))
+
         if self._sync_lock:
             logger.debug(f"Sync locked, deferring dirty mark for {section}")
             return
@@ -67,6 +77,56 @@ class FormatSyncManager(BaseManager):
 
         logger.debug(f"Marked section '{section}' as dirty ({operation})")
 
+    def track_collection(self, section: str, collection: Any) -> None:
+        """
+        Mark a section dirty whenever a collection reports a change.
+
+        Subscribes to the collection's change journal so adds, removes and
+        field edits made directly on the collection are tracked per UUID
+        without callers having to mark the section themselves.
+
+        Args:
+            section: Data section the collection maps to (e.g., 'symbol', 'wire')
+            collection: Collection providing subscribe()
+        """
+
+        def on_change(events) -> None:
+            for event in events:
+                context = {"uuid": event.uuid}
+                if event.field:
+                    context["field"] = event.field
+                self.mark_dirty(section, event.kind.value, context)
+
+        collection.subscribe(on_change)
+        self._tracked[section] = collection
+        self._cached_versions[section] = collection.change_version
+        logger.debug(f"Tracking collection changes for section '{section}'")
+
+    def element_cache(self) -> ElementTextCache:
+        """
+        Get the saved text of unchanged elements of tracked collections.
+
+        Entries of elements changed since the previous call are dropped first,
+        read from each collection's change journal (so changes still
+        deferred inside a batch are covered). A truncated journal drops the
+        whole section.
+
+        Returns:
+            ElementTextCache to pass to FileIOManager.save_schematic()
+        """
+        for section, collection in self._tracked.items():
+            version = collection.change_version
+            if version == self._cached_versions[section]:
+                continue
+            changes = collection.changes_since(self._cached_versions[section])
+            if changes is None:
+                self._element_cache.invalidate(section)
+            else:
+                for change in changes:
+                    self._element_cache.invalidate(section, change.uuid)
+            self._cached_versions[section] = version
+        return self._element_cache
+
     def sync_component_to_data(self, component: Component) -> None:
         """
         Synchronize a component object back to S-expression data.
@@ -358,9 +418,9 @@ class FormatSyncManager(BaseManager):
         Get the change log.
 
         Returns:
-            List of change entries
+            List of change entries since the last clear, oldest first
         """
-        return self._change_log.copy()
+        return list(self._change_log)
 
     def clear_change_log(self) -> None:
         """Clear the change log."""
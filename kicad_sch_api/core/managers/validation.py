@@ -7,9 +7,10 @@ validation issues systematically.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from ...utils.validation import ValidationError, ValidationIssue
+from ...utils.validation import SchematicValidator, ValidationError, ValidationIssue
 from ..types import Point
 from .base import BaseManager
 
@@ -30,7 +31,12 @@ class ValidationManager(BaseManager):
     """
 
     def __init__(
-        self, schematic_data: Dict[str, Any], component_collection=None, wire_collection=None
+        self,
+        schematic_data: Dict[str, Any],
+        component_collection=None,
+        wire_collection=None,
+        junction_collection=None,
+        schematic=None,
     ):
         """
         Initialize ValidationManager.
@@ -39,10 +45,16 @@ class ValidationManager(BaseManager):
             schematic_data: Reference to schematic data
             component_collection: Component collection for validation
             wire_collection: Wire collection for connectivity analysis
+            junction_collection: Junction collection for T-connection checks
+            schematic: Owning schematic, for endpoint checks (unconnected
+                pins, floating wires)
         """
         super().__init__(schematic_data)
         self._components = component_collection
         self._wires = wire_collection
+        self._junctions = junction_collection
+        self._schematic = schematic
+        self._element_validator = SchematicValidator()
         self._validation_rules = self._initialize_validation_rules()
 
     def validate_schematic(self) -> List[ValidationIssue]:
@@ -74,6 +86,87 @@ class ValidationManager(BaseManager):
         logger.info(f"Schematic validation completed with {len(issues)} issues")
         return issues
 
+    def validate_changes(self, component_uuids: Iterable[str]) -> List[ValidationIssue]:
+        """
+        Validate only the given components plus schematic metadata.
+
+        Used for save-time validation of components changed since the last
+        save. Each component is visited once for structure, reference,
+        lib_id and bounds checks; (reference, unit) uniqueness is checked
+        through the collection's reference index instead of a full scan.
+        Sheet-wide checks (overlaps, missing junctions) only run in
+        validate_schematic().
+
+        Args:
+            component_uuids: UUIDs of added or modified components
+
+        Returns:
+            List of validation issues for those components
+        """
+        issues = self.validate_metadata()
+        if not self._components:
+            return issues
+
+        checked_pairs: Set[Tuple[str, int]] = set()
+        for component_uuid in component_uuids:
+            component = self._components.get_by_uuid(component_uuid)
+            if component is None:
+                continue  # Added and removed again since the last save
+
+            ref = component.reference
+            element_issues = self._element_validator.validate_component(
+                component._data.__dict__, f"component {ref}"
+            )
+            issues.extend(element_issues)
+
+            if not self._validate_reference_format(ref) and not any(
+                issue.category == "reference" for issue in element_issues
+            ):
+                issues.append(
+                    ValidationIssue(
+                        category="component_references",
+                        message=f"Invalid reference format: {ref}",
+                        level="warning",
+                        context={"reference": ref},
+                    )
+                )
+
+            unit = getattr(component._data, "unit", 1)
+            if (ref, unit) not in checked_pairs:
+                checked_pairs.add((ref, unit))
+                same_unit = [
+                    c
+                    for c in self._components.get_units(ref)
+                    if getattr(c._data, "unit", 1) == unit
+                ]
+                if len(same_unit) > 1:
+                    issues.append(
+                        ValidationIssue(
+                            category="component_references",
+                            message=f"Duplicate component reference and unit: {ref} (unit {unit})",
+                            level="error",
+                            context={"reference": ref, "unit": unit},
+                        )
+                    )
+
+            if self._is_out_of_bounds(component.position):
+                issues.append(
+                    ValidationIssue(
+                        category="positioning",
+                        message=(
+                            f"Component outside typical bounds: {ref} at {component.position}"
+                        ),
+                        level="info",
+                        context={
+                            "component": ref,
+                            "position": (component.position.x, component.position.y),
+                        },
+                    )
+                )
+
+        logger.debug(f"Change validation completed with {len(issues)} issues")
+        return issues
+
     def validate_component_references(self) -> List[ValidationIssue]:
         """
         Validate component references for duplicates and format.
@@ -139,7 +232,28 @@ class ValidationManager(BaseManager):
         """
         issues = []
 
-        if not self._wires or not self._components:
+        if not self._wires:
+            return issues
+
+        # Check for T-connections without a junction
+        for position, wire_uuid, source in self._find_missing_junctions():
+            issues.append(
+                ValidationIssue(
+                    category="connectivity",
+                    message=(
+                        f"Missing junction: {source} at ({position.x:.2f}, {position.y:.2f}) "
+                        f"lands on wire {wire_uuid}"
+                    ),
+                    level="warning",
+                    context={
+                        "position": (position.x, position.y),
+                        "wire": wire_uuid,
+                        "source": source,
+                    },
+                )
+            )
+
+        if not self._components:
             return issues
 
         # Check for unconnected pins
@@ -193,10 +307,16 @@ class ValidationManager(BaseManager):
         if self._components:
             overlapping_components = self._find_overlapping_components()
             for comp1_ref, comp2_ref, distance in overlapping_components:
+                if distance == 0.0:
+                    message = f"Components overlap: {comp1_ref} and {comp2_ref}"
+                else:
+                    message = (
+                        f"Components too close: {comp1_ref} and {comp2_ref} (gap: {distance:.2f})"
+                    )
                 issues.append(
                     ValidationIssue(
                         category="positioning",
-                        message=f"Components too close: {comp1_ref} and {comp2_ref} (distance: {distance:.2f})",
+                        message=message,
                         level="warning",
                         context={
                             "component1": comp1_ref,
@@ -374,36 +494,83 @@ class ValidationManager(BaseManager):
         return True
 
     def _find_unconnected_pins(self) -> List[Tuple[str, str]]:
-        """Find component pins that are not connected to any wires."""
-        unconnected = []
+        """Find component pins that touch no wire, pin, label or no-connect flag."""
+        if not self._components or self._schematic is None:
+            return []
+
+        from ..connectivity import EndpointIndex
+
+        endpoints = EndpointIndex.for_schematic(self._schematic)
+        return [(reference, pin) for reference, pin, _ in endpoints.unconnected_pins()]
 
-        if not self._components or not self._wires:
-            return unconnected
+    def _find_missing_junctions(self) -> List[Tuple[Point, str, str]]:
+        """
+        Find wire ends and pins landing on the middle of another wire.
+
+        KiCAD only connects such T-connections when a junction is placed
+        there. Segments are bucketed in a SegmentIndex, so the check is
+        O(n log n) in the number of wires and pins.
+
+        Returns:
+            List of (position, wire UUID, description of what lands there)
+        """
+        from ..connectivity import DisjointSet, PointGrid, SegmentIndex
 
-        # Get all wire endpoints
-        wire_points = set()
+        tolerance = 0.01
+        index = SegmentIndex(tolerance)
         for wire in self._wires:
-            wire_points.add((wire.start.x, wire.start.y))
-            wire_points.add((wire.end.x, wire.end.y))
+            for start, end in zip(wire.points, wire.points[1:]):
+                index.add_segment(wire.uuid, start, end)
 
-        # Check each component pin
-        for component in self._components:
-            # This would need actual pin position calculation
-            # Simplified for now - would use component's pin positions
-            pass
+        junctions = PointGrid(DisjointSet(), tolerance)
+        for junction in self._junctions or []:
+            junctions.node(junction.position)
 
-        return unconnected
+        probes: List[Tuple[Point, Optional[str], str]] = []
+        for wire in self._wires:
+            if len(wire.points) >= 2:
+                probes.append((wire.points[0], wire.uuid, f"wire {wire.uuid} end"))
+                probes.append((wire.points[-1], wire.uuid, f"wire {wire.uuid} end"))
+        for reference, pin_number, position in self._component_pin_positions():
+            probes.append((position, None, f"pin {reference}.{pin_number}"))
+
+        missing = []
+        seen: Set[Tuple[float, float, str]] = set()
+        for position, owner, source in probes:
+            for wire_uuid in index.segments_at(position):
+                key = (position.x, position.y, wire_uuid)
+                if wire_uuid == owner or key in seen:
+                    continue
+                seen.add(key)
+                if junctions.find(position) is None:
+                    missing.append((position, wire_uuid, source))
+
+        return missing
+
+    def _component_pin_positions(self) -> List[Tuple[str, str, Point]]:
+        """Get (reference, pin number, absolute position) for every component pin."""
+        from ..pin_utils import list_component_pins
+
+        positions = []
+        for component in self._components or []:
+            try:
+                pins = list_component_pins(component)
+            except Exception as e:
+                logger.debug(f"Could not resolve pins of {component.reference}: {e}")
+                continue
+            for pin_number, position in pins:
+                if position is not None:
+                    positions.append((component.reference, pin_number, position))
+        return positions
 
     def _find_floating_wires(self) -> List[str]:
-        """Find wires that don't connect to any components."""
-        floating = []
+        """Find wires none of whose points touch a pin, label, junction or other wire."""
+        if not self._wires or self._schematic is None:
+            return []
 
-        if not self._wires or not self._components:
-            return floating
+        from ..connectivity import EndpointIndex
 
-        # This would need actual connectivity analysis
-        # Simplified implementation
-        return floating
+        return EndpointIndex.for_schematic(self._schematic).floating_wires()
 
     def _find_potential_short_circuits(self) -> List[Dict[str, Any]]:
         """Find potential short circuits in the design."""
@@ -413,21 +580,66 @@ class ValidationManager(BaseManager):
         # Simplified implementation
         return short_circuits
 
-    def _find_overlapping_components(self) -> List[Tuple[str, str, float]]:
-        """Find components that are positioned too close together."""
+    def _find_overlapping_components(
+        self, clearance: Optional[float] = None
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Find components whose symbol bodies overlap or are too close together.
+
+        Body bounding boxes are bucketed on a uniform grid (cells about one
+        typical symbol wide), so only boxes sharing a cell are compared
+        instead of every pair.
+
+        Args:
+            clearance: Minimum gap between symbol bodies in mm (default:
+                config.validation.component_clearance)
+
+        Returns:
+            List of (reference1, reference2, gap) in component order; gap is
+            0.0 for overlapping bodies
+        """
+        from ..component_bounds import get_schematic_component_bboxes
+        from ..config import config
+
         overlapping = []
 
         if not self._components:
             return overlapping
 
-        components = list(self._components)
-        min_distance = 10.0  # Minimum distance threshold
+        if clearance is None:
+            clearance = config.validation.component_clearance
 
-        for i, comp1 in enumerate(components):
-            for comp2 in components[i + 1 :]:
-                distance = comp1.position.distance_to(comp2.position)
-                if distance < min_distance:
-                    overlapping.append((comp1.reference, comp2.reference, distance))
+        components = list(self._components)
+        boxes = [
+            (box.min_x, box.min_y, box.max_x, box.max_y)
+            for box in get_schematic_component_bboxes(components, include_properties=False)
+        ]
+
+        sizes = sorted(max(x2 - x1, y2 - y1) for x1, y1, x2, y2 in boxes)
+        cell = max(sizes[len(sizes) // 2] + clearance, 2.54)
+        margin = clearance / 2
+
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        pairs: Set[Tuple[int, int]] = set()
+        for index, (x1, y1, x2, y2) in enumerate(boxes):
+            for col in range(int((x1 - margin) // cell), int((x2 + margin) // cell) + 1):
+                for row in range(int((y1 - margin) // cell), int((y2 + margin) // cell) + 1):
+                    bucket = grid.setdefault((col, row), [])
+                    pairs.update((other, index) for other in bucket)
+                    bucket.append(index)
+
+        for first, second in sorted(pairs):
+            ax1, ay1, ax2, ay2 = boxes[first]
+            bx1, by1, bx2, by2 = boxes[second]
+            overlap_x = min(ax2, bx2) - max(ax1, bx1)
+            overlap_y = min(ay2, by2) - max(ay1, by1)
+            if overlap_x > 0 and overlap_y > 0:
+                gap = 0.0
+            else:
+                gap = math.hypot(max(-overlap_x, 0.0), max(-overlap_y, 0.0))
+                if gap >= clearance:
+                    continue
+            overlapping.append((components[first].reference, components[second].reference, gap))
 
         return overlapping
 
@@ -438,16 +650,20 @@ class ValidationManager(BaseManager):
         if not self._components:
             return out_of_bounds
 
+        for component in self._components:
+            if self._is_out_of_bounds(component.position):
+                out_of_bounds.append((component.reference, component.position))
+
+        return out_of_bounds
+
+    @staticmethod
+    def _is_out_of_bounds(pos: Point) -> bool:
+        """Check a position against typical schematic bounds."""
         # Define typical bounds (these could be configurable)
         min_x, min_y = 0, 0
         max_x, max_y = 1000, 1000  # Adjust based on paper size
 
-        for component in self._components:
-            pos = component.position
-            if pos.x < min_x or pos.x > max_x or pos.y < min_y or pos.y > max_y:
-                out_of_bounds.append((component.reference, pos))
-
-        return out_of_bounds
+        return pos.x < min_x or pos.x > max_x or pos.y < min_y or pos.y > max_y
 
     def _check_wire_spacing(self) -> List[ValidationIssue]:
         """Check minimum wire spacing requirements."""
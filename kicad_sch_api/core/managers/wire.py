@@ -9,6 +9,7 @@ import logging
 import uuid
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from ...collections.base import ChangeKind
 from ...library.cache import get_symbol_cache
 from ..connectivity import ConnectivityAnalyzer, Net
 from ..types import Point, Wire, WireType
@@ -30,6 +31,11 @@ class WireManager(BaseManager):
     - Wire-to-pin connections
     """
 
+    # Component fields whose changes never alter electrical connectivity
+    _CONNECTIVITY_NEUTRAL_FIELDS = frozenset(
+        {"footprint", "property_effects", "in_bom", "on_board", "fields_autoplaced"}
+    )
+
     def __init__(
         self,
         schematic_data: Dict[str, Any],
@@ -55,6 +61,14 @@ class WireManager(BaseManager):
         # Lazy-initialized connectivity analyzer (always hierarchical)
         self._connectivity_analyzer: Optional[ConnectivityAnalyzer] = None
         self._connectivity_valid = False
+        # Component UUID -> reference at the time it entered the analyzer
+        self._analyzed_references: Dict[str, str] = {}
+
+        # Edits on the collections update the analyzer incrementally
+        if hasattr(self._wires, "subscribe"):
+            self._wires.subscribe(self._on_wires_changed)
+        if hasattr(self._components, "subscribe"):
+            self._components.subscribe(self._on_components_changed)
 
     def add_wire(
         self, start: Union[Point, Tuple[float, float]], end: Union[Point, Tuple[float, float]]
@@ -74,12 +88,9 @@ class WireManager(BaseManager):
         if isinstance(end, tuple):
             end = Point(end[0], end[1])
 
-        # Use the wire collection to add the wire
+        # Use the wire collection to add the wire; connectivity follows its events
         wire_uuid = self._wires.add(start=start, end=end)
 
-        # Invalidate connectivity cache
-        self._invalidate_connectivity()
-
         logger.debug(f"Added wire: {start} -> {end}")
         return wire_uuid
 
@@ -107,8 +118,9 @@ class WireManager(BaseManager):
 
         success = removed_from_collection or removed_from_data
         if success:
-            # Invalidate connectivity cache
-            self._invalidate_connectivity()
+            # Collection removals update connectivity through their events
+            if not removed_from_collection:
+                self.invalidate_connectivity()
             logger.debug(f"Removed wire: {wire_uuid}")
 
         return success
@@ -384,25 +396,135 @@ class WireManager(BaseManager):
 
         return []
 
+    def get_connectivity_analyzer(self) -> ConnectivityAnalyzer:
+        """
+        Get the connectivity analyzer, analyzing the schematic if needed.
+
+        Returns:
+            Up-to-date ConnectivityAnalyzer for the schematic
+        """
+        self._ensure_connectivity()
+        return self._connectivity_analyzer
+
     def _ensure_connectivity(self):
         """
         Ensure connectivity analysis is up-to-date.
 
         Lazily initializes and runs connectivity analyzer on first query.
-        Re-runs analysis if schematic has changed since last analysis.
+        Re-runs analysis only after an invalidation; ordinary wire and
+        component edits are applied incrementally as they happen.
         """
         if not self._connectivity_valid:
             logger.debug("Running connectivity analysis (hierarchical)...")
             self._connectivity_analyzer = ConnectivityAnalyzer()
             self._connectivity_analyzer.analyze(self._schematic, hierarchical=True)
+            self._analyzed_references = {
+                component.uuid: component.reference for component in self._components
+            }
             self._connectivity_valid = True
             logger.debug("Connectivity analysis complete")
 
-    def _invalidate_connectivity(self):
+    def track_collection(self, collection) -> None:
+        """
+        Re-analyze connectivity after edits on a collection.
+
+        For collections the analyzer cannot update incrementally (junctions,
+        labels, no-connects): any change invalidates the analysis.
+
+        Args:
+            collection: Collection exposing subscribe()
+        """
+        if hasattr(collection, "subscribe"):
+            collection.subscribe(self._on_collection_changed)
+
+    def _on_collection_changed(self, events) -> None:
+        """
+        Invalidate connectivity after events from a tracked collection.
+
+        Args:
+            events: ChangeEvent list from the collection
+        """
+        if events:
+            self.invalidate_connectivity()
+
+    def _on_wires_changed(self, events) -> None:
+        """
+        Apply wire collection events to the connectivity analyzer.
+
+        Args:
+            events: ChangeEvent list from the wire collection
+        """
+        self._apply_connectivity_events(events, self._apply_wire_event)
+
+    def _on_components_changed(self, events) -> None:
+        """
+        Apply component collection events to the connectivity analyzer.
+
+        Args:
+            events: ChangeEvent list from the component collection
+        """
+        events = [e for e in events if e.field not in self._CONNECTIVITY_NEUTRAL_FIELDS]
+        self._apply_connectivity_events(events, self._apply_component_event)
+
+    def _apply_connectivity_events(self, events, apply) -> None:
+        """
+        Apply events to a valid analyzer, falling back to full re-analysis.
+
+        Args:
+            events: ChangeEvent list
+            apply: Callback applying one event to the analyzer
+        """
+        if not events or not self._connectivity_valid:
+            return
+
+        try:
+            for event in events:
+                apply(self._connectivity_analyzer, event)
+        except Exception as e:
+            logger.warning(f"Incremental connectivity update failed, re-analyzing: {e}")
+            self.invalidate_connectivity()
+
+    def _apply_wire_event(self, analyzer: ConnectivityAnalyzer, event) -> None:
+        """Add, remove or replace one wire in the analyzer."""
+        if event.kind is ChangeKind.REMOVE:
+            analyzer.remove_wire(event.uuid)
+            return
+
+        wire = self._wires.get(event.uuid)
+        if wire is not None:
+            analyzer.add_wire(wire)
+
+    def _apply_component_event(self, analyzer: ConnectivityAnalyzer, event) -> None:
+        """Re-add the pins of every reference touched by one component event."""
+        references = set()
+        previous = self._analyzed_references.pop(event.uuid, None)
+        if previous is not None:
+            references.add(previous)
+
+        if event.kind is not ChangeKind.REMOVE:
+            component = self._components.get_by_uuid(event.uuid)
+            if component is not None:
+                references.add(component.reference)
+                self._analyzed_references[event.uuid] = component.reference
+
+        # Units of a multi-unit part share a reference, so rebuild them together
+        for reference in references:
+            analyzer.remove_component(reference)
+            for component in self._components_with_reference(reference):
+                analyzer.add_component(component)
+
+    def _components_with_reference(self, reference: str) -> List[Any]:
+        """Get all components (units) carrying a reference."""
+        components = self._components.index_lookup("reference", reference)
+        if components is None:
+            components = [c for c in self._components if c.reference == reference]
+        return components
+
+    def invalidate_connectivity(self):
         """
         Invalidate connectivity cache.
 
-        Called when schematic changes that affect connectivity (wires, components, etc.).
+        Called when a change cannot be applied incrementally.
         Next connectivity query will trigger re-analysis.
         """
         if self._connectivity_valid:
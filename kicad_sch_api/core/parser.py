@@ -8,7 +8,7 @@ with exact format preservation and enhanced error handling.
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import sexpdata
 
@@ -22,7 +22,7 @@ from ..parsers.elements.text_parser import TextParser
 from ..parsers.elements.wire_parser import WireParser
 from ..parsers.utils import color_to_rgb255, color_to_rgba
 from ..utils.validation import ValidationError, ValidationIssue
-from .formatter import ExactFormatter
+from .formatter import ElementTextCache, ExactFormatter
 from .types import Junction, Label, Net, Point, SchematicSymbol, Wire
 
 logger = logging.getLogger(__name__)
@@ -219,6 +219,7 @@ class SExpressionParser:
             "junctions": [],
             "labels": [],
             "hierarchical_labels": [],
+            "global_label": [],  # Same key as Schematic.add_global_label()
             "no_connects": [],
             "texts": [],
             "text_boxes": [],
@@ -278,6 +279,10 @@ class SExpressionParser:
                 hlabel = self._parse_hierarchical_label(item)
                 if hlabel:
                     schematic_data["hierarchical_labels"].append(hlabel)
+            elif element_type == "global_label":
+                glabel = self._parse_global_label(item)
+                if glabel:
+                    schematic_data["global_label"].append(glabel)
             elif element_type == "no_connect":
                 no_connect = self._parse_no_connect(item)
                 if no_connect:
@@ -329,8 +334,21 @@ class SExpressionParser:
 
         return schematic_data
 
-    def _schematic_data_to_sexp(self, schematic_data: Dict[str, Any]) -> List[Any]:
-        """Convert internal schematic format to S-expression data."""
+    def _schematic_data_to_sexp(
+        self, schematic_data: Dict[str, Any], element_cache: Optional[ElementTextCache] = None
+    ) -> List[Any]:
+        """
+        Convert internal schematic format to S-expression data.
+
+        Args:
+            schematic_data: Schematic data structure
+            element_cache: Formatted text of unchanged components, wires,
+                junctions and labels; those elements are emitted as
+                FormattedElement text instead of S-expressions
+
+        Returns:
+            S-expression data
+        """
         sexp_data = [sexpdata.Symbol("kicad_sch")]
 
         # Add version and generator info
@@ -359,24 +377,44 @@ class SExpressionParser:
         sexp_data.append(self._lib_symbols_to_sexp(lib_symbols))
 
         # Add components
+        schematic_uuid = schematic_data.get("uuid")
         for component in schematic_data.get("components", []):
-            sexp_data.append(self._symbol_to_sexp(component, schematic_data.get("uuid")))
+            sexp_data.append(
+                self._element_to_sexp(
+                    element_cache,
+                    "symbol",
+                    component,
+                    lambda data: self._symbol_to_sexp(data, schematic_uuid),
+                )
+            )
 
         # Add wires
         for wire in schematic_data.get("wires", []):
-            sexp_data.append(self._wire_to_sexp(wire))
+            sexp_data.append(self._element_to_sexp(element_cache, "wire", wire, self._wire_to_sexp))
 
         # Add junctions
         for junction in schematic_data.get("junctions", []):
-            sexp_data.append(self._junction_to_sexp(junction))
+            sexp_data.append(
+                self._element_to_sexp(element_cache, "junction", junction, self._junction_to_sexp)
+            )
 
         # Add labels
         for label in schematic_data.get("labels", []):
-            sexp_data.append(self._label_to_sexp(label))
+            sexp_data.append(
+                self._element_to_sexp(element_cache, "label", label, self._label_to_sexp)
+            )
 
         # Add hierarchical labels
         for hlabel in schematic_data.get("hierarchical_labels", []):
-            sexp_data.append(self._hierarchical_label_to_sexp(hlabel))
+            sexp_data.append(
+                self._element_to_sexp(
+                    element_cache, "hierarchical_label", hlabel, self._hierarchical_label_to_sexp
+                )
+            )
+
+        # Add global labels
+        for glabel in schematic_data.get("global_label", []):
+            sexp_data.append(self._global_label_to_sexp(glabel))
 
         # Add no_connects
         for no_connect in schematic_data.get("no_connects", []):
@@ -441,6 +479,29 @@ class SExpressionParser:
 
         return sexp_data
 
+    @staticmethod
+    def _element_to_sexp(
+        element_cache: Optional[ElementTextCache],
+        section: str,
+        element: Dict[str, Any],
+        to_sexp: Callable[[Dict[str, Any]], List[Any]],
+    ) -> Any:
+        """
+        Convert one element, reusing its cached text when available.
+
+        Wire, junction and label data is rebuilt on every save, so their cached
+        text is also checked against it. Component data shares nested objects
+        with the live component and relies on change events (property writes
+        included); only the exposed hidden-property set is compared.
+        """
+        if element_cache is None or not element.get("uuid"):
+            return to_sexp(element)
+        if section == "symbol":
+            data = frozenset(element.get("hidden_properties") or ())
+        else:
+            data = element
+        return element_cache.get(section, element["uuid"], lambda: to_sexp(element), data)
+
     def _parse_title_block(self, item: List[Any]) -> Dict[str, Any]:
         """Parse title block information."""
         return self._metadata_parser._parse_title_block(item)
@@ -469,6 +530,10 @@ class SExpressionParser:
         """Parse a hierarchical label definition."""
         return self._label_parser._parse_hierarchical_label(item)
 
+    def _parse_global_label(self, item: List[Any]) -> Optional[Dict[str, Any]]:
+        """Parse a global label definition."""
+        return self._label_parser._parse_global_label(item)
+
     def _parse_no_connect(self, item: List[Any]) -> Optional[Dict[str, Any]]:
         """Parse a no_connect symbol."""
         return self._wire_parser._parse_no_connect(item)
@@ -622,6 +687,10 @@ class SExpressionParser:
         """Convert hierarchical label to S-expression."""
         return self._label_parser._hierarchical_label_to_sexp(hlabel_data)
 
+    def _global_label_to_sexp(self, glabel_data: Dict[str, Any]) -> List[Any]:
+        """Convert global label to S-expression."""
+        return self._label_parser._global_label_to_sexp(glabel_data)
+
     def _no_connect_to_sexp(self, no_connect_data: Dict[str, Any]) -> List[Any]:
         """Convert no_connect to S-expression."""
         return self._wire_parser._no_connect_to_sexp(no_connect_data)
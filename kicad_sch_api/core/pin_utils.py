@@ -3,13 +3,17 @@ Pin positioning utilities for KiCAD schematic manipulation.
 
 Provides accurate pin position calculation with component transformations,
 migrated and improved from circuit-synth.
+
+Absolute pin positions of collection components are cached per component,
+keyed by (lib_id, unit, position, rotation, mirror); Component.move(),
+rotate() and translate() drop the cached table.
 """
 
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..library.cache import get_symbol_cache
-from .geometry import apply_transformation
+from .geometry import NUMPY_AVAILABLE, apply_transformation, apply_transformation_batch
 from .types import Point, SchematicSymbol
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,10 @@ def get_component_pin_position(component: SchematicSymbol, pin_number: str) -> O
     Returns:
         Absolute position of the pin, or None if not found
     """
+    table = _cached_pin_table(component)
+    if table is not None and pin_number in table[2]:
+        return table[2][pin_number]
+
     logger.info(f"Getting position for {component.reference} pin {pin_number}")
     logger.info(f"  Component position: ({component.position.x}, {component.position.y})")
     logger.info(f"  Component rotation: {getattr(component, 'rotation', 0)}°")
@@ -190,6 +198,134 @@ def get_component_pin_info(
     return None
 
 
+def pin_table_key(component: SchematicSymbol) -> Tuple[Any, ...]:
+    """
+    Key under which a component's absolute pin table stays valid.
+
+    Args:
+        component: Component (wrapper or SchematicSymbol)
+
+    Returns:
+        (lib_id, unit, x, y, rotation, mirror) tuple
+    """
+    position = component.position
+    return (
+        component.lib_id,
+        getattr(getattr(component, "_data", component), "unit", 1),
+        position.x,
+        position.y,
+        getattr(component, "rotation", 0),
+        getattr(component, "mirror", None),
+    )
+
+
+def _cached_pin_table(
+    component: SchematicSymbol,
+) -> Optional[Tuple[Tuple[Any, ...], Tuple[Tuple[str, Point], ...], Dict[str, Point]]]:
+    """
+    Get a component's (key, pins, positions by number) table, building it if stale.
+
+    Only components exposing a ``_pin_table`` slot (collection Components) are
+    cached. Empty tables are not kept, so a symbol library that becomes
+    available later is picked up.
+
+    Args:
+        component: Component to look up
+
+    Returns:
+        Cached table, or None if the component cannot cache one
+    """
+    try:
+        table = component._pin_table
+    except AttributeError:
+        return None
+
+    key = pin_table_key(component)
+    if table is not None and table[0] == key:
+        return table
+
+    return _store_pin_table(component, key, tuple(_compute_component_pins(component)))
+
+
+def _store_pin_table(
+    component: SchematicSymbol, key: Tuple[Any, ...], pins: Tuple[Tuple[str, Point], ...]
+) -> Tuple[Tuple[Any, ...], Tuple[Tuple[str, Point], ...], Dict[str, Point]]:
+    """Build a pin table and keep it on the component unless it is empty."""
+    positions: Dict[str, Point] = {}
+    for pin_number, position in pins:
+        positions.setdefault(pin_number, position)
+    table = (key, pins, positions)
+    if hasattr(component, "_pin_table"):
+        component._pin_table = table if pins else None
+    return table
+
+
+def _symbol_local_pins(component: SchematicSymbol) -> list:
+    """Pins in symbol space: the component's own pins, else the library symbol's."""
+    if component.pins:
+        return component.pins
+    try:
+        symbol_def = get_symbol_cache().get_symbol(component.lib_id)
+    except Exception as e:
+        logger.error(f"Error getting pins from symbol library: {e}")
+        return []
+    return symbol_def.pins if symbol_def else []
+
+
+def list_pins_batch(components: Iterable[SchematicSymbol]) -> List[List[Tuple[str, Point]]]:
+    """
+    List the absolute pins of many components at once.
+
+    Components with a valid cached pin table reuse it. With NumPy installed,
+    the others are grouped by their symbol-local pins (in practice, by
+    lib_id) and each group is transformed in one apply_transformation_batch()
+    call; without NumPy every component goes through list_component_pins().
+    The new tables are cached exactly as list_component_pins() caches them.
+
+    Args:
+        components: Components to list
+
+    Returns:
+        One list of (pin_number, absolute_position) tuples per component
+    """
+    components = list(components)
+    if not NUMPY_AVAILABLE:
+        return [list_component_pins(component) for component in components]
+
+    results: List[List[Tuple[str, Point]]] = [[] for _ in components]
+    groups: Dict[Tuple[Any, ...], Tuple[list, List[int], List[Tuple[Any, ...]]]] = {}
+    for row, component in enumerate(components):
+        key = pin_table_key(component)
+        table = getattr(component, "_pin_table", None)
+        if table is not None and table[0] == key:
+            results[row] = list(table[1])
+            continue
+
+        local_pins = _symbol_local_pins(component)
+        if local_pins:
+            group_key = (component.lib_id, tuple(map(id, local_pins)))
+            groups.setdefault(group_key, (local_pins, [], []))
+            groups[group_key][1].append(row)
+            groups[group_key][2].append(key)
+
+    for local_pins, rows, keys in groups.values():
+        numbers = [pin.number for pin in local_pins]
+        members = [components[row] for row in rows]
+        absolute = apply_transformation_batch(
+            [(pin.position.x, pin.position.y) for pin in local_pins],
+            [(member.position.x, member.position.y) for member in members],
+            [getattr(member, "rotation", 0) for member in members],
+            [getattr(member, "mirror", None) for member in members],
+        )
+        for row, key, member, coords in zip(rows, keys, members, absolute.tolist()):
+            pins = tuple((number, Point(x, y)) for number, (x, y) in zip(numbers, coords))
+            _store_pin_table(member, key, pins)
+            results[row] = list(pins)
+
+    logger.debug(f"Listed pins of {len(components)} components in {len(groups)} batches")
+    return results
+
+
 def list_component_pins(component: SchematicSymbol) -> List[Tuple[str, Point]]:
     """
     List all pins for a component with their absolute positions.
@@ -200,6 +336,14 @@ def list_component_pins(component: SchematicSymbol) -> List[Tuple[str, Point]]:
     Returns:
         List of (pin_number, absolute_position) tuples
     """
+    table = _cached_pin_table(component)
+    if table is not None:
+        return list(table[1])
+    return _compute_component_pins(component)
+
+
+def _compute_component_pins(component: SchematicSymbol) -> List[Tuple[str, Point]]:
+    """Transform every pin of a component to absolute coordinates."""
     logger.info(f"Listing pins for component {component.reference}")
 
     pins = []
@@ -22,6 +22,7 @@ from ..collections import (
     LabelElement,
     WireCollection,
 )
+from ..collections.base import ChangeKind
 from ..library.cache import get_symbol_cache
 from ..utils.validation import SchematicValidator, ValidationError, ValidationIssue
 from .factories import ElementFactory
@@ -168,11 +169,38 @@ class Schematic:
         self._sheet_manager = SheetManager(self._data)
         self._text_element_manager = TextElementManager(self._data)
         self._wire_manager = WireManager(self._data, self._wires, self._components, self)
-        self._validation_manager = ValidationManager(self._data, self._components, self._wires)
+        self._validation_manager = ValidationManager(
+            self._data, self._components, self._wires, self._junctions, self
+        )
+
+        # Collections report their own changes to the format sync manager
+        for section, collection in (
+            ("symbol", self._components),
+            ("wire", self._wires),
+            ("junction", self._junctions),
+            ("label", self._labels),
+            ("hierarchical_label", self._hierarchical_labels),
+            ("bus_entry", self._bus_entries),
+        ):
+            self._format_sync_manager.track_collection(section, collection)
+
+        # Connectivity follows edits the analyzer cannot apply incrementally
+        for collection in (
+            self._junctions,
+            self._labels,
+            self._hierarchical_labels,
+            self._no_connects,
+        ):
+            self._wire_manager.track_collection(collection)
 
         # Track modifications for save optimization
         self._modified = False
         self._last_save_time = None
+        # Component change version covered by the last full or dirty save-time
+        # validation; None until the sheet has been fully validated once
+        self._validated_version: Optional[int] = None
+        # Embedded lib_symbols entries keyed by (lib_id, project name, library mtime)
+        self._embedded_symbols: Dict[Tuple[str, str, Optional[float]], Any] = {}
 
         # Performance tracking
         self._operation_count = 0
@@ -532,17 +560,28 @@ class Schematic:
         return self._wire_manager.get_connected_pins(component_ref, pin_number)
 
     # File operations (delegated to FileIOManager)
-    def save(self, file_path: Optional[Union[str, Path]] = None, preserve_format: bool = True):
+    def save(
+        self,
+        file_path: Optional[Union[str, Path]] = None,
+        preserve_format: bool = True,
+        validate: str = "full",
+    ):
         """
         Save schematic to file.
 
         Args:
             file_path: Output file path (uses current path if None)
             preserve_format: Whether to preserve exact formatting
+            validate: Save-time validation: "full" runs validate(), "dirty" checks
+                only components changed since the last validated save (the first
+                dirty save of a sheet runs validate()), "none" skips validation
 
         Raises:
             ValidationError: If schematic data is invalid
         """
+        if validate not in ("full", "dirty", "none"):
+            raise ValueError(f"validate must be 'full', 'dirty' or 'none', got {validate!r}")
+
         start_time = time.time()
 
         # Use current file path if not specified
@@ -555,7 +594,13 @@ class Schematic:
             self._file_path = file_path
 
         # Validate before saving
-        issues = self.validate()
+        validated_version = self._components.change_version
+        if validate == "full":
+            issues = self.validate()
+        elif validate == "dirty":
+            issues = self._validate_changes()
+        else:
+            issues = []
         errors = [issue for issue in issues if issue.level.value in ("error", "critical")]
         if errors:
             raise ValidationError("Cannot save schematic with validation errors", errors)
@@ -573,8 +618,10 @@ class Schematic:
         # Ensure FileIOManager's parser has the correct project name
         self._file_io_manager._parser.project_name = self.name
 
-        # Use FileIOManager for saving
-        self._file_io_manager.save_schematic(self._data, file_path, preserve_format)
+        # Use FileIOManager for saving; unchanged elements reuse their saved text
+        self._file_io_manager.save_schematic(
+            self._data, file_path, preserve_format, self._format_sync_manager.element_cache()
+        )
 
         # Update state
         self._modified = False
@@ -584,14 +631,19 @@ class Schematic:
         self._labels.mark_saved()
         self._hierarchical_labels.mark_saved()
         self._format_sync_manager.clear_dirty_flags()
+        self._format_sync_manager.clear_change_log()
         self._last_save_time = time.time()
+        if validate != "none":
+            self._validated_version = validated_version
 
         save_time = time.time() - start_time
         logger.info(f"Saved schematic to {file_path} in {save_time:.3f}s")
 
-    def save_as(self, file_path: Union[str, Path], preserve_format: bool = True):
+    def save_as(
+        self, file_path: Union[str, Path], preserve_format: bool = True, validate: str = "full"
+    ):
         """Save schematic to a new file path."""
-        self.save(file_path, preserve_format)
+        self.save(file_path, preserve_format, validate)
 
     def backup(self, suffix: str = ".backup") -> Path:
         """
@@ -697,7 +749,6 @@ class Schematic:
                 end = Point(end.x * grid_size, end.y * grid_size)
 
         wire_uuid = self._wire_manager.add_wire(start, end)
-        self._format_sync_manager.mark_dirty("wire", "add", {"uuid": wire_uuid})
         self._modified = True
         return wire_uuid
 
@@ -741,8 +792,6 @@ class Schematic:
         wire_uuids = self._wire_manager.auto_route_pins(
             component1_ref, pin1_number, component2_ref, pin2_number, routing_strategy
         )
-        for wire_uuid in wire_uuids:
-            self._format_sync_manager.mark_dirty("wire", "add", {"uuid": wire_uuid})
         self._modified = True
         return wire_uuids
 
@@ -926,7 +975,6 @@ class Schematic:
             uuid=uuid,
         )
         self._sync_labels_to_data()  # Sync immediately
-        self._format_sync_manager.mark_dirty("label", "add", {"uuid": label.uuid})
         self._modified = True
         return label.uuid
 
@@ -1086,7 +1134,6 @@ class Schematic:
         # Use the hierarchical_labels collection
         hlabel = self._hierarchical_labels.add(text, position, rotation=rotation, size=size)
         self._sync_hierarchical_labels_to_data()  # Sync immediately
-        self._format_sync_manager.mark_dirty("hierarchical_label", "add", {"uuid": hlabel.uuid})
         self._modified = True
         return hlabel.uuid
 
@@ -1111,6 +1158,7 @@ class Schematic:
         """
         label_uuid = self._text_element_manager.add_global_label(text, position, shape, effects)
         self._format_sync_manager.mark_dirty("global_label", "add", {"uuid": label_uuid})
+        self._wire_manager.invalidate_connectivity()
         self._modified = True
         return label_uuid
 
@@ -1127,7 +1175,6 @@ class Schematic:
         removed = self._labels.remove(label_uuid)
         if removed:
             self._sync_labels_to_data()  # Sync immediately
-            self._format_sync_manager.mark_dirty("label", "remove", {"uuid": label_uuid})
             self._modified = True
         return removed
 
@@ -1144,9 +1191,6 @@ class Schematic:
         removed = self._hierarchical_labels.remove(label_uuid)
         if removed:
             self._sync_hierarchical_labels_to_data()  # Sync immediately
-            self._format_sync_manager.mark_dirty(
-                "hierarchical_label", "remove", {"uuid": label_uuid}
-            )
             self._modified = True
         return removed
 
@@ -1192,6 +1236,7 @@ class Schematic:
             page_number=page_number,
         )
         self._format_sync_manager.mark_dirty("sheet", "add", {"uuid": sheet_uuid})
+        self._wire_manager.invalidate_connectivity()
         self._modified = True
         return sheet_uuid
 
@@ -1238,6 +1283,7 @@ class Schematic:
             sheet_uuid, name, pin_type, edge, position_along_edge, uuid_str=uuid
         )
         self._format_sync_manager.mark_dirty("sheet", "modify", {"uuid": sheet_uuid})
+        self._wire_manager.invalidate_connectivity()
         self._modified = True
         return pin_uuid
 
@@ -1254,6 +1300,7 @@ class Schematic:
         removed = self._sheet_manager.remove_sheet(sheet_uuid)
         if removed:
             self._format_sync_manager.mark_dirty("sheet", "remove", {"uuid": sheet_uuid})
+            self._wire_manager.invalidate_connectivity()
             self._modified = True
         return removed
 
@@ -1535,6 +1582,25 @@ class Schematic:
 
         return unique_issues
 
+    def _validate_changes(self) -> List[ValidationIssue]:
+        """
+        Validate components changed since the last validated save.
+
+        Falls back to validate() when the sheet has not been validated yet or
+        the change journal no longer covers the last validated save.
+
+        Returns:
+            List of validation issues found
+        """
+        if self._validated_version is None:
+            return self.validate()
+        changes = self._components.changes_since(self._validated_version)
+        if changes is None:
+            return self.validate()
+
+        changed = {change.uuid for change in changes if change.kind is not ChangeKind.REMOVE}
+        return self._validation_manager.validate_changes(changed)
+
     def get_validation_summary(self) -> Dict[str, Any]:
         """
         Get validation summary statistics.
@@ -1671,11 +1737,8 @@ class Schematic:
 
         for comp in self._components:
             if comp.lib_id and comp.lib_id not in lib_symbols:
-                # Get the actual symbol definition
-                symbol_def = cache.get_symbol(comp.lib_id)
-
-                if symbol_def:
-                    converted_symbol = self._convert_symbol_to_kicad_format(symbol_def, comp.lib_id)
+                converted_symbol = self._embedded_symbol(cache, comp.lib_id)
+                if converted_symbol is not None:
                     lib_symbols[comp.lib_id] = converted_symbol
 
         self._data["lib_symbols"] = lib_symbols
@@ -1806,6 +1869,31 @@ class Schematic:
 
         self._data["nets"] = net_data
 
+    def _embedded_symbol(self, cache, lib_id: str):
+        """
+        Get the lib_symbols entry for lib_id, converting it only on first use.
+
+        Conversion walks the whole symbol tree, so the result is memoized per
+        (lib_id, project name, library mtime): renaming the project or editing
+        the library file produces a fresh entry.
+        """
+        key = (lib_id, self.name, cache.get_library_mtime(lib_id.split(":", 1)[0]))
+        converted_symbol = self._embedded_symbols.get(key)
+        if converted_symbol is None:
+            # Get the actual symbol definition
+            symbol_def = cache.get_symbol(lib_id)
+            if not symbol_def:
+                return None
+
+            # Conversion rewrites project references shared with the library
+            # data in place, so entries made for other project names go stale
+            for stale in [k for k in self._embedded_symbols if k[1] != self.name]:
+                del self._embedded_symbols[stale]
+
+            converted_symbol = self._convert_symbol_to_kicad_format(symbol_def, lib_id)
+            self._embedded_symbols[key] = converted_symbol
+        return converted_symbol
+
     def _convert_symbol_to_kicad_format(self, symbol_def, lib_id: str):
         """Convert symbol definition to KiCAD format."""
         # Use raw data if available, but fix the symbol name to use full lib_id
@@ -1883,28 +1971,61 @@ class Schematic:
     # Export Methods (using kicad-cli)
     # ============================================================================
 
-    def run_erc(self, **kwargs):
+    def run_erc(self, use_kicad_cli=False, **kwargs):
         """
         Run Electrical Rule Check (ERC) on this schematic.
 
-        This requires the schematic to be saved first.
+        By default the checks run in-process on the connectivity engine
+        (validation.ElectricalRulesChecker); use_kicad_cli=True runs kicad-cli
+        on the saved file instead.
 
         Args:
-            **kwargs: Arguments passed to cli.erc.run_erc()
-                - output_path: Path for ERC report
-                - format: 'json' or 'report'
+            use_kicad_cli: Run ERC through kicad-cli (default: False)
+            **kwargs: Report options
+                - output_path: Path for ERC report (JSON when in-process)
                 - severity: 'all', 'error', 'warning', 'exclusions'
-                - units: 'mm', 'in', 'mils'
+                - format: 'json' or 'report' ('json' only when in-process)
+                - any other argument of cli.erc.run_erc() (kicad-cli only),
+                  such as units or variables
 
         Returns:
             ErcReport with violations and summary
 
+        Raises:
+            TypeError: If in-process ERC is given an option it cannot honour
+
         Example:
             >>> report = sch.run_erc()
             >>> if report.has_errors():
             ...     print(f"Found {report.error_count} errors")
         """
-        from kicad_sch_api.cli.erc import run_erc
+        from kicad_sch_api.cli.erc import report_from_result, run_erc
+
+        if not use_kicad_cli:
+            from kicad_sch_api.validation.erc import ElectricalRulesChecker
+
+            unsupported = sorted(set(kwargs) - {"output_path", "severity", "format"})
+            if kwargs.get("format", "json") != "json":
+                unsupported.append("format")
+            if unsupported:
+                raise TypeError(
+                    f"run_erc() arguments not supported in-process: {', '.join(unsupported)} "
+                    "(pass use_kicad_cli=True)"
+                )
+
+            result = ElectricalRulesChecker(self).run_all_checks()
+            severity = kwargs.get("severity", "all")
+            if severity == "error":
+                result.warnings = []
+            elif severity in ("warning", "exclusions"):
+                result.errors = []
+                if severity == "exclusions":
+                    result.warnings = []
+
+            output_path = kwargs.get("output_path")
+            if output_path:
+                Path(output_path).write_text(result.to_json())
+            return report_from_result(result, self._file_path)
 
         if not self._file_path:
             raise ValueError("Schematic must be saved before running ERC")
@@ -1914,28 +2035,56 @@ class Schematic:
 
         return run_erc(self._file_path, **kwargs)
 
-    def export_netlist(self, format="kicadsexpr", **kwargs):
+    def export_netlist(self, format="kicadsexpr", use_kicad_cli=False, **kwargs):
         """
         Export netlist from this schematic.
 
-        This requires the schematic to be saved first.
+        The 'kicadsexpr', 'json' and 'spicenodes' formats are written in-process
+        from the connectivity engine; other formats, or use_kicad_cli=True,
+        run kicad-cli on the saved file.
 
         Args:
             format: Netlist format (default: 'kicadsexpr')
                 - kicadsexpr: KiCad S-expression (default)
+                - json: JSON components and nets (native only)
+                - spicenodes: SPICE-style node list, no models (native only)
                 - kicadxml: KiCad XML
                 - spice: SPICE netlist
                 - spicemodel: SPICE with models
                 - cadstar, orcadpcb2, pads, allegro
-            **kwargs: Arguments passed to cli.netlist.export_netlist()
+            use_kicad_cli: Force export through kicad-cli (default: False)
+            **kwargs: output_path, plus arguments passed to
+                cli.netlist.export_netlist() for kicad-cli formats
 
         Returns:
             Path to generated netlist file
 
+        Raises:
+            TypeError: If arguments other than output_path are given for a
+                format written in-process
+
         Example:
             >>> netlist = sch.export_netlist(format='spice')
             >>> print(f"Netlist: {netlist}")
         """
+        from kicad_sch_api.exporters.netlist import NATIVE_NETLIST_FORMATS
+
+        if format in NATIVE_NETLIST_FORMATS and not use_kicad_cli:
+            from kicad_sch_api.exporters.netlist import export_netlist
+
+            unsupported = sorted(set(kwargs) - {"output_path"})
+            if unsupported:
+                raise TypeError(
+                    f"export_netlist() arguments not supported for native '{format}' export: "
+                    f"{', '.join(unsupported)} (pass use_kicad_cli=True)"
+                )
+            return export_netlist(
+                self,
+                output_path=kwargs.get("output_path"),
+                format=format,
+                analyzer=self._wire_manager.get_connectivity_analyzer(),
+            )
+
         from kicad_sch_api.cli.netlist import export_netlist
 
         if not self._file_path:
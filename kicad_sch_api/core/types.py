@@ -11,17 +11,17 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class Point:
     """2D point with x,y coordinates in mm."""
 
     x: float
     y: float
 
-    def __post_init__(self) -> None:
-        # Ensure coordinates are float
-        object.__setattr__(self, "x", float(self.x))
-        object.__setattr__(self, "y", float(self.y))
+    def __init__(self, x: float, y: float) -> None:
+        # Coerce to float while setting, instead of re-assigning in __post_init__
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
 
     def distance_to(self, other: "Point") -> float:
         """Calculate distance to another point."""
@@ -135,7 +135,7 @@ class PinShape(Enum):
     NON_LOGIC = "non_logic"
 
 
-@dataclass
+@dataclass(slots=True)
 class SchematicPin:
     """Pin definition for schematic symbols."""
 
@@ -484,7 +484,7 @@ class WireType(Enum):
     BUS = "bus"
 
 
-@dataclass
+@dataclass(slots=True)
 class Wire:
     """Wire connection in schematic."""
 
@@ -571,7 +571,7 @@ class BusEntry:
             raise ValueError(f"Bus entry rotation must be 0, 90, 180, or 270, got {self.rotation}")
 
 
-@dataclass
+@dataclass(slots=True)
 class Junction:
     """Junction point where multiple wires meet."""
 
@@ -604,7 +604,7 @@ class HierarchicalLabelShape(Enum):
     UNSPECIFIED = "unspecified"
 
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     """Text label in schematic."""
 
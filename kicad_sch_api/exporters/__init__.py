@@ -1,10 +1,17 @@
 """
 Exporters module for kicad-sch-api.
 
-This module provides functionality to export KiCad schematics to various formats,
-starting with Python code export.
+This module provides functionality to export KiCad schematics to various formats:
+Python code, and native netlists built from the connectivity engine.
 """
 
+from .netlist import NATIVE_NETLIST_FORMATS, NetlistData, export_netlist, write_netlist
 from .python_generator import PythonCodeGenerator
 
-__all__ = ["PythonCodeGenerator"]
+__all__ = [
+    "PythonCodeGenerator",
+    "NATIVE_NETLIST_FORMATS",
+    "NetlistData",
+    "export_netlist",
+    "write_netlist",
+]
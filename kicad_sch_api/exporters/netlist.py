@@ -0,0 +1,282 @@
+"""
+Native netlist export for KiCad schematics.
+
+Writes netlists straight from the nets built by ConnectivityAnalyzer, without
+starting kicad-cli or a container. Output is streamed to the file as it is
+generated, one component or net at a time.
+"""
+
+import json
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from ..core.connectivity import ConnectivityAnalyzer, SheetComponent
+
+logger = logging.getLogger(__name__)
+
+# Formats written in-process; anything else still goes through kicad-cli
+NATIVE_NETLIST_FORMATS = ("kicadsexpr", "json", "spicenodes")
+
+_EXTENSIONS = {"kicadsexpr": ".net", "json": ".json", "spicenodes": ".cir"}
+
+
+def _natural_key(text: str) -> Tuple[Any, ...]:
+    """Sort key ordering R2 before R10 and pin 2 before pin 10."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text))
+
+
+def _quote(text: Any) -> str:
+    """Quote a string for an S-expression."""
+    escaped = str(text).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+class NetlistData:
+    """
+    Components and nets of a schematic as they appear in a netlist.
+
+    Power symbols and other virtual symbols (references starting with '#')
+    and symbols excluded from the board are left out, as kicad-cli does; nets
+    keep only the pins of the remaining components and are numbered in name
+    order.
+    """
+
+    def __init__(self, analyzer: ConnectivityAnalyzer):
+        """
+        Collect netlist data from an analyzed schematic.
+
+        Args:
+            analyzer: ConnectivityAnalyzer that has run analyze()
+        """
+        self.components: List[SheetComponent] = []
+        seen = set()
+        for component in analyzer.get_components():
+            reference = component.reference
+            if reference.startswith("#") or not component.on_board or reference in seen:
+                continue  # Units of one multi-unit symbol share a reference
+            seen.add(reference)
+            self.components.append(component)
+        self.components.sort(key=lambda component: _natural_key(component.reference))
+
+        pin_types = {component.reference: component.pin_types for component in self.components}
+        self.nets: List[Tuple[str, List[Tuple[str, str, str]]]] = []
+        for net in sorted(analyzer.nets, key=lambda net: net.name or ""):
+            nodes = [
+                (pin.reference, pin.pin_number, pin_types[pin.reference].get(pin.pin_number))
+                for pin in analyzer.get_net_pins(net.code)
+                if pin.reference in pin_types
+            ]
+            if nodes:
+                nodes.sort(key=lambda node: (_natural_key(node[0]), _natural_key(node[1])))
+                self.nets.append((net.name, nodes))
+
+        sheets = analyzer.get_sheet_instances()
+        self.root_path = sheets[0][0].rstrip("/") if sheets else ""
+        self.sheets = [(names, self.sheet_tstamps(path, self.root_path)) for path, names in sheets]
+
+    @staticmethod
+    def sheet_tstamps(path: str, root_path: str) -> str:
+        """Instance path relative to the root sheet, as kicad-cli writes it ("/", "/<uuid>/")."""
+        relative = path[len(root_path) :] if root_path and path.startswith(root_path) else path
+        return relative.rstrip("/") + "/"
+
+    def pin_nets(self) -> Dict[str, Dict[str, str]]:
+        """Map reference to {pin number: net name}."""
+        pin_nets: Dict[str, Dict[str, str]] = {}
+        for name, nodes in self.nets:
+            for reference, pin, _ in nodes:
+                pin_nets.setdefault(reference, {})[pin] = name
+        return pin_nets
+
+
+def export_netlist(
+    schematic,
+    output_path: Optional[Union[str, Path]] = None,
+    format: str = "kicadsexpr",
+    analyzer: Optional[ConnectivityAnalyzer] = None,
+) -> Path:
+    """
+    Export a netlist from a schematic without kicad-cli.
+
+    Args:
+        schematic: Root schematic
+        output_path: Output file (default: schematic file with the format's extension)
+        format: 'kicadsexpr' (KiCad S-expression), 'json' or 'spicenodes'
+            (SPICE-style element lines listing the nodes of each component)
+        analyzer: Analyzer that has already run on the schematic (analyzed
+            hierarchically if None)
+
+    Returns:
+        Path to generated netlist file
+
+    Raises:
+        ValueError: If the format is not supported natively, or no output path
+            is given for a schematic that has never been saved
+
+    Example:
+        >>> from kicad_sch_api.exporters import export_netlist
+        >>> export_netlist(sch, "circuit.net")
+    """
+    if format not in NATIVE_NETLIST_FORMATS:
+        raise ValueError(
+            f"Unsupported native netlist format: {format} "
+            f"(supported: {', '.join(NATIVE_NETLIST_FORMATS)})"
+        )
+
+    if output_path is None:
+        file_path = getattr(schematic, "file_path", None)
+        if not file_path:
+            raise ValueError("Schematic must be saved before exporting netlist")
+        output_path = Path(file_path).with_suffix(_EXTENSIONS[format])
+    output_path = Path(output_path)
+
+    if analyzer is None:
+        analyzer = ConnectivityAnalyzer()
+        analyzer.analyze(schematic, hierarchical=True)
+
+    with open(output_path, "w", encoding="utf-8") as stream:
+        write_netlist(stream, schematic, format, analyzer)
+
+    logger.info(f"Exported {format} netlist: {output_path}")
+    return output_path
+
+
+def write_netlist(stream: TextIO, schematic, format: str, analyzer: ConnectivityAnalyzer) -> None:
+    """
+    Write a netlist to an open text stream.
+
+    Args:
+        stream: Destination, written incrementally
+        schematic: Root schematic (for source file and title)
+        format: 'kicadsexpr', 'json' or 'spicenodes'
+        analyzer: Analyzer that has run on the schematic
+    """
+    writers = {
+        "kicadsexpr": _kicad_sexpr_lines,
+        "json": _json_lines,
+        "spicenodes": _spice_lines,
+    }
+    if format not in writers:
+        raise ValueError(f"Unsupported native netlist format: {format}")
+
+    data = NetlistData(analyzer)
+    for line in writers[format](schematic, data):
+        stream.write(line)
+        stream.write("\n")
+
+
+def _source(schematic) -> str:
+    file_path = getattr(schematic, "file_path", None)
+    return str(Path(file_path).resolve()) if file_path else ""
+
+
+def _tool() -> str:
+    from .. import __version__
+
+    return f"kicad-sch-api {__version__}"
+
+
+def _kicad_sexpr_lines(schematic, data: NetlistData) -> Iterator[str]:
+    """KiCad S-expression netlist (version "E"), as read by Pcbnew."""
+    yield '(export (version "E")'
+    yield "  (design"
+    yield f"    (source {_quote(_source(schematic))})"
+    yield f"    (date {_quote(datetime.now().astimezone().isoformat(timespec='seconds'))})"
+    yield f"    (tool {_quote(_tool())})"
+    for number, (names, tstamps) in enumerate(data.sheets, start=1):
+        yield (
+            f"    (sheet (number {_quote(number)}) (name {_quote(names)}) "
+            f"(tstamps {_quote(tstamps)}))"
+        )
+    yield "  )"
+
+    yield "  (components"
+    for component in data.components:
+        library, _, part = component.lib_id.rpartition(":")
+        yield f"    (comp (ref {_quote(component.reference)})"
+        yield f"      (value {_quote(component.value)})"
+        if component.footprint:
+            yield f"      (footprint {_quote(component.footprint)})"
+        yield f"      (libsource (lib {_quote(library)}) (part {_quote(part)}))"
+        tstamps = data.sheet_tstamps(component.sheet_path, data.root_path)
+        yield (
+            f"      (sheetpath (names {_quote(component.sheet_names)}) "
+            f"(tstamps {_quote(tstamps)}))"
+        )
+        yield f"      (tstamps {_quote(component.uuid)}))"
+    yield "  )"
+
+    yield "  (nets"
+    for code, (name, nodes) in enumerate(data.nets, start=1):
+        yield f'    (net (code {_quote(code)}) (name {_quote(name)}) (class "Default")'
+        for reference, pin, pin_type in nodes:
+            pintype = f" (pintype {_quote(pin_type)})" if pin_type else ""
+            yield f"      (node (ref {_quote(reference)}) (pin {_quote(pin)}){pintype})"
+        yield "    )"
+    yield "  )"
+    yield ")"
+
+
+def _json_lines(schematic, data: NetlistData) -> Iterator[str]:
+    """JSON netlist: design info, components and nets with their nodes."""
+    design = {"source": _source(schematic), "tool": _tool()}
+    yield "{"
+    yield f'  "design": {json.dumps(design)},'
+    yield '  "components": ['
+    for index, component in enumerate(data.components):
+        entry = {
+            "ref": component.reference,
+            "value": component.value,
+            "lib_id": component.lib_id,
+            "footprint": component.footprint,
+            "sheet": component.sheet_names,
+            "uuid": component.uuid,
+        }
+        comma = "," if index < len(data.components) - 1 else ""
+        yield f"    {json.dumps(entry)}{comma}"
+    yield "  ],"
+    yield '  "nets": ['
+    for code, (name, nodes) in enumerate(data.nets, start=1):
+        entry = {
+            "code": code,
+            "name": name,
+            "nodes": [
+                {"ref": reference, "pin": pin, "pintype": pin_type}
+                for reference, pin, pin_type in nodes
+            ],
+        }
+        comma = "," if code < len(data.nets) else ""
+        yield f"    {json.dumps(entry)}{comma}"
+    yield "  ]"
+    yield "}"
+
+
+def _spice_node(name: str) -> str:
+    """SPICE node name: ground nets become node 0, whitespace is not allowed."""
+    if name in ("GND", "0"):
+        return "0"
+    return re.sub(r"\s+", "_", name)
+
+
+def _spice_lines(schematic, data: NetlistData) -> Iterator[str]:
+    """
+    SPICE-style node list: one element line per component, pins in number order.
+
+    Lists connectivity only; there are no models, subcircuits or includes, so
+    the output is not a simulation deck (use kicad-cli's 'spice' format).
+    """
+    title = (getattr(schematic, "title_block", None) or {}).get("title")
+    yield f"* {title or _source(schematic) or 'schematic'}"
+    yield f"* Generated by {_tool()}"
+    pin_nets = data.pin_nets()
+    for component in data.components:
+        reference = component.reference
+        nets = pin_nets.get(reference, {})
+        # Library pins when known, else the pins found on nets
+        pins = sorted(component.pin_types or nets, key=_natural_key)
+        nodes = [_spice_node(nets[pin]) if pin in nets else f"NC_{reference}_{pin}" for pin in pins]
+        yield " ".join([reference, *nodes, component.value])
+    yield ".end"
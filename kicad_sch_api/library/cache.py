@@ -610,6 +610,27 @@ class SymbolLibraryCache:
         # Return all symbols from this library
         return [symbol for symbol in self._symbols.values() if symbol.library == library_name]
 
+    def get_library_mtime(self, library_name: str) -> Optional[float]:
+        """
+        Get the modification time of an indexed library file.
+
+        Args:
+            library_name: Library name (e.g., "Device"), optionally "PCM_"-prefixed
+
+        Returns:
+            File modification time, or None if the library is unknown or unreadable
+        """
+        library_path = self._library_index.get(library_name)
+        if library_path is None and library_name.startswith("PCM_"):
+            library_path = self._library_index.get(library_name[4:])
+        if library_path is None:
+            return None
+
+        try:
+            return library_path.stat().st_mtime
+        except OSError:
+            return None
+
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
         total_requests = self._cache_hits + self._cache_misses
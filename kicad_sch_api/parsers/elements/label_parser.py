@@ -1,7 +1,7 @@
 """
-Label and hierarchical label elements parser for KiCAD schematics.
+Label, hierarchical label and global label elements parser for KiCAD schematics.
 
-Handles parsing and serialization of Label and hierarchical label elements.
+Handles parsing and serialization of local, hierarchical and global label elements.
 """
 
 import logging
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 class LabelParser(BaseElementParser):
-    """Parser for Label and hierarchical label elements."""
+    """Parser for local, hierarchical and global label elements."""
 
     def __init__(self):
         """Initialize label parser."""
@@ -142,6 +142,89 @@ class LabelParser(BaseElementParser):
 
         return hlabel_data
 
+    def _parse_global_label(self, item: List[Any]) -> Optional[Dict[str, Any]]:
+        """Parse a global label definition."""
+        # Format: (global_label "text" (shape input) (at x y rotation) (fields_autoplaced yes)
+        #          (effects ...) (uuid ...) (property "Intersheetrefs" ...))
+        # Stored like Schematic.add_global_label() data, with a KiCAD-style "at" list
+        if len(item) < 2:
+            return None
+
+        size = config.defaults.font_size
+        glabel_data = {
+            "uuid": None,
+            "text": str(item[1]),
+            "shape": "input",
+            "at": [0, 0, 0],
+            "effects": {"font": {"size": [size, size]}, "justify": ["left"]},
+        }
+
+        for elem in item[2:]:  # Skip global_label keyword and text
+            if not isinstance(elem, list):
+                continue
+
+            elem_type = str(elem[0]) if isinstance(elem[0], sexpdata.Symbol) else None
+
+            if elem_type == "shape":
+                if len(elem) >= 2:
+                    glabel_data["shape"] = str(elem[1])
+
+            elif elem_type == "at":
+                if len(elem) >= 3:
+                    glabel_data["at"] = self._parse_at(elem)
+
+            elif elem_type == "fields_autoplaced":
+                glabel_data["fields_autoplaced"] = len(elem) < 2 or str(elem[1]) == "yes"
+
+            elif elem_type == "effects":
+                glabel_data["effects"] = self._parse_label_effects(elem, glabel_data["effects"])
+
+            elif elem_type == "uuid":
+                glabel_data["uuid"] = str(elem[1]) if len(elem) > 1 else None
+
+            elif elem_type == "property" and len(elem) >= 3:
+                prop = {"name": str(elem[1]), "value": str(elem[2]), "at": [0, 0, 0]}
+                for prop_elem in elem[3:]:
+                    if not isinstance(prop_elem, list) or not prop_elem:
+                        continue
+                    if str(prop_elem[0]) == "at" and len(prop_elem) >= 3:
+                        prop["at"] = self._parse_at(prop_elem)
+                    elif str(prop_elem[0]) == "effects":
+                        prop["effects"] = self._parse_label_effects(prop_elem, {"font": {}})
+                glabel_data.setdefault("properties", []).append(prop)
+
+        return glabel_data
+
+    @staticmethod
+    def _parse_at(elem: List[Any]) -> List[float]:
+        """Parse (at x y [rotation]) into [x, y, rotation], keeping numbers as written."""
+        rotation = elem[3] if len(elem) >= 4 else 0
+        return [elem[1], elem[2], rotation]
+
+    @staticmethod
+    def _parse_label_effects(elem: List[Any], effects: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse (effects (font (size w h) (bold yes) (italic yes)) (justify ...) (hide yes))."""
+        for effect_elem in elem[1:]:
+            if not isinstance(effect_elem, list) or not effect_elem:
+                continue
+            effect_type = str(effect_elem[0])
+            if effect_type == "font":
+                for font_elem in effect_elem[1:]:
+                    if not isinstance(font_elem, list) or not font_elem:
+                        continue
+                    font_type = str(font_elem[0])
+                    if font_type == "size" and len(font_elem) >= 3:
+                        effects["font"]["size"] = [float(font_elem[1]), float(font_elem[2])]
+                    elif font_type in ("bold", "italic"):
+                        effects["font"][font_type] = (
+                            len(font_elem) < 2 or str(font_elem[1]) == "yes"
+                        )
+            elif effect_type == "justify":
+                effects["justify"] = [str(j) for j in effect_elem[1:]]
+            elif effect_type == "hide":
+                effects["hide"] = len(effect_elem) < 2 or str(effect_elem[1]) == "yes"
+        return effects
+
     def _label_to_sexp(self, label_data: Dict[str, Any]) -> List[Any]:
         """Convert local label to S-expression."""
         sexp = [sexpdata.Symbol("label"), label_data["text"]]
@@ -209,3 +292,59 @@ class LabelParser(BaseElementParser):
             sexp.append([sexpdata.Symbol("uuid"), hlabel_data["uuid"]])
 
         return sexp
+
+    def _global_label_to_sexp(self, glabel_data: Dict[str, Any]) -> List[Any]:
+        """Convert global label to S-expression."""
+        sexp = [sexpdata.Symbol("global_label"), glabel_data["text"]]
+
+        shape = glabel_data.get("shape", "input")
+        sexp.append([sexpdata.Symbol("shape"), sexpdata.Symbol(shape)])
+
+        # Position as stored by Schematic.add_global_label(): [x, y, rotation]
+        if "at" in glabel_data:
+            at = glabel_data["at"]
+        else:
+            pos = glabel_data["position"]
+            at = [pos["x"], pos["y"], glabel_data.get("rotation", 0)]
+        sexp.append(self._at_to_sexp(at))
+
+        if glabel_data.get("fields_autoplaced"):
+            sexp.append([sexpdata.Symbol("fields_autoplaced"), sexpdata.Symbol("yes")])
+
+        sexp.append(self._label_effects_to_sexp(glabel_data.get("effects") or {}))
+
+        if glabel_data.get("uuid"):
+            sexp.append([sexpdata.Symbol("uuid"), glabel_data["uuid"]])
+
+        for prop in glabel_data.get("properties", []):
+            prop_sexp = [sexpdata.Symbol("property"), prop["name"], prop["value"]]
+            prop_sexp.append(self._at_to_sexp(prop.get("at", [0, 0, 0])))
+            if prop.get("effects"):
+                prop_sexp.append(self._label_effects_to_sexp(prop["effects"]))
+            sexp.append(prop_sexp)
+
+        return sexp
+
+    @staticmethod
+    def _at_to_sexp(at: List[float]) -> List[Any]:
+        """Convert [x, y, rotation] to (at x y rotation), writing whole numbers as integers."""
+        values = [at[0], at[1], at[2] if len(at) > 2 else 0]
+        values = [int(v) if isinstance(v, float) and v.is_integer() else v for v in values]
+        return [sexpdata.Symbol("at")] + values
+
+    @staticmethod
+    def _label_effects_to_sexp(effects_data: Dict[str, Any]) -> List[Any]:
+        """Convert a global label or label field effects dict to (effects ...)."""
+        font_data = effects_data.get("font") or {}
+        size = font_data.get("size") or [config.defaults.font_size] * 2
+        font = [sexpdata.Symbol("font"), [sexpdata.Symbol("size"), size[0], size[1]]]
+        for style in ("bold", "italic"):
+            if font_data.get(style):
+                font.append([sexpdata.Symbol(style), sexpdata.Symbol("yes")])
+
+        effects = [sexpdata.Symbol("effects"), font]
+        justify = effects_data.get("justify") or ["left"]
+        effects.append([sexpdata.Symbol("justify")] + [sexpdata.Symbol(j) for j in justify])
+        if effects_data.get("hide"):
+            effects.append([sexpdata.Symbol("hide"), sexpdata.Symbol("yes")])
+        return effects
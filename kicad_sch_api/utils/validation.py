@@ -116,10 +116,12 @@ class SchematicValidator:
 
         return self.issues.copy()
 
-    def validate_component(self, component_data: Dict[str, Any]) -> List[ValidationIssue]:
-        """Validate a single component."""
+    def validate_component(
+        self, component_data: Dict[str, Any], context: str = "component"
+    ) -> List[ValidationIssue]:
+        """Validate a single component, prefixing messages with context."""
         self.issues.clear()
-        self._validate_single_component(component_data)
+        self._validate_single_component(component_data, context)
         return self.issues.copy()
 
     def validate_reference(self, reference: str) -> bool:
@@ -4,26 +4,100 @@ Main Electrical Rules Checker orchestrator.
 Coordinates all validators and produces comprehensive ERC results.
 """
 
+import logging
+import multiprocessing
+import os
 import time
-from typing import TYPE_CHECKING, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from kicad_sch_api.validation.erc_models import ERCConfig, ERCResult, ERCViolation
 from kicad_sch_api.validation.validators import (
     BaseValidator,
     ComponentValidator,
+    ConnectivitySnapshot,
     ConnectivityValidator,
     PinTypeValidator,
     PowerValidator,
+    connectivity_of,
 )
 
 if TYPE_CHECKING:
     from kicad_sch_api.core.schematic import Schematic
 
+logger = logging.getLogger(__name__)
+
+# How validators of one run are executed
+EXECUTORS = ("thread", "process", "serial")
+
+# Schematic collections whose change versions decide which checks re-run
+TRACKED_COLLECTIONS = (
+    "components",
+    "wires",
+    "junctions",
+    "labels",
+    "hierarchical_labels",
+    "no_connects",
+)
+
+
+@dataclass
+class _CheckCache:
+    """Violations of the last run, kept for run_incremental()."""
+
+    analyzer: Any
+    validators: Tuple[BaseValidator, ...]
+    versions: Dict[str, Optional[int]] = field(default_factory=dict)
+    # check_schematic() results per validator
+    schematic_results: List[List[ERCViolation]] = field(default_factory=list)
+    # check_net() results per validator, for nets with any violation
+    net_results: Dict[int, List[List[ERCViolation]]] = field(default_factory=dict)
+    checked_codes: Set[int] = field(default_factory=set)
+    last_code: int = 0
+
+
+# check_schematic() results (None if not run), check_net() results per
+# snapshot net, and elapsed seconds of one validator
+_Outcome = Tuple[Optional[List[ERCViolation]], List[List[ERCViolation]], float]
+
+
+def _run_validator(
+    validator: BaseValidator, snapshot: ConnectivitySnapshot, run_schematic: bool
+) -> _Outcome:
+    """Run one validator's checks over a snapshot."""
+    start = time.perf_counter()
+    schematic_results = validator.check_schematic() if run_schematic else None
+    net_results = [validator.check_net(net, pins) for net, pins in snapshot.nets]
+    return schematic_results, net_results, time.perf_counter() - start
+
+
+# Validators and snapshot of the check a forked worker serves; set in the
+# worker only, so concurrent checkers in one parent never share it
+_forked_run: Optional[Tuple[List[BaseValidator], ConnectivitySnapshot]] = None
+
+
+def _init_forked_worker(run: Tuple[List[BaseValidator], ConnectivitySnapshot]) -> None:
+    """Process pool initializer: adopt the run inherited through fork (never pickled)."""
+    global _forked_run
+    _forked_run = run
+
+
+def _run_forked_validator(index: int, run_schematic: bool) -> _Outcome:
+    """Run one validator in a forked worker (process pool entry point)."""
+    validators, snapshot = _forked_run
+    return _run_validator(validators[index], snapshot, run_schematic)
+
 
 class ElectricalRulesChecker:
     """Main ERC orchestrator.
 
     Coordinates all validation checks and produces comprehensive results.
+    Validators share one connectivity snapshot per run and execute
+    concurrently in a thread pool; pass executor="process" to use forked
+    worker processes or executor="serial" to run them one after another.
+    Violations are merged in validator order regardless of which finishes
+    first.
 
     Example:
         >>> import kicad_sch_api as ksa
@@ -38,16 +112,35 @@ class ElectricalRulesChecker:
         ...         print(f"ERROR: {error.message}")
     """
 
-    def __init__(self, schematic: "Schematic", config: Optional[ERCConfig] = None) -> None:
+    def __init__(
+        self,
+        schematic: "Schematic",
+        config: Optional[ERCConfig] = None,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+    ) -> None:
         """Initialize ERC checker.
 
         Args:
             schematic: Schematic to validate
             config: Optional custom configuration
+            executor: How validators run: "thread" (thread pool), "process"
+                (forked worker processes; threads where fork is unavailable)
+                or "serial"
+            max_workers: Maximum concurrent validators (default: one thread
+                per validator, one process per CPU)
+
+        Raises:
+            ValueError: If executor is unknown
         """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor} (expected one of {EXECUTORS})")
         self.schematic = schematic
         self.config = config or ERCConfig()
+        self.executor = executor
+        self.max_workers = max_workers
         self.validators: List[BaseValidator] = []
+        self._cache: Optional[_CheckCache] = None
 
         # Register default validators
         self._register_default_validators()
@@ -72,17 +165,101 @@ class ElectricalRulesChecker:
     def run_all_checks(self) -> ERCResult:
         """Run all ERC checks.
 
+        Returns:
+            Complete ERC result with all violations
+        """
+        return self._run_checks(incremental=False)
+
+    def run_incremental(self) -> ERCResult:
+        """Run all ERC checks, re-checking only what changed since the last run.
+
+        Nets are re-checked when the connectivity engine rebuilt them (every
+        rebuilt net gets a new net code); each validator's non-net checks
+        re-run only when a collection it depends on changed. The first run,
+        or any run after a full re-analysis of the schematic, checks
+        everything.
+
+        Returns:
+            Complete ERC result with all violations
+
+        Example:
+            >>> erc = ElectricalRulesChecker(sch)
+            >>> erc.run_incremental()  # Full check
+            >>> sch.wires.add(start=(100, 100), end=(120, 100))
+            >>> result = erc.run_incremental()  # Only the new wire's net
+        """
+        return self._run_checks(incremental=True)
+
+    def _run_checks(self, incremental: bool) -> ERCResult:
+        """Run the checks, reusing cached violations where inputs are unchanged.
+
+        Args:
+            incremental: Reuse the results of the previous run
+
         Returns:
             Complete ERC result with all violations
         """
         start_time = time.time()
 
+        analyzer = connectivity_of(self.schematic)
+        versions = self._collection_versions()
+        codes = {net.code for net in analyzer.nets}
+
+        cache = self._cache if incremental else None
+        if cache is not None and not self._cache_is_current(cache, analyzer, codes):
+            cache = None
+
+        if cache is None:
+            changed: Optional[Set[str]] = None  # Everything
+            cache = _CheckCache(analyzer, tuple(self.validators))
+            cache.schematic_results = [[] for _ in self.validators]
+        else:
+            changed = {
+                name for name, version in versions.items() if cache.versions[name] != version
+            }
+
+        # Freeze the connectivity shared by all validators, then run them
+        for code in cache.checked_codes - codes:
+            cache.net_results.pop(code, None)
+        new_nets = [net for net in analyzer.nets if net.code not in cache.checked_codes]
+        snapshot = ConnectivitySnapshot.build(
+            self.schematic, analyzer, None if changed is None else new_nets
+        )
+        run_schematic = [
+            changed is None
+            or validator.depends_on is None
+            or bool(changed.intersection(validator.depends_on))
+            for validator in self.validators
+        ]
+        outcomes = self._run_validators(snapshot, run_schematic)
+
+        # Merge in validator order: non-net checks, then each new net
+        validator_timings: Dict[str, float] = {}
+        for index, (schematic_results, _, elapsed) in enumerate(outcomes):
+            if schematic_results is not None:
+                cache.schematic_results[index] = schematic_results
+            name = type(self.validators[index]).__name__
+            if name in validator_timings:
+                name = f"{name}[{index}]"
+            validator_timings[name] = elapsed * 1000
+        for position, (net, _) in enumerate(snapshot.nets):
+            results = [outcome[1][position] for outcome in outcomes]
+            if any(results):
+                cache.net_results[net.code] = results
+
+        cache.versions = versions
+        cache.checked_codes = codes
+        cache.last_code = max(codes, default=cache.last_code)
+        self._cache = cache
+
+        # Merge per validator: non-net violations, then nets in analyzer order
         all_violations: List[ERCViolation] = []
-
-        # Run each validator
-        for validator in self.validators:
-            violations = validator.validate()
-            all_violations.extend(violations)
+        for index in range(len(self.validators)):
+            all_violations.extend(cache.schematic_results[index])
+            for net in analyzer.nets:
+                results = cache.net_results.get(net.code)
+                if results:
+                    all_violations.extend(results[index])
 
         # Apply configuration (severity overrides, suppression)
         all_violations = self._apply_config(all_violations)
@@ -105,6 +282,91 @@ class ElectricalRulesChecker:
             total_checks=total_checks,
             passed_checks=passed_checks,
             duration_ms=duration_ms,
+            validator_timings=validator_timings,
+        )
+
+    def _run_validators(
+        self, snapshot: ConnectivitySnapshot, run_schematic: List[bool]
+    ) -> List[_Outcome]:
+        """Run every validator over a snapshot with the configured executor.
+
+        Args:
+            snapshot: Connectivity shared by the validators
+            run_schematic: Whether each validator's check_schematic() runs
+
+        Returns:
+            Outcome per validator, in validator order
+        """
+        # Validators with nothing to check are skipped
+        pending = [index for index, run in enumerate(run_schematic) if run or snapshot.nets]
+        done: Dict[int, _Outcome] = {}
+        for validator in self.validators:
+            validator.snapshot = snapshot
+        try:
+            if self.executor == "process" and len(pending) > 1:
+                done = self._run_in_processes(snapshot, run_schematic, pending)
+            elif self.executor == "thread" and len(pending) > 1:
+                workers = min(self.max_workers or len(pending), len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        index: pool.submit(
+                            _run_validator, self.validators[index], snapshot, run_schematic[index]
+                        )
+                        for index in pending
+                    }
+                    done = {index: future.result() for index, future in futures.items()}
+            for index in pending:
+                if index not in done:
+                    done[index] = _run_validator(
+                        self.validators[index], snapshot, run_schematic[index]
+                    )
+        finally:
+            for validator in self.validators:
+                validator.snapshot = None
+        return [done.get(index, (None, [], 0.0)) for index in range(len(self.validators))]
+
+    def _run_in_processes(
+        self, snapshot: ConnectivitySnapshot, run_schematic: List[bool], pending: List[int]
+    ) -> Dict[int, _Outcome]:
+        """Run validators in forked workers; empty if processes are unavailable."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Process ERC needs the fork start method; running validators serially")
+            return {}
+        workers = min(self.max_workers or os.cpu_count() or 1, len(pending))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_forked_worker,
+                initargs=((self.validators, snapshot),),
+            ) as pool:
+                futures = {
+                    index: pool.submit(_run_forked_validator, index, run_schematic[index])
+                    for index in pending
+                }
+                return {index: future.result() for index, future in futures.items()}
+        except Exception as e:
+            # Pool start-up or a broken pool: run the validators in-process
+            logger.warning(f"Process ERC failed, running validators serially: {e}")
+            return {}
+
+    def _collection_versions(self) -> Dict[str, Optional[int]]:
+        """Current change version of each tracked schematic collection."""
+        return {
+            name: getattr(getattr(self.schematic, name, None), "change_version", None)
+            for name in TRACKED_COLLECTIONS
+        }
+
+    def _cache_is_current(self, cache: _CheckCache, analyzer: Any, codes: Set[int]) -> bool:
+        """Check if cached net results still describe the analyzer's nets.
+
+        Incremental edits only ever assign net codes above those already
+        used; lower new codes mean the schematic was analyzed from scratch.
+        """
+        return (
+            cache.analyzer is analyzer
+            and cache.validators == tuple(self.validators)
+            and all(code > cache.last_code for code in codes - cache.checked_codes)
         )
 
     def run_check(self, check_type: str) -> List[ERCViolation]:
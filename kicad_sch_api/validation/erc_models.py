@@ -67,6 +67,7 @@ class ERCResult:
         total_checks: Total number of checks performed
         passed_checks: Number of checks that passed
         duration_ms: Execution time in milliseconds
+        validator_timings: Milliseconds spent in each validator, by class name
     """
 
     errors: List[ERCViolation]
@@ -75,6 +76,7 @@ class ERCResult:
     total_checks: int
     passed_checks: int
     duration_ms: float
+    validator_timings: Dict[str, float] = field(default_factory=dict)
 
     def has_errors(self) -> bool:
         """Check if any errors were found."""
@@ -129,6 +131,7 @@ class ERCResult:
             "total_checks": self.total_checks,
             "passed_checks": self.passed_checks,
             "duration_ms": self.duration_ms,
+            "validator_timings": self.validator_timings,
             "summary": self.summary(),
         }
 
@@ -37,6 +37,7 @@ class PinConflictMatrix:
         "bidi": "bidirectional",
         "b": "bidirectional",
         "tristate": "tristate",
+        "tri_state": "tristate",
         "pt_tristate": "tristate",
         "tri": "tristate",
         "t": "tristate",
@@ -52,10 +53,12 @@ class PinConflictMatrix:
         "pt_unspecified": "unspecified",
         "u": "unspecified",
         "power_input": "power_input",
+        "power_in": "power_input",
         "pt_power_in": "power_input",
         "pwr_in": "power_input",
         "w": "power_input",
         "power_output": "power_output",
+        "power_out": "power_output",
         "pt_power_out": "power_output",
         "pwr_out": "power_output",
         "open_collector": "open_collector",
@@ -67,6 +70,7 @@ class PinConflictMatrix:
         "oe": "open_emitter",
         "e": "open_emitter",
         "nc": "nc",
+        "no_connect": "nc",
         "pt_nc": "nc",
         "not_connected": "nc",
         "n": "nc",
@@ -5,17 +5,158 @@ Individual validators for different categories of electrical rules.
 """
 
 import re
+from collections import Counter
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 from kicad_sch_api.validation.erc_models import ERCViolation
 from kicad_sch_api.validation.pin_matrix import PinConflictMatrix, PinSeverity
 
 if TYPE_CHECKING:
+    from kicad_sch_api.core.connectivity import ConnectivityAnalyzer, EndpointIndex, Net
     from kicad_sch_api.core.schematic import Schematic
 
+# (component_ref, pin_num, pin_type) with pin_type normalized for PinConflictMatrix
+NetPin = Tuple[str, str, str]
+
+# Pin types that can drive an input pin (as in KiCad's ERC)
+DRIVER_PIN_TYPES = {
+    "output",
+    "bidirectional",
+    "tristate",
+    "passive",
+    "power_output",
+    "open_collector",
+    "open_emitter",
+}
+
+
+def connectivity_of(schematic: "Schematic") -> "ConnectivityAnalyzer":
+    """Get the analyzed connectivity of a schematic.
+
+    Uses the analyzer kept up to date by the schematic's wire manager, so
+    repeated checks do not trace the nets again.
+
+    Args:
+        schematic: Schematic to analyze
+
+    Returns:
+        ConnectivityAnalyzer that has run on the schematic
+    """
+    wire_manager = getattr(schematic, "_wire_manager", None)
+    if wire_manager is not None:
+        return wire_manager.get_connectivity_analyzer()
+
+    from kicad_sch_api.core.connectivity import ConnectivityAnalyzer
+
+    analyzer = ConnectivityAnalyzer()
+    analyzer.analyze(schematic, hierarchical=True)
+    return analyzer
+
+
+def net_pin_types(
+    analyzer: "ConnectivityAnalyzer", nets: Optional[List["Net"]] = None
+) -> List[Tuple["Net", List[NetPin]]]:
+    """Get nets with the electrical types of their pins.
+
+    Pins whose library symbol is unknown have no type and are left out.
+
+    Args:
+        analyzer: Analyzer that has run on the schematic
+        nets: Nets to describe (default: all nets); only the components on
+            these nets are looked up
+
+    Returns:
+        List of (net, [(component_ref, pin_num, pin_type), ...])
+    """
+    if nets is None:
+        nets = analyzer.nets
+        pin_types: Dict[str, Dict[str, str]] = {}
+        for component in analyzer.get_components():
+            # Units of one multi-unit symbol share a reference
+            pin_types.setdefault(component.reference, {}).update(component.pin_types)
+    else:
+        pin_types = analyzer.get_pin_types({pin.reference for net in nets for pin in net.pins})
+
+    aliases = PinConflictMatrix.PIN_TYPE_ALIASES
+    typed = []
+    for net in nets:
+        pins = []
+        for pin in analyzer.get_net_pins(net.code):
+            pin_type = aliases.get(pin_types.get(pin.reference, {}).get(pin.pin_number, ""))
+            if pin_type:
+                pins.append((pin.reference, pin.pin_number, pin_type))
+        typed.append((net, pins))
+    return typed
+
+
+@dataclass(frozen=True)
+class ConnectivitySnapshot:
+    """Connectivity shared by the validators of one ERC run.
+
+    Built once before any validator runs and only read by them, so
+    validators can run concurrently in threads or forked processes.
+
+    Attributes:
+        analyzer: Analyzer that has run on the schematic
+        nets: Nets checked in this run with their typed pins
+        endpoints: Endpoint index with its check results already computed
+    """
+
+    analyzer: "ConnectivityAnalyzer"
+    nets: Tuple[Tuple["Net", Tuple[NetPin, ...]], ...]
+    endpoints: "EndpointIndex"
+
+    @classmethod
+    def build(
+        cls,
+        schematic: "Schematic",
+        analyzer: Optional["ConnectivityAnalyzer"] = None,
+        nets: Optional[List["Net"]] = None,
+    ) -> "ConnectivitySnapshot":
+        """Capture the connectivity of a schematic.
+
+        Args:
+            schematic: Schematic to describe
+            analyzer: Analyzer to use (default: connectivity_of(schematic))
+            nets: Nets to type (default: all nets)
+
+        Returns:
+            New snapshot
+        """
+        from kicad_sch_api.core.connectivity import EndpointIndex
+
+        analyzer = analyzer or connectivity_of(schematic)
+        endpoints = EndpointIndex.for_schematic(schematic)
+        # Compute the cached results now, so readers never update them
+        endpoints.unconnected_pins()
+        endpoints.dangling_wire_ends()
+        return cls(
+            analyzer=analyzer,
+            nets=tuple((net, tuple(pins)) for net, pins in net_pin_types(analyzer, nets)),
+            endpoints=endpoints,
+        )
+
 
 class BaseValidator:
-    """Base class for ERC validators."""
+    """Base class for ERC validators.
+
+    Validators that split their checks into check_net() (confined to one
+    net) and check_schematic() can be re-run incrementally by
+    ElectricalRulesChecker.run_incremental(): check_net() only for nets that
+    changed, check_schematic() only when a collection named in depends_on
+    changed. Validators that only implement validate() run in full every time.
+
+    During an ERC run, snapshot holds the connectivity shared by all
+    validators; validators may run concurrently and must not modify the
+    schematic.
+    """
+
+    # Schematic collections check_schematic() reads (None: re-run on any change)
+    depends_on: Optional[Tuple[str, ...]] = None
+
+    # Connectivity of the running ERC check (None outside of ERC runs)
+    snapshot: Optional[ConnectivitySnapshot] = None
 
     def __init__(self, schematic: "Schematic") -> None:
         """Initialize validator.
@@ -33,6 +174,51 @@ class BaseValidator:
         """
         raise NotImplementedError("Subclasses must implement validate()")
 
+    def check_net(self, net: "Net", pins: List[NetPin]) -> List[ERCViolation]:
+        """Run the checks confined to one net.
+
+        Args:
+            net: Net to check
+            pins: (component_ref, pin_num, pin_type) of the net's typed pins
+
+        Returns:
+            List of violations on this net
+        """
+        return []
+
+    def check_schematic(self) -> List[ERCViolation]:
+        """Run the checks that are not confined to one net.
+
+        Returns:
+            List of violations found
+        """
+        return self.validate()
+
+    def _connectivity(self) -> "ConnectivityAnalyzer":
+        """Get the analyzed connectivity of the schematic."""
+        if self.snapshot is not None:
+            return self.snapshot.analyzer
+        return connectivity_of(self.schematic)
+
+    def _endpoints(self) -> "EndpointIndex":
+        """Get the schematic's endpoint index, shared by all validators."""
+        if self.snapshot is not None:
+            return self.snapshot.endpoints
+
+        from kicad_sch_api.core.connectivity import EndpointIndex
+
+        return EndpointIndex.for_schematic(self.schematic)
+
+    def _net_pins(self) -> List[Tuple["Net", List[NetPin]]]:
+        """Get every net with the electrical types of its pins."""
+        return net_pin_types(self._connectivity())
+
+    @staticmethod
+    def _net_location(net: "Net"):
+        """Position of the first pin of a net, for reporting."""
+        pins = sorted(net.pins, key=lambda pin: (pin.reference, pin.pin_number))
+        return pins[0].position if pins else None
+
 
 class PinTypeValidator(BaseValidator):
     """Validates pin-to-pin connections for electrical conflicts.
@@ -52,6 +238,8 @@ class PinTypeValidator(BaseValidator):
         super().__init__(schematic)
         self.pin_matrix = pin_matrix or PinConflictMatrix()
 
+    depends_on = ()
+
     def validate(self) -> List[ERCViolation]:
         """Validate pin connections on all nets.
 
@@ -60,75 +248,125 @@ class PinTypeValidator(BaseValidator):
         """
         violations: List[ERCViolation] = []
 
-        # Build nets from wires and components
-        nets = self._build_nets()
-
         # Check each net for pin conflicts
-        for net_name, pins in nets.items():
-            net_violations = self._check_net_pins(net_name, pins)
-            violations.extend(net_violations)
+        for net, pins in self._net_pins():
+            violations.extend(self.check_net(net, pins))
 
         return violations
 
+    def check_net(self, net: "Net", pins: List[NetPin]) -> List[ERCViolation]:
+        """Check one net for pin conflicts."""
+        return self._check_net_pins(net.name, pins)
+
+    def check_schematic(self) -> List[ERCViolation]:
+        """Pin conflicts are confined to nets."""
+        return []
+
     def _build_nets(self) -> Dict[str, List[Tuple[str, str, str]]]:
         """Build net connectivity map.
 
         Returns:
             Dict mapping net name to list of (component_ref, pin_num, pin_type) tuples
         """
-        # TODO: Implement net tracing from wires and components
-        # For now, return placeholder
-        # This will be implemented when we have full net connectivity analysis
-        return {}
+        nets: Dict[str, List[Tuple[str, str, str]]] = {}
+        for net, pins in self._net_pins():
+            name = net.name or f"Net-{net.code}"
+            if name in nets:
+                name = f"{name} ({net.code})"
+            nets[name] = pins
+        return nets
 
     def _check_net_pins(
         self, net_name: str, pins: List[Tuple[str, str, str]]
     ) -> List[ERCViolation]:
         """Check all pin pairs on a net for conflicts.
 
+        The matrix is evaluated once per pair of pin types present on the net
+        (a histogram of normalized types), so large power nets cost O(pins)
+        when clean. Pin pairs are only enumerated for the types that conflict.
+
         Args:
             net_name: Net name
             pins: List of (component_ref, pin_num, pin_type) tuples
 
         Returns:
-            List of violations found on this net
+            List of violations found on this net, in pin pair order
         """
-        violations: List[ERCViolation] = []
+        if len(pins) < 2:
+            return []
+
+        normalized = [self.pin_matrix.normalize_pin_type(pin_type) for _, _, pin_type in pins]
+        histogram = Counter(normalized)
+
+        # Ordered type pairs that produce a violation
+        conflicts: Dict[Tuple[str, str], int] = {}
+        for type1 in histogram:
+            for type2 in histogram:
+                if type1 == type2 and histogram[type1] < 2:
+                    continue  # A lone pin cannot conflict with itself
+                severity = self.pin_matrix.check_connection(type1, type2)
+                if severity in (PinSeverity.ERROR, PinSeverity.WARNING):
+                    conflicts[(type1, type2)] = severity
+
+        if not conflicts:
+            return []
+
+        # Materialize only pins whose type takes part in a conflict
+        involved = {pin_type for pair in conflicts for pin_type in pair}
+        candidates = [
+            (pin, pin_type) for pin, pin_type in zip(pins, normalized) if pin_type in involved
+        ]
 
-        # Check all pairs of pins
-        for i, (ref1, pin1_num, pin1_type) in enumerate(pins):
-            for ref2, pin2_num, pin2_type in pins[i + 1 :]:
-                severity = self.pin_matrix.check_connection(pin1_type, pin2_type)
-
-                if severity == PinSeverity.ERROR:
-                    violations.append(
-                        ERCViolation(
-                            violation_type="pin_conflict",
-                            severity="error",
-                            message=f"Pin conflict: {pin1_type} ({ref1}) connected to {pin2_type} ({ref2})",
-                            component_refs=[ref1, ref2],
-                            net_name=net_name,
-                            pin_numbers=[pin1_num, pin2_num],
-                            error_code="E001",
-                            suggested_fix=f"Remove one output or add buffer between {ref1} and {ref2}",
-                        )
-                    )
-                elif severity == PinSeverity.WARNING:
-                    violations.append(
-                        ERCViolation(
-                            violation_type="pin_conflict",
-                            severity="warning",
-                            message=f"Pin warning: {pin1_type} ({ref1}) connected to {pin2_type} ({ref2})",
-                            component_refs=[ref1, ref2],
-                            net_name=net_name,
-                            pin_numbers=[pin1_num, pin2_num],
-                            error_code="W005",
-                            suggested_fix="Verify this connection is intentional",
-                        )
-                    )
+        violations: List[ERCViolation] = []
+        for i, (pin1, type1) in enumerate(candidates):
+            for pin2, type2 in candidates[i + 1 :]:
+                severity = conflicts.get((type1, type2))
+                if severity is not None:
+                    violations.append(self._pin_conflict(net_name, pin1, pin2, severity))
 
         return violations
 
+    @staticmethod
+    def _pin_conflict(
+        net_name: str, pin1: Tuple[str, str, str], pin2: Tuple[str, str, str], severity: int
+    ) -> ERCViolation:
+        """Build the violation for one conflicting pin pair.
+
+        Args:
+            net_name: Net name
+            pin1: First (component_ref, pin_num, pin_type) tuple
+            pin2: Second (component_ref, pin_num, pin_type) tuple
+            severity: PinSeverity.ERROR or PinSeverity.WARNING
+
+        Returns:
+            Pin conflict violation
+        """
+        ref1, pin1_num, pin1_type = pin1
+        ref2, pin2_num, pin2_type = pin2
+
+        if severity == PinSeverity.ERROR:
+            return ERCViolation(
+                violation_type="pin_conflict",
+                severity="error",
+                message=f"Pin conflict: {pin1_type} ({ref1}) connected to {pin2_type} ({ref2})",
+                component_refs=[ref1, ref2],
+                net_name=net_name,
+                pin_numbers=[pin1_num, pin2_num],
+                error_code="E001",
+                suggested_fix=f"Remove one output or add buffer between {ref1} and {ref2}",
+            )
+
+        return ERCViolation(
+            violation_type="pin_conflict",
+            severity="warning",
+            message=f"Pin warning: {pin1_type} ({ref1}) connected to {pin2_type} ({ref2})",
+            component_refs=[ref1, ref2],
+            net_name=net_name,
+            pin_numbers=[pin1_num, pin2_num],
+            error_code="W005",
+            suggested_fix="Verify this connection is intentional",
+        )
+
 
 class ConnectivityValidator(BaseValidator):
     """Validates wire connectivity and net driving.
@@ -136,6 +374,8 @@ class ConnectivityValidator(BaseValidator):
     Checks for dangling wires, unconnected pins, and undriven nets.
     """
 
+    depends_on = ("wires", "components", "junctions", "labels", "no_connects")
+
     def validate(self) -> List[ERCViolation]:
         """Validate connectivity.
 
@@ -144,54 +384,64 @@ class ConnectivityValidator(BaseValidator):
         """
         violations: List[ERCViolation] = []
 
-        violations.extend(self.find_dangling_wires())
-        violations.extend(self.find_unconnected_pins())
+        violations.extend(self.check_schematic())
         violations.extend(self.find_undriven_nets())
 
         return violations
 
+    def check_net(self, net: "Net", pins: List[NetPin]) -> List[ERCViolation]:
+        """Check one net for a missing driver."""
+        return self._check_driven(net, pins)
+
+    def check_schematic(self) -> List[ERCViolation]:
+        """Check wire endpoints and pins.
+
+        Returns:
+            List of dangling wire and unconnected pin violations
+        """
+        return self.find_dangling_wires() + self.find_unconnected_pins()
+
     def find_dangling_wires(self) -> List[ERCViolation]:
         """Find wires with only one connection.
 
         Returns:
             List of dangling wire violations
         """
-        violations: List[ERCViolation] = []
-
-        for wire in self.schematic.wires:
-            # Check endpoints for connections
-            start_connections = self._count_connections_at_point(wire.start)
-            end_connections = self._count_connections_at_point(wire.end)
-
-            if start_connections < 2 or end_connections < 2:
-                violations.append(
-                    ERCViolation(
-                        violation_type="dangling_wire",
-                        severity="warning",
-                        message=f"Wire has unconnected endpoint at ({wire.start.x}, {wire.start.y})",
-                        component_refs=[],
-                        location=wire.start if start_connections < 2 else wire.end,
-                        error_code="W002",
-                        suggested_fix="Connect wire to component pin or remove if unused",
-                    )
-                )
-
-        return violations
+        return [
+            ERCViolation(
+                violation_type="dangling_wire",
+                severity="warning",
+                message=f"Wire has unconnected endpoint at ({point.x}, {point.y})",
+                component_refs=[],
+                location=point,
+                error_code="W002",
+                suggested_fix="Connect wire to component pin or remove if unused",
+            )
+            for _, point in self._endpoints().dangling_wire_ends()
+        ]
 
     def find_unconnected_pins(self) -> List[ERCViolation]:
-        """Find input pins with no connections.
+        """Find pins with no connections.
+
+        Pins marked with a no-connect flag, pins of the no_connect type and
+        power symbol pins are not reported.
 
         Returns:
             List of unconnected pin violations
         """
-        violations: List[ERCViolation] = []
-
-        for component in self.schematic.components:
-            # TODO: Get pin types from symbol library
-            # For now, check if any pins have no wires
-            pass
-
-        return violations
+        return [
+            ERCViolation(
+                violation_type="unconnected_pin",
+                severity="warning",
+                message=f"Pin {pin_num} of {ref} is not connected",
+                component_refs=[ref],
+                error_code="W001",
+                pin_numbers=[pin_num],
+                location=position,
+                suggested_fix="Connect the pin or place a no-connect flag on it",
+            )
+            for ref, pin_num, position in self._endpoints().unconnected_pins()
+        ]
 
     def find_undriven_nets(self) -> List[ERCViolation]:
         """Find nets with only input pins (no output driver).
@@ -201,11 +451,31 @@ class ConnectivityValidator(BaseValidator):
         """
         violations: List[ERCViolation] = []
 
-        # TODO: Implement net tracing and driver detection
-        # This requires full net connectivity analysis
+        for net, pins in self._net_pins():
+            violations.extend(self._check_driven(net, pins))
 
         return violations
 
+    def _check_driven(self, net: "Net", pins: List[NetPin]) -> List[ERCViolation]:
+        """Report a net whose input pins have no driver."""
+        inputs = [(ref, pin_num) for ref, pin_num, pin_type in pins if pin_type == "input"]
+        if not inputs or any(pin_type in DRIVER_PIN_TYPES for _, _, pin_type in pins):
+            return []
+
+        return [
+            ERCViolation(
+                violation_type="undriven_net",
+                severity="warning",
+                message=f"Net {net.name} has input pins but no driver",
+                component_refs=[ref for ref, _ in inputs],
+                net_name=net.name,
+                pin_numbers=[pin_num for _, pin_num in inputs],
+                location=self._net_location(net),
+                error_code="W003",
+                suggested_fix="Connect an output pin or a pull-up/pull-down to the net",
+            )
+        ]
+
     def _count_connections_at_point(self, point) -> int:
         """Count number of connections at a point.
 
@@ -213,11 +483,10 @@ class ConnectivityValidator(BaseValidator):
             point: Point to check
 
         Returns:
-            Number of wires/pins at this point
+            Number of wire points, pins, junctions, labels, sheet pins and
+            no-connect flags at this point
         """
-        # TODO: Implement proper connection counting
-        # For now, return 2 (assume connected)
-        return 2
+        return self._endpoints().count(point)
 
 
 class ComponentValidator(BaseValidator):
@@ -229,6 +498,8 @@ class ComponentValidator(BaseValidator):
     # Valid reference format: Letter(s) followed by number(s)
     REFERENCE_PATTERN = re.compile(r"^[A-Z]+[0-9]+$", re.IGNORECASE)
 
+    depends_on = ("components",)
+
     def validate(self) -> List[ERCViolation]:
         """Validate components.
 
@@ -284,6 +555,9 @@ class ComponentValidator(BaseValidator):
         violations: List[ERCViolation] = []
 
         for component in self.schematic.components:
+            if component.reference.startswith("#"):
+                continue  # Power symbols and flags have no footprint or numbered reference
+
             # Check for missing value
             if not component.value or component.value.strip() == "":
                 violations.append(
@@ -348,6 +622,8 @@ class PowerValidator(BaseValidator):
         "V-",
     }
 
+    depends_on = ()
+
     def validate(self) -> List[ERCViolation]:
         """Validate power connections.
 
@@ -361,6 +637,19 @@ class PowerValidator(BaseValidator):
 
         return violations
 
+    def check_net(self, net: "Net", pins: List[NetPin]) -> List[ERCViolation]:
+        """Check that the power inputs of one net are driven."""
+        power_inputs = self._undriven_power_inputs(pins)
+        if not power_inputs:
+            return []
+        if self._is_power_rail(net, power_inputs):
+            return [self._missing_power_flag(net, power_inputs)]
+        return [self._power_input_undriven(net, power_inputs)]
+
+    def check_schematic(self) -> List[ERCViolation]:
+        """Power checks are confined to nets."""
+        return []
+
     def validate_power_flags(self) -> List[ERCViolation]:
         """Check for missing PWR_FLAG on power nets.
 
@@ -369,27 +658,77 @@ class PowerValidator(BaseValidator):
         """
         violations: List[ERCViolation] = []
 
-        # TODO: Implement power net detection and PWR_FLAG checking
-        # This requires:
-        # 1. Identify power nets (by name or power input pins)
-        # 2. Check for PWR_FLAG symbol or power output on net
-        # 3. Generate WARNING (not ERROR per requirements) if missing
+        for net, pins in self._net_pins():
+            power_inputs = self._undriven_power_inputs(pins)
+            if power_inputs and self._is_power_rail(net, power_inputs):
+                violations.append(self._missing_power_flag(net, power_inputs))
 
         return violations
 
     def check_power_continuity(self) -> List[ERCViolation]:
         """Check that power inputs are driven by power outputs.
 
+        Power rails (nets with a power symbol or a power net name) are
+        reported by validate_power_flags() instead.
+
         Returns:
             List of power continuity violations
         """
         violations: List[ERCViolation] = []
 
-        # TODO: Implement power driver checking
-        # This requires full net tracing with pin type detection
+        for net, pins in self._net_pins():
+            power_inputs = self._undriven_power_inputs(pins)
+            if power_inputs and not self._is_power_rail(net, power_inputs):
+                violations.append(self._power_input_undriven(net, power_inputs))
 
         return violations
 
+    @staticmethod
+    def _undriven_power_inputs(pins: List[NetPin]) -> List[Tuple[str, str]]:
+        """Get the power input pins of a net that has no power output pin.
+
+        Returns:
+            (component_ref, pin_num) of the power inputs (empty if driven)
+        """
+        if any(pin_type == "power_output" for _, _, pin_type in pins):
+            return []
+        return [(ref, pin_num) for ref, pin_num, pin_type in pins if pin_type == "power_input"]
+
+    def _is_power_rail(self, net: "Net", power_inputs: List[Tuple[str, str]]) -> bool:
+        """Check if a net is a power rail: it has a power symbol or a power net name."""
+        return any(ref.startswith("#") for ref, _ in power_inputs) or self.is_power_net(net.name)
+
+    def _missing_power_flag(self, net: "Net", power_inputs: List[Tuple[str, str]]) -> ERCViolation:
+        """Build the W004 violation for an undriven power rail."""
+        return ERCViolation(
+            violation_type="missing_power_flag",
+            severity="warning",
+            message=f"Power net {net.name} is not driven by a power output or PWR_FLAG",
+            component_refs=[ref for ref, _ in power_inputs],
+            net_name=net.name,
+            pin_numbers=[pin_num for _, pin_num in power_inputs],
+            location=self._net_location(net),
+            error_code="W004",
+            suggested_fix=f"Add a PWR_FLAG to {net.name} or connect a regulator output",
+        )
+
+    def _power_input_undriven(
+        self, net: "Net", power_inputs: List[Tuple[str, str]]
+    ) -> ERCViolation:
+        """Build the W009 violation for undriven power inputs off a power rail."""
+        refs = ", ".join(f"{ref}:{pin_num}" for ref, pin_num in power_inputs)
+        return ERCViolation(
+            violation_type="power_input_undriven",
+            severity="warning",
+            message=f"Power input pins not driven by any power output: {refs}",
+            component_refs=[ref for ref, _ in power_inputs],
+            net_name=net.name,
+            pin_numbers=[pin_num for _, pin_num in power_inputs],
+            location=self._net_location(net),
+            error_code="W009",
+            suggested_fix="Connect the pins to a power rail or a regulator output",
+        )
+
     def is_power_net(self, net_name: str) -> bool:
         """Check if net name suggests it's a power net.
 
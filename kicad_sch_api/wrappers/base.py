@@ -20,6 +20,8 @@ class ElementWrapper(ABC, Generic[T]):
     - Consistent API across different element types
     """
 
+    __slots__ = ("_data", "_collection")
+
     def __init__(self, data: T, parent_collection: Optional["IndexedCollection[Any]"]):
         """Initialize the wrapper.
 
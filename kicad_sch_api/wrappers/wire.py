@@ -19,6 +19,8 @@ class WireWrapper(ElementWrapper[Wire]):
     - Type-safe operations
     """
 
+    __slots__ = ()
+
     def __init__(self, wire: Wire, parent_collection: Optional["WireCollection"] = None):
         """Initialize wire wrapper.
 
@@ -1101,7 +1101,7 @@ async def list_netlist(
         for net in nets:
             # Convert pins from PinConnection objects to dicts
             pins = []
-            for pin in net.pins:
+            for pin in analyzer.get_net_pins(net.code):
                 pins.append({
                     "reference": pin.reference,
                     "pin": pin.pin_number,
@@ -1305,19 +1305,12 @@ async def find_at_position(
         try:
             from kicad_sch_api.core.connectivity import ConnectivityAnalyzer
             analyzer = ConnectivityAnalyzer()
-            nets = analyzer.analyze(schematic, hierarchical=True)
-
-            # Build pin -> net mapping
-            pin_to_net = {}
-            for net in nets:
-                for pin_conn in net.pins:
-                    key = f"{pin_conn.reference}.{pin_conn.pin_number}"
-                    pin_to_net[key] = net.name if net.name else "unnamed"
+            analyzer.analyze(schematic, hierarchical=True)
 
             # Update pins with net names
             for pin in pins_found:
-                key = f"{pin['component']}.{pin['pin_number']}"
-                pin['net'] = pin_to_net.get(key, None)
+                net = analyzer.get_net_for_pin(pin['component'], pin['pin_number'])
+                pin['net'] = (net.name or "unnamed") if net else None
 
         except Exception as e:
             logger.warning(f"[MCP] Could not analyze connectivity for net names: {e}")
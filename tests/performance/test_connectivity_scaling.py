@@ -0,0 +1,123 @@
+"""
+Connectivity analysis benchmark on synthetic large sheets.
+
+Builds a sheet of resistor chains: every chain is an L-shaped pair of wires
+between two pins, with a junction and a local label on the corner. Pin
+positions are precomputed so the benchmark measures net construction only,
+not symbol library lookups.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from kicad_sch_api.collections.labels import LabelElement
+from kicad_sch_api.core.connectivity import ConnectivityAnalyzer, PinConnection
+from kicad_sch_api.core.types import Junction, Label, Point, Wire
+
+WIRES = 10_000
+
+
+class SyntheticAnalyzer(ConnectivityAnalyzer):
+    """Analyzer reading pin positions from the synthetic sheet."""
+
+    def _build_pin_positions(self, schematic):
+        return schematic.pin_positions
+
+
+def build_sheet(wire_count: int) -> SimpleNamespace:
+    """
+    Build a synthetic sheet with wire_count wires.
+
+    Chain i joins R{i}.1 and R{i}.2 through two wires meeting at a corner;
+    chains sharing a label name (every 10th chain) form one net.
+    """
+    components, wires, junctions, labels = [], [], [], []
+    pin_positions = {}
+
+    for i in range(wire_count // 2):
+        x = (i % 100) * 12.7
+        y = (i // 100) * 12.7
+        start = Point(x, y)
+        corner = Point(x + 5.08, y)
+        end = Point(x + 5.08, y + 5.08)
+        reference = f"R{i}"
+
+        components.append(SimpleNamespace(reference=reference, lib_id="Device:R", value="10k"))
+        pin_positions[PinConnection(reference, "1", start)] = start
+        pin_positions[PinConnection(reference, "2", end)] = end
+        wires.append(Wire(uuid=f"w{i}a", points=[start, corner]))
+        wires.append(Wire(uuid=f"w{i}b", points=[corner, end]))
+        junctions.append(Junction(uuid=f"j{i}", position=corner))
+        labels.append(LabelElement(Label(uuid=f"l{i}", position=corner, text=f"N{i % 10}"), None))
+
+    return SimpleNamespace(
+        components=components,
+        wires=wires,
+        junctions=junctions,
+        labels=labels,
+        hierarchical_labels=[],
+        pin_positions=pin_positions,
+        file_path=None,
+        _data={},
+    )
+
+
+@pytest.mark.performance
+class TestConnectivityScaling:
+    """Net construction must stay near-linear in sheet size."""
+
+    def test_synthetic_sheet_nets(self):
+        analyzer = SyntheticAnalyzer()
+        nets = analyzer.analyze(build_sheet(200), hierarchical=False)
+
+        assert len(nets) == 10
+        assert {net.name for net in nets} == {f"N{i}" for i in range(10)}
+        assert analyzer.are_connected("R0", "1", "R10", "2")
+        assert not analyzer.are_connected("R0", "1", "R1", "1")
+
+    def test_10k_wire_sheet(self):
+        sheet = build_sheet(WIRES)
+        analyzer = SyntheticAnalyzer()
+
+        start = time.perf_counter()
+        nets = analyzer.analyze(sheet, hierarchical=False)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n{WIRES} wires, {len(sheet.pin_positions)} pins: {elapsed:.3f}s")
+        assert len(nets) == 10
+        assert sum(len(net.wires) for net in nets) == WIRES
+        assert elapsed < 5.0
+
+    def test_scaling_is_near_linear(self):
+        timings = {}
+        for wire_count in (2_500, 10_000):
+            sheet = build_sheet(wire_count)
+            start = time.perf_counter()
+            SyntheticAnalyzer().analyze(sheet, hierarchical=False)
+            timings[wire_count] = time.perf_counter() - start
+
+        # 4x the wires must cost well under the 16x of a quadratic algorithm
+        assert timings[10_000] < timings[2_500] * 8
+
+    def test_incremental_edits_beat_reanalysis(self):
+        sheet = build_sheet(WIRES)
+        analyzer = SyntheticAnalyzer()
+
+        start = time.perf_counter()
+        analyzer.analyze(sheet, hierarchical=False)
+        full = time.perf_counter() - start
+
+        # Cut and restore one corner wire per chain in a 1000-wire net
+        edits = [wire for wire in sheet.wires if wire.uuid.endswith("b")][:50]
+        start = time.perf_counter()
+        for wire in edits:
+            analyzer.remove_wire(wire.uuid)
+            analyzer.add_wire(wire)
+        per_edit = (time.perf_counter() - start) / (2 * len(edits))
+
+        print(f"\nfull analysis {full:.3f}s, incremental edit {per_edit * 1000:.2f}ms")
+        assert len(analyzer.nets) == 10
+        assert sum(len(net.wires) for net in analyzer.nets) == WIRES
+        assert per_edit < full / 10
@@ -0,0 +1,66 @@
+"""
+Incremental ERC benchmark on a 5k-component sheet.
+
+After a full check, a one-wire edit re-checks only the rebuilt net and the
+wire-dependent checks instead of every net and component.
+"""
+
+import gc
+import time
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.validation.erc import ElectricalRulesChecker
+
+COMPONENTS = 5_000
+EDITS = 5
+
+
+def build_sheet(count: int):
+    """Resistors on a grid, wired in pairs."""
+    sch = ksa.create_schematic("ERC benchmark")
+    sch.components.add_many(
+        {
+            "lib_id": "Device:R",
+            "reference": f"R{i + 1}",
+            "value": "1k",
+            "position": (25.4 + (i % 100) * 12.7, 25.4 + (i // 100) * 25.4),
+        }
+        for i in range(count)
+    )
+    pins = sch.components.pin_table()
+    with sch.wires.batch_mode():
+        for i in range(1, count, 2):
+            sch.wires.add(start=pins.position(f"R{i}", "2"), end=pins.position(f"R{i + 1}", "1"))
+    return sch, pins
+
+
+def signature(result):
+    return sorted((v.error_code, v.message) for v in result.errors + result.warnings)
+
+
+@pytest.mark.performance
+class TestIncrementalERCPerformance:
+    """run_incremental() after a single edit."""
+
+    def test_one_wire_edit_rechecks_quickly(self):
+        sch, pins = build_sheet(COMPONENTS)
+        erc = ElectricalRulesChecker(sch)
+        erc.run_incremental()
+
+        timings = []
+        for i in range(EDITS):
+            # Join two neighbouring pairs: R(4i+2).2 to R(4i+3).1
+            sch.wires.add(
+                start=pins.position(f"R{4 * i + 2}", "2"), end=pins.position(f"R{4 * i + 3}", "1")
+            )
+            gc.collect()
+            start = time.perf_counter()
+            result = erc.run_incremental()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        best_ms = min(timings)
+        print(f"\nIncremental ERC after one wire ({COMPONENTS} components): {best_ms:.1f} ms")
+        assert best_ms < 50, f"Incremental ERC took {best_ms:.1f} ms"
+        assert signature(result) == signature(ElectricalRulesChecker(sch).run_all_checks())
@@ -0,0 +1,162 @@
+"""
+Memory benchmark for hot value types on a synthetic large schematic.
+
+Compares the slotted Point/Wire/Junction/Label/SchematicPin/PinConnection
+types against equivalent dict-backed dataclasses (the previous layout) and
+reports bytes per element for each.
+"""
+
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import pytest
+
+from kicad_sch_api.collections.components import Component
+from kicad_sch_api.collections.labels import LabelElement
+from kicad_sch_api.core.connectivity import PinConnection
+from kicad_sch_api.core.types import (
+    Junction,
+    Label,
+    LabelType,
+    PinShape,
+    PinType,
+    Point,
+    SchematicPin,
+    Wire,
+    WireType,
+)
+from kicad_sch_api.wrappers.wire import WireWrapper
+
+ELEMENTS_PER_KIND = 10_000  # 50k elements in total
+
+
+# Dict-backed equivalents of the value types before they were slotted
+@dataclass(frozen=True)
+class DictPoint:
+    x: float
+    y: float
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "x", float(self.x))
+        object.__setattr__(self, "y", float(self.y))
+
+
+@dataclass
+class DictWire:
+    uuid: str
+    points: List[DictPoint]
+    wire_type: WireType = WireType.WIRE
+    stroke_width: float = 0.0
+    stroke_type: str = "default"
+
+
+@dataclass
+class DictJunction:
+    uuid: str
+    position: DictPoint
+    diameter: float = 0
+    color: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+
+@dataclass
+class DictLabel:
+    uuid: str
+    position: DictPoint
+    text: str
+    label_type: LabelType = LabelType.LOCAL
+    rotation: float = 0.0
+    size: float = 1.27
+    shape: Optional[str] = None
+    justify_h: str = "left"
+    justify_v: str = "bottom"
+
+
+@dataclass
+class DictPin:
+    number: str
+    name: str
+    position: DictPoint
+    pin_type: PinType = PinType.PASSIVE
+    pin_shape: PinShape = PinShape.LINE
+    length: float = 2.54
+    rotation: float = 0.0
+
+
+@dataclass
+class DictPinConnection:
+    reference: str
+    pin_number: str
+    position: DictPoint
+
+
+def _build_sheet(point, wire, junction, label, pin, pin_connection):
+    """Build a synthetic sheet with ELEMENTS_PER_KIND elements of each kind."""
+    elements = []
+    for i in range(ELEMENTS_PER_KIND):
+        x = (i % 500) * 1.27
+        y = (i // 500) * 1.27
+        elements.append(wire(f"w{i}", [point(x, y), point(x + 2.54, y)]))
+        elements.append(junction(f"j{i}", point(x, y)))
+        elements.append(label(f"l{i}", point(x, y), f"N{i}"))
+        elements.append(pin(str(i), "P", point(x, y)))
+        elements.append(pin_connection(f"R{i}", "1", point(x, y)))
+    return elements
+
+
+def _measure(*types) -> int:
+    """Return bytes retained by a synthetic sheet built from the given types."""
+    tracemalloc.start()
+    try:
+        elements = _build_sheet(*types)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(elements) == 5 * ELEMENTS_PER_KIND
+    return current
+
+
+@pytest.mark.performance
+class TestMemoryFootprint:
+    """Slotted value types must be smaller than their dict-backed equivalents."""
+
+    def test_value_types_have_no_instance_dict(self):
+        point = Point(1, 2)
+        instances = [
+            point,
+            Wire(uuid="w", points=[point, point]),
+            Junction(uuid="j", position=point),
+            Label(uuid="l", position=point, text="N"),
+            SchematicPin(number="1", name="P", position=point),
+            PinConnection("R1", "1", point),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__"), type(instance).__name__
+
+    def test_wrappers_have_no_instance_dict(self):
+        point = Point(0, 0)
+        wrappers = [
+            Component.__new__(Component),
+            LabelElement.__new__(LabelElement),
+            WireWrapper(Wire(uuid="w", points=[point, point])),
+        ]
+        for wrapper in wrappers:
+            assert not hasattr(wrapper, "__dict__"), type(wrapper).__name__
+
+    def test_point_coerces_to_float(self):
+        point = Point(1, 2)
+        assert type(point.x) is float and type(point.y) is float
+        assert point == Point(x=1.0, y=2.0)
+        assert hash(point) == hash(Point(1.0, 2.0))
+
+    def test_synthetic_sheet_memory(self):
+        before = _measure(DictPoint, DictWire, DictJunction, DictLabel, DictPin, DictPinConnection)
+        after = _measure(Point, Wire, Junction, Label, SchematicPin, PinConnection)
+
+        elements = 5 * ELEMENTS_PER_KIND
+        print(
+            f"\n{elements} elements: dict-backed {before / 1e6:.1f} MB "
+            f"({before / elements:.0f} B/element), slotted {after / 1e6:.1f} MB "
+            f"({after / elements:.0f} B/element)"
+        )
+        assert after < before * 0.8
@@ -0,0 +1,38 @@
+"""Shared fixtures for ERC tests."""
+
+import pytest
+
+import kicad_sch_api as ksa
+
+
+@pytest.fixture
+def shift_registers():
+    """
+    Factory for sheets of 74HC595 shift registers U1..Un side by side.
+
+    Call with the register count, optional wires as (ref, pin, ref, pin)
+    tuples joining pins, and an optional schematic name.
+    """
+
+    def make(count=2, wires=(), name="Test"):
+        sch = ksa.create_schematic(name)
+        for i in range(count):
+            sch.components.add("74xx:74HC595", f"U{i + 1}", "74HC595", (100.33 + 50.8 * i, 100.33))
+        for ref1, pin1, ref2, pin2 in wires:
+            sch.add_wire_between_pins(ref1, pin1, ref2, pin2)
+        return sch
+
+    return make
+
+
+@pytest.fixture
+def violations():
+    """Function listing (code, message, refs) of every violation of an ERCResult in order."""
+
+    def collect(result):
+        return [
+            (v.error_code, v.message, tuple(v.component_refs))
+            for v in result.errors + result.warnings + result.info
+        ]
+
+    return collect
@@ -0,0 +1,132 @@
+"""Unit tests for batch ERC over many schematic files."""
+
+import json
+import shutil
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.cli import main
+from kicad_sch_api.cli.erc_batch import check_schematics, collect_schematics
+
+
+@pytest.fixture
+def write_registers(shift_registers):
+    """Save two 74HC595s with SER pins wired; conflict=True also joins both outputs."""
+
+    def write(path, conflict=False):
+        wires = [("U1", "14", "U2", "14")] + ([("U1", "9", "U2", "9")] if conflict else [])
+        shift_registers(2, wires, name=path.stem).save(str(path))
+        return path
+
+    return write
+
+
+class TestCollectSchematics:
+    """Expansion of directories, files and glob patterns."""
+
+    def test_directories_files_and_globs(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        for name in ("a.kicad_sch", "sub/b.kicad_sch", "sub/_autosave-b.kicad_sch", "c.txt"):
+            (tmp_path / name).write_text("")
+
+        found = collect_schematics(
+            [str(tmp_path), str(tmp_path / "a.kicad_sch"), str(tmp_path / "**" / "*.kicad_sch")]
+        )
+
+        assert found == [tmp_path / "a.kicad_sch", tmp_path / "sub" / "b.kicad_sch"]
+
+
+class TestCheckSchematics:
+    """Native ERC over many files with a content-hash cache."""
+
+    def test_results_and_cache(self, tmp_path, write_registers):
+        clean = write_registers(tmp_path / "clean.kicad_sch")
+        broken = write_registers(tmp_path / "broken.kicad_sch", conflict=True)
+        cache_dir = tmp_path / "cache"
+
+        first = check_schematics([broken, clean], max_workers=1, cache_dir=cache_dir)
+        assert [(r.path, r.status, r.cached) for r in first.files] == [
+            (broken, "failed", False),
+            (clean, "passed", False),
+        ]
+        assert [v["error_code"] for v in first.files[0].errors] == ["E001"]
+
+        second = check_schematics([broken, clean], max_workers=1, cache_dir=cache_dir)
+        assert [r.cached for r in second.files] == [True, True]
+        assert second.files[0].errors == first.files[0].errors
+
+        write_registers(clean, conflict=True)
+        third = check_schematics([broken, clean], max_workers=1, cache_dir=cache_dir)
+        assert [(r.status, r.cached) for r in third.files] == [("failed", True), ("failed", False)]
+
+    def test_changed_child_sheet_invalidates_parent(self, tmp_path, write_registers):
+        write_registers(tmp_path / "child.kicad_sch")
+        root = ksa.create_schematic("root")
+        root.add_sheet("Child", "child.kicad_sch", (100, 100), (20, 20))
+        root.save(str(tmp_path / "root.kicad_sch"))
+        cache_dir = tmp_path / "cache"
+
+        check_schematics([tmp_path / "root.kicad_sch"], max_workers=1, cache_dir=cache_dir)
+        write_registers(tmp_path / "child.kicad_sch", conflict=True)
+        report = check_schematics([tmp_path / "root.kicad_sch"], cache_dir=cache_dir)
+
+        assert not report.files[0].cached
+
+    def test_copied_root_checks_its_own_child_sheets(self, tmp_path, write_registers):
+        root = ksa.create_schematic("root")
+        root.add_sheet("Child", "child.kicad_sch", (100, 100), (20, 20))
+        root.save(str(tmp_path / "root.kicad_sch"))
+        for project, conflict in (("a", False), ("b", True), ("c", False)):
+            (tmp_path / project).mkdir()
+            shutil.copy(tmp_path / "root.kicad_sch", tmp_path / project / "root.kicad_sch")
+            write_registers(tmp_path / project / "child.kicad_sch", conflict=conflict)
+        (tmp_path / "c" / "child.kicad_sch").write_bytes(
+            (tmp_path / "a" / "child.kicad_sch").read_bytes()
+        )
+        cache_dir = tmp_path / "cache"
+
+        check_schematics([tmp_path / "a" / "root.kicad_sch"], max_workers=1, cache_dir=cache_dir)
+        copies = [tmp_path / project / "root.kicad_sch" for project in ("b", "c")]
+        report = check_schematics(copies, max_workers=1, cache_dir=cache_dir)
+
+        # b's child differs from the one a was checked with; c's is identical
+        assert [r.cached for r in report.files] == [False, True]
+
+    def test_unreadable_file_is_reported(self, tmp_path):
+        (tmp_path / "bad.kicad_sch").write_text("(kicad_sch (version")
+
+        report = check_schematics([tmp_path / "bad.kicad_sch"], cache_dir=None)
+
+        assert report.files[0].status == "error"
+        assert report.files[0].message
+        assert report.has_failures()
+
+
+class TestErcCommand:
+    """kicad-sch-api erc with JSON and JUnit reports."""
+
+    def test_reports_and_exit_code(self, tmp_path, capsys, write_registers):
+        write_registers(tmp_path / "clean.kicad_sch")
+        write_registers(tmp_path / "broken.kicad_sch", conflict=True)
+        args = ["erc", str(tmp_path), "--jobs", "2", "--cache-dir", str(tmp_path / "cache")]
+
+        code = main(args + ["--json", str(tmp_path / "erc.json")])
+        junit_code = main(args + ["--junit", str(tmp_path / "erc.xml")])
+
+        assert code == junit_code == 1
+        output = capsys.readouterr().out
+        assert "Checked 2 files (0 cached)" in output
+        assert "Checked 2 files (2 cached)" in output
+
+        report = json.loads((tmp_path / "erc.json").read_text())
+        assert [f["status"] for f in report["files"]] == ["failed", "passed"]
+        assert all(f["elapsed"] > 0 for f in report["files"])
+        assert report["summary"]["errors"] == 1
+        assert report["summary"]["wall_time"] > 0
+
+        suite = ET.parse(tmp_path / "erc.xml").getroot().find("testsuite")
+        assert suite.get("tests") == "2" and suite.get("failures") == "1"
+        (failure,) = suite.iter("failure")
+        assert failure.text.startswith("E001")
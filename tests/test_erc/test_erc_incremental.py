@@ -0,0 +1,103 @@
+"""
+Tests for incremental ERC.
+
+ElectricalRulesChecker.run_incremental() keeps the violations of its last
+run and re-checks only nets rebuilt by the connectivity engine and
+validators whose collections changed.
+"""
+
+from kicad_sch_api.validation.erc import ElectricalRulesChecker
+from kicad_sch_api.validation.validators import BaseValidator, ComponentValidator
+
+# SER pins wired in pairs (undriven input nets)
+SER_PAIRS = [("U1", "14", "U2", "14"), ("U3", "14", "U4", "14")]
+
+
+def count_calls(monkeypatch, validator, method):
+    calls = []
+    original = getattr(validator, method)
+
+    def counting(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(validator, method, counting)
+    return calls
+
+
+class TestIncrementalERC:
+    """run_incremental() results and re-check scope."""
+
+    def test_matches_full_run_after_edits(self, shift_registers, violations):
+        sch = shift_registers(4, SER_PAIRS)
+        erc = ElectricalRulesChecker(sch)
+        erc.run_incremental()
+
+        sch.add_wire_between_pins("U1", "9", "U3", "14")  # QH' drives U3/U4 SER
+        sch.add_wire_between_pins("U2", "9", "U4", "9")  # Output-output conflict
+        sch.components.get("U4").value = ""
+        result = erc.run_incremental()
+
+        full = ElectricalRulesChecker(sch).run_all_checks()
+        assert sorted(violations(result)) == sorted(violations(full))
+        assert [v.error_code for v in result.errors] == ["E001"]
+        assert len([v for v in result.warnings if v.error_code == "W003"]) == 1
+
+    def test_only_rebuilt_nets_are_checked(self, monkeypatch, shift_registers):
+        sch = shift_registers(4, SER_PAIRS)
+        erc = ElectricalRulesChecker(sch)
+        erc.run_incremental()
+        pin_checks = count_calls(monkeypatch, erc.validators[0], "check_net")
+
+        sch.add_wire_between_pins("U1", "9", "U3", "14")
+        erc.run_incremental()
+
+        assert len(pin_checks) == 1
+        net, pins = pin_checks[0]
+        assert {ref for ref, _, _ in pins} == {"U1", "U3", "U4"}
+
+    def test_wire_edit_skips_component_checks(self, monkeypatch, shift_registers):
+        sch = shift_registers(4, SER_PAIRS)
+        erc = ElectricalRulesChecker(sch)
+        erc.run_incremental()
+        (component_validator,) = [v for v in erc.validators if isinstance(v, ComponentValidator)]
+        component_checks = count_calls(monkeypatch, component_validator, "check_schematic")
+
+        sch.add_wire_between_pins("U1", "9", "U3", "14")
+        erc.run_incremental()
+        assert component_checks == []
+
+        sch.components.get("U2").footprint = "Package_SO:SOIC-16_3.9x9.9mm_P1.27mm"
+        result = erc.run_incremental()
+        assert len(component_checks) == 1
+        assert "U2" not in [
+            ref for v in result.warnings for ref in v.component_refs if v.error_code == "W007"
+        ]
+
+    def test_reanalysis_falls_back_to_full_run(self, monkeypatch, shift_registers):
+        sch = shift_registers(4, SER_PAIRS)
+        erc = ElectricalRulesChecker(sch)
+        erc.run_incremental()
+        pin_checks = count_calls(monkeypatch, erc.validators[0], "check_net")
+
+        sch._wire_manager.invalidate_connectivity()
+        erc.run_incremental()
+
+        assert len(pin_checks) == len(sch._wire_manager.get_connectivity_analyzer().nets)
+
+    def test_validate_only_validators_run_every_time(self, shift_registers):
+        runs = []
+
+        class CountingValidator(BaseValidator):
+            def validate(self):
+                runs.append(1)
+                return []
+
+        sch = shift_registers(2, SER_PAIRS[:1])
+        erc = ElectricalRulesChecker(sch)
+        erc.add_validator(CountingValidator(sch))
+
+        erc.run_incremental()
+        erc.run_incremental()
+
+        assert len(runs) == 2
@@ -0,0 +1,116 @@
+"""
+Tests for concurrent ERC validator execution.
+
+Validators of one run share a frozen ConnectivitySnapshot and may run in a
+thread pool (default), forked processes or serially; the merged result is the
+same either way.
+"""
+
+import dataclasses
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.validation.erc import ElectricalRulesChecker
+from kicad_sch_api.validation.validators import BaseValidator
+
+
+@pytest.fixture
+def conflicting_registers(shift_registers):
+    """74HC595s with an output-output conflict, an undriven net and a missing value."""
+    sch = shift_registers(4, [("U1", "14", "U2", "14"), ("U2", "9", "U4", "9")])
+    sch.components.get("U3").value = ""
+    return sch
+
+
+class TestParallelERC:
+    """Executors, merge order and timings."""
+
+    @pytest.mark.parametrize(
+        "executor",
+        [
+            "thread",
+            pytest.param(
+                "process",
+                marks=pytest.mark.skipif(
+                    "fork" not in multiprocessing.get_all_start_methods(),
+                    reason="process executor needs fork",
+                ),
+            ),
+        ],
+    )
+    def test_executors_merge_in_validator_order(self, executor, conflicting_registers, violations):
+        sch = conflicting_registers
+
+        serial = ElectricalRulesChecker(sch, executor="serial").run_all_checks()
+        parallel = ElectricalRulesChecker(sch, executor=executor, max_workers=4).run_all_checks()
+
+        assert violations(parallel) == violations(serial)
+        assert [v.error_code for v in parallel.errors] == ["E001"]
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="process executor needs fork"
+    )
+    def test_concurrent_process_checks_keep_their_own_run(self, conflicting_registers, violations):
+        clean = ksa.create_schematic("Clean")
+        clean.components.add("Device:R", "R1", "10k", (100.33, 100.33))
+        sheets = [conflicting_registers, clean] * 2
+        expected = [
+            violations(ElectricalRulesChecker(s, executor="serial").run_all_checks())
+            for s in sheets
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(sheets)) as pool:
+            results = list(
+                pool.map(
+                    lambda s: ElectricalRulesChecker(s, executor="process").run_all_checks(),
+                    sheets,
+                )
+            )
+
+        assert [violations(r) for r in results] == expected
+
+    def test_validator_timings(self, conflicting_registers):
+        erc = ElectricalRulesChecker(conflicting_registers)
+
+        result = erc.run_all_checks()
+
+        assert list(result.validator_timings) == [
+            "PinTypeValidator",
+            "ConnectivityValidator",
+            "ComponentValidator",
+            "PowerValidator",
+        ]
+        assert all(ms >= 0 for ms in result.validator_timings.values())
+        assert result.to_dict()["validator_timings"] == result.validator_timings
+
+    def test_validators_share_a_frozen_snapshot(self, conflicting_registers):
+        seen = []
+
+        class SnapshotValidator(BaseValidator):
+            def validate(self):
+                seen.append((self.snapshot, self._connectivity(), self._endpoints()))
+                return []
+
+        sch = conflicting_registers
+        erc = ElectricalRulesChecker(sch)
+        first, second = SnapshotValidator(sch), SnapshotValidator(sch)
+        erc.add_validator(first)
+        erc.add_validator(second)
+
+        result = erc.run_all_checks()
+
+        (snapshot, analyzer, endpoints), other = seen
+        assert other == (snapshot, analyzer, endpoints)
+        assert analyzer is snapshot.analyzer and endpoints is snapshot.endpoints
+        assert len(snapshot.nets) == len(analyzer.nets)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.nets = ()
+        assert first.snapshot is None and second.snapshot is None
+        assert "SnapshotValidator[5]" in result.validator_timings
+
+    def test_unknown_executor(self, conflicting_registers):
+        with pytest.raises(ValueError, match="Unknown executor"):
+            ElectricalRulesChecker(conflicting_registers, executor="gpu")
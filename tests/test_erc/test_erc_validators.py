@@ -73,6 +73,70 @@ class TestPinTypeValidator:
         errors = [v for v in violations if v.severity == "error"]
         assert len(errors) == 0
 
+    def test_build_nets_reports_pin_types(self, shift_registers):
+        """Test that nets carry the library electrical type of each pin."""
+        sch = shift_registers()
+        sch.add_wire_between_pins("U1", "9", "U2", "14")
+
+        nets = PinTypeValidator(sch)._build_nets()
+
+        assert list(nets.values()) == [[("U1", "9", "output"), ("U2", "14", "input")]]
+        assert PinTypeValidator(sch).validate() == []
+
+    def test_output_to_output_conflict_on_net(self, shift_registers):
+        """Test that two outputs on one net are reported as E001."""
+        sch = shift_registers()
+        sch.add_wire_between_pins("U1", "9", "U2", "9")
+
+        violations = PinTypeValidator(sch).validate()
+
+        assert [(v.error_code, v.component_refs) for v in violations] == [("E001", ["U1", "U2"])]
+
+    def test_histogram_matches_pairwise(self):
+        """Test that conflicts found from the type histogram equal the pairwise check."""
+        import random
+
+        from kicad_sch_api.validation.pin_matrix import PinSeverity
+
+        types = ["input", "output", "passive", "tri_state", "power_in", "power_out", "unspecified"]
+        rng = random.Random(42)
+        validator = PinTypeValidator(ksa.create_schematic("Test"))
+        matrix = validator.pin_matrix
+
+        for _ in range(50):
+            pins = [(f"U{i}", str(rng.randint(1, 20)), rng.choice(types)) for i in range(12)]
+            names = {PinSeverity.ERROR: "error", PinSeverity.WARNING: "warning"}
+            expected = [
+                (names[severity], f"{a[2]} ({a[0]}) connected to {b[2]} ({b[0]})", [a[1], b[1]])
+                for i, a in enumerate(pins)
+                for b in pins[i + 1 :]
+                for severity in [matrix.check_connection(a[2], b[2])]
+                if severity != PinSeverity.OK
+            ]
+
+            violations = validator._check_net_pins("NET", pins)
+
+            assert [(v.severity, v.message.split(": ")[1], v.pin_numbers) for v in violations] == (
+                expected
+            )
+
+    def test_clean_net_checks_type_pairs_only(self, monkeypatch):
+        """Test that a large clean net is checked once per pin type pair."""
+        validator = PinTypeValidator(ksa.create_schematic("Test"))
+        calls = []
+        original = validator.pin_matrix.check_connection
+
+        def counting(pin1_type, pin2_type):
+            calls.append((pin1_type, pin2_type))
+            return original(pin1_type, pin2_type)
+
+        monkeypatch.setattr(validator.pin_matrix, "check_connection", counting)
+        pins = [(f"U{i}", "8", "power_in") for i in range(500)]
+        pins += [(f"R{i}", "2", "passive") for i in range(500)]
+
+        assert validator._check_net_pins("GND", pins) == []
+        assert len(calls) == 4
+
     def test_power_output_short_detected(self):
         """Test detection of multiple power outputs on same net (ERROR)."""
         sch = ksa.create_schematic("Test")
@@ -136,6 +200,25 @@ class TestConnectivityValidator:
         undriven = [v for v in violations if v.violation_type == "undriven_net"]
         assert len(undriven) > 0
 
+    def test_inputs_without_driver_are_undriven(self, shift_registers):
+        """Test that a net of input pins only is reported as undriven (W003)."""
+        sch = shift_registers()
+        sch.add_wire_between_pins("U1", "14", "U2", "14")  # SER to SER
+
+        undriven = ConnectivityValidator(sch).find_undriven_nets()
+
+        assert len(undriven) == 1
+        assert undriven[0].error_code == "W003"
+        assert undriven[0].component_refs == ["U1", "U2"]
+        assert undriven[0].pin_numbers == ["14", "14"]
+
+    def test_output_drives_input(self, shift_registers):
+        """Test that an output pin drives the input pins on its net."""
+        sch = shift_registers()
+        sch.add_wire_between_pins("U1", "9", "U2", "14")  # QH' to SER
+
+        assert ConnectivityValidator(sch).find_undriven_nets() == []
+
     def test_properly_connected_circuit_no_warnings(self):
         """Test that properly connected circuit has no connectivity warnings."""
         sch = ksa.create_schematic("Test")
@@ -221,36 +304,41 @@ class TestComponentValidator:
 class TestPowerValidator:
     """Test power supply validation."""
 
-    def test_detect_missing_power_flag(self):
+    def test_detect_missing_power_flag(self, shift_registers):
         """Test detection of power net without PWR_FLAG (WARNING)."""
-        sch = ksa.create_schematic("Test")
-
-        # Add component with power pins but no PWR_FLAG
-        # Power nets typically need PWR_FLAG to indicate they're driven externally
+        sch = shift_registers(1)
+        sch.components.add("power:+3.3V", "#PWR01", "+3.3V", (100.33, 60.96))
+        sch.add_wire_between_pins("U1", "16", "#PWR01", "1")
 
         validator = PowerValidator(sch)
         violations = validator.validate()
 
-        # Should warn about missing power flag
-        # Note: This is WARNING not ERROR per requirements
+        # Power symbol pins are power inputs; nothing outputs power on the rail
+        assert [v.error_code for v in violations] == ["W004"]
+        assert violations[0].severity == "warning"
+        assert violations[0].net_name == "+3.3V"
+        assert violations[0].component_refs == ["#PWR01", "U1"]
 
-    def test_power_input_without_driver(self):
+    def test_power_input_without_driver(self, shift_registers):
         """Test detection of power input with no power source (WARNING)."""
-        sch = ksa.create_schematic("Test")
-
-        # Component with power input but no regulator or PWR_FLAG
+        sch = shift_registers()
+        sch.add_wire_between_pins("U1", "8", "U2", "8")  # GND pins, no power symbol
 
         validator = PowerValidator(sch)
         violations = validator.validate()
 
-        # Should warn about undriven power
+        assert [v.error_code for v in violations] == ["W009"]
+        assert violations[0].violation_type == "power_input_undriven"
+        assert violations[0].pin_numbers == ["8", "8"]
 
     def test_proper_power_connection_no_warnings(self):
         """Test that properly powered circuit has no power warnings."""
         sch = ksa.create_schematic("Test")
 
-        # Proper power: regulator output driving IC power input
-        # This is correct and should not generate warnings
+        # Unconnected power pins form no net to check
+        sch.components.add("74xx:74HC595", "U1", "74HC595", (100.33, 100.33))
+
+        assert PowerValidator(sch).validate() == []
 
 
 class TestElectricalRulesChecker:
@@ -324,6 +412,29 @@ class TestElectricalRulesChecker:
         # Should be fast (<100ms for 50 components)
         assert duration < 100, f"ERC took {duration}ms for 50 components (target <100ms)"
 
+    def test_schematic_run_erc_in_process(self, shift_registers, tmp_path):
+        """Test that Schematic.run_erc() reports native results without saving."""
+        sch = shift_registers()
+        sch.add_wire_between_pins("U1", "9", "U2", "9")
+
+        report = sch.run_erc(output_path=tmp_path / "erc.json")
+
+        assert report.error_count == 1
+        assert report.get_errors()[0].type == "pin_conflict"
+        assert report.schematic_path is None
+        assert (tmp_path / "erc.json").read_text() == report.raw_output
+        assert sch.run_erc(severity="error").warning_count == 0
+        assert sch.run_erc(format="json").error_count == 1
+
+    def test_schematic_run_erc_rejects_kicad_cli_options(self, shift_registers):
+        """Test that in-process ERC refuses options only kicad-cli honours."""
+        sch = shift_registers()
+
+        with pytest.raises(TypeError, match="units"):
+            sch.run_erc(units="in")
+        with pytest.raises(TypeError, match="format"):
+            sch.run_erc(format="report")
+
     def test_erc_with_no_violations(self):
         """Test ERC on schematic with no violations."""
         sch = ksa.create_schematic("Test")
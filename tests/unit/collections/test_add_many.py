@@ -0,0 +1,174 @@
+"""
+Tests for ComponentCollection.add_many bulk insertion.
+
+Verifies that bulk insertion validates the whole batch up front, resolves
+each lib_id once, pre-allocates references and UUIDs, and leaves the
+collection indexes consistent.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kicad_sch_api.collections.components import ComponentCollection
+from kicad_sch_api.core.exceptions import LibraryError
+from kicad_sch_api.core.types import Point, SchematicSymbol
+from kicad_sch_api.utils.validation import ValidationError
+
+
+def _symbol_def(prefix, units=1):
+    symbol_def = MagicMock()
+    symbol_def.reference_prefix = prefix
+    symbol_def.units = units
+    symbol_def.pins = []
+    return symbol_def
+
+
+@pytest.fixture
+def symbol_cache():
+    """Patch the symbol cache with a small fake library."""
+    library = {
+        "Device:R": _symbol_def("R"),
+        "Device:C": _symbol_def("C"),
+        "Amplifier_Operational:TL072": _symbol_def("U", units=3),
+    }
+    cache = MagicMock()
+    cache.get_symbol.side_effect = library.get
+    with patch("kicad_sch_api.collections.components.get_symbol_cache", return_value=cache):
+        yield cache
+
+
+class TestAddMany:
+    """Test cases for add_many()."""
+
+    def test_add_many_basic(self, symbol_cache):
+        collection = ComponentCollection()
+        components = collection.add_many(
+            [
+                {"lib_id": "Device:R", "reference": "R1", "value": "10k", "position": (10, 10)},
+                {"lib_id": "Device:C", "reference": "C1", "value": "100nF", "position": (20, 10)},
+            ]
+        )
+
+        assert [c.reference for c in components] == ["R1", "C1"]
+        assert len(collection) == 2
+        assert collection.get("R1").value == "10k"
+        assert collection.get("C1") is components[1]
+
+    def test_add_many_resolves_each_lib_id_once(self, symbol_cache):
+        collection = ComponentCollection()
+        collection.add_many({"lib_id": "Device:R", "value": "1k"} for _ in range(50))
+
+        assert len(collection) == 50
+        symbol_cache.get_symbol.assert_called_once_with("Device:R")
+
+    def test_add_many_allocates_references(self, symbol_cache):
+        collection = ComponentCollection(
+            [
+                SchematicSymbol(
+                    uuid="existing", lib_id="Device:R", reference="R1", position=Point(0, 0)
+                )
+            ]
+        )
+        components = collection.add_many(
+            [
+                {"lib_id": "Device:R"},
+                {"lib_id": "Device:R", "reference": "R3"},
+                {"lib_id": "Device:R"},
+                {"lib_id": "Device:C"},
+            ]
+        )
+
+        assert [c.reference for c in components] == ["R2", "R3", "R4", "C1"]
+
+    def test_add_many_matches_add_placement(self, symbol_cache):
+        single = ComponentCollection()
+        bulk = ComponentCollection()
+        specs = [
+            {"lib_id": "Device:R", "reference": "R1", "position": (10.1, 20.2), "rotation": 450},
+            {"lib_id": "Device:R", "reference": "R2"},
+        ]
+
+        for spec in specs:
+            single.add(**spec)
+        bulk.add_many(specs)
+
+        for expected, actual in zip(single, bulk):
+            assert actual.position == expected.position
+            assert actual.rotation == expected.rotation
+
+    def test_add_many_custom_properties_and_uuid(self, symbol_cache):
+        collection = ComponentCollection()
+        (component,) = collection.add_many(
+            [{"lib_id": "Device:R", "component_uuid": "u-1", "MPN": "RC0603"}]
+        )
+
+        assert component.uuid == "u-1"
+        assert component.get_property("MPN") == "RC0603"
+        assert collection.get_by_uuid("u-1") is component
+
+    def test_add_many_multi_unit(self, symbol_cache):
+        collection = ComponentCollection()
+        collection.add_many(
+            {"lib_id": "Amplifier_Operational:TL072", "reference": "U1", "unit": unit}
+            for unit in (1, 2, 3)
+        )
+
+        assert sorted(c._data.unit for c in collection) == [1, 2, 3]
+
+    def test_add_many_duplicate_unit_is_atomic(self, symbol_cache):
+        collection = ComponentCollection()
+        with pytest.raises(ValidationError, match="already exists"):
+            collection.add_many(
+                [
+                    {"lib_id": "Device:R", "reference": "R1"},
+                    {"lib_id": "Device:R", "reference": "R2"},
+                    {"lib_id": "Device:R", "reference": "R1"},
+                ]
+            )
+        assert len(collection) == 0
+
+    def test_add_many_rejects_mismatched_lib_id(self, symbol_cache):
+        collection = ComponentCollection()
+        collection.add_many([{"lib_id": "Device:R", "reference": "R1"}])
+        with pytest.raises(ValidationError, match="different lib_id"):
+            collection.add_many([{"lib_id": "Device:C", "reference": "R1", "unit": 2}])
+
+    def test_add_many_rejects_invalid_unit(self, symbol_cache):
+        collection = ComponentCollection()
+        with pytest.raises(ValidationError, match="Unit 4 invalid"):
+            collection.add_many([{"lib_id": "Amplifier_Operational:TL072", "unit": 4}])
+
+    def test_add_many_rejects_duplicate_uuid(self, symbol_cache):
+        collection = ComponentCollection()
+        with pytest.raises(ValidationError, match="UUID"):
+            collection.add_many(
+                [
+                    {"lib_id": "Device:R", "component_uuid": "same"},
+                    {"lib_id": "Device:R", "component_uuid": "same"},
+                ]
+            )
+
+    def test_add_many_rejects_bad_rotation(self, symbol_cache):
+        collection = ComponentCollection()
+        with pytest.raises(ValidationError, match="rotation"):
+            collection.add_many([{"lib_id": "Device:R", "rotation": 45}])
+
+    def test_add_many_unknown_symbol(self, symbol_cache):
+        collection = ComponentCollection()
+        with pytest.raises(LibraryError):
+            collection.add_many([{"lib_id": "Device:Missing"}])
+
+    def test_add_many_empty(self, symbol_cache):
+        collection = ComponentCollection()
+        assert collection.add_many([]) == []
+        assert not collection.is_modified
+
+    def test_add_many_rebuilds_indexes_once(self, symbol_cache):
+        collection = ComponentCollection()
+        with patch.object(
+            collection._index_registry, "rebuild", wraps=collection._index_registry.rebuild
+        ) as rebuild:
+            collection.add_many({"lib_id": "Device:R"} for _ in range(100))
+        assert rebuild.call_count == 1
+        assert collection.get("R100") is not None
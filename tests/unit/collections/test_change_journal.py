@@ -0,0 +1,212 @@
+"""
+Tests for the collection change journal.
+
+Covers add/remove/modify events, subscriber delivery and batching,
+changes_since() polling, and the schematic-level consumers
+(FormatSyncManager dirty flags and WireManager connectivity updates).
+"""
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.collections.base import ChangeEvent, ChangeJournal, ChangeKind
+from kicad_sch_api.collections.components import ComponentCollection
+from kicad_sch_api.collections.labels import LabelCollection
+from kicad_sch_api.collections.wires import WireCollection
+from kicad_sch_api.core.types import Point, SchematicSymbol
+
+
+@pytest.fixture
+def components():
+    """Collection with two resistors."""
+    return ComponentCollection(
+        [
+            SchematicSymbol(
+                uuid=f"r{i}",
+                lib_id="Device:R",
+                reference=f"R{i}",
+                value="10k",
+                position=Point(10 * i, 0),
+            )
+            for i in (1, 2)
+        ]
+    )
+
+
+@pytest.fixture
+def events():
+    """List collecting every delivered batch of events."""
+    return []
+
+
+class TestChangeJournal:
+    """Journal bookkeeping independent of any collection."""
+
+    def test_versions_increase(self):
+        journal = ChangeJournal()
+        first = journal.record(ChangeKind.ADD, "a")
+        second = journal.record(ChangeKind.MODIFY, "a", "value")
+        assert (first.version, second.version) == (1, 2)
+        assert journal.version == 2
+
+    def test_changes_since(self):
+        journal = ChangeJournal()
+        journal.record(ChangeKind.ADD, "a")
+        journal.record(ChangeKind.ADD, "b")
+        journal.record(ChangeKind.REMOVE, "a")
+        assert [e.uuid for e in journal.changes_since(1)] == ["b", "a"]
+        assert journal.changes_since(3) == []
+
+    def test_changes_since_truncated_returns_none(self):
+        journal = ChangeJournal(max_events=2)
+        for uuid in "abc":
+            journal.record(ChangeKind.ADD, uuid)
+        assert journal.changes_since(0) is None
+        assert [e.uuid for e in journal.changes_since(1)] == ["b", "c"]
+
+    def test_nested_batches_deliver_once(self, events):
+        journal = ChangeJournal()
+        journal.subscribe(events.append)
+        journal.begin_batch()
+        journal.record(ChangeKind.ADD, "a")
+        journal.begin_batch()
+        journal.record(ChangeKind.ADD, "b")
+        journal.end_batch()
+        assert events == []
+        journal.end_batch()
+        assert [[e.uuid for e in batch] for batch in events] == [["a", "b"]]
+
+    def test_failing_listener_does_not_block_others(self, events):
+        journal = ChangeJournal()
+
+        def broken(_):
+            raise RuntimeError("boom")
+
+        journal.subscribe(broken)
+        journal.subscribe(events.append)
+        journal.record(ChangeKind.ADD, "a")
+        assert len(events) == 1
+
+
+class TestCollectionEvents:
+    """Events emitted by BaseCollection subclasses."""
+
+    def test_initial_items_are_baseline(self, components):
+        assert components.change_version == 0
+        assert components.changes_since(0) == []
+
+    def test_add_and_remove(self, events):
+        wires = WireCollection()
+        wires.subscribe(events.append)
+
+        wire_uuid = wires.add(start=(0, 0), end=(10, 0))
+        wires.remove(wire_uuid)
+
+        assert [e for batch in events for e in batch] == [
+            ChangeEvent(ChangeKind.ADD, wire_uuid, None, 1),
+            ChangeEvent(ChangeKind.REMOVE, wire_uuid, None, 2),
+        ]
+
+    def test_component_field_changes(self, components, events):
+        components.subscribe(events.append)
+        r1 = components.get("R1")
+
+        r1.value = "1k"
+        r1.position = (20, 20)
+        r1.set_property("MPN", "RC0603")
+
+        assert [(e.kind, e.uuid, e.field) for batch in events for e in batch] == [
+            (ChangeKind.MODIFY, "r1", "value"),
+            (ChangeKind.MODIFY, "r1", "position"),
+            (ChangeKind.MODIFY, "r1", "properties"),
+        ]
+
+    def test_component_remove_by_reference(self, components, events):
+        components.subscribe(events.append)
+        components.remove("R2")
+        assert events == [[ChangeEvent(ChangeKind.REMOVE, "r2", None, 1)]]
+
+    def test_label_field_changes(self, events):
+        labels = LabelCollection()
+        label = labels.add("VCC", (0, 0))
+        labels.subscribe(events.append)
+
+        label.text = "GND"
+        label.rotation = 90
+
+        assert [(e.uuid, e.field) for batch in events for e in batch] == [
+            (label.uuid, "text"),
+            (label.uuid, "rotation"),
+        ]
+
+    def test_batch_mode_delivers_single_notification(self, components, events):
+        components.subscribe(events.append)
+        with components.batch_mode():
+            components.get("R1").value = "1k"
+            components.get("R2").value = "2k"
+            assert events == []
+
+        assert len(events) == 1
+        assert [e.uuid for e in events[0]] == ["r1", "r2"]
+
+    def test_clear_emits_remove_per_item(self, components, events):
+        components.subscribe(events.append)
+        components.clear()
+        assert len(events) == 1
+        assert {e.uuid for e in events[0]} == {"r1", "r2"}
+        assert all(e.kind is ChangeKind.REMOVE for e in events[0])
+
+    def test_unsubscribe(self, components, events):
+        components.subscribe(events.append)
+        components.unsubscribe(events.append)
+        components.get("R1").value = "1k"
+        assert events == []
+        assert [e.field for e in components.changes_since(0)] == ["value"]
+
+
+class TestSchematicConsumers:
+    """Schematic managers react to journal events."""
+
+    def test_format_sync_tracks_direct_collection_edits(self):
+        sch = ksa.create_schematic("Journal")
+        assert not sch._format_sync_manager.is_dirty()
+
+        wire_uuid = sch.wires.add(start=(0, 0), end=(10, 0))
+
+        assert sch._format_sync_manager.is_dirty("wire")
+        assert sch._format_sync_manager.get_change_log()[-1] == {
+            "section": "wire",
+            "operation": "add",
+            "timestamp": None,
+            "context": {"uuid": wire_uuid},
+        }
+
+    def test_direct_wire_add_updates_connectivity(self):
+        sch = ksa.create_schematic("Journal")
+        manager = sch._wire_manager
+        manager._ensure_connectivity()
+        analyzer = manager._connectivity_analyzer
+
+        sch.wires.add(start=(0, 0), end=(10, 0))
+
+        assert manager._connectivity_valid
+        assert manager._connectivity_analyzer is analyzer
+        assert len(analyzer.nets) == 1
+
+    def test_footprint_change_skips_connectivity(self):
+        sch = ksa.create_schematic("Journal")
+        manager = sch._wire_manager
+        # No analyzer: any attempted incremental update would fail
+        manager._connectivity_valid = True
+
+        manager._on_components_changed([ChangeEvent(ChangeKind.MODIFY, "r1", "footprint", 1)])
+        assert manager._connectivity_valid
+
+    def test_failed_incremental_update_falls_back_to_reanalysis(self):
+        sch = ksa.create_schematic("Journal")
+        manager = sch._wire_manager
+        manager._connectivity_valid = True
+        manager._analyzed_references = {"r1": "R1"}
+
+        manager._on_components_changed([ChangeEvent(ChangeKind.MODIFY, "r1", "position", 2)])
+        assert not manager._connectivity_valid
@@ -0,0 +1,172 @@
+"""
+Unit tests for the columnar component store.
+
+Each query test runs with and without NumPy so both the vectorized and the
+pure-Python paths are covered.
+"""
+
+import pytest
+
+from kicad_sch_api.collections import columnar
+from kicad_sch_api.collections.columnar import MISSING, StringTable
+from kicad_sch_api.collections.components import ComponentCollection
+from kicad_sch_api.core.types import Point, SchematicSymbol
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run tests against both the NumPy and pure-Python code paths."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "NUMPY_AVAILABLE", False)
+    return request.param
+
+
+@pytest.fixture
+def collection():
+    """Collection with resistors, capacitors and a DNP part."""
+    symbols = [
+        SchematicSymbol(
+            uuid="r1",
+            lib_id="Device:R",
+            reference="R1",
+            value="10k",
+            footprint="R_0603",
+            position=Point(10, 10),
+            properties={"MPN": "RC0603-10K", "__sexp_Reference": ["ignored"]},
+        ),
+        SchematicSymbol(
+            uuid="r2",
+            lib_id="Device:R",
+            reference="R2",
+            value="1k",
+            footprint="R_0603",
+            position=Point(20, 10),
+            rotation=90,
+        ),
+        SchematicSymbol(
+            uuid="r3",
+            lib_id="Device:R",
+            reference="R3",
+            value="10k",
+            footprint="R_0603",
+            position=Point(30, 40),
+            properties={"MPN": "RC0603-10K"},
+        ),
+        SchematicSymbol(
+            uuid="c1",
+            lib_id="Device:C",
+            reference="C1",
+            value="100nF",
+            position=Point(10, 50),
+            in_bom=False,
+        ),
+    ]
+    return ComponentCollection(symbols)
+
+
+class TestStringTable:
+    """Test string interning."""
+
+    def test_intern_reuses_ids(self):
+        table = StringTable()
+        assert table.intern("10k") == table.intern("10k") == 0
+        assert table.intern("1k") == 1
+        assert len(table) == 2
+
+    def test_none_maps_to_missing(self):
+        table = StringTable()
+        assert table.intern(None) == MISSING
+        assert table.resolve(MISSING) is None
+
+    def test_lookup_does_not_add(self):
+        table = StringTable()
+        assert table.lookup("x") is None
+        assert len(table) == 0
+
+
+class TestComponentColumns:
+    """Test building and querying the store."""
+
+    def test_views_match_components(self, collection):
+        columns = collection.to_columns()
+        assert len(columns) == len(collection)
+        for view, component in zip(columns, collection):
+            assert view.uuid == component.uuid
+            assert view.reference == component.reference
+            assert view.lib_id == component.lib_id
+            assert view.value == component.value
+            assert view.footprint == component.footprint
+            assert view.position == component.position
+            assert view.rotation == component.rotation
+            assert view.in_bom == component.in_bom
+
+    def test_strings_are_interned(self, collection):
+        columns = collection.to_columns()
+        resistor = columns._strings.lookup("Device:R")
+        capacitor = columns._strings.lookup("Device:C")
+        assert list(columns.column("lib_id")) == [resistor, resistor, resistor, capacitor]
+
+    def test_sparse_properties(self, collection):
+        columns = collection.to_columns()
+        assert columns[0].properties == {"MPN": "RC0603-10K"}
+        assert columns[1].properties == {}
+        assert columns[1].get_property("MPN", "n/a") == "n/a"
+        assert columns[-2].get_property("MPN") == "RC0603-10K"
+
+    def test_filter_exact(self, collection, backend):
+        columns = collection.to_columns()
+        assert [v.reference for v in columns.filter(lib_id="Device:R", value="10k")] == ["R1", "R3"]
+        assert columns.filter(value="unknown") == []
+
+    def test_filter_matches_collection_filter(self, collection, backend):
+        columns = collection.to_columns()
+        for criteria in [
+            {"footprint": "R_0603"},
+            {"in_area": (0, 0, 25, 20)},
+            {"has_property": "MPN"},
+            {"lib_id": "Device:R", "in_area": (15, 0, 40, 50)},
+        ]:
+            expected = [c.uuid for c in collection.filter(**criteria)]
+            assert [v.uuid for v in columns.filter(**criteria)] == expected, criteria
+
+    def test_filter_properties_and_flags(self, collection, backend):
+        columns = collection.to_columns()
+        assert columns.select(properties={"MPN": "RC0603-10K"}) == [0, 2]
+        assert columns.select(properties={"Missing": "x"}) == []
+        assert columns.select(in_bom=False) == [3]
+
+    def test_group_by_for_bom(self, collection, backend):
+        columns = collection.to_columns()
+        groups = columns.group_by("lib_id", "value", "footprint")
+        assert groups == {
+            ("Device:R", "10k", "R_0603"): [0, 2],
+            ("Device:R", "1k", "R_0603"): [1],
+            ("Device:C", "100nF", None): [3],
+        }
+
+    def test_group_by_property_and_rows(self, collection, backend):
+        columns = collection.to_columns()
+        groups = columns.group_by("MPN", rows=columns.select(lib_id="Device:R"))
+        assert groups == {("RC0603-10K",): [0, 2], (None,): [1]}
+
+    def test_group_by_requires_field(self, collection):
+        with pytest.raises(ValueError):
+            collection.to_columns().group_by()
+
+    def test_extend_invalidates_cached_columns(self, collection, backend):
+        columns = collection.to_columns()
+        assert columns.select(value="47k") == []
+        columns.extend(
+            [
+                SchematicSymbol(
+                    uuid="r4", lib_id="Device:R", reference="R4", value="47k", position=Point(0, 0)
+                )
+            ]
+        )
+        assert columns.select(value="47k") == [4]
+
+    def test_unknown_column_raises(self, collection):
+        with pytest.raises(KeyError):
+            collection.to_columns().column("nope")
@@ -0,0 +1,202 @@
+"""
+Tests for declarative secondary indexes on ComponentCollection.
+
+Covers registering field and property indexes via IndexSpec, index-aware
+filter()/bulk_update(), explain() reporting, and index maintenance when
+component fields change.
+"""
+
+import pytest
+
+from kicad_sch_api.bom.matcher import PropertyMatcher
+from kicad_sch_api.collections.base import IndexSpec
+from kicad_sch_api.collections.components import ComponentCollection
+from kicad_sch_api.core.types import Point, SchematicSymbol
+
+
+@pytest.fixture
+def collection():
+    """Collection with a mix of resistors and capacitors."""
+    symbols = []
+    for i in range(10):
+        symbols.append(
+            SchematicSymbol(
+                uuid=f"r{i}",
+                lib_id="Device:R",
+                reference=f"R{i + 1}",
+                value="10k" if i % 2 == 0 else "1k",
+                position=Point(10 * i, 0),
+                footprint="Resistor_SMD:R_0603_1608Metric",
+                properties={"MPN": f"RC0603-{i % 3}"},
+            )
+        )
+    symbols.append(
+        SchematicSymbol(
+            uuid="c0",
+            lib_id="Device:C",
+            reference="C1",
+            value="100nF",
+            position=Point(0, 50),
+        )
+    )
+    return ComponentCollection(symbols)
+
+
+class TestIndexRegistration:
+    """Registering and removing secondary indexes."""
+
+    def test_add_field_index(self, collection):
+        collection.add_field_index("value")
+        assert "value" in collection.index_names
+
+    def test_add_property_index(self, collection):
+        collection.add_property_index("MPN")
+        assert "property:MPN" in collection.index_names
+
+    def test_add_index_with_spec(self, collection):
+        collection.add_index(
+            IndexSpec(name="footprint", key_func=lambda c: c.footprint, unique=False)
+        )
+        assert collection.explain(footprint="x")["index"] == "footprint"
+
+    def test_duplicate_index_raises_error(self, collection):
+        collection.add_field_index("value")
+        with pytest.raises(ValueError, match="already exists"):
+            collection.add_field_index("value")
+
+    def test_remove_index(self, collection):
+        collection.add_field_index("value")
+        collection.remove_index("value")
+        assert "value" not in collection.index_names
+        assert collection.explain(value="10k")["strategy"] == "scan"
+
+    def test_remove_builtin_index_raises_error(self, collection):
+        with pytest.raises(ValueError, match="built-in"):
+            collection.remove_index("uuid")
+
+
+class TestIndexedFilter:
+    """filter() results must match an unindexed scan."""
+
+    def test_filter_without_index_scans(self, collection):
+        plan = collection.explain(value="10k")
+        assert plan["strategy"] == "scan"
+        assert plan["candidates"] == len(collection)
+
+    def test_filter_uses_field_index(self, collection):
+        expected = collection.filter(value="10k")
+        collection.add_field_index("value")
+
+        assert collection.filter(value="10k") == expected
+        plan = collection.explain(value="10k")
+        assert plan == {
+            "strategy": "index",
+            "index": "value",
+            "key": "10k",
+            "candidates": 5,
+            "total": 11,
+        }
+
+    def test_filter_picks_most_selective_index(self, collection):
+        collection.add_field_index("lib_id")
+        collection.add_field_index("value")
+
+        plan = collection.explain(lib_id="Device:R", value="10k")
+        assert plan["index"] == "value"
+
+        results = collection.filter(lib_id="Device:R", value="10k")
+        assert [c.reference for c in results] == ["R1", "R3", "R5", "R7", "R9"]
+
+    def test_filter_by_indexed_property(self, collection):
+        expected = collection.filter(properties={"MPN": "RC0603-1"})
+        collection.add_property_index("MPN")
+
+        results = collection.filter(properties={"MPN": "RC0603-1"})
+        assert results == expected
+        assert [c.reference for c in results] == ["R2", "R5", "R8"]
+        assert collection.explain(properties={"MPN": "RC0603-1"})["index"] == "property:MPN"
+
+    def test_filter_missing_key_returns_empty(self, collection):
+        collection.add_field_index("value")
+        assert collection.filter(value="does-not-exist") == []
+        assert collection.explain(value="does-not-exist")["candidates"] == 0
+
+    def test_filter_combines_index_with_other_criteria(self, collection):
+        collection.add_field_index("value")
+        results = collection.filter(value="10k", in_area=(0, 0, 40, 0))
+        assert [c.reference for c in results] == ["R1", "R3", "R5"]
+
+    def test_index_tracks_value_changes(self, collection):
+        collection.add_field_index("value")
+        assert len(collection.filter(value="47k")) == 0
+
+        collection.get("R2").value = "47k"
+
+        assert [c.reference for c in collection.filter(value="47k")] == ["R2"]
+        assert len(collection.filter(value="1k")) == 4
+
+    def test_index_tracks_property_changes(self, collection):
+        collection.add_property_index("MPN")
+
+        collection.get("C1").set_property("MPN", "GRM188")
+        assert [c.reference for c in collection.filter(properties={"MPN": "GRM188"})] == ["C1"]
+
+        collection.get("C1").remove_property("MPN")
+        assert collection.filter(properties={"MPN": "GRM188"}) == []
+
+    def test_index_tracks_direct_property_writes(self, collection):
+        collection.add_property_index("MPN")
+        assert collection.filter(properties={"MPN": "B1"}) == []
+
+        collection.get("R3").properties["MPN"] = "B1"
+        assert [c.reference for c in collection.filter(properties={"MPN": "B1"})] == ["R3"]
+        assert collection.explain(properties={"MPN": "B1"})["index"] == "property:MPN"
+
+        del collection.get("R3").properties["MPN"]
+        assert collection.filter(properties={"MPN": "B1"}) == []
+
+    def test_batch_mode_falls_back_to_scan(self, collection):
+        collection.add_field_index("value")
+        with collection.batch_mode():
+            collection.get("R2").value = "47k"
+            assert collection.explain(value="47k")["strategy"] == "scan"
+            assert [c.reference for c in collection.filter(value="47k")] == ["R2"]
+
+    def test_bulk_update_uses_index(self, collection):
+        collection.add_field_index("value")
+        count = collection.bulk_update(
+            criteria={"value": "10k"}, updates={"properties": {"Tolerance": "1%"}}
+        )
+        assert count == 5
+        assert len(collection.filter(has_property="Tolerance")) == 5
+
+
+class TestPropertyMatcherIndexes:
+    """PropertyMatcher.filter() uses collection indexes for exact patterns."""
+
+    def test_filter_without_index_matches_scan(self, collection):
+        criteria = {"value": "^10k$", "MPN": "RC0603-0"}
+        expected = [c for c in collection if PropertyMatcher.matches(c, criteria)]
+        assert PropertyMatcher.filter(collection, criteria) == expected
+
+    def test_filter_with_indexes_matches_scan(self, collection):
+        criteria_list = [
+            {"value": "^10k$"},
+            {"MPN": ""},
+            {"MPN": "^RC0603-2$", "reference": "R*"},
+            {"reference": "^C1$"},
+        ]
+        expected = [
+            [c for c in collection if PropertyMatcher.matches(c, criteria)]
+            for criteria in criteria_list
+        ]
+
+        collection.add_field_index("value")
+        collection.add_property_index("MPN")
+
+        for criteria, want in zip(criteria_list, expected):
+            assert PropertyMatcher.filter(collection, criteria) == want
+
+    def test_filter_accepts_plain_iterables(self, collection):
+        components = list(collection)
+        assert PropertyMatcher.filter(components, {"value": "100nF"}) == [collection.get("C1")]
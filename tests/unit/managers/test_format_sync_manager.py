@@ -0,0 +1,117 @@
+"""Unit tests for FormatSyncManager: the element text cache used by save and the change log."""
+
+import kicad_sch_api as ksa
+from kicad_sch_api.core.managers.format_sync import FormatSyncManager
+from kicad_sch_api.core.types import Point
+
+
+def saved_sheet(tmp_path):
+    """A saved and reloaded sheet with components, a wire, a junction and a label."""
+    sch = ksa.create_schematic("Cache")
+    for i in range(3):
+        sch.components.add("Device:R", f"R{i + 1}", "1k", (100.33 + 10.16 * i, 100.33))
+    sch.wires.add(start=(50.8, 50.8), end=(76.2, 50.8))
+    sch.junctions.add(position=(50.8, 50.8))
+    sch.add_label("SIG", position=(76.2, 50.8))
+    sch.save(str(tmp_path / "cache.kicad_sch"))
+    sch = ksa.load_schematic(str(tmp_path / "cache.kicad_sch"))
+    sch.save()
+    return sch
+
+
+def resave(sch):
+    """Save again and return the cache statistics of that save and the file text."""
+    cache = sch._format_sync_manager.element_cache()
+    hits, misses = cache.hits, cache.misses
+    sch.save()
+    return (cache.hits - hits, cache.misses - misses), sch.file_path.read_text()
+
+
+def uncached_text(sch, tmp_path):
+    """File text formatted from scratch, without the element cache."""
+    path = tmp_path / "uncached.kicad_sch"
+    sch._file_io_manager.save_schematic(sch._data, path)
+    return path.read_text()
+
+
+def test_unchanged_save_reuses_every_element(tmp_path):
+    sch = saved_sheet(tmp_path)
+
+    (hits, misses), text = resave(sch)
+
+    assert (hits, misses) == (6, 0)
+    assert text == uncached_text(sch, tmp_path)
+
+
+def test_changed_component_is_formatted_again(tmp_path):
+    sch = saved_sheet(tmp_path)
+
+    sch.components.get("R2").value = "4k7"
+    (hits, misses), text = resave(sch)
+
+    assert (hits, misses) == (5, 1)
+    assert '"Value" "4k7"' in text
+    assert text == uncached_text(sch, tmp_path)
+
+
+def test_direct_property_write_is_saved(tmp_path):
+    sch = saved_sheet(tmp_path)
+
+    sch.components.get("R3").properties["MPN"] = "XYZ-123"
+    (hits, misses), text = resave(sch)
+
+    assert (hits, misses) == (5, 1)
+    assert '"MPN" "XYZ-123"' in text
+
+    sch.components.get("R3").hidden_properties.add("MPN")
+    (hits, misses), text = resave(sch)
+
+    assert (hits, misses) == (5, 1)
+    assert text == uncached_text(sch, tmp_path)
+
+
+def test_changes_made_inside_a_batch_are_seen(tmp_path):
+    sch = saved_sheet(tmp_path)
+
+    with sch.components.batch_mode():
+        sch.components.get("R1").position = (127.0, 127.0)
+        _, text = resave(sch)
+
+    assert "(at 127 127 0)" in text
+
+
+def test_unreported_wire_edit_is_detected(tmp_path):
+    sch = saved_sheet(tmp_path)
+
+    (wire,) = sch.wires
+    wire.points[1] = Point(88.9, 50.8)
+    _, text = resave(sch)
+
+    assert "(xy 88.9 50.8)" in text
+
+
+def test_new_project_name_rebuilds_everything(tmp_path):
+    sch = saved_sheet(tmp_path)
+
+    sch.name = "Renamed"
+    (hits, misses), text = resave(sch)
+
+    assert (hits, misses) == (0, 6)
+    assert text == uncached_text(sch, tmp_path)
+
+
+def test_change_log_is_cleared_on_save_and_bounded(tmp_path):
+    sch = saved_sheet(tmp_path)
+    assert sch._format_sync_manager.get_change_log() == []
+
+    for i in range(5):
+        sch.components.get("R1").value = f"{i}k"
+    assert len(sch._format_sync_manager.get_change_log()) == 5
+
+    sch.save()
+    assert sch._format_sync_manager.get_change_log() == []
+
+    manager = FormatSyncManager({}, max_log_entries=3)
+    for i in range(5):
+        manager.mark_dirty("wire", "add", {"uuid": str(i)})
+    assert [e["context"]["uuid"] for e in manager.get_change_log()] == ["2", "3", "4"]
@@ -0,0 +1,183 @@
+"""Unit tests for ValidationManager checks and save-time validation."""
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.utils.validation import ValidationError, ValidationLevel
+
+
+def missing_junction_issues(sch):
+    """Connectivity issues reporting a missing junction."""
+    return [
+        issue
+        for issue in sch._validation_manager.validate_connectivity()
+        if issue.message.startswith("Missing junction")
+    ]
+
+
+def test_t_connection_without_junction_is_reported():
+    """A wire end on the middle of another wire needs a junction."""
+    sch = ksa.create_schematic("T")
+    bar = sch.wires.add(start=(0, 0), end=(20, 0))
+    stem = sch.wires.add(start=(10, 0), end=(10, 10))
+
+    (issue,) = missing_junction_issues(sch)
+
+    assert issue.level is ValidationLevel.WARNING
+    assert issue.context == {
+        "position": (10, 0),
+        "wire": bar,
+        "source": f"wire {stem} end",
+    }
+
+
+def test_t_connection_with_junction_is_clean():
+    """A junction at the T-connection satisfies the check."""
+    sch = ksa.create_schematic("T")
+    sch.wires.add(start=(0, 0), end=(20, 0))
+    sch.wires.add(start=(10, 0), end=(10, 10))
+    sch.junctions.add(position=(10, 0))
+
+    assert missing_junction_issues(sch) == []
+
+
+def test_corners_and_crossings_are_not_t_connections():
+    """Endpoint-to-endpoint corners and plain crossings need no junction."""
+    sch = ksa.create_schematic("T")
+    sch.wires.add(start=(0, 0), end=(20, 0))
+    sch.wires.add(start=(20, 0), end=(20, 20))
+    sch.wires.add(start=(10, -10), end=(10, 10))
+
+    assert missing_junction_issues(sch) == []
+
+
+def positioning_messages(sch):
+    """Messages of overlapping-component issues."""
+    return [
+        issue.message
+        for issue in sch._validation_manager.validate_positioning()
+        if issue.message.startswith("Components")
+    ]
+
+
+def test_overlapping_symbol_bodies_are_reported():
+    """Overlap is judged on symbol bodies, not origin distance."""
+    sch = ksa.create_schematic("Overlap")
+    sch.components.add("Device:R", "R1", "1k", (100.33, 100.33))
+    sch.components.add("Device:R", "R2", "1k", (100.33, 102.87))  # Bodies overlap
+    sch.components.add("Device:R", "R3", "1k", (105.41, 100.33))  # 5 mm apart, bodies clear
+
+    assert positioning_messages(sch) == ["Components overlap: R1 and R2"]
+
+
+def test_clearance_is_configurable():
+    """A clearance also reports bodies closer than that gap."""
+    from kicad_sch_api.core.config import config
+
+    sch = ksa.create_schematic("Overlap")
+    sch.components.add("Device:R", "R1", "1k", (100.33, 100.33))
+    sch.components.add("Device:R", "R2", "1k", (105.41, 100.33))
+    manager = sch._validation_manager
+
+    assert manager._find_overlapping_components() == []
+    ((first, second, gap),) = manager._find_overlapping_components(clearance=5.0)
+    assert (first, second) == ("R1", "R2")
+    assert 0 < gap < 5.0
+
+    original = config.validation.component_clearance
+    config.validation.component_clearance = 5.0
+    try:
+        assert len(positioning_messages(sch)) == 1
+    finally:
+        config.validation.component_clearance = original
+
+
+def saved_resistors(tmp_path, count=3):
+    """A saved sheet of resistors, so later saves only see new changes."""
+    sch = ksa.create_schematic("Save")
+    for i in range(count):
+        sch.components.add("Device:R", f"R{i + 1}", "1k", (100.33 + 10.16 * i, 100.33))
+    sch.save(str(tmp_path / "save.kicad_sch"))
+    return sch
+
+
+def test_dirty_save_validates_changed_components_only(tmp_path, monkeypatch):
+    """A save after one edit checks that component, not the whole sheet."""
+    sch = saved_resistors(tmp_path)
+    checked = []
+    original = sch._validation_manager.validate_changes
+
+    def recording(component_uuids):
+        checked.append(set(component_uuids))
+        return original(component_uuids)
+
+    monkeypatch.setattr(sch._validation_manager, "validate_changes", recording)
+    monkeypatch.setattr(sch._validation_manager, "validate_schematic", lambda: 1 / 0)
+
+    sch.components.get("R2").value = "2k"
+    sch.save(validate="dirty")
+    sch.save(validate="dirty")
+
+    assert checked == [{sch.components.get("R2").uuid}, set()]
+
+
+def test_dirty_save_rejects_invalid_change(tmp_path):
+    """Errors in changed components still block the save until fixed."""
+    sch = saved_resistors(tmp_path)
+    component = sch.components.get("R2")
+    component._data.lib_id = "no-library"
+    component.value = "2k"
+
+    with pytest.raises(ValidationError):
+        sch.save(validate="dirty")
+    sch.save(validate="none")
+    with pytest.raises(ValidationError):
+        sch.save(validate="dirty")  # The unvalidated save does not count as checked
+
+    component._data.lib_id = "Device:R"
+    component.value = "3k"
+    sch.save(validate="dirty")
+
+
+def test_full_save_revalidates_unchanged_components(tmp_path):
+    """The default full validation also sees problems in components not edited since."""
+    sch = saved_resistors(tmp_path)
+    sch.components.get("R1")._data.lib_id = "no-library"  # Not journaled
+
+    sch.save(validate="dirty")
+    with pytest.raises(ValidationError):
+        sch.save()
+    with pytest.raises(ValueError):
+        sch.save(validate="partial")
+
+
+def test_first_dirty_save_of_loaded_sheet_is_full(tmp_path):
+    """A loaded sheet is fully validated by its first dirty save."""
+    saved_resistors(tmp_path)
+    sch = ksa.Schematic.load(str(tmp_path / "save.kicad_sch"))
+    duplicate = sch.components.get("R2")._data
+    duplicate.reference = "R1"  # Not journaled
+
+    with pytest.raises(ValidationError):
+        sch.save(validate="dirty")
+    duplicate.reference = "R2"
+    sch.save(validate="dirty")
+    duplicate.reference = "R1"
+    sch.save(validate="dirty")  # Validated once; unchanged components are skipped
+
+
+def test_unconnected_pins_and_floating_wires_are_reported():
+    """Connectivity validation lists pins and wires that touch nothing."""
+    sch = ksa.create_schematic("Endpoints")
+    sch.components.add("Device:R", "R1", "1k", (100.33, 100.33))
+    pin = sch.components.pin_table().position("R1", "2")
+    sch.wires.add(start=pin, end=(pin.x, pin.y + 10.16))
+    floating = sch.wires.add(start=(20, 20), end=(30, 20))
+
+    issues = [
+        issue.context
+        for issue in sch._validation_manager.validate_connectivity()
+        if issue.message.startswith(("Unconnected pin", "Floating wire"))
+    ]
+
+    assert issues == [{"component": "R1", "pin": "1"}, {"wire": floating}]
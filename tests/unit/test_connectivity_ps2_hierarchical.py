@@ -4,6 +4,7 @@ Unit tests for connectivity analysis - PS2: Hierarchical power symbols.
 Tests multi-sheet hierarchical connectivity with power symbols and sheet pins.
 """
 
+import re
 from pathlib import Path
 
 import pytest
@@ -120,6 +121,25 @@ class TestConnectivityPS2Hierarchical:
         connected = analyzer.get_connected_pins("R2", "1")
         assert ("R1", "2") in connected, "R2.1 should be connected to R1.2"
 
+    def test_matches_kicad_netlist(self, reference_schematic, analyzer):
+        """Pin groupings match the netlist exported by KiCad for this design."""
+        netlist = Path(reference_schematic.file_path).with_suffix(".net").read_text()
+        nets_section = netlist[netlist.index("(nets") :]
+
+        expected = {}
+        for block in re.split(r"\(net \(code", nets_section)[1:]:
+            name = re.search(r'\(name "([^"]*)"\)', block).group(1)
+            nodes = re.findall(r'\(node \(ref "([^"]+)"\) \(pin "([^"]+)"\)', block)
+            expected[name.lstrip("/")] = set(nodes)
+
+        actual = {
+            net.name: {
+                (p.reference, p.pin_number) for p in net.pins if not p.reference.startswith("#")
+            }
+            for net in analyzer.nets
+        }
+        assert actual == expected
+
     def test_hierarchical_labels_counted(self, reference_schematic):
         """Child schematic should have hierarchical labels."""
         # Load child manually to verify structure
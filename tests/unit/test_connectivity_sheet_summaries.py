@@ -0,0 +1,258 @@
+"""
+Unit tests for hierarchical connectivity composed from per-sheet summaries.
+
+A child sheet file is analyzed once per content hash; each instance of the
+sheet is stitched to its parent through sheet pins.
+"""
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.core import connectivity
+from kicad_sch_api.core.connectivity import ConnectivityAnalyzer, PinConnection
+from kicad_sch_api.core.types import Point, SymbolInstance, Wire
+
+
+class OriginPinAnalyzer(ConnectivityAnalyzer):
+    """Analyzer giving every component a single pin "1" at its origin."""
+
+    def _build_pin_positions(self, schematic):
+        pin_positions = {}
+        for component in schematic.components:
+            pin_positions.update(self._component_pin_positions(component))
+        return pin_positions
+
+    def _component_pin_positions(self, component):
+        return {PinConnection(component.reference, "1", component.position): component.position}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    connectivity.clear_sheet_summary_cache()
+    yield
+    connectivity.clear_sheet_summary_cache()
+
+
+@pytest.fixture
+def load_counter(monkeypatch):
+    """Count Schematic.load calls made while analyzing."""
+    calls = []
+    original = ksa.Schematic.load
+
+    def counting_load(path, *args, **kwargs):
+        calls.append(path)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(ksa.Schematic, "load", staticmethod(counting_load))
+    return calls
+
+
+def write_channel(path, instances=(), global_label=None):
+    """Child sheet: R1 wired to hierarchical label IN, plus a wired GND symbol."""
+    child = ksa.create_schematic("channel")
+    resistor = child.components.add("Device:R", reference="R1", value="1k", position=(50, 50))
+    resistor._data.instances = [
+        SymbolInstance(path=instance_path, reference=reference, project="channel")
+        for instance_path, reference in instances
+    ]
+    ground = child.components.add("power:GND", reference="#PWR01", value="GND", position=(30, 30))
+    r_x, r_y = resistor.position.x, resistor.position.y
+    child.wires.add(start=(r_x, r_y), end=(r_x + 10, r_y))
+    child.wires.add(start=(ground.position.x, ground.position.y), end=(ground.position.x, 20))
+    child.add_hierarchical_label("IN", (r_x + 10, r_y))
+    if global_label:
+        child.add_global_label(global_label, (r_x, r_y))
+    child.save(str(path))
+
+
+def write_root(path, count, filename="channel.kicad_sch"):
+    """Root sheet with `count` child instances, each IN pin on its own wire."""
+    filenames = [filename] * count if isinstance(filename, str) else filename
+    root = ksa.create_schematic("root")
+    sheet_uuids = []
+    for i in range(count):
+        x = 100 + 40 * i
+        sheet = root.add_sheet(f"CH{i}", filenames[i], (x, 100), (20, 20))
+        root.add_sheet_pin(sheet, "IN", "input", "left", 10)
+        root.wires.add(start=(x - 10, 110), end=(x, 110))
+        sheet_uuids.append(sheet)
+    root.save(str(path))
+    return root, sheet_uuids
+
+
+def analyze(path):
+    analyzer = OriginPinAnalyzer(tolerance=0.1)
+    analyzer.analyze(ksa.Schematic.load(str(path)), hierarchical=True)
+    return analyzer
+
+
+class TestSheetSummaries:
+    """Hierarchical composition from cached sheet summaries."""
+
+    def test_reused_sheet_is_analyzed_once(self, tmp_path, load_counter):
+        write_channel(tmp_path / "channel.kicad_sch")
+        write_root(tmp_path / "root.kicad_sch", 4)
+
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        assert [p for p in load_counter if p.endswith("channel.kicad_sch")] == [
+            str(tmp_path / "channel.kicad_sch")
+        ]
+        # Every instance brings its own IN net, each joined to its root wire
+        in_nets = [net for net in analyzer.nets if len(net.wires) == 2 and net.name != "GND"]
+        assert len(in_nets) == 4
+        assert len(analyzer._sheet_paths) == 5
+
+    def test_summary_reused_across_analyses(self, tmp_path, load_counter):
+        write_channel(tmp_path / "channel.kicad_sch")
+        write_root(tmp_path / "root.kicad_sch", 2)
+
+        first = analyze(tmp_path / "root.kicad_sch")
+        second = analyze(tmp_path / "root.kicad_sch")
+
+        assert sum(p.endswith("channel.kicad_sch") for p in load_counter) == 1
+        assert sorted(n.name for n in first.nets) == sorted(n.name for n in second.nets)
+
+    def test_changed_file_is_reanalyzed(self, tmp_path, load_counter):
+        write_channel(tmp_path / "channel.kicad_sch")
+        write_root(tmp_path / "root.kicad_sch", 1)
+        analyze(tmp_path / "root.kicad_sch")
+
+        child = ksa.Schematic.load(str(tmp_path / "channel.kicad_sch"))
+        child.wires.add(start=(20, 20), end=(20, 10))
+        child.save(str(tmp_path / "channel.kicad_sch"))
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        assert sum(p.endswith("channel.kicad_sch") for p in load_counter) == 3
+        assert len(analyzer.nets) == 3
+
+    def test_library_edit_reanalyzes_sheets_using_it(self, tmp_path, load_counter, monkeypatch):
+        write_channel(tmp_path / "channel.kicad_sch")
+        write_root(tmp_path / "root.kicad_sch", 1)
+        analyze(tmp_path / "root.kicad_sch")
+        analyze(tmp_path / "root.kicad_sch")
+        assert sum(p.endswith("channel.kicad_sch") for p in load_counter) == 1
+
+        cache = ksa.get_symbol_cache()
+        mtime = cache.get_library_mtime
+        monkeypatch.setattr(
+            cache, "get_library_mtime", lambda name: 0.0 if name == "Device" else mtime(name)
+        )
+        analyze(tmp_path / "root.kicad_sch")
+
+        assert sum(p.endswith("channel.kicad_sch") for p in load_counter) == 2
+
+    def test_power_symbols_merge_across_instances(self, tmp_path):
+        write_channel(tmp_path / "channel.kicad_sch")
+        write_root(tmp_path / "root.kicad_sch", 3)
+
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        (gnd,) = [net for net in analyzer.nets if net.name == "GND"]
+        assert len(gnd.wires) == 1  # Same wire UUID in every instance
+
+    def test_instance_references_are_resolved(self, tmp_path):
+        root, sheets = write_root(tmp_path / "root.kicad_sch", 2)
+        write_channel(
+            tmp_path / "channel.kicad_sch",
+            instances=[
+                (f"/{root.uuid}/{sheets[0]}", "R101"),
+                (f"/{root.uuid}/{sheets[1]}", "R201"),
+            ],
+        )
+
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        first = analyzer.get_net_for_pin("R101", "1")
+        second = analyzer.get_net_for_pin("R201", "1")
+        assert first is not None and second is not None
+        assert first is not second
+        assert not analyzer.are_connected("R101", "1", "R201", "1")
+        components = {c.reference: c.sheet_path for c in analyzer.get_components()}
+        assert components["R101"] == f"/{root.uuid}/{sheets[0]}"
+        assert components["R201"] == f"/{root.uuid}/{sheets[1]}"
+
+    def test_nested_sheets_are_composed(self, tmp_path):
+        write_channel(tmp_path / "channel.kicad_sch")
+        middle = ksa.create_schematic("middle")
+        sheet = middle.add_sheet("CH", "channel.kicad_sch", (100, 100), (20, 20))
+        middle.add_sheet_pin(sheet, "IN", "input", "left", 10)
+        middle.wires.add(start=(80, 110), end=(100, 110))
+        middle.add_hierarchical_label("IN", (80, 110))
+        middle.save(str(tmp_path / "middle.kicad_sch"))
+        write_root(tmp_path / "root.kicad_sch", 1, filename="middle.kicad_sch")
+
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        # Root wire, middle wire and the channel's IN wire form one net
+        assert any(len(net.wires) == 3 and net.name != "GND" for net in analyzer.nets)
+
+    def test_global_labels_merge_across_sheets(self, tmp_path):
+        write_channel(tmp_path / "a.kicad_sch", global_label="BUS")
+        write_channel(tmp_path / "b.kicad_sch", global_label="BUS")
+        write_channel(tmp_path / "c.kicad_sch")
+        root, _ = write_root(
+            tmp_path / "root.kicad_sch", 3, filename=["a.kicad_sch", "b.kicad_sch", "c.kicad_sch"]
+        )
+        root = ksa.Schematic.load(str(tmp_path / "root.kicad_sch"))
+        root.add_global_label("BUS", (90, 110))
+        root.save(str(tmp_path / "root.kicad_sch"))
+
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        # The labelled IN nets of sheets a and b with their root wires; c stays apart
+        (bus,) = [net for net in analyzer.nets if net.name == "BUS"]
+        assert len(bus.wires) == 4
+        assert analyzer._label_name_to_nets["BUS"] == [bus]
+        assert [net.name for net in analyzer.nets].count("GND") == 1
+
+    def test_child_instances_are_read_only(self, tmp_path):
+        write_channel(tmp_path / "channel.kicad_sch")
+        write_root(tmp_path / "root.kicad_sch", 1)
+        analyzer = analyze(tmp_path / "root.kicad_sch")
+
+        with pytest.raises(ValueError):
+            analyzer.add_wire(Wire(uuid="w", points=[Point(0, 0), Point(1, 0)]), sheet_index=1)
+
+
+def net_signature(analyzer):
+    return [
+        (net.name, sorted((p.reference, p.pin_number) for p in net.pins), sorted(net.wires))
+        for net in analyzer.nets
+    ]
+
+
+class TestParallelSummaries:
+    """Child sheet files summarized across a process pool."""
+
+    def test_parallel_matches_serial(self, tmp_path):
+        filenames = [f"{name}.kicad_sch" for name in ("a", "b", "c")]
+        for filename in filenames:
+            write_channel(tmp_path / filename)
+        write_root(tmp_path / "root.kicad_sch", 3, filename=filenames)
+        schematic = ksa.Schematic.load(str(tmp_path / "root.kicad_sch"))
+
+        serial = OriginPinAnalyzer(tolerance=0.1)
+        serial.analyze(schematic)
+        connectivity.clear_sheet_summary_cache()
+        parallel = OriginPinAnalyzer(tolerance=0.1)
+        parallel.analyze(schematic, max_workers=2)
+
+        assert len(connectivity._sheet_summaries) == 3
+        assert net_signature(parallel) == net_signature(serial)
+
+    def test_broken_sheet_does_not_stop_analysis(self, tmp_path):
+        write_channel(tmp_path / "a.kicad_sch")
+        write_channel(tmp_path / "b.kicad_sch")
+        (tmp_path / "broken.kicad_sch").write_text("(kicad_sch (version")
+        write_root(
+            tmp_path / "root.kicad_sch",
+            3,
+            filename=["a.kicad_sch", "broken.kicad_sch", "b.kicad_sch"],
+        )
+
+        analyzer = OriginPinAnalyzer(tolerance=0.1)
+        analyzer.analyze(ksa.Schematic.load(str(tmp_path / "root.kicad_sch")), max_workers=None)
+
+        assert len(analyzer._sheet_paths) == 3
+        assert [net.name for net in analyzer.nets].count("GND") == 1
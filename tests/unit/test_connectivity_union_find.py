@@ -0,0 +1,535 @@
+"""
+Unit tests for the union-find connectivity engine.
+
+Covers DisjointSet, PointGrid and SegmentIndex, net construction rules on small
+synthetic sheets with precomputed pin positions, and incremental updates.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from kicad_sch_api.collections.labels import LabelElement
+from kicad_sch_api.core.connectivity import (
+    ConnectivityAnalyzer,
+    DisjointSet,
+    PinConnection,
+    PointGrid,
+    SegmentIndex,
+)
+from kicad_sch_api.core.types import Junction, Label, Point, Wire
+
+
+class SheetAnalyzer(ConnectivityAnalyzer):
+    """Analyzer reading pin positions from a synthetic sheet."""
+
+    def _build_pin_positions(self, schematic):
+        return schematic.pin_positions
+
+    def _component_pin_positions(self, component):
+        return component.pin_positions
+
+
+def make_sheet(pins=(), wires=(), junctions=(), labels=(), power=(), global_labels=()):
+    """
+    Build a synthetic sheet.
+
+    Args:
+        pins: (reference, pin_number, (x, y)) tuples
+        wires: Lists of (x, y) points
+        junctions: (x, y) positions
+        labels: (text, (x, y)) tuples
+        power: (reference, value) tuples marking power symbols
+        global_labels: (text, (x, y)) tuples
+    """
+    power_values = dict(power)
+    references = sorted({ref for ref, _, _ in pins})
+    components = [
+        SimpleNamespace(
+            reference=ref,
+            lib_id="power:" + power_values[ref] if ref in power_values else "Device:R",
+            value=power_values.get(ref, "10k"),
+        )
+        for ref in references
+    ]
+    return SimpleNamespace(
+        components=components,
+        pin_positions={
+            PinConnection(ref, number, Point(*xy)): Point(*xy) for ref, number, xy in pins
+        },
+        wires=[
+            Wire(uuid=f"w{i}", points=[Point(*xy) for xy in points])
+            for i, points in enumerate(wires)
+        ],
+        junctions=[Junction(uuid=f"j{i}", position=Point(*xy)) for i, xy in enumerate(junctions)],
+        labels=[
+            LabelElement(Label(uuid=f"l{i}", position=Point(*xy), text=text), None)
+            for i, (text, xy) in enumerate(labels)
+        ],
+        hierarchical_labels=[],
+        file_path=None,
+        _data={
+            "global_label": [
+                {"uuid": f"g{i}", "text": text, "at": [x, y, 0]}
+                for i, (text, (x, y)) in enumerate(global_labels)
+            ]
+        },
+    )
+
+
+def make_component(reference, pins, power=None):
+    """Build a synthetic component from (pin_number, (x, y)) tuples."""
+    return SimpleNamespace(
+        reference=reference,
+        lib_id="power:" + power if power else "Device:R",
+        value=power or "10k",
+        pin_positions={
+            PinConnection(reference, number, Point(*xy)): Point(*xy) for number, xy in pins
+        },
+    )
+
+
+def partition(analyzer):
+    """Nets as sorted (pins, explicit name, wires) tuples."""
+    return sorted(
+        (
+            sorted((p.reference, p.pin_number) for p in net.pins),
+            "" if net.name.startswith("Net-(unnamed") else net.name,
+            sorted(net.wires),
+        )
+        for net in analyzer.nets
+    )
+
+
+def analyze(sheet, tolerance=0.01):
+    analyzer = SheetAnalyzer(tolerance=tolerance)
+    analyzer.analyze(sheet, hierarchical=False)
+    return analyzer
+
+
+class TestDisjointSet:
+    """Test union-find bookkeeping."""
+
+    def test_union_and_find(self):
+        uf = DisjointSet()
+        a, b, c = uf.make(), uf.make(), uf.make()
+        uf.union(a, b)
+        assert uf.find(a) == uf.find(b)
+        assert uf.find(c) != uf.find(a)
+        assert len(uf) == 3
+
+    def test_reset_splits_nodes(self):
+        merges = []
+        uf = DisjointSet(on_merge=lambda root, absorbed: merges.append((root, absorbed)))
+        a, b = uf.make(), uf.make()
+        uf.union(a, b)
+        uf.union(a, b)
+        assert len(merges) == 1
+
+        uf.reset([a, b])
+        assert uf.find(a) != uf.find(b)
+
+    def test_long_chain_stays_shallow(self):
+        uf = DisjointSet()
+        nodes = [uf.make() for _ in range(10_000)]
+        for left, right in zip(nodes, nodes[1:]):
+            uf.union(left, right)
+        root = uf.find(nodes[0])
+        assert all(uf.find(node) == root for node in nodes)
+
+
+class TestPointGrid:
+    """Test tolerance-based coordinate snapping."""
+
+    def test_points_within_tolerance_share_node(self):
+        grid = PointGrid(DisjointSet(), tolerance=0.1)
+        node = grid.node(Point(6.35, 10.0))
+        # 6.35 / 0.1 sits on a cell boundary; near values must still match
+        assert grid.node(Point(6.3499999, 10.0)) == node
+        assert grid.node(Point(6.41, 10.0)) == node
+        assert grid.find(Point(6.6, 10.0)) is None
+
+    def test_find_does_not_create(self):
+        uf = DisjointSet()
+        grid = PointGrid(uf, tolerance=0.01)
+        assert grid.find(Point(1, 1)) is None
+        assert len(uf) == 0
+
+    def test_tolerance_must_be_positive(self):
+        with pytest.raises(ValueError):
+            PointGrid(DisjointSet(), tolerance=0)
+
+
+class TestSegmentIndex:
+    """Test point-on-segment incidence queries."""
+
+    def test_interior_hits_exclude_endpoints(self):
+        index = SegmentIndex(tolerance=0.01)
+        index.add_segment("h", Point(0, 0), Point(10, 0))
+        index.add_segment("v", Point(5, -5), Point(5, 5))
+
+        assert sorted(index.segments_at(Point(5, 0))) == ["h", "v"]
+        assert index.segments_at(Point(10, 0)) == []
+        assert index.segments_at(Point(5.005, 0.005)) == ["h", "v"]
+        assert index.segments_at(Point(11, 0)) == []
+
+    def test_long_segment_found_past_short_ones(self):
+        index = SegmentIndex(tolerance=0.01)
+        index.add_segment("long", Point(0, 0), Point(100, 0))
+        for i in range(20):
+            index.add_segment(f"s{i}", Point(i * 2, 0), Point(i * 2 + 1, 0))
+        assert index.segments_at(Point(90, 0)) == ["long"]
+        assert sorted(index.segments_at(Point(4.5, 0))) == ["long", "s2"]
+
+    def test_points_on_segment(self):
+        index = SegmentIndex(tolerance=0.01)
+        index.add_point("mid", Point(0, 5))
+        index.add_point("end", Point(0, 10))
+        index.add_point("off", Point(1, 5))
+        assert index.points_on(Point(0, 0), Point(0, 10)) == ["mid"]
+        assert index.points_on(Point(0, 10), Point(0, 0)) == ["mid"]
+
+    def test_diagonal_segments_are_ignored(self):
+        index = SegmentIndex(tolerance=0.01)
+        assert not index.add_segment("d", Point(0, 0), Point(10, 10))
+        assert index.points_on(Point(0, 0), Point(10, 10)) == []
+
+    def test_remove(self):
+        index = SegmentIndex(tolerance=0.01)
+        index.add_segment("w", Point(0, 0), Point(10, 0))
+        index.add_segment("w", Point(10, 0), Point(10, 10))
+        index.add_point("j", Point(5, 0))
+        index.remove("w")
+        index.remove("j")
+        assert index.segments_at(Point(10, 5)) == []
+        assert index.points_on(Point(0, 0), Point(10, 0)) == []
+
+
+class TestNetConstruction:
+    """Net rules of the union-find analyzer."""
+
+    def test_wire_corner_connects_without_junction(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (10, 10))],
+            wires=[[(0, 0), (10, 0)], [(10, 0), (10, 10)]],
+        )
+        analyzer = analyze(sheet)
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+        assert len(analyzer.nets) == 1
+
+    def test_polyline_interior_point_connects_pin(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (5, 0))],
+            wires=[[(0, 0), (5, 0), (5, 5)]],
+        )
+        assert analyze(sheet).are_connected("R1", "1", "R2", "1")
+
+    def test_pin_to_pin_contact_connects(self):
+        sheet = make_sheet(pins=[("R1", "2", (5, 0)), ("R2", "1", (5, 0))])
+        analyzer = analyze(sheet)
+        assert analyzer.are_connected("R1", "2", "R2", "1")
+
+    def test_lone_pin_has_no_net(self):
+        sheet = make_sheet(pins=[("R1", "1", (0, 0))], wires=[[(5, 5), (10, 5)]])
+        analyzer = analyze(sheet)
+        assert analyzer.get_net_for_pin("R1", "1") is None
+        assert len(analyzer.nets) == 1
+
+    def test_t_connection_needs_junction(self):
+        pins = [("R1", "1", (0, 0)), ("R2", "1", (5, 10))]
+        wires = [[(0, 0), (10, 0)], [(5, 0), (5, 10)]]
+
+        assert not analyze(make_sheet(pins=pins, wires=wires)).are_connected("R1", "1", "R2", "1")
+
+        analyzer = analyze(make_sheet(pins=pins, wires=wires, junctions=[(5, 0)]))
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+        assert analyzer.get_net_for_pin("R1", "1").junctions == {"j0"}
+
+    def test_crossing_with_junction_connects(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 5)), ("R2", "1", (5, 0))],
+            wires=[[(0, 5), (10, 5)], [(5, 0), (5, 10)]],
+            junctions=[(5, 5)],
+        )
+        assert analyze(sheet).are_connected("R1", "1", "R2", "1")
+
+    def test_pin_on_wire_middle_with_junction_connects(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (5, 0))],
+            wires=[[(0, 0), (10, 0)]],
+            junctions=[(5, 0)],
+        )
+        assert analyze(sheet).are_connected("R1", "1", "R2", "1")
+
+    def test_junction_recorded_on_net(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0))],
+            wires=[[(0, 0), (5, 0)], [(5, 0), (5, 5)]],
+            junctions=[(5, 0), (50, 50)],
+        )
+        (net,) = analyze(sheet).nets
+        assert net.junctions == {"j0"}
+        assert net.wires == {"w0", "w1"}
+
+    def test_labels_merge_and_name_nets(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (20, 0))],
+            wires=[[(0, 0), (5, 0)], [(20, 0), (25, 0)]],
+            labels=[("SIG", (5, 0)), ("SIG", (25, 0)), ("SIG", (100, 100))],
+        )
+        analyzer = analyze(sheet)
+        net = analyzer.get_net_for_pin("R1", "1")
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+        assert net.name == "SIG"
+        assert net.labels == {"l0", "l1"}
+
+    def test_global_labels_merge_and_outrank_local_names(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (20, 0)), ("R3", "1", (40, 0))],
+            wires=[[(0, 0), (5, 0)], [(20, 0), (25, 0)], [(40, 0), (45, 0)]],
+            labels=[("LOCAL", (0, 0))],
+            global_labels=[("VBUS", (5, 0)), ("VBUS", (25, 0)), ("OTHER", (45, 0))],
+        )
+        analyzer = analyze(sheet)
+        net = analyzer.get_net_for_pin("R1", "1")
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+        assert not analyzer.are_connected("R1", "1", "R3", "1")
+        assert net.name == "VBUS"
+        assert net.labels == {"l0", "g0", "g1"}
+        assert analyzer._label_name_to_nets["LOCAL"] == [net]
+
+    def test_power_symbols_merge_by_value(self):
+        sheet = make_sheet(
+            pins=[
+                ("R1", "2", (0, 0)),
+                ("R2", "2", (20, 0)),
+                ("#PWR01", "1", (0, 5)),
+                ("#PWR02", "1", (20, 5)),
+            ],
+            wires=[[(0, 0), (0, 5)], [(20, 0), (20, 5)]],
+            labels=[("LOCAL", (0, 0))],
+            power=[("#PWR01", "GND"), ("#PWR02", "GND")],
+        )
+        analyzer = analyze(sheet)
+        assert analyzer.are_connected("R1", "2", "R2", "2")
+        assert analyzer.get_net_for_pin("R1", "2").name == "GND"
+
+    def test_auto_names_are_deterministic(self):
+        sheet = make_sheet(
+            pins=[("R2", "1", (0, 0)), ("R1", "2", (5, 0))],
+            wires=[[(0, 0), (5, 0)], [(50, 50), (60, 50)]],
+        )
+        names = sorted(net.name for net in analyze(sheet).nets)
+        assert names == ["Net-(R1-Pad2)", "Net-(unnamed-1)"]
+
+    def test_reanalysis_starts_fresh(self):
+        sheet = make_sheet(pins=[("R1", "1", (0, 0))], wires=[[(0, 0), (5, 0)]])
+        analyzer = SheetAnalyzer()
+        analyzer.analyze(sheet, hierarchical=False)
+        analyzer.analyze(sheet, hierarchical=False)
+        assert len(analyzer.nets) == 1
+
+
+class TestPinLookup:
+    """Pin-to-net and net-to-pins lookup tables."""
+
+    def test_pin_lookup_and_sorted_members(self):
+        sheet = make_sheet(
+            pins=[("R2", "1", (10, 0)), ("R10", "2", (10, 0)), ("R1", "1", (0, 0))],
+            wires=[[(0, 0), (10, 0)]],
+        )
+        analyzer = analyze(sheet)
+        (net,) = analyzer.nets
+
+        assert analyzer.get_net_code("R2", "1") == net.code
+        assert analyzer.get_net_by_code(net.code) is net
+        assert [(p.reference, p.pin_number) for p in analyzer.get_net_pins(net.code)] == [
+            ("R1", "1"),
+            ("R10", "2"),
+            ("R2", "1"),
+        ]
+        assert analyzer.get_connected_pins("R1", "1") == [("R10", "2"), ("R2", "1")]
+
+    def test_unknown_pins_and_codes(self):
+        analyzer = analyze(make_sheet(pins=[("R1", "1", (0, 0))]))
+
+        assert analyzer.get_net_code("R1", "1") is None
+        assert analyzer.get_net_for_pin("R9", "1") is None
+        assert not analyzer.are_connected("R1", "1", "R9", "1")
+        assert analyzer.get_net_by_code(99) is None
+        assert analyzer.get_net_pins(99) == []
+
+    def test_codes_are_retired_on_update(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (10, 0))], wires=[[(0, 0), (10, 0)]]
+        )
+        analyzer = analyze(sheet)
+        old = analyzer.get_net_code("R1", "1")
+
+        analyzer.add_wire(Wire(uuid="stub", points=[Point(10, 0), Point(10, 10)]))
+        new = analyzer.get_net_code("R1", "1")
+
+        assert new != old
+        assert analyzer.get_net_by_code(old) is None
+        assert analyzer.get_net_pins(old) == []
+        assert analyzer.get_net_code("R2", "1") == new
+
+
+class TestIncrementalUpdates:
+    """Wire and component edits applied without re-analysis."""
+
+    def test_add_wire_joins_pins(self):
+        sheet = make_sheet(pins=[("R1", "1", (0, 0)), ("R2", "1", (10, 0))])
+        analyzer = analyze(sheet)
+        assert analyzer.nets == []
+
+        analyzer.add_wire(Wire(uuid="new", points=[Point(0, 0), Point(10, 0)]))
+
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+        assert analyzer.get_net_for_pin("R1", "1").wires == {"new"}
+
+    def test_remove_wire_splits_only_its_net(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (10, 5)), ("R3", "1", (50, 0))],
+            wires=[[(0, 0), (10, 0)], [(10, 0), (10, 5)], [(50, 0), (60, 0)]],
+        )
+        analyzer = analyze(sheet)
+        other = analyzer.get_net_for_pin("R3", "1")
+
+        assert analyzer.remove_wire("w1")
+
+        assert not analyzer.are_connected("R1", "1", "R2", "1")
+        assert analyzer.get_net_for_pin("R1", "1").wires == {"w0"}
+        assert analyzer.get_net_for_pin("R2", "1") is None
+        assert analyzer.get_net_for_pin("R3", "1") is other
+        assert len(analyzer.nets) == 2
+        assert not analyzer.remove_wire("w1")
+
+    def test_remove_wire_resplits_label_links(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (20, 0))],
+            wires=[[(0, 0), (5, 0)], [(20, 0), (25, 0)]],
+            labels=[("SIG", (5, 0)), ("SIG", (25, 0))],
+        )
+        analyzer = analyze(sheet)
+
+        analyzer.remove_wire("w1")
+
+        assert not analyzer.are_connected("R1", "1", "R2", "1")
+        assert [net.name for net in analyzer.nets] == ["SIG"]
+        assert analyzer._label_name_to_nets["SIG"] == analyzer.nets
+
+    def test_remove_wire_resplits_global_label_links(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (20, 0))],
+            wires=[[(0, 0), (5, 0)], [(20, 0), (25, 0)]],
+            global_labels=[("VBUS", (5, 0)), ("VBUS", (25, 0))],
+        )
+        analyzer = analyze(sheet)
+
+        analyzer.remove_wire("w0")
+        assert not analyzer.are_connected("R1", "1", "R2", "1")
+
+        analyzer.add_wire(Wire(uuid="w9", points=[Point(0, 0), Point(5, 0)]))
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+
+    def test_add_and_remove_power_symbol(self):
+        sheet = make_sheet(
+            pins=[("R1", "2", (0, 0)), ("R2", "2", (20, 0)), ("#PWR01", "1", (0, 5))],
+            wires=[[(0, 0), (0, 5)], [(20, 0), (20, 5)]],
+            power=[("#PWR01", "GND")],
+        )
+        analyzer = analyze(sheet)
+        assert not analyzer.are_connected("R1", "2", "R2", "2")
+
+        analyzer.add_component(make_component("#PWR02", [("1", (20, 5))], power="GND"))
+        assert analyzer.are_connected("R1", "2", "R2", "2")
+        assert analyzer.get_net_for_pin("R2", "2").name == "GND"
+
+        assert analyzer.remove_component("#PWR01")
+        assert not analyzer.are_connected("R1", "2", "R2", "2")
+        assert analyzer.get_net_for_pin("R1", "2").name == "Net-(R1-Pad2)"
+
+    def test_moving_component_replaces_pins(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (10, 0))], wires=[[(0, 0), (10, 0)]]
+        )
+        analyzer = analyze(sheet)
+
+        analyzer.add_component(make_component("R2", [("1", (30, 0))]))
+
+        assert not analyzer.are_connected("R1", "1", "R2", "1")
+        assert analyzer.get_net_for_pin("R2", "1") is None
+
+    def test_wire_through_junction_connects_and_splits(self):
+        sheet = make_sheet(
+            pins=[("R1", "1", (0, 0)), ("R2", "1", (5, 10))],
+            wires=[[(5, 0), (5, 10)]],
+            junctions=[(5, 0)],
+        )
+        analyzer = analyze(sheet)
+
+        analyzer.add_wire(Wire(uuid="bar", points=[Point(0, 0), Point(10, 0)]))
+        assert analyzer.are_connected("R1", "1", "R2", "1")
+
+        analyzer.remove_wire("bar")
+        assert not analyzer.are_connected("R1", "1", "R2", "1")
+
+    def test_updates_require_analysis(self):
+        with pytest.raises(ValueError):
+            SheetAnalyzer().add_wire(Wire(uuid="w", points=[Point(0, 0), Point(1, 0)]))
+
+    def test_random_edits_match_full_analysis(self):
+        rng = random.Random(7)
+        coords = [(x * 5, y * 5) for x in range(4) for y in range(4)]
+        components = {
+            f"R{i}": make_component(f"R{i}", [("1", rng.choice(coords)), ("2", rng.choice(coords))])
+            for i in range(6)
+        }
+        components["#PWR1"] = make_component("#PWR1", [("1", rng.choice(coords))], power="GND")
+        components["#PWR2"] = make_component("#PWR2", [("1", rng.choice(coords))], power="GND")
+        wires = {}
+        labels = [("A", coords[0]), ("A", coords[-1]), ("B", coords[5])]
+
+        junctions = [coords[5], coords[6], coords[9]]
+
+        def snapshot():
+            sheet = make_sheet(labels=labels, junctions=junctions)
+            sheet.components = list(components.values())
+            sheet.pin_positions = {
+                pin: pos for c in components.values() for pin, pos in c.pin_positions.items()
+            }
+            sheet.wires = list(wires.values())
+            return sheet
+
+        analyzer = analyze(snapshot())
+        for step in range(60):
+            action = rng.random()
+            if action < 0.4 or not wires:
+                uuid = f"n{step}"
+                wires[uuid] = Wire(uuid=uuid, points=rng.sample([Point(*c) for c in coords], 2))
+                analyzer.add_wire(wires[uuid])
+            elif action < 0.75:
+                uuid = rng.choice(sorted(wires))
+                del wires[uuid]
+                analyzer.remove_wire(uuid)
+            else:
+                reference = rng.choice(sorted(components))
+                component = components.pop(reference)
+                analyzer.remove_component(reference)
+                moved = make_component(
+                    reference,
+                    [(pin.pin_number, rng.choice(coords)) for pin in component.pin_positions],
+                    power=None if component.lib_id == "Device:R" else component.value,
+                )
+                components[reference] = moved
+                analyzer.add_component(moved)
+
+            assert partition(analyzer) == partition(analyze(snapshot())), f"step {step}"
+            for net in analyzer.nets:
+                assert analyzer.get_net_pins(net.code) == sorted(
+                    net.pins, key=lambda p: (p.reference, p.pin_number)
+                )
+                for pin in net.pins:
+                    assert analyzer.get_net_for_pin(pin.reference, pin.pin_number) is net
@@ -0,0 +1,62 @@
+"""Unit tests for memoized lib_symbols embedding on save."""
+
+import kicad_sch_api as ksa
+from kicad_sch_api.library.cache import get_symbol_cache
+
+
+def counted_sheet(tmp_path, monkeypatch):
+    """A saved two-part sheet and the list of lib_ids converted for embedding."""
+    sch = ksa.create_schematic("Embed")
+    sch.components.add("Device:R", "R1", "1k", (100.33, 100.33))
+    sch.components.add("Device:C", "C1", "100n", (120.65, 100.33))
+    sch.components.add("Device:R", "R2", "2k", (140.97, 100.33))
+
+    converted = []
+    convert = sch._convert_symbol_to_kicad_format
+
+    def counting_convert(symbol_def, lib_id):
+        converted.append(lib_id)
+        return convert(symbol_def, lib_id)
+
+    monkeypatch.setattr(sch, "_convert_symbol_to_kicad_format", counting_convert)
+    sch.save(str(tmp_path / "embed.kicad_sch"))
+    return sch, converted
+
+
+def test_resave_reuses_converted_symbols(tmp_path, monkeypatch):
+    sch, converted = counted_sheet(tmp_path, monkeypatch)
+    embedded = dict(sch._data["lib_symbols"])
+
+    sch.components.get("R1").value = "4k7"
+    sch.save()
+
+    assert converted == ["Device:R", "Device:C"]
+    assert list(sch._data["lib_symbols"]) == ["Device:R", "Device:C"]
+    assert all(sch._data["lib_symbols"][k] is v for k, v in embedded.items())
+
+
+def test_project_rename_converts_again(tmp_path, monkeypatch):
+    sch, converted = counted_sheet(tmp_path, monkeypatch)
+
+    sch.name = "Renamed"
+    sch.save()
+
+    assert converted == ["Device:R", "Device:C"] * 2
+
+
+def test_library_change_converts_again(tmp_path, monkeypatch):
+    sch, converted = counted_sheet(tmp_path, monkeypatch)
+
+    monkeypatch.setattr(get_symbol_cache(), "get_library_mtime", lambda name: 0.0)
+    sch.save()
+
+    assert converted == ["Device:R", "Device:C"] * 2
+
+
+def test_library_mtime():
+    cache = get_symbol_cache()
+    mtime = cache._library_index["Device"].stat().st_mtime
+
+    assert cache.get_library_mtime("Device") == mtime
+    assert cache.get_library_mtime("PCM_Device") == mtime
+    assert cache.get_library_mtime("NoSuchLibrary") is None
@@ -0,0 +1,96 @@
+"""Unit tests for the endpoint grid hash behind unconnected-pin and dangling-wire checks."""
+
+import random
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.core.connectivity import EndpointIndex
+from kicad_sch_api.core.types import Point
+
+
+def resistors(count=2):
+    """A sheet of unwired resistors and its pin table."""
+    sch = ksa.create_schematic("Endpoints")
+    for i in range(count):
+        sch.components.add("Device:R", f"R{i + 1}", "1k", (100.33 + 10.16 * i, 100.33))
+    return sch, sch.components.pin_table()
+
+
+def results(index):
+    return index.unconnected_pins(), index.floating_wires(), index.dangling_wire_ends()
+
+
+class TestLookup:
+    """Point lookups within tolerance, including across cell boundaries."""
+
+    def test_at_and_count(self):
+        index = EndpointIndex()
+        index.add(EndpointIndex.JUNCTION, "j", Point(10.0, 10.0))
+        index.add(EndpointIndex.LABEL, "l", Point(10.005, 9.995))
+        index.add(EndpointIndex.LABEL, "far", Point(10.02, 10.0))
+
+        assert sorted(index.at(Point(10.0, 10.0))) == [("junction", "j"), ("label", "l")]
+        assert index.count(Point(9.999, 10.001)) == 2
+        assert index.count(Point(11.0, 10.0)) == 0
+
+    def test_tolerance_must_be_positive(self):
+        with pytest.raises(ValueError):
+            EndpointIndex(0)
+
+
+class TestChecks:
+    """Unconnected pins, floating wires and dangling wire ends."""
+
+    def test_unconnected_pins(self):
+        sch, pins = resistors()
+        sch.wires.add(start=pins.position("R1", "2"), end=pins.position("R2", "1"))
+        sch.no_connects.add(pins.position("R2", "2"))
+
+        unconnected = EndpointIndex.build(sch).unconnected_pins()
+
+        assert unconnected == [("R1", "1", pins.position("R1", "1"))]
+
+    def test_floating_and_dangling_wires(self):
+        sch, pins = resistors()
+        floating = sch.wires.add(start=(20, 20), end=(30, 20))
+        dangling = sch.wires.add(start=pins.position("R1", "1"), end=(80, 100.33))
+        sch.wires.add(start=pins.position("R1", "2"), end=pins.position("R2", "1"))
+
+        index = EndpointIndex.build(sch)
+
+        assert index.floating_wires() == [floating]
+        assert index.dangling_wire_ends() == [
+            (floating, Point(20, 20)),
+            (dangling, Point(80, 100.33)),
+        ]
+
+    def test_index_is_shared_and_patched_by_edits(self):
+        sch, pins = resistors()
+        index = EndpointIndex.for_schematic(sch)
+        assert EndpointIndex.for_schematic(sch) is index
+
+        sch.wires.add(start=pins.position("R1", "2"), end=pins.position("R2", "1"))
+
+        assert EndpointIndex.for_schematic(sch) is index
+        assert [pin for _, pin, _ in index.unconnected_pins()] == ["1", "2"]
+
+    def test_random_edits_match_rebuild(self):
+        sch, pins = resistors(20)
+        index = EndpointIndex.for_schematic(sch)
+        results(index)
+        rnd = random.Random(7)
+
+        for _ in range(40):
+            operation = rnd.randrange(3)
+            if operation == 0:
+                a, b = rnd.sample(range(1, 21), 2)
+                sch.wires.add(start=pins.position(f"R{a}", "2"), end=pins.position(f"R{b}", "1"))
+            elif operation == 1 and len(sch.wires):
+                sch.wires.remove(rnd.choice(list(sch.wires)).uuid)
+            else:
+                component = rnd.choice(list(sch.components))
+                component.position = (component.position.x, component.position.y + 2.54)
+
+            assert EndpointIndex.for_schematic(sch) is index
+            assert results(index) == results(EndpointIndex.build(sch))
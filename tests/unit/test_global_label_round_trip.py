@@ -0,0 +1,65 @@
+"""Round trip of global labels written by KiCAD."""
+
+import kicad_sch_api as ksa
+
+KICAD_SHEET = """\
+(kicad_sch
+	(version 20250114)
+	(generator "eeschema")
+	(generator_version "9.0")
+	(uuid "0b6c2f5e-7f1d-4c2a-9a55-3f0f4f2d8a11")
+	(paper "A4")
+	(lib_symbols)
+	(global_label "CLK"
+		(shape input)
+		(at 127 63.5 0)
+		(fields_autoplaced yes)
+		(effects
+			(font
+				(size 1.27 1.27)
+				(bold yes)
+				(italic yes)
+			)
+			(justify left)
+		)
+		(uuid "5e6f8a2b-1c3d-4e5f-8a9b-0c1d2e3f4a5b")
+		(property "Intersheetrefs" "${INTERSHEET_REFS}"
+			(at 135.4666 63.5 0)
+			(effects
+				(font
+					(size 1.27 1.27)
+				)
+				(justify left)
+				(hide yes)
+			)
+		)
+	)
+	(sheet_instances
+		(path "/"
+			(page "1")
+		)
+	)
+	(embedded_fonts no)
+)
+"""
+
+
+def test_kicad_global_label_round_trip(tmp_path):
+    path = tmp_path / "global.kicad_sch"
+    path.write_text(KICAD_SHEET)
+
+    sch = ksa.load_schematic(str(path))
+    sch.save(str(tmp_path / "saved.kicad_sch"))
+
+    assert (tmp_path / "saved.kicad_sch").read_text() == KICAD_SHEET
+    (label,) = sch._data["global_label"]
+    assert label["effects"]["font"] == {"size": [1.27, 1.27], "bold": True, "italic": True}
+    assert [p["name"] for p in label["properties"]] == ["Intersheetrefs"]
+
+
+def test_api_global_label_has_integer_rotation(tmp_path):
+    sch = ksa.create_schematic("Global")
+    sch.add_global_label("CLK", (127.0, 63.5))
+    sch.save(str(tmp_path / "api.kicad_sch"))
+
+    assert "(at 127 63.5 0)" in (tmp_path / "api.kicad_sch").read_text()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the native netlist exporter.
+
+The KiCad S-expression output is compared with the netlist kicad-cli wrote
+for the PS2 hierarchical reference project.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import sexpdata
+
+import kicad_sch_api as ksa
+from kicad_sch_api.exporters import NATIVE_NETLIST_FORMATS, export_netlist
+
+REFERENCE = (
+    Path(__file__).parent.parent
+    / "reference_kicad_projects"
+    / "connectivity"
+    / "ps2_hierarchical_power"
+)
+
+
+def sexpr_nets(path):
+    """Nets of a KiCad S-expression netlist as sorted (ref, pin) node lists."""
+    (nets,) = [
+        item
+        for item in sexpdata.loads(Path(path).read_text())
+        if isinstance(item, list) and str(item[0]) == "nets"
+    ]
+    members = []
+    for net in nets[1:]:
+        nodes = [entry for entry in net if isinstance(entry, list) and str(entry[0]) == "node"]
+        members.append(sorted((str(node[1][1]), str(node[2][1])) for node in nodes))
+    return sorted(members)
+
+
+@pytest.fixture
+def reference_schematic():
+    return ksa.Schematic.load(str(REFERENCE / "ps2_hierarchical_power.kicad_sch"))
+
+
+class TestNativeNetlist:
+    """Netlists written from ConnectivityAnalyzer nets."""
+
+    def test_kicad_netlist_matches_kicad_cli(self, reference_schematic, tmp_path):
+        output = reference_schematic.export_netlist(output_path=tmp_path / "ps2.net")
+
+        assert sexpr_nets(output) == sexpr_nets(REFERENCE / "ps2_hierarchical_power.net")
+        text = output.read_text()
+        assert '(name "/Child Circuit/")' in text
+        assert "#PWR" not in text  # Power symbols are not netlist components
+
+    def test_json_netlist(self, reference_schematic, tmp_path):
+        output = reference_schematic.export_netlist(
+            format="json", output_path=tmp_path / "ps2.json"
+        )
+
+        netlist = json.loads(output.read_text())
+        assert [c["ref"] for c in netlist["components"]] == ["R1", "R2"]
+        data = {
+            net["name"]: [(n["ref"], n["pin"]) for n in net["nodes"]] for net in netlist["nets"]
+        }
+        assert data == {
+            "DATA": [("R1", "2"), ("R2", "1")],
+            "GND": [("R2", "2")],
+            "VCC": [("R1", "1")],
+        }
+
+    def test_spice_node_list(self, reference_schematic, tmp_path):
+        output = reference_schematic.export_netlist(
+            format="spicenodes", output_path=tmp_path / "ps2.cir"
+        )
+
+        lines = output.read_text().splitlines()
+        assert lines[2:] == ["R1 VCC DATA 10k", "R2 DATA 0 10k", ".end"]
+
+    def test_spice_goes_through_kicad_cli(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            "kicad_sch_api.cli.netlist.export_netlist",
+            lambda path, **kwargs: calls.append((path, kwargs)) or tmp_path / "board.cir",
+        )
+        sch = ksa.create_schematic("Netlist")
+        sch.save(str(tmp_path / "board.kicad_sch"))
+
+        assert sch.export_netlist(format="spice", executor="docker") == tmp_path / "board.cir"
+        assert calls == [(tmp_path / "board.kicad_sch", {"format": "spice", "executor": "docker"})]
+
+    def test_native_export_rejects_kicad_cli_arguments(self, tmp_path):
+        sch = ksa.create_schematic("Netlist")
+        sch.save(str(tmp_path / "board.kicad_sch"))
+
+        with pytest.raises(TypeError, match="executor"):
+            sch.export_netlist(executor="docker")
+
+    def test_default_path_and_errors(self, tmp_path):
+        sch = ksa.create_schematic("Netlist")
+        with pytest.raises(ValueError):
+            export_netlist(sch)
+
+        sch.save(str(tmp_path / "board.kicad_sch"))
+        assert sch.export_netlist() == tmp_path / "board.net"
+        with pytest.raises(ValueError):
+            export_netlist(sch, tmp_path / "board.asc", format="pads")
+        assert "pads" not in NATIVE_NETLIST_FORMATS
@@ -0,0 +1,173 @@
+"""
+Unit tests for cached absolute pin tables.
+
+Covers the per-component cache in pin_utils, its invalidation on
+move/rotate/translate, the batched (NumPy) pin transformation, and the
+schematic-wide PinTable.
+"""
+
+import itertools
+
+import pytest
+
+import kicad_sch_api as ksa
+from kicad_sch_api.collections import PinTable
+from kicad_sch_api.core import geometry, pin_utils
+from kicad_sch_api.core.types import Point
+
+requires_numpy = pytest.mark.skipif(not geometry.NUMPY_AVAILABLE, reason="NumPy not installed")
+
+
+@pytest.fixture
+def transform_counter(monkeypatch):
+    """Count apply_transformation calls made by pin_utils."""
+    calls = []
+    original = pin_utils.apply_transformation
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(pin_utils, "apply_transformation", counting)
+    return calls
+
+
+@pytest.fixture
+def resistor():
+    sch = ksa.create_schematic("Pins")
+    return sch, sch.components.add("Device:R", "R1", "10k", position=(100.33, 100.33))
+
+
+class TestComponentPinCache:
+    """Per-component absolute pin tables."""
+
+    def test_repeated_lookups_reuse_table(self, resistor, transform_counter):
+        _, r1 = resistor
+        first = pin_utils.list_component_pins(r1)
+        transform_counter.clear()
+
+        assert pin_utils.list_component_pins(r1) == first
+        assert pin_utils.get_component_pin_position(r1, "2") == dict(first)["2"]
+        assert transform_counter == []
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            lambda c: c.move(50.8, 50.8),
+            lambda c: c.translate(2.54, 0),
+            lambda c: c.rotate(90),
+        ],
+        ids=["move", "translate", "rotate"],
+    )
+    def test_edits_invalidate_table(self, resistor, edit):
+        _, r1 = resistor
+        before = dict(pin_utils.list_component_pins(r1))
+
+        edit(r1)
+
+        after = dict(pin_utils.list_component_pins(r1))
+        assert after != before
+        assert after == dict(pin_utils._compute_component_pins(r1))
+
+    def test_direct_data_edit_is_caught_by_key(self, resistor):
+        _, r1 = resistor
+        pin_utils.list_component_pins(r1)
+
+        r1._data.position = Point(0, 0)
+
+        assert pin_utils.list_component_pins(r1) == pin_utils._compute_component_pins(r1)
+
+    def test_plain_symbols_are_not_cached(self, resistor):
+        _, r1 = resistor
+        symbol = r1._data
+
+        assert pin_utils.list_component_pins(symbol) == pin_utils.list_component_pins(r1)
+        assert not hasattr(symbol, "_pin_table")
+
+
+class TestPinTable:
+    """Schematic-wide pin table."""
+
+    def test_columns_and_lookup(self, resistor):
+        sch, r1 = resistor
+        sch.components.add("Device:R", "R2", "1k", position=(120.65, 100.33))
+
+        table = sch.components.pin_table()
+
+        assert isinstance(table, PinTable)
+        assert len(table) == 4
+        assert table.references == ["R1", "R1", "R2", "R2"]
+        assert sorted(table.pins) == ["1", "1", "2", "2"]
+        assert table.position("R1", "1") == sch.get_component_pin_position("R1", "1")
+        assert table.position("R9", "1") is None
+        assert list(table.column("x")) == [position.x for _, _, position in table]
+
+    def test_rebuild_only_transforms_edited_components(self, resistor, transform_counter):
+        sch, r1 = resistor
+        sch.components.add("Device:R", "R2", "1k", position=(120.65, 100.33))
+        sch.components.pin_table()
+        transform_counter.clear()
+
+        r1.move(50.8, 50.8)
+        table = sch.components.pin_table()
+
+        assert len(transform_counter) == 2
+        assert table.position("R1", "1") == sch.get_component_pin_position("R1", "1")
+
+
+class TestBatchedTransformation:
+    """apply_transformation_batch() and list_pins_batch()."""
+
+    @requires_numpy
+    def test_batch_matches_scalar_exactly(self):
+        points = [(0.0, 3.81), (-2.54, -1.27), (5.08, 0.0)]
+        cases = list(itertools.product([0, 90, 180, 270, 45], [None, "x", "y"]))
+        origins = [(100.33 + i, 50.8 - i) for i in range(len(cases))]
+
+        result = geometry.apply_transformation_batch(
+            points, origins, [rotation for rotation, _ in cases], [mirror for _, mirror in cases]
+        )
+
+        assert result.shape == (len(cases), len(points), 2)
+        for (rotation, mirror), origin, row in zip(cases, origins, result.tolist()):
+            expected = [
+                geometry.apply_transformation(point, Point(*origin), rotation, mirror)
+                for point in points
+            ]
+            assert [tuple(xy) for xy in row] == expected
+
+    def test_list_pins_batch_matches_per_component(self, resistor):
+        sch, r1 = resistor
+        r2 = sch.components.add("Device:R", "R2", "1k", position=(120.65, 100.33))
+        r2.rotate(90)
+        sch.components.add("Device:C", "C1", "100n", position=(80.01, 60.96))
+        components = list(sch.components)
+
+        batched = pin_utils.list_pins_batch(components)
+
+        assert batched == [pin_utils._compute_component_pins(c) for c in components]
+        assert [pin_utils.list_component_pins(c) for c in components] == batched
+
+    def test_list_pins_batch_scalar_fallback(self, resistor, monkeypatch):
+        sch, r1 = resistor
+        monkeypatch.setattr(pin_utils, "NUMPY_AVAILABLE", False)
+
+        assert pin_utils.list_pins_batch([r1]) == [pin_utils._compute_component_pins(r1)]
+
+    @requires_numpy
+    def test_list_pins_batch_transforms_each_lib_id_once(self, monkeypatch):
+        sch = ksa.create_schematic("Batch")
+        for i in range(5):
+            sch.components.add("Device:R", f"R{i + 1}", "1k", position=(20.32 * (i + 1), 50.8))
+        calls = []
+        original = pin_utils.apply_transformation_batch
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(pin_utils, "apply_transformation_batch", counting)
+        pin_utils.list_pins_batch(list(sch.components))
+
+        assert len(calls) == 1
+        assert len(calls[0][1]) == 5
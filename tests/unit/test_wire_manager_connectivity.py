@@ -213,6 +213,93 @@ class TestWireManagerConnectivity:
         assert result2 is not None
         assert len(result3) >= 1
 
+    # Test incremental updates
+
+    def test_wire_edits_reuse_analyzer(self, simple_circuit):
+        """Test that wire edits update the existing analysis in place."""
+        manager = simple_circuit._wire_manager
+        assert not simple_circuit.are_pins_connected("R1", "1", "R2", "2")
+        analyzer = manager._connectivity_analyzer
+
+        wire_uuid = manager.add_wire_between_pins("R1", "1", "R2", "2")
+        assert simple_circuit.are_pins_connected("R1", "1", "R2", "2")
+
+        manager.remove_wire(wire_uuid)
+        assert not simple_circuit.are_pins_connected("R1", "1", "R2", "2")
+        assert manager._connectivity_analyzer is analyzer
+
+    def test_component_move_updates_nets(self, simple_circuit):
+        """Test that moving a component re-splits its net without re-analysis."""
+        manager = simple_circuit._wire_manager
+        assert simple_circuit.are_pins_connected("R1", "2", "R2", "1")
+        analyzer = manager._connectivity_analyzer
+
+        simple_circuit.components.get("R2").position = (200, 100)
+
+        assert not simple_circuit.are_pins_connected("R1", "2", "R2", "1")
+        assert manager._connectivity_analyzer is analyzer
+
+    def test_component_remove_and_add_update_nets(self, simple_circuit):
+        """Test that component removal and insertion are applied incrementally."""
+        manager = simple_circuit._wire_manager
+        assert simple_circuit.get_net_for_pin("R2", "1") is not None
+        analyzer = manager._connectivity_analyzer
+
+        simple_circuit.components.remove("R2")
+        assert simple_circuit.get_net_for_pin("R2", "1") is None
+
+        simple_circuit.components.add("Device:R", "R3", "1k", position=(150, 100))
+        assert simple_circuit.are_pins_connected("R1", "2", "R3", "1")
+        assert manager._connectivity_analyzer is analyzer
+
+    def test_junction_edits_update_nets(self):
+        """Test that adding a junction after a query joins a T-connection."""
+        sch = ksa.create_schematic("T Test")
+        sch.components.add("Device:R", "R1", "10k", position=(100, 100))
+        sch.components.add("Device:R", "R3", "10k", position=(125, 125))
+        sch.wires.add((100.33, 104.14), (140, 104.14))
+        sch.wires.add((124.46, 120.65), (124.46, 104.14))
+        assert not sch.are_pins_connected("R1", "2", "R3", "1")
+
+        junction_uuid = sch.junctions.add(position=(124.46, 104.14))
+        assert sch.are_pins_connected("R1", "2", "R3", "1")
+
+        sch.junctions.remove(junction_uuid)
+        assert not sch.are_pins_connected("R1", "2", "R3", "1")
+
+    def test_label_edits_update_nets(self, simple_circuit):
+        """Test that adding and removing labels after a query changes nets."""
+        sch = simple_circuit
+        sch._wire_manager.add_wire_to_pin((90, 95.86), "R1", "1")
+        sch._wire_manager.add_wire_to_pin((160, 104.14), "R2", "2")
+        sch.add_label("LINK", position=(90, 95.86))
+        assert not sch.are_pins_connected("R1", "1", "R2", "2")
+
+        label_uuid = sch.add_label("LINK", position=(160, 104.14))
+        assert sch.are_pins_connected("R1", "1", "R2", "2")
+
+        sch.remove_label(label_uuid)
+        assert not sch.are_pins_connected("R1", "1", "R2", "2")
+
+    def test_incremental_matches_reanalysis(self, circuit_with_junction):
+        """Test that incremental results equal a fresh analysis."""
+        from kicad_sch_api.core.connectivity import ConnectivityAnalyzer
+
+        sch = circuit_with_junction
+        manager = sch._wire_manager
+        manager._ensure_connectivity()
+
+        first_wire = next(iter(sch.wires))
+        manager.remove_wire(first_wire.uuid)
+        sch.components.get("R3").rotation = 90
+        manager.add_wire((125, 104.14), (125, 90))
+
+        def partition(nets):
+            return sorted(sorted((p.reference, p.pin_number) for p in net.pins) for net in nets)
+
+        fresh = ConnectivityAnalyzer().analyze(sch, hierarchical=True)
+        assert partition(manager._connectivity_analyzer.nets) == partition(fresh)
+
     # Test hierarchical connectivity
 
     def test_hierarchical_always_enabled(self, hierarchical_circuit):